@@ -450,6 +450,24 @@ def validate_brd_file(file_path: Path) -> ValidationResult:
         result.add_error("VAL-E005", f"Failed to read file: {e}")
         return result
 
+    return validate_brd_content(file_path, content, result)
+
+
+def validate_brd_content(file_path: Path, content: str, result: Optional[ValidationResult] = None) -> ValidationResult:
+    """
+    Validate BRD text without reading it from disk (e.g. an in-memory fix).
+
+    Args:
+        file_path: Path the content belongs to (used for name checks)
+        content: BRD markdown text
+        result: Result to add issues to (default: new result)
+
+    Returns:
+        ValidationResult with all issues found
+    """
+    if result is None:
+        result = ValidationResult(str(file_path))
+
     # Determine if template
     is_template = "TEMPLATE" in file_path.name.upper()
 
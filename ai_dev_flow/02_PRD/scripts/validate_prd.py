@@ -448,6 +448,24 @@ def validate_prd_file(file_path: Path) -> ValidationResult:
         result.add_error("VAL-E005", f"Failed to read file: {e}")
         return result
 
+    return validate_prd_content(file_path, content, result)
+
+
+def validate_prd_content(file_path: Path, content: str, result: Optional[ValidationResult] = None) -> ValidationResult:
+    """
+    Validate PRD text without reading it from disk (e.g. an in-memory fix).
+
+    Args:
+        file_path: Path the content belongs to (used for name checks)
+        content: PRD markdown text
+        result: Result to add issues to (default: new result)
+
+    Returns:
+        ValidationResult with all issues found
+    """
+    if result is None:
+        result = ValidationResult(str(file_path))
+
     # Parse frontmatter
     metadata, body = parse_frontmatter(content)
 
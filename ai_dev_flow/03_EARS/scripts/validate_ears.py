@@ -120,9 +120,12 @@ class EarsValidator:
             ))
             return self.results
 
-        content = file_path.read_text(encoding="utf-8")
-        
-        
+        return self.validate_content(file_path, file_path.read_text(encoding="utf-8"))
+
+    def validate_content(self, file_path: Path, content: str) -> list[ValidationResult]:
+        """Validate EARS text without reading it from disk (e.g. an in-memory fix)."""
+        self.results = []
+
         clean_content = content
         lines = clean_content.split("\n")
 
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Streaming Gherkin Tokenizer - Layer 4
+
+Incremental, line-at-a-time tokenizer for Gherkin .feature files. Instead of
+building a whole-document structure, it yields one event per source line
+(Feature, Rule, Background, Scenario, Examples, Step, Tag, ...). Validators
+register event subscribers and run every check in a single pass, so memory
+stays bounded regardless of feature file size.
+
+Used by:
+    validate_bdd.py        - Layer 4 Gherkin structure validation
+    validate_bdd_suite.py  - Section-based suite validation
+
+Usage:
+    from gherkin_stream import stream_feature_file, run_subscribers
+
+    run_subscribers(stream_feature_file(path), [check_a, check_b])
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence
+
+
+# =============================================================================
+# EVENT KINDS
+# =============================================================================
+
+EVENT_BLANK = "blank"
+EVENT_COMMENT = "comment"
+EVENT_TAG = "tag"
+EVENT_FEATURE = "feature"
+EVENT_RULE = "rule"
+EVENT_BACKGROUND = "background"
+EVENT_SCENARIO = "scenario"
+EVENT_EXAMPLES = "examples"
+EVENT_STEP = "step"
+EVENT_TABLE_ROW = "table_row"
+EVENT_DOCSTRING = "docstring"
+EVENT_TEXT = "text"
+
+# Block keywords (checked in order; "Scenario Outline:" before "Scenario:")
+BLOCK_KEYWORDS = [
+    ("Feature:", EVENT_FEATURE),
+    ("Rule:", EVENT_RULE),
+    ("Background:", EVENT_BACKGROUND),
+    ("Scenario Outline:", EVENT_SCENARIO),
+    ("Scenario Template:", EVENT_SCENARIO),
+    ("Scenario:", EVENT_SCENARIO),
+    ("Example:", EVENT_SCENARIO),
+    ("Examples:", EVENT_EXAMPLES),
+    ("Scenarios:", EVENT_EXAMPLES),
+]
+
+OUTLINE_KEYWORDS = {"Scenario Outline:", "Scenario Template:"}
+
+STEP_KEYWORDS = ["Given", "When", "Then", "And", "But", "*"]
+
+# Lower-cased forms for ignore_case tokenizing
+_BLOCK_KEYWORDS_LOWER = [(keyword.lower(), keyword, kind) for keyword, kind in BLOCK_KEYWORDS]
+_STEP_KEYWORDS_LOWER = [(keyword.lower() + " ", keyword) for keyword in STEP_KEYWORDS]
+
+DOCSTRING_DELIMITERS = ('"""', "```")
+
+
+# =============================================================================
+# EVENT TYPE
+# =============================================================================
+
+@dataclass
+class GherkinEvent:
+    """A single tokenized Gherkin source line."""
+    kind: str
+    line: int
+    raw: str
+    text: str
+    keyword: str = ""
+    tags: List[str] = field(default_factory=list)
+
+    @property
+    def is_outline(self) -> bool:
+        """True for Scenario Outline / Scenario Template events."""
+        return self.kind == EVENT_SCENARIO and self.keyword in OUTLINE_KEYWORDS
+
+
+# =============================================================================
+# TOKENIZER
+# =============================================================================
+
+def iter_gherkin_events(lines: Iterable[str], ignore_case: bool = False) -> Iterator[GherkinEvent]:
+    """
+    Tokenize Gherkin source lines into events.
+
+    Tags are emitted as their own events and also attached to the next
+    Feature/Rule/Scenario/Examples event, mirroring Gherkin tag scoping.
+    Lines inside doc strings are emitted verbatim as docstring events.
+
+    Args:
+        lines: Iterable of source lines (trailing newlines are stripped)
+        ignore_case: Match block and step keywords case-insensitively
+            ("scenario:" is a Scenario event). event.keyword is always the
+            canonical spelling from BLOCK_KEYWORDS / STEP_KEYWORDS.
+
+    Yields:
+        GherkinEvent for every line, in source order
+    """
+    pending_tags: List[str] = []
+    docstring_delimiter = None
+
+    for line_no, raw in enumerate(lines, 1):
+        raw = raw.rstrip("\r\n")
+        stripped = raw.strip()
+
+        if docstring_delimiter is not None:
+            if stripped.startswith(docstring_delimiter):
+                docstring_delimiter = None
+            yield GherkinEvent(EVENT_DOCSTRING, line_no, raw, stripped)
+            continue
+
+        if not stripped:
+            yield GherkinEvent(EVENT_BLANK, line_no, raw, stripped)
+            continue
+
+        if stripped.startswith("#"):
+            yield GherkinEvent(EVENT_COMMENT, line_no, raw, stripped)
+            continue
+
+        if stripped.startswith("@"):
+            tags = stripped.split()
+            pending_tags.extend(tags)
+            yield GherkinEvent(EVENT_TAG, line_no, raw, stripped, tags=tags)
+            continue
+
+        if stripped.startswith(DOCSTRING_DELIMITERS):
+            docstring_delimiter = stripped[:3]
+            yield GherkinEvent(EVENT_DOCSTRING, line_no, raw, stripped)
+            continue
+
+        if stripped.startswith("|"):
+            yield GherkinEvent(EVENT_TABLE_ROW, line_no, raw, stripped)
+            continue
+
+        event = None
+        if ignore_case:
+            folded = stripped.lower()
+            for prefix, keyword, kind in _BLOCK_KEYWORDS_LOWER:
+                if folded.startswith(prefix):
+                    event = GherkinEvent(kind, line_no, raw, stripped, keyword=keyword, tags=pending_tags)
+                    pending_tags = []
+                    break
+            if event is None:
+                for prefix, keyword in _STEP_KEYWORDS_LOWER:
+                    if folded.startswith(prefix):
+                        event = GherkinEvent(EVENT_STEP, line_no, raw, stripped, keyword=keyword)
+                        break
+        else:
+            for keyword, kind in BLOCK_KEYWORDS:
+                if stripped.startswith(keyword):
+                    event = GherkinEvent(kind, line_no, raw, stripped, keyword=keyword, tags=pending_tags)
+                    pending_tags = []
+                    break
+            if event is None:
+                for keyword in STEP_KEYWORDS:
+                    if stripped.startswith(keyword + " "):
+                        event = GherkinEvent(EVENT_STEP, line_no, raw, stripped, keyword=keyword)
+                        break
+
+        if event is None:
+            event = GherkinEvent(EVENT_TEXT, line_no, raw, stripped)
+
+        yield event
+
+
+def stream_feature_file(
+    file_path: Path, encoding: str = "utf-8", ignore_case: bool = False
+) -> Iterator[GherkinEvent]:
+    """
+    Stream events from a feature file without loading it into memory.
+
+    Args:
+        file_path: Path to .feature file
+        encoding: File encoding (default: utf-8)
+        ignore_case: Match keywords case-insensitively (see iter_gherkin_events)
+
+    Yields:
+        GherkinEvent for every line in the file
+    """
+    with open(file_path, encoding=encoding) as handle:
+        yield from iter_gherkin_events(handle, ignore_case=ignore_case)
+
+
+# =============================================================================
+# SUBSCRIBER DISPATCH
+# =============================================================================
+
+class EventSubscriber:
+    """Base class for single-pass checks driven by Gherkin events."""
+
+    def on_event(self, event: GherkinEvent):
+        """Handle one event. Called for every line in source order."""
+
+    def finish(self):
+        """Called once after the last event (flush open state here)."""
+
+
+def run_subscribers(events: Iterable[GherkinEvent], subscribers: Sequence[EventSubscriber]) -> int:
+    """
+    Feed every event to every subscriber, then finish each subscriber.
+
+    Args:
+        events: Event stream (e.g. from stream_feature_file)
+        subscribers: Checks to run, in registration order
+
+    Returns:
+        Number of events (source lines) processed
+    """
+    count = 0
+    for event in events:
+        count += 1
+        for subscriber in subscribers:
+            subscriber.on_event(event)
+
+    for subscriber in subscribers:
+        subscriber.finish()
+
+    return count
@@ -3,7 +3,8 @@
 BDD (Behavior-Driven Development) Validator - Layer 4
 
 Validates BDD .feature files against BDD_MVP_SCHEMA.yaml requirements.
-Supports Gherkin syntax validation.
+Supports Gherkin syntax validation. Files are tokenized by gherkin_stream.py
+and all checks run as event subscribers in a single streaming pass.
 
 Usage:
     python validate_bdd.py <file_or_directory>
@@ -30,6 +31,22 @@ sys.path.insert(0, str(SHARED_SCRIPTS_DIR))
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from error_codes import Severity, calculate_exit_code, format_error
+from gherkin_stream import (
+    EVENT_BACKGROUND,
+    EVENT_COMMENT,
+    EVENT_EXAMPLES,
+    EVENT_FEATURE,
+    EVENT_RULE,
+    EVENT_SCENARIO,
+    EVENT_STEP,
+    EVENT_TAG,
+    EVENT_TEXT,
+    EventSubscriber,
+    GherkinEvent,
+    iter_gherkin_events,
+    run_subscribers,
+    stream_feature_file,
+)
 
 
 # =============================================================================
@@ -42,22 +59,13 @@ FILE_NAME_PATTERN_MONOLITHIC = r"^BDD-\d{2,}_[A-Za-z0-9_]+\.feature$"
 # Decimal suffix (one-to-many): BDD-NN.DD_slug.feature (Vertical ID Alignment)
 FILE_NAME_PATTERN_DECIMAL = r"^BDD-\d{2,}\.\d+_[A-Za-z0-9_]+\.feature$"
 
-# Gherkin keywords
-FEATURE_KEYWORD = "Feature:"
-BACKGROUND_KEYWORD = "Background:"
-SCENARIO_KEYWORD = "Scenario:"
-SCENARIO_OUTLINE_KEYWORD = "Scenario Outline:"
-EXAMPLES_KEYWORD = "Examples:"
-
-# Step keywords
-STEP_KEYWORDS = ["Given", "When", "Then", "And", "But"]
-
 # User story patterns
 USER_STORY_PATTERNS = [
     r"^\s+As a\s",
     r"^\s+I want\s",
     r"^\s+So that\s",
 ]
+USER_STORY_LABELS = ["As a", "I want", "So that"]
 
 # Required traceability tags (Layer 4)
 REQUIRED_TRACE_TAGS = ["@brd", "@prd", "@ears"]
@@ -95,6 +103,11 @@ class ValidationResult:
     def add_info(self, code: str, message: str):
         self.info.append((code, message))
 
+    def merge(self, other: "ValidationResult"):
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.info.extend(other.info)
+
     @property
     def is_valid(self) -> bool:
         return len(self.errors) == 0
@@ -116,113 +129,7 @@ class ValidationResult:
 
 
 # =============================================================================
-# PARSING FUNCTIONS
-# =============================================================================
-
-def parse_feature_file(content: str) -> Dict:
-    """
-    Parse a Gherkin feature file into structured data.
-
-    Returns:
-        Dictionary with feature, scenarios, tags, etc.
-    """
-    result = {
-        "feature": None,
-        "feature_tags": [],
-        "user_story": [],
-        "background": None,
-        "scenarios": [],
-        "tags": [],
-        "header_comments": [],
-    }
-
-    lines = content.split("\n")
-    current_scenario = None
-    in_examples = False
-    current_tags = []
-
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        # Collect header comments
-        if stripped.startswith("#") and result["feature"] is None:
-            result["header_comments"].append(stripped)
-            continue
-
-        # Collect tags
-        if stripped.startswith("@"):
-            current_tags.extend(stripped.split())
-            result["tags"].extend(stripped.split())
-            continue
-
-        # Feature declaration
-        if stripped.startswith(FEATURE_KEYWORD):
-            result["feature"] = stripped
-            result["feature_tags"] = current_tags.copy()
-            current_tags = []
-            continue
-
-        # User story lines
-        for pattern in USER_STORY_PATTERNS:
-            if re.match(pattern, line):
-                result["user_story"].append(stripped)
-                break
-
-        # Background
-        if stripped.startswith(BACKGROUND_KEYWORD):
-            result["background"] = {"line": i, "steps": []}
-            current_scenario = result["background"]
-            in_examples = False
-            continue
-
-        # Scenario or Scenario Outline
-        if stripped.startswith(SCENARIO_KEYWORD) or stripped.startswith(SCENARIO_OUTLINE_KEYWORD):
-            is_outline = stripped.startswith(SCENARIO_OUTLINE_KEYWORD)
-            current_scenario = {
-                "line": i,
-                "name": stripped,
-                "is_outline": is_outline,
-                "tags": current_tags.copy(),
-                "steps": [],
-                "has_given": False,
-                "has_when": False,
-                "has_then": False,
-                "has_examples": False,
-            }
-            result["scenarios"].append(current_scenario)
-            current_tags = []
-            in_examples = False
-            continue
-
-        # Examples section
-        if stripped.startswith(EXAMPLES_KEYWORD):
-            in_examples = True
-            if current_scenario:
-                current_scenario["has_examples"] = True
-            continue
-
-        # Step lines
-        for keyword in STEP_KEYWORDS:
-            if stripped.startswith(keyword + " "):
-                if current_scenario:
-                    current_scenario["steps"].append({
-                        "keyword": keyword,
-                        "line": i,
-                        "text": stripped
-                    })
-                    if keyword == "Given":
-                        current_scenario["has_given"] = True
-                    elif keyword == "When":
-                        current_scenario["has_when"] = True
-                    elif keyword == "Then":
-                        current_scenario["has_then"] = True
-                break
-
-    return result
-
-
-# =============================================================================
-# VALIDATION FUNCTIONS
+# FILE-LEVEL VALIDATION FUNCTIONS
 # =============================================================================
 
 def validate_file_name(file_path: Path, result: ValidationResult):
@@ -253,188 +160,296 @@ def validate_file_extension(file_path: Path, result: ValidationResult):
     return True
 
 
-def validate_feature_declaration(parsed: Dict, result: ValidationResult):
+# =============================================================================
+# STREAMING CHECKS (Gherkin event subscribers)
+# =============================================================================
+
+class FeatureCheck(EventSubscriber):
+    """Base streaming check; records issues into its own result buffer."""
+
+    def __init__(self, file_path: str):
+        self.result = ValidationResult(file_path)
+
+
+class FeatureDeclarationCheck(FeatureCheck):
     """Validate Feature declaration."""
-    if not parsed["feature"]:
-        result.add_error("BDD-E001", "Missing Feature declaration")
-        return
 
-    # Check for multiple Feature declarations (already handled by parser)
-    # The parser only captures the first Feature
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.has_feature = False
+
+    def on_event(self, event: GherkinEvent):
+        if event.kind == EVENT_FEATURE:
+            self.has_feature = True
+
+    def finish(self):
+        if not self.has_feature:
+            self.result.add_error("BDD-E001", "Missing Feature declaration")
 
 
-def validate_user_story(parsed: Dict, result: ValidationResult):
+class UserStoryCheck(FeatureCheck):
     """Validate user story (As a / I want / So that)."""
-    user_story = parsed["user_story"]
-
-    has_as_a = any("As a" in line for line in user_story)
-    has_i_want = any("I want" in line for line in user_story)
-    has_so_that = any("So that" in line for line in user_story)
-
-    if not (has_as_a and has_i_want and has_so_that):
-        missing = []
-        if not has_as_a:
-            missing.append("As a")
-        if not has_i_want:
-            missing.append("I want")
-        if not has_so_that:
-            missing.append("So that")
-        result.add_warning(
-            "BDD-W001",
-            f"Feature missing user story components: {', '.join(missing)}"
-        )
 
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.found = [False] * len(USER_STORY_PATTERNS)
+
+    def on_event(self, event: GherkinEvent):
+        if event.kind != EVENT_TEXT:
+            return
+        for idx, pattern in enumerate(USER_STORY_PATTERNS):
+            if re.match(pattern, event.raw):
+                self.found[idx] = True
+                break
+
+    def finish(self):
+        missing = [label for label, found in zip(USER_STORY_LABELS, self.found) if not found]
+        if missing:
+            self.result.add_warning(
+                "BDD-W001",
+                f"Feature missing user story components: {', '.join(missing)}"
+            )
 
-def validate_scenarios(parsed: Dict, result: ValidationResult):
+
+class ScenarioTracker(FeatureCheck):
+    """Tracks the open scenario and hands it to on_scenario() when it closes."""
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.scenario: Optional[Dict] = None
+        self.scenario_count = 0
+
+    def on_event(self, event: GherkinEvent):
+        if event.kind in (EVENT_FEATURE, EVENT_RULE, EVENT_BACKGROUND, EVENT_SCENARIO):
+            self._close()
+            if event.kind == EVENT_SCENARIO:
+                self.scenario_count += 1
+                self.scenario = {
+                    "line": event.line,
+                    "name": event.text,
+                    "is_outline": event.is_outline,
+                    "tags": event.tags,
+                    "has_examples": False,
+                }
+                self.on_scenario_start(self.scenario)
+        elif self.scenario is not None:
+            if event.kind == EVENT_EXAMPLES:
+                self.scenario["has_examples"] = True
+            elif event.kind == EVENT_STEP:
+                self.on_step(self.scenario, event)
+
+    def finish(self):
+        self._close()
+
+    def _close(self):
+        if self.scenario is not None:
+            self.on_scenario(self.scenario)
+            self.scenario = None
+
+    def on_scenario_start(self, scenario: Dict):
+        """Called when a Scenario/Scenario Outline opens."""
+
+    def on_step(self, scenario: Dict, event: GherkinEvent):
+        """Called for each step inside the open scenario."""
+
+    def on_scenario(self, scenario: Dict):
+        """Called when the open scenario closes."""
+
+
+class ScenarioStructureCheck(ScenarioTracker):
     """Validate scenarios have required structure."""
-    scenarios = parsed["scenarios"]
 
-    if not scenarios:
-        result.add_error("BDD-E002", "No Scenario or Scenario Outline found")
-        return
+    def on_scenario_start(self, scenario: Dict):
+        scenario.update(has_given=False, has_when=False, has_then=False)
+
+    def on_step(self, scenario: Dict, event: GherkinEvent):
+        if event.keyword == "Given":
+            scenario["has_given"] = True
+        elif event.keyword == "When":
+            scenario["has_when"] = True
+        elif event.keyword == "Then":
+            scenario["has_then"] = True
 
-    for scenario in scenarios:
+    def on_scenario(self, scenario: Dict):
         name = scenario["name"]
 
         # Check for When step (required)
         if not scenario["has_when"]:
-            result.add_error("BDD-E003", f"Scenario missing When step: {name[:50]}")
+            self.result.add_error("BDD-E003", f"Scenario missing When step: {name[:50]}")
 
         # Check for Then step (required)
         if not scenario["has_then"]:
-            result.add_error("BDD-E003", f"Scenario missing Then step: {name[:50]}")
+            self.result.add_error("BDD-E003", f"Scenario missing Then step: {name[:50]}")
 
         # Check for Given step (recommended)
         if not scenario["has_given"]:
-            result.add_warning("BDD-W002", f"Scenario missing Given step: {name[:50]}")
+            self.result.add_warning("BDD-W002", f"Scenario missing Given step: {name[:50]}")
 
         # Check Scenario Outline has Examples
         if scenario["is_outline"] and not scenario["has_examples"]:
-            result.add_error("BDD-E002", f"Scenario Outline missing Examples: {name[:50]}")
+            self.result.add_error("BDD-E002", f"Scenario Outline missing Examples: {name[:50]}")
+
+    def finish(self):
+        super().finish()
+        if self.scenario_count == 0:
+            self.result.add_error("BDD-E002", "No Scenario or Scenario Outline found")
 
 
-def validate_step_order(parsed: Dict, result: ValidationResult):
+class StepOrderCheck(ScenarioTracker):
     """Validate Given-When-Then step order."""
-    for scenario in parsed["scenarios"]:
-        steps = scenario["steps"]
-        if not steps:
-            continue
 
-        # Track step type progression
-        last_type = None  # 'G', 'W', 'T'
-
-        for step in steps:
-            keyword = step["keyword"]
-
-            if keyword == "Given":
-                current_type = "G"
-            elif keyword == "When":
-                current_type = "W"
-            elif keyword == "Then":
-                current_type = "T"
-            else:  # And/But - inherit previous type
-                current_type = last_type
-
-            # Check order violations
-            if last_type == "W" and current_type == "G":
-                result.add_error(
-                    "BDD-E003",
-                    f"Invalid step order: Given after When at line {step['line']}"
-                )
-            elif last_type == "T" and current_type in ["G", "W"]:
-                result.add_error(
-                    "BDD-E003",
-                    f"Invalid step order: {keyword} after Then at line {step['line']}"
-                )
-
-            last_type = current_type
-
-
-def validate_traceability_tags(parsed: Dict, result: ValidationResult):
+    def on_scenario_start(self, scenario: Dict):
+        scenario["last_type"] = None  # 'G', 'W', 'T'
+
+    def on_step(self, scenario: Dict, event: GherkinEvent):
+        keyword = event.keyword
+        last_type = scenario["last_type"]
+
+        if keyword == "Given":
+            current_type = "G"
+        elif keyword == "When":
+            current_type = "W"
+        elif keyword == "Then":
+            current_type = "T"
+        else:  # And/But/* - inherit previous type
+            current_type = last_type
+
+        # Check order violations
+        if last_type == "W" and current_type == "G":
+            self.result.add_error(
+                "BDD-E003",
+                f"Invalid step order: Given after When at line {event.line}"
+            )
+        elif last_type == "T" and current_type in ["G", "W"]:
+            self.result.add_error(
+                "BDD-E003",
+                f"Invalid step order: {keyword} after Then at line {event.line}"
+            )
+
+        scenario["last_type"] = current_type
+
+
+class TraceabilityTagCheck(FeatureCheck):
     """Validate cumulative traceability tags (Layer 4 requires @brd, @prd, @ears)."""
-    all_tags = parsed["tags"]
-    header = "\n".join(parsed["header_comments"])
-
-    # Check for required tags
-    has_brd = any("@brd" in tag or "@brd:" in header for tag in all_tags) or "@brd:" in header
-    has_prd = any("@prd" in tag or "@prd:" in header for tag in all_tags) or "@prd:" in header
-    has_ears = any("@ears" in tag or "@ears:" in header for tag in all_tags) or "@ears:" in header
-
-    missing = []
-    if not has_brd:
-        missing.append("@brd")
-    if not has_prd:
-        missing.append("@prd")
-    if not has_ears:
-        missing.append("@ears")
-
-    if missing:
-        result.add_error(
-            "BDD-E005",
-            f"Missing cumulative traceability tags (Layer 4 requires): {', '.join(missing)}"
-        )
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.found = {tag: False for tag in REQUIRED_TRACE_TAGS}
+        self.in_header = True
+
+    def on_event(self, event: GherkinEvent):
+        if event.kind == EVENT_FEATURE:
+            self.in_header = False
+        elif event.kind == EVENT_TAG:
+            for required in self.found:
+                if any(required in tag for tag in event.tags):
+                    self.found[required] = True
+        elif event.kind == EVENT_COMMENT and self.in_header:
+            for required in self.found:
+                if f"{required}:" in event.text:
+                    self.found[required] = True
+
+    def finish(self):
+        missing = [tag for tag, found in self.found.items() if not found]
+        if missing:
+            self.result.add_error(
+                "BDD-E005",
+                f"Missing cumulative traceability tags (Layer 4 requires): {', '.join(missing)}"
+            )
 
 
-def validate_scenario_categories(parsed: Dict, result: ValidationResult):
+class ScenarioCategoryCheck(ScenarioTracker):
     """Check for recommended scenario categories."""
-    scenarios = parsed["scenarios"]
 
-    has_primary = any("@primary" in s.get("tags", []) for s in scenarios)
-    has_negative = any("@negative" in s.get("tags", []) or "@error_handling" in s.get("tags", []) for s in scenarios)
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.has_primary = False
+        self.has_negative = False
+
+    def on_scenario(self, scenario: Dict):
+        tags = scenario["tags"]
+        if "@primary" in tags:
+            self.has_primary = True
+        if "@negative" in tags or "@error_handling" in tags:
+            self.has_negative = True
 
-    if not has_primary:
-        result.add_warning("BDD-W001", "No success path scenarios (@primary) detected")
+    def finish(self):
+        super().finish()
+        if not self.has_primary:
+            self.result.add_warning("BDD-W001", "No success path scenarios (@primary) detected")
 
-    if not has_negative:
-        result.add_info("BDD-I001", "Consider adding error path scenarios (@negative)")
+        if not self.has_negative:
+            self.result.add_info("BDD-I001", "Consider adding error path scenarios (@negative)")
 
 
-def validate_scenario_names(parsed: Dict, result: ValidationResult):
+class ScenarioNameCheck(FeatureCheck):
     """Validate scenario naming conventions."""
-    for scenario in parsed["scenarios"]:
-        name = scenario["name"]
+
+    def on_event(self, event: GherkinEvent):
+        if event.kind != EVENT_SCENARIO:
+            return
 
         # Extract name after keyword
-        if name.startswith(SCENARIO_KEYWORD):
-            actual_name = name[len(SCENARIO_KEYWORD):].strip()
-        elif name.startswith(SCENARIO_OUTLINE_KEYWORD):
-            actual_name = name[len(SCENARIO_OUTLINE_KEYWORD):].strip()
-        else:
-            continue
+        actual_name = event.text[len(event.keyword):].strip()
 
         # Check first letter is capitalized
         if actual_name and not actual_name[0].isupper():
-            result.add_warning(
+            self.result.add_warning(
                 "BDD-W001",
                 f"Scenario name should start with capital letter: '{actual_name[:30]}'"
             )
 
 
-def validate_crosslinking_tags(content: str, result: ValidationResult):
+class CrosslinkTagCheck(FeatureCheck):
     """Detect and report cross-linking tags for AI assistance (info-level)."""
-    # Detect @depends tags
-    depends_matches = re.findall(r'@depends:\s*(BDD-\d+)', content)
-    if depends_matches:
-        unique_deps = set(depends_matches)
-        result.add_info(
-            "BDD-I001",
-            f"Document has @depends cross-links: {', '.join(sorted(unique_deps))} (for AI relationship discovery)"
-        )
-    
-    # Detect @discoverability tags
-    discoverability_matches = re.findall(r'@discoverability:\s*(BDD-\d+)', content)
-    if discoverability_matches:
-        unique_disc = set(discoverability_matches)
-        result.add_info(
-            "BDD-I002",
-            f"Document has @discoverability tags: {', '.join(sorted(unique_disc))} (for AI ranking)"
-        )
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.depends = set()
+        self.discoverability = set()
+
+    def on_event(self, event: GherkinEvent):
+        if "@" not in event.raw:
+            return
+        self.depends.update(re.findall(r'@depends:\s*(BDD-\d+)', event.raw))
+        self.discoverability.update(re.findall(r'@discoverability:\s*(BDD-\d+)', event.raw))
+
+    def finish(self):
+        # Detect @depends tags
+        if self.depends:
+            self.result.add_info(
+                "BDD-I001",
+                f"Document has @depends cross-links: {', '.join(sorted(self.depends))} (for AI relationship discovery)"
+            )
+
+        # Detect @discoverability tags
+        if self.discoverability:
+            self.result.add_info(
+                "BDD-I002",
+                f"Document has @discoverability tags: {', '.join(sorted(self.discoverability))} (for AI ranking)"
+            )
+
+
+# Checks run in a single streaming pass; issues are reported in this order
+STREAMING_CHECKS = [
+    FeatureDeclarationCheck,
+    UserStoryCheck,
+    ScenarioStructureCheck,
+    StepOrderCheck,
+    TraceabilityTagCheck,
+    ScenarioCategoryCheck,
+    ScenarioNameCheck,
+    CrosslinkTagCheck,
+]
 
 
 def validate_bdd_file(file_path: Path) -> ValidationResult:
     """
     Validate a single BDD feature file.
 
+    The file is tokenized line by line and every check runs as an event
+    subscriber in one pass, so memory stays bounded for large suites.
+
     Args:
         file_path: Path to BDD .feature file
 
@@ -455,26 +470,37 @@ def validate_bdd_file(file_path: Path) -> ValidationResult:
     # Validate file name
     validate_file_name(file_path, result)
 
-    # Read content
+    # Stream feature file through all checks
     try:
-        content = file_path.read_text(encoding="utf-8")
+        return _run_streaming_checks(file_path, stream_feature_file(file_path), result)
     except Exception as e:
         result.add_error("VAL-E005", f"Failed to read file: {e}")
         return result
 
-    # Parse feature file
-    parsed = parse_feature_file(content)
 
-    # Run validations
-    validate_feature_declaration(parsed, result)
-    validate_user_story(parsed, result)
-    validate_scenarios(parsed, result)
-    validate_step_order(parsed, result)
-    validate_traceability_tags(parsed, result)
-    validate_scenario_categories(parsed, result)
-    validate_scenario_names(parsed, result)
-    validate_crosslinking_tags(content, result)
+def validate_bdd_content(file_path: Path, content: str) -> ValidationResult:
+    """
+    Validate feature text without reading it from disk (e.g. an in-memory fix).
+
+    Args:
+        file_path: Path the content belongs to (used for name/extension checks)
+        content: Gherkin source text
+
+    Returns:
+        ValidationResult with all issues found
+    """
+    result = ValidationResult(str(file_path))
+    if not validate_file_extension(file_path, result):
+        return result
+    validate_file_name(file_path, result)
+    return _run_streaming_checks(file_path, iter_gherkin_events(content.splitlines()), result)
+
 
+def _run_streaming_checks(file_path: Path, events, result: ValidationResult) -> ValidationResult:
+    checks = [check(str(file_path)) for check in STREAMING_CHECKS]
+    run_subscribers(events, checks)
+    for check in checks:
+        result.merge(check.result)
     return result
 
 
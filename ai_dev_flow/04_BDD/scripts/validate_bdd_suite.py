@@ -23,11 +23,16 @@ Checks (all blocking):
   - Max 500 lines per .feature file; max 12 scenarios per Feature block
   - No Markdown headings inside .feature files
   - No ambiguous timezone abbreviations (EST/EDT/PST/…)
-  - Threshold enforcement: @threshold:PRD.NN.* format
+  - Threshold enforcement: @threshold:PRD.NN.* format, resolved against the
+    PRD threshold registry index (threshold_registry.py, built once per run)
   - Section metadata tags (@section, @parent_doc, @index)
 
+Each .feature file is streamed through gherkin_stream.py once; all content
+checks run as event subscribers in that single pass.
+
 Usage:
   python3 scripts/validate_bdd_suite.py --root BDD --prd-root PRD
+  python3 scripts/validate_bdd_suite.py --root BDD --prd-root PRD --threshold-cache .cache/thresholds.json
 
 Exit codes:
   0 = success, 1 = violations found
@@ -40,7 +45,24 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+# Add shared scripts directory to path (2 levels up + scripts)
+SHARED_SCRIPTS_DIR = SCRIPT_DIR.parents[1] / "scripts"
+sys.path.insert(0, str(SHARED_SCRIPTS_DIR))
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from gherkin_stream import (
+    EVENT_FEATURE,
+    EVENT_SCENARIO,
+    EVENT_TAG,
+    EventSubscriber,
+    GherkinEvent,
+    run_subscribers,
+    stream_feature_file,
+)
+from threshold_registry import ThresholdRegistry, build_threshold_registry
 
 
 # =============================================================================
@@ -74,8 +96,8 @@ SINGLE_FILE_PATTERN = re.compile(r"^BDD-\d{2,}_[a-z0-9_]+\.feature$")
 # =============================================================================
 
 REDIRECT_TAG_RE = re.compile(r"^@.*\bredirect\b", re.IGNORECASE)
-SCENARIO_RE = re.compile(r"^\s*Scenario(?: Outline)?:\s*", re.IGNORECASE)
-FEATURE_RE = re.compile(r"^\s*Feature:\s*", re.IGNORECASE)
+# Scenario keywords counted by the suite rules (Scenario Template / Example are not)
+SUITE_SCENARIO_KEYWORDS = frozenset({"Scenario:", "Scenario Outline:"})
 MD_HEADING_RE = re.compile(r"^\s*#{1,6}\s+")
 AMBIG_TZ_RE = re.compile(r"\b(EST|EDT|PST|PDT|CST|CDT|IST|BST|GMT)\b")
 
@@ -93,7 +115,7 @@ RAW_RETRY_RE = re.compile(
 )
 
 THRESHOLD_TAG_RE = re.compile(
-    r"@threshold\s*:\s*PRD\.(\d{2})\.[a-z0-9_]+(?:\.[a-z0-9_]+)*",
+    r"@threshold\s*:\s*PRD\.(\d{2})\.([a-z0-9_]+(?:\.[a-z0-9_]+)*)",
     re.IGNORECASE,
 )
 
@@ -117,21 +139,19 @@ def iter_feature_files(root: Path) -> Iterable[Path]:
         yield p
 
 
-def validate_section_based_file(path: Path, lines: List[str]) -> List[Violation]:
+def validate_section_file_name(path: Path) -> Tuple[List[Violation], bool, bool]:
     """
-    Validate section-based file naming and structure.
-    
+    Validate section-based file naming.
+
     Checks:
     1. Prohibited patterns (ERROR if found)
     2. Valid section pattern match (one of 3 patterns)
-    3. Aggregator-specific validation (@redirect tag, 0 scenarios)
-    4. Section metadata tags
-    
-    Returns list of violations.
+
+    Returns (violations, name_is_valid, is_aggregator).
     """
     violations: List[Violation] = []
     filename = path.name
-    
+
     # Check prohibited patterns first (legacy formats)
     if PART_SUFFIX_PATTERN.match(filename):
         violations.append(
@@ -141,8 +161,8 @@ def validate_section_based_file(path: Path, lines: List[str]) -> List[Violation]
                 f"BDD-NN.SS.01_{{}}, BDD-NN.SS.02_{{}}, etc."
             )
         )
-        return violations  # Don't continue if prohibited pattern found
-    
+        return violations, False, False  # Don't continue if prohibited pattern found
+
     if SINGLE_FILE_PATTERN.match(filename) and not (SECTION_ONLY_PATTERN.match(filename) or SUBSECTION_PATTERN.match(filename) or AGGREGATOR_PATTERN.match(filename)):
         violations.append(
             Violation(
@@ -151,13 +171,13 @@ def validate_section_based_file(path: Path, lines: List[str]) -> List[Violation]
                 f"BDD-NN.SS_{{}}.feature"
             )
         )
-        return violations
-    
+        return violations, False, False
+
     # Validate section-based pattern (one of 3 valid patterns)
     is_section_only = SECTION_ONLY_PATTERN.match(filename)
     is_subsection = SUBSECTION_PATTERN.match(filename)
     is_aggregator = AGGREGATOR_PATTERN.match(filename)
-    
+
     if not (is_section_only or is_subsection or is_aggregator):
         violations.append(
             Violation(
@@ -166,140 +186,237 @@ def validate_section_based_file(path: Path, lines: List[str]) -> List[Violation]
                 f"Use: BDD-NN.SS_{{}}.feature, BDD-NN.SS.mm_{{}}.feature, or BDD-NN.SS.00_{{}}.feature"
             )
         )
-        return violations
-    
-    # Aggregator-specific validation
-    if is_aggregator:
-        has_redirect_tag = any(REDIRECT_TAG_RE.search(l) for l in lines)
-        has_scenarios = any(SCENARIO_RE.search(l) for l in lines)
-        
-        if not has_redirect_tag:
-            violations.append(
-                Violation(path, 1, "ERROR", "Aggregator file (.00) missing required @redirect tag")
-            )
-        
-        if has_scenarios:
-            # Find first offending line for context
-            for i, l in enumerate(lines, 1):
-                if SCENARIO_RE.search(l):
-                    violations.append(
-                        Violation(
-                            path, i, "ERROR",
-                            "Aggregator file (.00) must have 0 scenarios (redirect stub only)"
-                        )
+        return violations, False, False
+
+    return violations, True, bool(is_aggregator)
+
+
+# =============================================================================
+# STREAMING CHECKS (Gherkin event subscribers)
+# =============================================================================
+
+class SuiteCheck(EventSubscriber):
+    """Base streaming check; collects violations for one feature file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.violations: List[Violation] = []
+
+
+class SectionMetadataCheck(SuiteCheck):
+    """
+    Aggregator rules (@redirect tag, 0 scenarios) and section metadata tags
+    (@section, @parent_doc, @index) required for all section-based files.
+    """
+
+    def __init__(self, path: Path, is_aggregator: bool):
+        super().__init__(path)
+        self.is_aggregator = is_aggregator
+        self.has_redirect_tag = False
+        self.first_scenario_line = 0
+        self.has_section_tag = False
+        self.has_parent_doc_tag = False
+        self.has_index_tag = False
+
+    def on_event(self, event: GherkinEvent):
+        if event.kind == EVENT_TAG:
+            text = event.text
+            self.has_redirect_tag = self.has_redirect_tag or bool(REDIRECT_TAG_RE.search(text))
+            self.has_section_tag = self.has_section_tag or bool(SECTION_TAG_RE.search(text))
+            self.has_parent_doc_tag = self.has_parent_doc_tag or bool(PARENT_DOC_TAG_RE.search(text))
+            self.has_index_tag = self.has_index_tag or bool(INDEX_TAG_RE.search(text))
+        elif (event.kind == EVENT_SCENARIO and event.keyword in SUITE_SCENARIO_KEYWORDS
+              and not self.first_scenario_line):
+            self.first_scenario_line = event.line
+
+    def finish(self):
+        path = self.path
+
+        # Aggregator-specific validation
+        if self.is_aggregator:
+            if not self.has_redirect_tag:
+                self.violations.append(
+                    Violation(path, 1, "ERROR", "Aggregator file (.00) missing required @redirect tag")
+                )
+            if self.first_scenario_line:
+                # Report first offending line for context
+                self.violations.append(
+                    Violation(
+                        path, self.first_scenario_line, "ERROR",
+                        "Aggregator file (.00) must have 0 scenarios (redirect stub only)"
                     )
-                    break
-    
-    # Validate section metadata tags (required for all .feature files)
-    has_section_tag = any(SECTION_TAG_RE.search(l) for l in lines)
-    has_parent_doc_tag = any(PARENT_DOC_TAG_RE.search(l) for l in lines)
-    has_index_tag = any(INDEX_TAG_RE.search(l) for l in lines)
-    
-    if not has_section_tag:
-        violations.append(
-            Violation(path, 1, "ERROR", "Missing required @section: N.S metadata tag")
-        )
-    if not has_parent_doc_tag:
-        violations.append(
-            Violation(path, 1, "ERROR", "Missing required @parent_doc: BDD-NN metadata tag")
-        )
-    if not has_index_tag:
-        violations.append(
-            Violation(path, 1, "ERROR", "Missing required @index: BDD-NN.0_index.md metadata tag")
-        )
-    
-    return violations
+                )
+
+        if not self.has_section_tag:
+            self.violations.append(
+                Violation(path, 1, "ERROR", "Missing required @section: N.S metadata tag")
+            )
+        if not self.has_parent_doc_tag:
+            self.violations.append(
+                Violation(path, 1, "ERROR", "Missing required @parent_doc: BDD-NN metadata tag")
+            )
+        if not self.has_index_tag:
+            self.violations.append(
+                Violation(path, 1, "ERROR", "Missing required @index: BDD-NN.0_index.md metadata tag")
+            )
+
 
+class SizeAndCountCheck(SuiteCheck):
+    """Max 500 lines per .feature file; max 12 scenarios per Feature block."""
 
-def check_size_and_counts(path: Path, lines: List[str]) -> List[Violation]:
-    v: List[Violation] = []
-    if len(lines) > 500:
-        v.append(Violation(path, 1, "ERROR", f"File exceeds 500 lines ({len(lines)})"))
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.line_count = 0
+        self.feature_line = 0
+        self.scenario_count = 0
+        self.block_violations: List[Violation] = []
 
-    # Count scenarios per Feature block
-    feature_starts: List[int] = [i for i, l in enumerate(lines) if FEATURE_RE.search(l)]
-    feature_starts.append(len(lines))  # sentinel to handle last block
+    def on_event(self, event: GherkinEvent):
+        self.line_count = event.line
+        if event.kind == EVENT_FEATURE:
+            self._close_block()
+            self.feature_line = event.line
+        elif event.kind == EVENT_SCENARIO and event.keyword in SUITE_SCENARIO_KEYWORDS and self.feature_line:
+            self.scenario_count += 1
 
-    for idx in range(len(feature_starts) - 1):
-        start = feature_starts[idx]
-        end = feature_starts[idx + 1]
-        block = lines[start:end]
-        scenario_count = sum(1 for l in block if SCENARIO_RE.search(l))
-        if scenario_count > 12:
-            v.append(
+    def _close_block(self):
+        if self.feature_line and self.scenario_count > 12:
+            self.block_violations.append(
                 Violation(
-                    path,
-                    start + 1,
+                    self.path,
+                    self.feature_line,
                     "ERROR",
-                    f"Feature block has {scenario_count} scenarios (>12)",
+                    f"Feature block has {self.scenario_count} scenarios (>12)",
                 )
             )
-    return v
+        self.scenario_count = 0
+
+    def finish(self):
+        self._close_block()
+        if self.line_count > 500:
+            self.violations.append(
+                Violation(self.path, 1, "ERROR", f"File exceeds 500 lines ({self.line_count})")
+            )
+        self.violations.extend(self.block_violations)
+
 
+class MarkdownTimezoneCheck(SuiteCheck):
+    """No Markdown headings and no ambiguous timezone abbreviations."""
 
-def check_markdown_and_timezone(path: Path, lines: List[str]) -> List[Violation]:
-    v: List[Violation] = []
-    for i, l in enumerate(lines, 1):
-        if MD_HEADING_RE.search(l):
-            v.append(Violation(path, i, "ERROR", "Markdown headings not allowed in .feature"))
-        if AMBIG_TZ_RE.search(l):
-            v.append(
+    def on_event(self, event: GherkinEvent):
+        if MD_HEADING_RE.search(event.raw):
+            self.violations.append(
+                Violation(self.path, event.line, "ERROR", "Markdown headings not allowed in .feature")
+            )
+        if AMBIG_TZ_RE.search(event.raw):
+            self.violations.append(
                 Violation(
-                    path,
-                    i,
+                    self.path,
+                    event.line,
                     "ERROR",
                     "Ambiguous timezone abbreviation found (use IANA timezone, e.g., America/New_York)",
                 )
             )
-    return v
 
 
-def check_thresholds(path: Path, lines: List[str], prd_root: Path) -> List[Violation]:
-    v: List[Violation] = []
-    content = "\n".join(lines)
+class ThresholdCheck(SuiteCheck):
+    """Raw durations/retries are discouraged; @threshold tags must resolve to a PRD registry."""
 
-    # Discourage raw durations / retries
-    for m in RAW_DURATION_RE.finditer(content):
-        # best-effort line number
-        ln = content[: m.start()].count("\n") + 1
-        v.append(
-            Violation(
-                path,
-                ln,
-                "ERROR",
-                "Raw duration found; replace with @threshold:PRD.NN.timeout.<key>",
-            )
-        )
-    for m in RAW_RETRY_RE.finditer(content):
-        ln = content[: m.start()].count("\n") + 1
-        v.append(
-            Violation(
-                path,
-                ln,
-                "ERROR",
-                "Raw retry count found; replace with @threshold:PRD.NN.retry.<key>",
-            )
-        )
+    def __init__(self, path: Path, registry: ThresholdRegistry):
+        super().__init__(path)
+        self.registry = registry
+        self.duration_violations: List[Violation] = []
+        self.retry_violations: List[Violation] = []
+        self.registry_violations: List[Violation] = []
 
-    # Verify threshold tag format and registry existence
-    for m in THRESHOLD_TAG_RE.finditer(content):
-        prd_num = m.group(1)  # zero-padded 2 digits
-        # Registry file pattern: docs/PRD/PRD-XX_*/PRD-XX_threshold_registry.md
-        candidates = list(prd_root.glob(f"PRD-{prd_num}_*/PRD-{prd_num}_threshold_registry.md"))
-        if not candidates:
-            ln = content[: m.start()].count("\n") + 1
-            v.append(
+    def on_event(self, event: GherkinEvent):
+        line = event.raw
+
+        # Discourage raw durations / retries
+        for _ in RAW_DURATION_RE.finditer(line):
+            self.duration_violations.append(
+                Violation(
+                    self.path,
+                    event.line,
+                    "ERROR",
+                    "Raw duration found; replace with @threshold:PRD.NN.timeout.<key>",
+                )
+            )
+        for _ in RAW_RETRY_RE.finditer(line):
+            self.retry_violations.append(
                 Violation(
-                    path,
-                    ln,
+                    self.path,
+                    event.line,
                     "ERROR",
-                    f"Threshold registry for PRD-{prd_num} not found under docs/PRD",
+                    "Raw retry count found; replace with @threshold:PRD.NN.retry.<key>",
                 )
             )
-    return v
 
+        # Verify threshold tag format and registry existence
+        if "@threshold" not in line:
+            return
+        for m in THRESHOLD_TAG_RE.finditer(line):
+            prd_num, key = m.group(1), m.group(2)  # zero-padded 2 digits, threshold key
+            if not self.registry.has_document("PRD", prd_num):
+                self.registry_violations.append(
+                    Violation(
+                        self.path,
+                        event.line,
+                        "ERROR",
+                        f"Threshold registry for PRD-{prd_num} not found under docs/PRD",
+                    )
+                )
+            elif (self.registry.has_definitions("PRD", prd_num)
+                  and self.registry.lookup("PRD", prd_num, key) is None):
+                self.registry_violations.append(
+                    Violation(
+                        self.path,
+                        event.line,
+                        "ERROR",
+                        f"Threshold PRD.{prd_num}.{key.lower()} not defined in PRD-{prd_num} threshold sources",
+                    )
+                )
 
-def validate(root: Path, prd_root: Path) -> List[Violation]:
+    def finish(self):
+        self.violations.extend(self.duration_violations)
+        self.violations.extend(self.retry_violations)
+        self.violations.extend(self.registry_violations)
+
+
+def validate_feature_file(path: Path, registry: ThresholdRegistry) -> List[Violation]:
+    """
+    Validate one .feature file in a single streaming pass.
+
+    File naming is checked up front; every content check then runs as a
+    Gherkin event subscriber, so the file is never held in memory.
+    """
+    # Section-based validation (pattern, metadata, aggregator rules)
+    violations, name_ok, is_aggregator = validate_section_file_name(path)
+
+    checks: List[SuiteCheck] = []
+    if name_ok:
+        checks.append(SectionMetadataCheck(path, is_aggregator))
+    checks.extend([
+        # Size and scenario count limits
+        SizeAndCountCheck(path),
+        # Markdown and timezone checks
+        MarkdownTimezoneCheck(path),
+        # Threshold validation
+        ThresholdCheck(path, registry),
+    ])
+
+    try:
+        # Suite keyword rules have always been case-insensitive
+        run_subscribers(stream_feature_file(path, ignore_case=True), checks)
+    except Exception as e:
+        return [Violation(path, 1, "ERROR", f"Failed to read file: {e}")]
+
+    for check in checks:
+        violations.extend(check.violations)
+    return violations
+
+
+def validate(root: Path, prd_root: Path, threshold_cache: Optional[Path] = None) -> List[Violation]:
     """
     Validate section-based BDD suite structure.
     
@@ -358,25 +475,12 @@ def validate(root: Path, prd_root: Path) -> List[Violation]:
                 )
             )
     
-    # Validate each .feature file
+    # Threshold registry index: built once, shared by every file's lookups
+    registry = build_threshold_registry(prd_root, cache_path=threshold_cache)
+
+    # Validate each .feature file (single streaming pass per file)
     for f in feature_files:
-        try:
-            lines = f.read_text(encoding="utf-8").splitlines()
-        except Exception as e:
-            violations.append(Violation(f, 1, "ERROR", f"Failed to read file: {e}"))
-            continue
-        
-        # Section-based validation (pattern, metadata, aggregator rules)
-        violations.extend(validate_section_based_file(f, lines))
-        
-        # Size and scenario count limits
-        violations.extend(check_size_and_counts(f, lines))
-        
-        # Markdown and timezone checks
-        violations.extend(check_markdown_and_timezone(f, lines))
-        
-        # Threshold validation
-        violations.extend(check_thresholds(f, lines, prd_root))
+        violations.extend(validate_feature_file(f, registry))
     
     return violations
 
@@ -393,12 +497,18 @@ def main() -> int:
         default="docs/PRD",
         help="Root directory for PRD threshold registries (default: docs/PRD)",
     )
+    parser.add_argument(
+        "--threshold-cache",
+        default=None,
+        help="JSON cache for the threshold registry index (reused while PRD file hashes match)",
+    )
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
     prd_root = Path(args.prd_root).resolve()
+    threshold_cache = Path(args.threshold_cache).resolve() if args.threshold_cache else None
 
-    v = validate(root, prd_root)
+    v = validate(root, prd_root, threshold_cache)
     if not v:
         print("✓ BDD validation passed (no violations)")
         return 0
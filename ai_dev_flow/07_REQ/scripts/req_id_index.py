@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Requirement ID Index - Layer 7
+
+Corpus-wide index of REQ document IDs, used for cross-file checks that a
+per-file validator cannot do on its own:
+
+- Duplicate REQ-IDs (same ID declared by more than one file)
+- ID gaps (missing REQ-NN numbers, missing REQ-NN.MM sub-numbers)
+- Out-of-order placement (REQ-NN.MM filed under another REQ-XX_* section)
+
+The index is built by scanning REQ files in parallel (one header extraction
+per file) and merging the results. With --index it is persisted as JSON
+(recording the corpus root its keys are relative to), conventionally at
+<project>/.autopilot_state/req_id_index.json. Entries are reused while a
+file's size and mtime are unchanged (and re-parsed only if its SHA-256
+changed), so validating a single REQ file refreshes one entry and checks
+global uniqueness without rescanning the rest.
+
+Usage:
+    from req_id_index import build_req_index, load_req_index
+
+    index = build_req_index(
+        Path("docs/07_REQ"),
+        index_path=Path(".autopilot_state/req_id_index.json"),
+    )
+    print(index.duplicates())
+
+    python req_id_index.py docs/07_REQ [--index FILE] [--jobs N] [--json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Bump when extraction output changes so stale index entries are ignored
+REQ_INDEX_VERSION = 2
+
+# Conventional index location below a project root (found by find_index_file)
+DEFAULT_INDEX_PATH = Path(".autopilot_state") / "req_id_index.json"
+
+# Header forms that declare a document's REQ-ID (first match wins)
+REQ_ID_HEADER_PATTERNS = [
+    re.compile(r"^##?\s*(REQ-\d{2,}(?:\.\d{2,})*)", re.MULTILINE),  # ## REQ-01.01 or # REQ-01.01
+    re.compile(r"^\*\*ID\*\*:\s*(REQ-\d{2,}(?:\.\d{2,})*)", re.MULTILINE),  # **ID**: REQ-01.01
+    re.compile(r"^\|\s*\*\*ID\*\*\s*\|\s*(REQ-\d{2,}(?:\.\d{2,})*)", re.MULTILINE),  # | **ID** | REQ-01.01 |
+]
+
+SECTION_DIR_RE = re.compile(r"^REQ-(\d{2,})_")
+
+# Below this many files to parse, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def extract_req_id(content: str) -> str:
+    """Return the REQ-ID declared in a document header, or '' if none."""
+    for pattern in REQ_ID_HEADER_PATTERNS:
+        match = pattern.search(content)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def is_indexed_req_file(path: Path) -> bool:
+    """True for REQ documents that take part in ID validation."""
+    name = path.name
+    if "archived" in str(path).lower():
+        return False
+    if "TEMPLATE" in name:
+        return False
+    if "REQ-000" in name or "index" in name.lower():
+        return False
+    if "-REF-" in name:
+        return False  # REF documents get minimal validation only
+    return True
+
+
+def iter_req_files(directory: Path) -> Iterable[Path]:
+    """Yield REQ files under directory that take part in ID validation."""
+    for path in sorted(directory.rglob("REQ-*.md")):
+        if is_indexed_req_file(path):
+            yield path
+
+
+def parse_id_parts(req_id: str) -> Tuple[int, ...]:
+    """'REQ-08.03' -> (8, 3)"""
+    return tuple(int(part) for part in req_id.split("-", 1)[1].split("."))
+
+
+# =============================================================================
+# INDEX TYPES
+# =============================================================================
+
+@dataclass
+class IndexEntry:
+    """Indexed state of one REQ file."""
+    req_id: str
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class RequirementIndex:
+    """REQ-ID index over a corpus root, keyed by file path relative to root."""
+    root: Path
+    entries: Dict[str, IndexEntry] = field(default_factory=dict)
+
+    def key_for(self, path: Path) -> str:
+        """Index key for a file (relative to root when inside it)."""
+        resolved = path.resolve()
+        try:
+            return resolved.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(resolved)
+
+    def contains(self, path: Path) -> bool:
+        """True if path lies under the corpus root."""
+        return not Path(self.key_for(path)).is_absolute()
+
+    def path_for(self, key: str) -> Path:
+        """Filesystem path for an index key."""
+        path = Path(key)
+        return path if path.is_absolute() else self.root / path
+
+    def ids_to_files(self) -> Dict[str, List[str]]:
+        """REQ-ID -> index keys of the files declaring it (sorted)."""
+        mapping: Dict[str, List[str]] = {}
+        for key in sorted(self.entries):
+            req_id = self.entries[key].req_id
+            if req_id:
+                mapping.setdefault(req_id, []).append(key)
+        return mapping
+
+    def files_for_id(self, req_id: str) -> List[str]:
+        """Index keys of all files declaring req_id."""
+        return sorted(k for k, e in self.entries.items() if e.req_id == req_id)
+
+    def duplicates(self) -> Dict[str, List[str]]:
+        """REQ-IDs declared by more than one file."""
+        return {req_id: keys for req_id, keys in self.ids_to_files().items() if len(keys) > 1}
+
+    def unique_ids(self) -> List[str]:
+        """All declared REQ-IDs, in numeric order."""
+        return sorted(self.ids_to_files(), key=parse_id_parts)
+
+    def gaps(self) -> List[str]:
+        """
+        Missing IDs between the lowest and highest number at each level.
+
+        Top level: REQ-NN numbers (REQ-00 index excluded). Sub level: REQ-NN.MM
+        numbers within each REQ-NN group.
+        """
+        top: set = set()
+        subs: Dict[int, set] = {}
+        for req_id in self.ids_to_files():
+            parts = parse_id_parts(req_id)
+            top.add(parts[0])
+            if len(parts) >= 2:
+                subs.setdefault(parts[0], set()).add(parts[1])
+
+        missing: List[str] = []
+        if top:
+            for number in range(min(top), max(top) + 1):
+                if number not in top and number != 0:
+                    missing.append(f"REQ-{number:02d}")
+        for parent in sorted(subs):
+            numbers = subs[parent]
+            for number in range(min(numbers), max(numbers) + 1):
+                if number not in numbers:
+                    missing.append(f"REQ-{parent:02d}.{number:02d}")
+        return missing
+
+    def out_of_order(self) -> List[Tuple[str, str]]:
+        """
+        (key, req_id) for sub-requirements filed under another section.
+
+        REQ-NN.MM documents belong in the REQ-NN_* section directory; a file
+        declaring REQ-08.03 inside REQ-05_*/ breaks the hierarchical order.
+        """
+        misplaced: List[Tuple[str, str]] = []
+        for key in sorted(self.entries):
+            req_id = self.entries[key].req_id
+            if not req_id:
+                continue
+            parts = parse_id_parts(req_id)
+            if len(parts) < 2:
+                continue
+            for directory in reversed(Path(key).parts[:-1]):
+                match = SECTION_DIR_RE.match(directory)
+                if match:
+                    if int(match.group(1)) != parts[0]:
+                        misplaced.append((key, req_id))
+                    break
+        return misplaced
+
+
+# =============================================================================
+# SCANNING
+# =============================================================================
+
+def _scan_worker(path_str: str) -> Tuple[str, Optional[Dict]]:
+    """Read, hash and extract one file (module-level so it pickles)."""
+    path = Path(path_str)
+    try:
+        stat = path.stat()
+        raw = path.read_bytes()
+    except OSError:
+        return path_str, None
+    return path_str, {
+        "req_id": extract_req_id(raw.decode("utf-8", errors="replace")),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def _scan_files(paths: List[Path], jobs: int) -> Dict[str, Optional[Dict]]:
+    tasks = [str(p) for p in paths]
+    if jobs <= 1 or len(tasks) < PARALLEL_MIN_FILES:
+        return dict(_scan_worker(t) for t in tasks)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        return dict(pool.map(_scan_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+
+def _stat_matches(entry: IndexEntry, path: Path) -> bool:
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns
+
+
+def _merge_scan(index: RequirementIndex, path: Path, scanned: Optional[Dict], previous: Optional[IndexEntry]):
+    key = index.key_for(path)
+    if scanned is None:
+        index.entries.pop(key, None)
+        return
+    if previous and previous.sha256 == scanned["sha256"]:
+        scanned["req_id"] = previous.req_id  # Touched but unchanged
+    index.entries[key] = IndexEntry(**scanned)
+
+
+# =============================================================================
+# PERSISTENCE
+# =============================================================================
+
+def load_req_index(index_path: Path, root: Optional[Path] = None) -> RequirementIndex:
+    """
+    Load a persisted index (empty if missing, unreadable or stale).
+
+    Args:
+        index_path: JSON index file
+        root: Corpus root the caller expects. An index recorded for another
+            root is treated as stale. Default: the root recorded in the
+            index, else the index file's directory.
+    """
+    expected_root = root.resolve() if root else None
+    index = RequirementIndex(root=expected_root or index_path.parent.resolve())
+    if not index_path.exists():
+        return index
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return index
+    if data.get("version") != REQ_INDEX_VERSION or not data.get("root"):
+        return index
+    stored_root = Path(data["root"])
+    if expected_root is not None and stored_root != expected_root:
+        return index
+    index.root = stored_root
+    for key, entry in data.get("files", {}).items():
+        try:
+            index.entries[key] = IndexEntry(**entry)
+        except TypeError:
+            continue
+    return index
+
+
+def save_req_index(index: RequirementIndex, index_path: Path):
+    """Atomically write the index (errors are ignored; the index is an optimization)."""
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(index_path.suffix + ".tmp")
+        tmp_path.write_text(
+            json.dumps({
+                "version": REQ_INDEX_VERSION,
+                "root": str(index.root),
+                "files": {k: asdict(e) for k, e in sorted(index.entries.items())},
+            }, indent=2),
+            encoding="utf-8",
+        )
+        tmp_path.replace(index_path)
+    except OSError:
+        pass
+
+
+def find_index_file(start: Path) -> Optional[Path]:
+    """Nearest DEFAULT_INDEX_PATH at or above start (for single-file validation)."""
+    directory = start if start.is_dir() else start.parent
+    for candidate_dir in [directory, *directory.parents]:
+        candidate = candidate_dir / DEFAULT_INDEX_PATH
+        if candidate.exists():
+            return candidate
+    return None
+
+
+# =============================================================================
+# BUILD / UPDATE
+# =============================================================================
+
+def build_req_index(directory: Path, index_path: Optional[Path] = None, jobs: int = 1) -> RequirementIndex:
+    """
+    Build the REQ-ID index for every REQ file under directory.
+
+    Files whose size and mtime match the persisted entry are not read; the
+    rest are scanned (in a process pool when jobs > 1) and merged. Entries
+    for deleted files are dropped.
+
+    Args:
+        directory: Corpus root
+        index_path: Optional JSON index to reuse and update
+        jobs: Worker processes for scanning (1 = serial)
+
+    Returns:
+        RequirementIndex covering exactly the current REQ files
+    """
+    root = directory.resolve()
+    previous = load_req_index(index_path, root) if index_path else RequirementIndex(root=root)
+    index = RequirementIndex(root=root)
+
+    to_scan: List[Path] = []
+    for path in iter_req_files(directory):
+        key = index.key_for(path)
+        entry = previous.entries.get(key)
+        if entry and _stat_matches(entry, path):
+            index.entries[key] = entry
+        else:
+            to_scan.append(path)
+
+    for path_str, scanned in _scan_files(to_scan, jobs).items():
+        path = Path(path_str)
+        _merge_scan(index, path, scanned, previous.entries.get(index.key_for(path)))
+
+    if index_path and index.entries != previous.entries:
+        save_req_index(index, index_path)
+
+    return index
+
+
+def update_req_index(index: RequirementIndex, path: Path, index_path: Optional[Path] = None) -> Optional[IndexEntry]:
+    """
+    Refresh a single file's entry and persist the index.
+
+    A file outside the corpus root is indexed in memory only, so it takes
+    part in the checks without adding an absolute-path key to the file.
+
+    Returns:
+        The file's entry, or None if it could not be read
+    """
+    key = index.key_for(path)
+    previous = index.entries.get(key)
+    if previous and _stat_matches(previous, path):
+        return previous
+    _, scanned = _scan_worker(str(path))
+    _merge_scan(index, path, scanned, previous)
+    if index_path and index.contains(path) and index.entries.get(key) != previous:
+        save_req_index(index, index_path)
+    return index.entries.get(key)
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the corpus-wide REQ-ID index")
+    parser.add_argument("directory", type=Path, help="Root directory of REQ documents")
+    parser.add_argument("--index", type=Path,
+                        help=f"Persist the index to this file and reuse it (e.g. <project>/{DEFAULT_INDEX_PATH})")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for scanning (default: CPU count)")
+    parser.add_argument("--json", action="store_true", help="Print the index as JSON")
+    args = parser.parse_args()
+
+    if not args.directory.is_dir():
+        print(f"Error: Directory not found: {args.directory}", file=sys.stderr)
+        return 2
+
+    index = build_req_index(args.directory, index_path=args.index, jobs=args.jobs)
+
+    if args.json:
+        print(json.dumps({
+            "ids": index.ids_to_files(),
+            "duplicates": index.duplicates(),
+            "gaps": index.gaps(),
+            "out_of_order": [{"file": k, "req_id": r} for k, r in index.out_of_order()],
+        }, indent=2))
+        return 0
+
+    print(f"Files indexed: {len(index.entries)}")
+    print(f"Unique REQ-IDs: {len(index.ids_to_files())}")
+    for req_id, keys in sorted(index.duplicates().items()):
+        print(f"Duplicate {req_id}: {', '.join(keys)}")
+    gaps = index.gaps()
+    if gaps:
+        print(f"ID gaps: {', '.join(gaps)}")
+    for key, req_id in index.out_of_order():
+        print(f"Out of order: {req_id} filed at {key}")
+    return 1 if index.duplicates() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
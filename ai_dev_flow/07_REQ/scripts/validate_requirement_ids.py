@@ -7,8 +7,8 @@ Ensures:
 - REQ-NN ID format compliance
 - Filename matches document ID
 - V2 mandatory sections present
-- No duplicate REQ-IDs
-- Proper hierarchical organization
+- No duplicate REQ-IDs (checked against the corpus-wide REQ-ID index)
+- Proper hierarchical organization (ID gaps, out-of-order placement)
 - ID pattern consistency (IDPAT-E001 to IDPAT-W001)
 - Element code validation (ELEM-E001, ELEM-W001)
 
@@ -17,6 +17,13 @@ Usage:
     python validate_requirement_ids.py --req-file REQ/api/REQ-01.md
     python validate_requirement_ids.py --directory REQ/ --check-v2-sections
     python validate_requirement_ids.py --directory docs/ --check-id-patterns
+    python validate_requirement_ids.py --directory REQ/ --jobs 8 \
+        --index .autopilot_state/req_id_index.json
+
+Directory runs build the REQ-ID index in memory; with --index it is persisted
+and reused. Single-file runs use --index or the nearest
+.autopilot_state/req_id_index.json above the file, refresh that one entry,
+and check global uniqueness without rescanning the corpus.
 
 Error Codes:
 - IDPAT-E001: Inconsistent document ID format
@@ -28,6 +35,7 @@ Error Codes:
 """
 
 import argparse
+import os
 import re
 import sys
 from pathlib import Path
@@ -42,6 +50,17 @@ SHARED_SCRIPTS_DIR = SCRIPT_DIR.parents[1] / "scripts"
 sys.path.insert(0, str(SHARED_SCRIPTS_DIR))
 sys.path.insert(0, str(SCRIPT_DIR))
 
+from req_id_index import (
+    DEFAULT_INDEX_PATH,
+    RequirementIndex,
+    build_req_index,
+    extract_req_id,
+    find_index_file,
+    iter_req_files,
+    load_req_index,
+    update_req_index,
+)
+
 try:
     from error_codes import format_error, calculate_exit_code
 except ImportError:
@@ -175,6 +194,13 @@ class RequirementIDValidator:
         self.check_element_codes = check_element_codes
         self.seen_ids: Set[str] = set()
         self.id_to_files: Dict[str, List[Path]] = defaultdict(list)
+        self.index: Optional[RequirementIndex] = None
+        self._index_ids: Dict[str, List[str]] = {}
+
+    def use_index(self, index: RequirementIndex) -> None:
+        """Check uniqueness against a corpus-wide REQ-ID index."""
+        self.index = index
+        self._index_ids = index.ids_to_files()
 
     def validate_file(self, file_path: Path) -> ValidationResult:
         """Validate a single REQ file."""
@@ -245,17 +271,9 @@ class RequirementIDValidator:
 
     def _extract_req_id(self, content: str, result: ValidationResult) -> str:
         """Extract REQ-ID from document header."""
-        # Look for ## REQ-NN: Title or # REQ-NN: Title
-        id_patterns = [
-            r"^##?\s*(REQ-\d{2,}(?:\.\d{2,})*)",  # ## REQ-01.01 or # REQ-01.01
-            r"^\*\*ID\*\*:\s*(REQ-\d{2,}(?:\.\d{2,})*)",  # **ID**: REQ-01.01
-            r"^\|\s*\*\*ID\*\*\s*\|\s*(REQ-\d{2,}(?:\.\d{2,})*)"  # | **ID** | REQ-01.01 |
-        ]
-
-        for pattern in id_patterns:
-            match = re.search(pattern, content, re.MULTILINE)
-            if match:
-                return match.group(1)
+        req_id = extract_req_id(content)
+        if req_id:
+            return req_id
 
         result.errors.append("REQ-ID not found in document header")
         return ""
@@ -294,9 +312,23 @@ class RequirementIDValidator:
         file_path: Path,
         result: ValidationResult
     ) -> None:
-        """Check for duplicate REQ-IDs."""
+        """Check for duplicate REQ-IDs (corpus-wide when an index is in use)."""
         self.id_to_files[req_id].append(file_path)
 
+        if self.index is not None:
+            self.seen_ids.add(req_id)
+            own_key = self.index.key_for(file_path)
+            others = [
+                key for key in self._index_ids.get(req_id, [])
+                if key != own_key and self.index.path_for(key).exists()
+            ]
+            if others:
+                result.errors.append(
+                    f"Duplicate REQ-ID: {req_id} also declared in {', '.join(others)}"
+                )
+                result.valid = False
+            return
+
         if req_id in self.seen_ids:
             result.errors.append(
                 f"Duplicate REQ-ID: {req_id} found in multiple files"
@@ -563,39 +595,48 @@ class RequirementIDValidator:
                 ))
                 result.valid = False
 
-    def validate_directory(self, directory: Path) -> List[ValidationResult]:
-        """Validate all REQ files in a directory."""
-        results = []
-
-        for req_file in directory.rglob("REQ-*.md"):
-            # Skip archived files
-            if "archived" in str(req_file).lower():
-                continue
-
-            # Skip templates
-            if "TEMPLATE" in req_file.name:
-                continue
-
-            # Skip index files
-            if "REQ-000" in req_file.name or "index" in req_file.name.lower():
-                continue
+    def validate_directory(
+        self,
+        directory: Path,
+        index_path: Optional[Path] = None,
+        jobs: int = 1
+    ) -> List[ValidationResult]:
+        """
+        Validate all REQ files in a directory.
 
-            # Skip REF documents (minimal validation only)
-            if "-REF-" in req_file.name:
-                continue
+        The REQ-ID index is built first (in parallel, reusing index_path when
+        given) so duplicates are detected across the whole corpus.
+        """
+        self.use_index(build_req_index(directory, index_path=index_path, jobs=jobs))
 
-            result = self.validate_file(req_file)
-            results.append(result)
+        results = [self.validate_file(req_file) for req_file in iter_req_files(directory)]
 
         # Report duplicate IDs
-        for req_id, files in self.id_to_files.items():
-            if len(files) > 1:
-                print(f"\n❌ DUPLICATE ID: {req_id} found in:")
-                for file_path in files:
-                    print(f"    - {file_path}")
+        for req_id, keys in sorted(self.index.duplicates().items()):
+            print(f"\n❌ DUPLICATE ID: {req_id} found in:")
+            for key in keys:
+                print(f"    - {self.index.path_for(key)}")
 
         return results
 
+    def validate_single_file(
+        self,
+        file_path: Path,
+        index_path: Optional[Path] = None
+    ) -> ValidationResult:
+        """
+        Validate one REQ file against the persisted corpus index.
+
+        Only this file's index entry is refreshed; other files are not read.
+        Without an index, uniqueness cannot be checked beyond the file itself.
+        """
+        index_path = index_path or find_index_file(file_path.resolve())
+        if index_path:
+            index = load_req_index(index_path)
+            update_req_index(index, file_path, index_path=index_path)
+            self.use_index(index)
+        return self.validate_file(file_path)
+
     def print_report(self, results: List[ValidationResult]) -> None:
         """Print validation report."""
         print("\n" + "=" * 80)
@@ -608,22 +649,21 @@ class RequirementIDValidator:
         print(f"Total Files: {len(results)}")
         print(f"Valid: {len(valid)}")
         print(f"Invalid: {len(invalid)}")
-        print(f"Unique REQ-IDs: {len(self.seen_ids)}\n")
-
-        # Check for ID gaps
-        id_numbers = sorted([
-            int(req_id.split('-')[1].split('.')[0])
-            for req_id in self.seen_ids
-        ])
-
-        if id_numbers:
-            gaps = []
-            for i in range(id_numbers[0], id_numbers[-1] + 1):
-                if i not in id_numbers and i != 0:  # Skip REQ-000 (index)
-                    gaps.append(i)
+        if self.index is not None:
+            print(f"Unique REQ-IDs: {len(self._index_ids)} (corpus index: {len(self.index.entries)} files)\n")
 
+            gaps = self.index.gaps()
             if gaps:
-                print(f"⚠️  ID Gaps: REQ-{', REQ-'.join(f'{g:03d}' for g in gaps)}\n")
+                print(f"⚠️  ID Gaps: {', '.join(gaps)}\n")
+
+            misplaced = self.index.out_of_order()
+            if misplaced:
+                print("⚠️  Out-of-order IDs (filed under another section):")
+                for key, req_id in misplaced:
+                    print(f"    {req_id}: {key}")
+                print()
+        else:
+            print(f"Unique REQ-IDs: {len(self.seen_ids)}\n")
 
         # Detailed results
         for result in results:
@@ -683,6 +723,23 @@ def main():
         action="store_true",
         help="Run all validation checks"
     )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        help=f"Persist and reuse the REQ-ID index in this file (e.g. <project>/{DEFAULT_INDEX_PATH}; "
+             "single-file runs default to the nearest such index above the file)"
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Do not read or persist the REQ-ID index"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for building the REQ-ID index (default: CPU count)"
+    )
 
     args = parser.parse_args()
 
@@ -701,9 +758,13 @@ def main():
     )
 
     if args.req_file:
-        results = [validator.validate_file(args.req_file)]
+        if args.no_index:
+            results = [validator.validate_file(args.req_file)]
+        else:
+            results = [validator.validate_single_file(args.req_file, index_path=args.index)]
     else:
-        results = validator.validate_directory(args.directory)
+        index_path = None if args.no_index else args.index
+        results = validator.validate_directory(args.directory, index_path=index_path, jobs=args.jobs)
 
     if not results:
         print("No REQ files found to validate")
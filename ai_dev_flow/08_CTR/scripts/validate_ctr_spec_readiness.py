@@ -14,6 +14,11 @@ Scores CTR files on completeness (0-100%) based on presence of:
 - Concrete, domain-specific examples
 - Diagrams (state/sequence)
 
+The companion .yaml file (dual-format CTR) is also checked against the
+compiled structural schema from CTR_MVP_SCHEMA.yaml (yaml_schema section):
+OpenAPI 3.x, JSON Schema, AsyncAPI, or the CTR-MVP-TEMPLATE.yaml layout.
+Structural errors are reported with their JSON Pointer location.
+
 Usage:
     python validate_ctr_spec_readiness.py --ctr-file docs/08_CTR/CTR-01_iam.md
     python validate_ctr_spec_readiness.py --directory docs/08_CTR/ --min-score 90
@@ -23,9 +28,59 @@ import argparse
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
+import yaml
+
+# Add shared scripts directory to path (2 levels up + scripts)
+SCRIPT_DIR = Path(__file__).resolve().parent
+SHARED_SCRIPTS_DIR = SCRIPT_DIR.parents[1] / "scripts"
+sys.path.insert(0, str(SHARED_SCRIPTS_DIR))
+
+from schema_compiler import compile_schema
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Companion YAML shapes accepted by CTR_MVP_SCHEMA.yaml (yaml_schema section)
+CTR_COMPANION_SCHEMA = {
+    "anyOf": [
+        {   # OpenAPI 3.0.x / 3.1.x
+            "type": "object",
+            "required": ["openapi", "info", "paths", "components"],
+            "properties": {
+                "openapi": {"type": "string", "pattern": r"^3\.[01]\."},
+                "info": {"type": "object", "required": ["title", "version", "description"]},
+                "paths": {"type": "object", "minProperties": 1},
+                "components": {"type": "object", "required": ["schemas"]},
+            },
+        },
+        {   # JSON Schema
+            "type": "object",
+            "required": ["$schema", "title", "type", "properties"],
+        },
+        {   # AsyncAPI
+            "type": "object",
+            "required": ["asyncapi", "info", "channels"],
+        },
+        {   # CTR-MVP-TEMPLATE.yaml layout
+            "type": "object",
+            "required": ["id", "title", "document_control", "contract_endpoints"],
+            "properties": {
+                "contract_endpoints": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {"type": "object", "required": ["endpoint_id", "path", "method"]},
+                },
+            },
+        },
+    ],
+}
+
+# Compiled once per process; reused for every CTR file
+CTR_COMPANION_VALIDATOR = compile_schema(CTR_COMPANION_SCHEMA)
+
 
 @dataclass
 class ValidationResult:
@@ -110,6 +165,9 @@ class CTRSpecReadinessValidator:
         result.checks["concrete_examples"] = self._check_concrete_examples(content, result)
         result.checks["diagrams"] = bool(re.search(self.STATE_DIAGRAM_PATTERN, content))
 
+        # Companion YAML structure (not scored; structural errors block)
+        self._check_companion_yaml(file_path, result)
+
         # Score: 10 points per true check
         result.score = sum(10 for ok in result.checks.values() if ok)
         if result.errors:
@@ -119,6 +177,25 @@ class CTRSpecReadinessValidator:
 
         return result
 
+    def _find_companion_yaml(self, file_path: Path) -> Optional[Path]:
+        for suffix in (".yaml", ".yml"):
+            candidate = file_path.with_suffix(suffix)
+            if candidate != file_path and candidate.exists():
+                return candidate
+        return None
+
+    def _check_companion_yaml(self, file_path: Path, result: ValidationResult) -> None:
+        companion = self._find_companion_yaml(file_path)
+        if companion is None:
+            return
+        try:
+            data = yaml.load(companion.read_text(encoding="utf-8"), Loader=YAML_SAFE_LOADER)
+        except (OSError, yaml.YAMLError) as e:
+            result.errors.append(f"Companion YAML {companion.name} could not be parsed: {e}")
+            return
+        for error in CTR_COMPANION_VALIDATOR(data):
+            result.errors.append(f"Companion YAML {companion.name} {error}")
+
     def _check_no_placeholders(self, content: str, result: ValidationResult) -> bool:
         # Remove code blocks to avoid counting example ellipses and placeholders inside code
         stripped = re.sub(r"```[\s\S]*?```", "", content)
@@ -10,6 +10,11 @@ Usage:
     python validate_spec.py <file_or_directory>
     python validate_spec.py /path/to/docs/SPEC
     python validate_spec.py /path/to/docs/SPEC/SPEC-01_example/SPEC-01_example.yaml
+    python validate_spec.py /path/to/docs/SPEC --readiness --min-score 90 --jobs 8
+
+With --readiness, each file is parsed once and both the structural checks and
+the implementation-readiness scoring run from that single parse. With
+--jobs N, directories are validated across a process pool of N workers.
 
 Exit Codes:
     0 = Pass (no errors, no warnings)
@@ -20,6 +25,8 @@ Exit Codes:
 import argparse
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -33,6 +40,11 @@ sys.path.insert(0, str(SHARED_SCRIPTS_DIR))
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from error_codes import Severity, calculate_exit_code, format_error
+from schema_compiler import ANY_NON_NULL, compile_schema
+from validate_spec_implementation_readiness import SPECImplementationReadinessValidator
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 # =============================================================================
@@ -99,6 +111,86 @@ REQUIRED_CUMULATIVE_TAGS = ["brd", "prd", "ears", "bdd", "adr", "sys", "req"]
 # Optional cumulative tags
 OPTIONAL_CUMULATIVE_TAGS = ["ctr"]
 
+# Structural schema (JSON-Schema subset, see scripts/schema_compiler.py).
+# x-code selects the error code reported for each subtree.
+SPEC_STRUCTURE_SCHEMA = {
+    "type": "object",
+    "x-code": "SPEC-E002",
+    "x-required-code": "SPEC-E002",
+    "required": REQUIRED_TOP_LEVEL,
+    "properties": {
+        **{name: {"type": ANY_NON_NULL} for name in REQUIRED_TOP_LEVEL},
+        "metadata": {
+            "type": "object",
+            "x-code": "SPEC-E003",
+            "required": REQUIRED_METADATA,
+            "properties": {
+                "version": {"type": "string", "pattern": SEMVER_PATTERN, "x-code": "SPEC-E004"},
+                "status": {"enum": VALID_STATUS, "x-code": "SPEC-E005"},
+            },
+        },
+        "traceability": {
+            "type": "object",
+            "x-code": "SPEC-E014",
+            "required": ["cumulative_tags"],
+            "properties": {
+                # Mapping of tag -> IDs, or a list of "@tag: ID" strings
+                "cumulative_tags": {"type": ["object", "array"], "x-code": "SPEC-E015"},
+            },
+        },
+        "interfaces": {
+            "type": "object",
+            "x-code": "SPEC-E008",
+            "required": ["classes"],
+            "properties": {
+                "classes": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {
+                        "required": ["methods"],
+                        "properties": {
+                            "methods": {"type": "array", "minItems": 1, "x-code": "SPEC-E009"},
+                        },
+                    },
+                },
+            },
+        },
+        "performance": {
+            "type": "object",
+            "x-code": "SPEC-E010",
+            "required": ["latency_targets"],
+            "properties": {
+                "latency_targets": {"type": "object", "minProperties": 1},
+            },
+        },
+        "security": {
+            "type": "object",
+            "x-code": "SPEC-E011",
+            "required": ["authentication", "authorization", "input_validation"],
+            "properties": {
+                "authentication": {"required": ["required"]},
+                "authorization": {"required": ["enabled"]},
+                "input_validation": {"required": ["strategy"]},
+            },
+        },
+        "observability": {
+            "type": "object",
+            "x-code": "SPEC-E012",
+            "required": ["metrics", "logging", "health_checks"],
+            "properties": {
+                "metrics": {
+                    "required": ["standard_metrics"],
+                    "properties": {"standard_metrics": {"minItems": 1}},
+                },
+                "health_checks": {"required": ["enabled"]},
+            },
+        },
+    },
+}
+
+# Compiled once per process; reused for every SPEC file
+SPEC_STRUCTURE_VALIDATOR = compile_schema(SPEC_STRUCTURE_SCHEMA)
+
 
 # =============================================================================
 # VALIDATION RESULT TYPES
@@ -153,14 +245,27 @@ def parse_yaml_file(file_path: Path) -> Tuple[Optional[Dict], Optional[str]]:
     Returns:
         Tuple of (parsed dict or None, error message or None)
     """
+    _, data, error = load_spec_file(file_path)
+    return data, error
+
+
+def load_spec_file(file_path: Path) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """
+    Read and parse a SPEC file once (C-accelerated loader when available).
+
+    Returns:
+        Tuple of (raw content, parsed dict or None, error message or None)
+    """
     try:
         content = file_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
-        return data, None
+    except Exception as e:
+        return "", None, str(e)
+    try:
+        return content, yaml.load(content, Loader=YAML_SAFE_LOADER), None
     except yaml.YAMLError as e:
-        return None, f"YAML syntax error: {e}"
+        return content, None, f"YAML syntax error: {e}"
     except Exception as e:
-        return None, str(e)
+        return content, None, str(e)
 
 
 def get_nested(data: Dict, *keys, default=None) -> Any:
@@ -207,22 +312,17 @@ def validate_file_extension(file_path: Path, result: ValidationResult) -> bool:
     return True
 
 
-def validate_top_level_fields(data: Dict, result: ValidationResult):
-    """Validate required top-level fields."""
-    if not isinstance(data, dict):
-        result.add_error("SPEC-E002", "Document root must be a YAML mapping")
-        return
-
-    for field in REQUIRED_TOP_LEVEL:
-        if field not in data or data[field] is None:
-            result.add_error("SPEC-E002", f"Missing required top-level field: {field}")
+def validate_structure(data: Any, result: ValidationResult):
+    """Validate document shape against the compiled SPEC structure schema."""
+    for error in SPEC_STRUCTURE_VALIDATOR(data):
+        result.add_error(error.code or "SPEC-E002", str(error))
 
 
 def validate_id_field(data: Dict, file_path: Path, result: ValidationResult):
     """Validate id field format and match with filename."""
     spec_id = data.get("id")
     if not spec_id:
-        return  # Already caught by top-level validation
+        return  # Already caught by structure validation
 
     if not re.match(ID_PATTERN, str(spec_id)):
         result.add_warning(
@@ -230,7 +330,6 @@ def validate_id_field(data: Dict, file_path: Path, result: ValidationResult):
             f"id '{spec_id}' should be snake_case (lowercase with underscores)"
         )
 
-    # Check if id matches filename slug
     # Check if id matches filename slug
     file_name = file_path.stem  # SPEC-01_component_name
     
@@ -250,34 +349,12 @@ def validate_id_field(data: Dict, file_path: Path, result: ValidationResult):
 
 
 def validate_metadata(data: Dict, result: ValidationResult):
-    """Validate metadata section."""
+    """Validate metadata values (shape, version and status are schema-checked)."""
     metadata = data.get("metadata")
     if not isinstance(metadata, dict):
-        result.add_error("SPEC-E003", "metadata must be a mapping")
-        return
+        return  # Already caught by structure validation
 
-    # Check required metadata fields
-    for field in REQUIRED_METADATA:
-        if field not in metadata or metadata[field] is None:
-            result.add_error("SPEC-E003", f"Missing required metadata field: {field}")
-
-    # Validate version format
-    version = metadata.get("version")
-    if version and not re.match(SEMVER_PATTERN, str(version)):
-        result.add_error(
-            "SPEC-E004",
-            f"Invalid version format: '{version}'. Expected MAJOR.MINOR.PATCH"
-        )
-
-    # Validate status
-    status = metadata.get("status")
-    if status and str(status) not in VALID_STATUS:
-        result.add_error(
-            "SPEC-E005",
-            f"Invalid status: '{status}'. Allowed: {', '.join(VALID_STATUS)}"
-        )
-
-    # Validate dates
+    # Validate dates (YAML may load unquoted dates as date objects)
     for date_field in ["created_date", "last_updated"]:
         date_value = metadata.get(date_field)
         if date_value and not re.match(DATE_PATTERN, str(date_value)):
@@ -295,24 +372,20 @@ def validate_metadata(data: Dict, result: ValidationResult):
     if not authors:
         result.add_error("SPEC-E007", "No authors specified in metadata")
     elif isinstance(authors, list):
-        if len(authors) == 0:
-            result.add_error("SPEC-E007", "authors list is empty")
-        else:
-            for i, author in enumerate(authors):
-                if isinstance(author, dict):
-                    if not author.get("name"):
-                        result.add_warning(
-                            "SPEC-W006",
-                            f"Author at index {i} missing 'name' field"
-                        )
+        for i, author in enumerate(authors):
+            if isinstance(author, dict):
+                if not author.get("name"):
+                    result.add_warning(
+                        "SPEC-W006",
+                        f"Author at index {i} missing 'name' field"
+                    )
 
 
 def validate_traceability(data: Dict, result: ValidationResult):
     """Validate traceability section with cumulative tags."""
     traceability = data.get("traceability")
     if not isinstance(traceability, dict):
-        result.add_error("SPEC-E014", "traceability must be a mapping")
-        return
+        return  # Already caught by structure validation
 
     # Check for upstream_sources
     upstream = traceability.get("upstream_sources")
@@ -324,9 +397,7 @@ def validate_traceability(data: Dict, result: ValidationResult):
 
     # Check for cumulative_tags
     cumulative_tags = traceability.get("cumulative_tags")
-    if not cumulative_tags:
-        result.add_error("SPEC-E015", "Missing cumulative_tags in traceability")
-    elif isinstance(cumulative_tags, dict):
+    if isinstance(cumulative_tags, dict) and cumulative_tags:
         missing_tags = []
         for tag in REQUIRED_CUMULATIVE_TAGS:
             if tag not in cumulative_tags or not cumulative_tags[tag]:
@@ -340,24 +411,10 @@ def validate_traceability(data: Dict, result: ValidationResult):
 
 
 def validate_interfaces(data: Dict, result: ValidationResult):
-    """Validate interfaces section."""
-    interfaces = data.get("interfaces")
-    if not isinstance(interfaces, dict):
-        result.add_error("SPEC-E008", "interfaces must be a mapping")
-        return
-
-    classes = interfaces.get("classes")
-    if not classes:
-        result.add_error("SPEC-E008", "No classes defined in interfaces section")
-        return
-
+    """Validate interface naming conventions (shape is schema-checked)."""
+    classes = get_nested(data, "interfaces", "classes")
     if not isinstance(classes, list):
-        result.add_error("SPEC-E008", "interfaces.classes must be an array")
-        return
-
-    if len(classes) == 0:
-        result.add_error("SPEC-E008", "interfaces.classes array is empty")
-        return
+        return  # Already caught by structure validation
 
     # Validate each class
     for i, cls in enumerate(classes):
@@ -374,17 +431,10 @@ def validate_interfaces(data: Dict, result: ValidationResult):
                 f"Class name '{class_name}' not in PascalCase format"
             )
 
-        # Check for methods
+        # Validate method names
         methods = cls.get("methods")
-        if not methods:
-            result.add_error("SPEC-E009", f"Class '{class_name}' has no methods defined")
-            continue
-
-        if not isinstance(methods, list) or len(methods) == 0:
-            result.add_error("SPEC-E009", f"Class '{class_name}' has no methods defined")
+        if not isinstance(methods, list):
             continue
-
-        # Validate method names
         for method in methods:
             if isinstance(method, dict):
                 method_name = method.get("name", "")
@@ -396,17 +446,9 @@ def validate_interfaces(data: Dict, result: ValidationResult):
 
 
 def validate_performance(data: Dict, result: ValidationResult):
-    """Validate performance section."""
-    performance = data.get("performance")
-    if not isinstance(performance, dict):
-        result.add_error("SPEC-E010", "performance must be a mapping")
-        return
-
-    # Check latency_targets
-    latency = performance.get("latency_targets")
-    if not latency:
-        result.add_error("SPEC-E010", "Missing latency_targets in performance section")
-    elif isinstance(latency, dict):
+    """Validate performance latency targets (presence is schema-checked)."""
+    latency = get_nested(data, "performance", "latency_targets")
+    if isinstance(latency, dict) and latency:
         # Relaxed check: Accept if keys contain p50/p95/p99 or if strict keys exist
         keys = latency.keys()
         has_p50 = "p50_milliseconds" in keys or any("p50" in k.lower() for k in keys)
@@ -439,73 +481,14 @@ def validate_performance(data: Dict, result: ValidationResult):
                     pass
 
 
-def validate_security(data: Dict, result: ValidationResult):
-    """Validate security section."""
-    security = data.get("security")
-    if not isinstance(security, dict):
-        result.add_error("SPEC-E011", "security must be a mapping")
-        return
-
-    # Check authentication
-    auth = security.get("authentication")
-    if not auth:
-        result.add_error("SPEC-E011", "Missing authentication specification in security section")
-    elif isinstance(auth, dict):
-        if "required" not in auth:
-            result.add_error("SPEC-E011", "authentication.required must be specified")
-
-    # Check authorization
-    authz = security.get("authorization")
-    if not authz:
-        result.add_error("SPEC-E011", "Missing authorization specification in security section")
-    elif isinstance(authz, dict):
-        if "enabled" not in authz:
-            result.add_error("SPEC-E011", "authorization.enabled must be specified")
-
-    # Check input_validation
-    input_val = security.get("input_validation")
-    if not input_val:
-        result.add_error("SPEC-E011", "Missing input_validation specification in security section")
-    elif isinstance(input_val, dict):
-        if "strategy" not in input_val:
-            result.add_error("SPEC-E011", "input_validation.strategy must be specified")
-
-
 def validate_observability(data: Dict, result: ValidationResult):
-    """Validate observability section."""
-    observability = data.get("observability")
-    if not isinstance(observability, dict):
-        result.add_error("SPEC-E012", "observability must be a mapping")
-        return
-
-    # Check metrics
-    metrics = observability.get("metrics")
-    if not metrics:
-        result.add_error("SPEC-E012", "Missing metrics in observability section")
-    elif isinstance(metrics, dict):
-        standard_metrics = metrics.get("standard_metrics")
-        if not standard_metrics or (isinstance(standard_metrics, list) and len(standard_metrics) == 0):
-            result.add_error("SPEC-E012", "At least one standard_metric must be defined")
-
-    # Check logging
-    logging_config = observability.get("logging")
-    if not logging_config:
-        result.add_error("SPEC-E012", "Missing logging in observability section")
-    elif isinstance(logging_config, dict):
-        level = logging_config.get("level")
-        if level and str(level) not in ["DEBUG", "INFO", "WARN", "ERROR"]:
-            result.add_warning(
-                "SPEC-W006",
-                f"logging.level '{level}' not standard (DEBUG/INFO/WARN/ERROR)"
-            )
-
-    # Check health_checks
-    health = observability.get("health_checks")
-    if not health:
-        result.add_error("SPEC-E012", "Missing health_checks in observability section")
-    elif isinstance(health, dict):
-        if "enabled" not in health:
-            result.add_error("SPEC-E012", "health_checks.enabled must be specified")
+    """Validate observability values (shape is schema-checked)."""
+    level = get_nested(data, "observability", "logging", "level")
+    if level and str(level) not in ["DEBUG", "INFO", "WARN", "ERROR"]:
+        result.add_warning(
+            "SPEC-W006",
+            f"logging.level '{level}' not standard (DEBUG/INFO/WARN/ERROR)"
+        )
 
 
 def validate_verification(data: Dict, result: ValidationResult):
@@ -565,50 +548,111 @@ def validate_spec_file(file_path: Path) -> ValidationResult:
     Returns:
         ValidationResult with all issues found
     """
+    result, _, _ = _check_and_load(file_path)
+    return result
+
+
+def _check_and_load(file_path: Path) -> Tuple[ValidationResult, str, Optional[Dict]]:
+    """
+    Run all structural checks, returning the result plus the parsed document.
+
+    Returns:
+        Tuple of (ValidationResult, raw content, parsed dict or None when
+        the file could not be loaded)
+    """
     result = ValidationResult(str(file_path))
 
     # Check file exists
     if not file_path.exists():
         result.add_error("VAL-E001", "File not found")
-        return result
+        return result, "", None
 
     # Check file extension
     if not validate_file_extension(file_path, result):
-        return result
+        return result, "", None
 
     # Validate file name
     validate_file_name(file_path, result)
 
-    # Read content for cross-linking detection
-    try:
-        content = file_path.read_text(encoding="utf-8")
-    except Exception:
-        content = ""
-
-    # Parse YAML
-    data, error = parse_yaml_file(file_path)
+    # Read and parse YAML once; content is reused for cross-linking detection
+    content, data, error = load_spec_file(file_path)
     if error:
         result.add_error("SPEC-E001", f"Invalid YAML: {error}")
-        return result
+        return result, content, None
 
     if not data:
         result.add_error("SPEC-E001", "Empty YAML document")
-        return result
+        return result, content, data
+
+    # Structural checks (compiled schema), then value-level checks
+    validate_structure(data, result)
+    if not isinstance(data, dict):
+        return result, content, data
 
-    # Run validations
-    validate_top_level_fields(data, result)
     validate_id_field(data, file_path, result)
     validate_metadata(data, result)
     validate_traceability(data, result)
     validate_interfaces(data, result)
     validate_performance(data, result)
-    validate_security(data, result)
     validate_observability(data, result)
     validate_verification(data, result)
     validate_optional_sections(data, result)
     validate_crosslinking_tags(content, result)
 
-    return result
+    return result, content, data
+
+
+def validate_spec_with_readiness(file_path: Path, min_score: int = 90):
+    """
+    Validate structure and score implementation readiness from one YAML parse.
+
+    Args:
+        file_path: Path to SPEC .yaml file
+        min_score: Minimum readiness score to pass
+
+    Returns:
+        Tuple of (ValidationResult, readiness ValidationResult)
+    """
+    result, content, data = _check_and_load(file_path)
+    readiness = SPECImplementationReadinessValidator(min_score=min_score)
+    if data is None and result.errors:
+        # Unreadable/invalid YAML: let the readiness scorer report it the usual way
+        return result, readiness.validate_file(file_path)
+    return result, readiness.validate_data(file_path, content, data)
+
+
+def _validate_worker(task: Tuple[Path, Optional[int]]):
+    """Process-pool entry point (module level so it can be pickled)."""
+    file_path, min_score = task
+    if min_score is None:
+        return validate_spec_file(file_path), None
+    return validate_spec_with_readiness(file_path, min_score)
+
+
+def validate_files(files: List[Path], min_score: Optional[int] = None, jobs: int = 1) -> List[Tuple]:
+    """
+    Validate many SPEC files, optionally across a process pool.
+
+    Falls back to validating in-process when a pool cannot be started.
+
+    Args:
+        files: SPEC files to validate
+        min_score: When set, also score implementation readiness
+        jobs: Worker processes (1 = serial)
+
+    Returns:
+        List of (ValidationResult, readiness result or None), in input order
+    """
+    tasks = [(f, min_score) for f in files]
+    if jobs <= 1 or len(tasks) <= 1:
+        return [_validate_worker(task) for task in tasks]
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            return list(pool.map(_validate_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+    except (OSError, BrokenProcessPool):
+        # e.g. no semaphore support in a sandbox; validate in-process instead
+        return [_validate_worker(task) for task in tasks]
 
 
 def validate_directory(dir_path: Path) -> List[ValidationResult]:
@@ -621,8 +665,11 @@ def validate_directory(dir_path: Path) -> List[ValidationResult]:
     Returns:
         List of ValidationResult for each file
     """
-    results = []
+    return [result for result, _ in validate_files(find_spec_files(dir_path))]
 
+
+def find_spec_files(dir_path: Path) -> List[Path]:
+    """Find SPEC YAML files in a directory (templates/indexes/archives excluded)."""
     # Find SPEC files
     patterns = ["SPEC-*.yaml", "SPEC-*.yml", "spec-*.yaml"]
     spec_files = []
@@ -648,16 +695,8 @@ def validate_directory(dir_path: Path) -> List[ValidationResult]:
 
     if not spec_files:
         print(f"[WARNING] VAL-W001: No SPEC files found in {dir_path}")
-        return results
-
-    for file_path in sorted(set(spec_files)):
-        # Skip template files
-        if "TEMPLATE" in file_path.name.upper():
-            continue
-        result = validate_spec_file(file_path)
-        results.append(result)
 
-    return results
+    return sorted(set(spec_files))
 
 
 # =============================================================================
@@ -674,6 +713,7 @@ Examples:
   python validate_spec.py /path/to/docs/SPEC
   python validate_spec.py /path/to/SPEC-01_example.yaml
   python validate_spec.py . --verbose
+  python validate_spec.py /path/to/docs/SPEC --readiness --jobs 8
         """
     )
 
@@ -692,6 +732,23 @@ Examples:
         action="store_true",
         help="Show verbose output including info messages"
     )
+    parser.add_argument(
+        "--readiness",
+        action="store_true",
+        help="Also score implementation readiness from the same YAML parse"
+    )
+    parser.add_argument(
+        "--min-score",
+        type=int,
+        default=90,
+        help="Minimum readiness score with --readiness (default: 90)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for directory validation (default: 1 = serial)"
+    )
 
     args = parser.parse_args()
 
@@ -701,10 +758,10 @@ Examples:
         return 2
 
     # Run validation
-    if args.path.is_file():
-        results = [validate_spec_file(args.path)]
-    else:
-        results = validate_directory(args.path)
+    files = [args.path] if args.path.is_file() else find_spec_files(args.path)
+    min_score = args.min_score if args.readiness else None
+    outcomes = validate_files(files, min_score=min_score, jobs=args.jobs)
+    results = [result for result, _ in outcomes]
 
     # Collect all issues
     all_errors = []
@@ -725,8 +782,18 @@ Examples:
         print(f"Warnings: {len(all_warnings)}")
         print(f"Status: {'PASS' if not all_errors else 'FAIL'}")
 
+    exit_code = calculate_exit_code(all_errors, all_warnings, args.strict)
+
+    if args.readiness and outcomes:
+        readiness_results = [readiness for _, readiness in outcomes]
+        SPECImplementationReadinessValidator(min_score=args.min_score).print_report(readiness_results)
+        if any(r.errors for r in readiness_results):
+            exit_code = max(exit_code, 2)
+        elif not all(r.passed for r in readiness_results):
+            exit_code = max(exit_code, 1)
+
     # Return exit code
-    return calculate_exit_code(all_errors, all_warnings, args.strict)
+    return exit_code
 
 
 if __name__ == "__main__":
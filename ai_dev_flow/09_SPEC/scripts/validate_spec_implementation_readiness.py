@@ -28,6 +28,9 @@ from pathlib import Path
 from typing import Dict, List
 from dataclasses import dataclass, field
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class ValidationResult:
@@ -63,7 +66,7 @@ class SPECImplementationReadinessValidator:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                spec_data = yaml.safe_load(content)
+                spec_data = yaml.load(content, Loader=YAML_SAFE_LOADER)
         except yaml.YAMLError as e:
             result.errors.append(f"Invalid YAML: {e}")
             return result
@@ -71,6 +74,12 @@ class SPECImplementationReadinessValidator:
             result.errors.append(f"File read error: {e}")
             return result
 
+        return self.validate_data(file_path, content, spec_data)
+
+    def validate_data(self, file_path: Path, content: str, spec_data) -> ValidationResult:
+        """Score an already-loaded SPEC (lets callers share a single YAML parse)."""
+        result = ValidationResult(file_path=file_path, score=0, passed=False)
+
         if not spec_data or not isinstance(spec_data, dict):
             result.errors.append("YAML is empty or not a dictionary")
             return result
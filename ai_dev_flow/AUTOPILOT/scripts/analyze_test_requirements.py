@@ -7,6 +7,7 @@ Part of Phase 2: TDD Awareness in MVP Autopilot.
 
 Usage:
     python analyze_test_requirements.py --test-dir tests/unit/ --output tmp/test_requirements.json
+    python analyze_test_requirements.py --test-dir tests/ --output tmp/test_requirements.json --jobs 8
     python analyze_test_requirements.py --test-file tests/unit/test_auth.py --output tmp/test_requirements.json
 
 Reference: IPLAN-001 Section 4.2.1
@@ -14,13 +15,23 @@ Reference: IPLAN-001 Section 4.2.1
 
 import argparse
 import ast
+import hashlib
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, asdict, replace
 from pathlib import Path
 from typing import Any, Optional
 
+# Bump when the analysis output changes; invalidates on-disk caches
+ANALYZER_VERSION = 2
+
+# Below this many files to (re-)analyze, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
 
 @dataclass
 class TraceabilityTags:
@@ -118,24 +129,12 @@ class TestRequirementAnalyzer:
         module_docstring = ast.get_docstring(tree)
         file_traceability = self._extract_traceability(module_docstring or "")
 
-        # Analyze test classes and functions
-        test_cases = []
-        required_classes = set()
-        all_required_methods = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name.startswith('Test'):
-                class_analysis = self._analyze_test_class(node, str(test_file))
-                test_cases.extend(class_analysis['test_cases'])
-                required_classes.update(class_analysis['required_classes'])
-                all_required_methods.extend(class_analysis['required_methods'])
-
-            elif isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                # Top-level test function (not in a class)
-                if not self._is_inside_class(tree, node):
-                    test_case = self._analyze_test_function(node, None, str(test_file))
-                    test_cases.append(test_case)
-                    all_required_methods.extend(test_case.required_methods)
+        # Analyze test classes and functions in a single traversal
+        visitor = _TestModuleVisitor(self, str(test_file))
+        visitor.visit(tree)
+        test_cases = visitor.test_cases
+        required_classes = visitor.required_classes
+        all_required_methods = [m for tc in test_cases for m in tc.required_methods]
 
         # Extract coverage targets from traceability
         coverage_targets = self._extract_coverage_targets(file_traceability, test_cases)
@@ -150,42 +149,19 @@ class TestRequirementAnalyzer:
             coverage_targets=coverage_targets
         )
 
-    def _analyze_test_class(self, class_node: ast.ClassDef, file_path: str) -> dict:
-        """Analyze a test class and its methods."""
-        test_cases = []
-        required_classes = set()
-        required_methods = []
-
-        class_docstring = ast.get_docstring(class_node)
-        class_traceability = self._extract_traceability(class_docstring or "")
-
-        for node in class_node.body:
-            if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                test_case = self._analyze_test_function(
-                    node, class_node.name, file_path, class_traceability
-                )
-                test_cases.append(test_case)
-                required_methods.extend(test_case.required_methods)
-
-            # Look for fixture methods that might indicate class dependencies
-            elif isinstance(node, ast.FunctionDef) and not node.name.startswith('_'):
-                classes = self._extract_class_references(node)
-                required_classes.update(classes)
-
-        return {
-            'test_cases': test_cases,
-            'required_classes': required_classes,
-            'required_methods': required_methods
-        }
-
-    def _analyze_test_function(
+    def _start_test_case(
         self,
         func_node: ast.FunctionDef,
         class_name: Optional[str],
-        file_path: str,
         inherited_traceability: Optional[TraceabilityTags] = None
     ) -> TestCase:
-        """Analyze a single test function."""
+        """
+        Create the TestCase for a test function.
+
+        Docstring, traceability, parametrize cases and test ID come from the
+        function node itself; calls, assertions and I/O hints are appended by
+        _TestModuleVisitor while it walks the body.
+        """
         docstring = ast.get_docstring(func_node)
         traceability = self._extract_traceability(docstring or "")
 
@@ -193,29 +169,16 @@ class TestRequirementAnalyzer:
         if inherited_traceability:
             traceability = self._merge_traceability(inherited_traceability, traceability)
 
-        # Extract method calls that look like production code
-        required_methods = self._extract_required_methods(func_node, file_path)
-
-        # Extract assertions for I/O hints
-        assertions = self._extract_assertions(func_node)
-        input_output_hints = self._derive_io_hints(func_node)
-
-        # Extract parametrized cases
-        parametrized = self._extract_parametrized_cases(func_node)
-
-        # Generate test ID
-        test_id = self._generate_test_id(func_node, traceability)
-
         return TestCase(
-            test_id=test_id,
+            test_id=self._generate_test_id(func_node, traceability),
             test_name=func_node.name,
             test_class=class_name,
             docstring=docstring,
             traceability=traceability,
-            required_methods=required_methods,
-            input_output_hints=input_output_hints,
-            assertions=assertions,
-            parametrized_cases=parametrized
+            required_methods=[],
+            input_output_hints=[],
+            assertions=[],
+            parametrized_cases=self._extract_parametrized_cases(func_node)
         )
 
     def _extract_traceability(self, text: str) -> TraceabilityTags:
@@ -252,31 +215,6 @@ class TestRequirementAnalyzer:
 
         return merged
 
-    def _extract_required_methods(
-        self,
-        func_node: ast.FunctionDef,
-        file_path: str
-    ) -> list[MethodSignature]:
-        """Extract method signatures from test code that need implementation."""
-        methods = []
-
-        for node in ast.walk(func_node):
-            # Look for method calls
-            if isinstance(node, ast.Call):
-                method_info = self._analyze_call(node, func_node.name)
-                if method_info:
-                    method_info.source_test = f"{file_path}::{func_node.name}"
-                    methods.append(method_info)
-
-            # Look for with pytest.raises() to identify expected exceptions
-            if isinstance(node, ast.Call) and self._is_pytest_raises(node):
-                exception_name = self._extract_exception_name(node)
-                if exception_name:
-                    # Find the associated method call inside the with block
-                    pass  # This would require more context analysis
-
-        return methods
-
     def _analyze_call(self, call_node: ast.Call, test_name: str) -> Optional[MethodSignature]:
         """Analyze a function/method call to extract signature."""
         # Skip common test framework calls
@@ -375,46 +313,6 @@ class TestRequirementAnalyzer:
             return 'object'
         return 'unknown'
 
-    def _extract_assertions(self, func_node: ast.FunctionDef) -> list[str]:
-        """Extract assertion statements as strings."""
-        assertions = []
-
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Assert):
-                try:
-                    assertions.append(ast.unparse(node.test))
-                except Exception:
-                    assertions.append("<complex assertion>")
-            elif isinstance(node, ast.Call):
-                name = self._get_call_name(node)
-                if name and 'assert' in name.lower():
-                    try:
-                        assertions.append(ast.unparse(node))
-                    except Exception:
-                        assertions.append(f"<{name}>")
-
-        return assertions
-
-    def _derive_io_hints(self, func_node: ast.FunctionDef) -> list[dict[str, Any]]:
-        """Derive input/output hints from test structure."""
-        hints = []
-
-        # Look for patterns like: result = func(input) / assert result == expected
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Assign):
-                # Simple assignment: result = func(...)
-                if len(node.targets) == 1 and isinstance(node.value, ast.Call):
-                    target_name = self._get_assign_target_name(node.targets[0])
-                    call_name = self._get_call_name(node.value)
-                    if target_name and call_name:
-                        hints.append({
-                            'call': call_name,
-                            'result_variable': target_name,
-                            'input_args': self._extract_call_params(node.value)
-                        })
-
-        return hints
-
     def _get_assign_target_name(self, target: ast.AST) -> Optional[str]:
         """Get the name of an assignment target."""
         if isinstance(target, ast.Name):
@@ -460,27 +358,6 @@ class TestRequirementAnalyzer:
 
         return cases
 
-    def _extract_class_references(self, node: ast.FunctionDef) -> set[str]:
-        """Extract class names referenced in function."""
-        classes = set()
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                name = self._get_call_name(child)
-                if name and name[0].isupper():  # Likely a class instantiation
-                    classes.add(name.split('.')[0])
-
-        return classes
-
-    def _is_inside_class(self, tree: ast.Module, func_node: ast.FunctionDef) -> bool:
-        """Check if function is inside a class."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for child in node.body:
-                    if child is func_node:
-                        return True
-        return False
-
     def _is_pytest_raises(self, call_node: ast.Call) -> bool:
         """Check if call is pytest.raises()."""
         name = self._get_call_name(call_node)
@@ -535,6 +412,12 @@ class TestRequirementAnalyzer:
 
         for method in methods:
             if method.name not in seen:
+                # Copy so merging does not leak into the per-test signatures
+                method = replace(
+                    method,
+                    parameters=list(method.parameters),
+                    exceptions=list(method.exceptions)
+                )
                 seen[method.name] = method
                 deduped.append(method)
             else:
@@ -543,6 +426,9 @@ class TestRequirementAnalyzer:
                 for param in method.parameters:
                     if param not in existing.parameters:
                         existing.parameters.append(param)
+                for exception in method.exceptions:
+                    if exception not in existing.exceptions:
+                        existing.exceptions.append(exception)
 
         return deduped
 
@@ -550,15 +436,22 @@ class TestRequirementAnalyzer:
         self,
         test_dir: Path,
         output: Path,
-        pattern: str = "test_*.py"
+        pattern: str = "test_*.py",
+        jobs: Optional[int] = None,
+        cache_path: Optional[Path] = None
     ) -> dict[str, Any]:
         """
         Generate test requirements JSON from all test files.
 
+        Files are analyzed across a process pool. With a cache, files whose
+        content is unchanged since the last run are served from it.
+
         Args:
             test_dir: Directory containing test files
             output: Path to output JSON file
             pattern: Glob pattern for test files
+            jobs: Worker processes (default: CPU count; 1 analyzes in-process)
+            cache_path: Analysis cache file (None disables caching)
 
         Returns:
             Dictionary of all requirements
@@ -576,39 +469,34 @@ class TestRequirementAnalyzer:
             'required_classes': []
         }
 
-        test_files = list(test_dir.glob(f"**/{pattern}"))
-        all_requirements['metadata']['file_count'] = len(test_files)
+        analyses = self.analyze_directory(test_dir, pattern, jobs=jobs, cache_path=cache_path)
+        all_requirements['metadata']['file_count'] = len(analyses)
 
         all_classes = set()
         all_methods = []
 
-        for test_file in test_files:
-            if self.verbose:
-                print(f"Analyzing: {test_file}")
-
-            try:
-                analysis = self.analyze_test_file(test_file)
-
-                # Store file analysis
-                rel_path = str(test_file.relative_to(test_dir) if test_dir in test_file.parents else test_file)
-                all_requirements['files'][rel_path] = self._serialize_analysis(analysis)
+        for test_file, analysis in analyses.items():
+            if 'error' in analysis:
+                if self.verbose:
+                    print(f"  Error ({test_file}): {analysis['error']}")
+                all_requirements['files'][str(test_file)] = analysis
+                continue
 
-                # Index by REQ ID
-                for target in analysis.coverage_targets:
-                    if target not in all_requirements['by_req']:
-                        all_requirements['by_req'][target] = []
-                    all_requirements['by_req'][target].append(rel_path)
+            # Store file analysis
+            rel_path = str(test_file.relative_to(test_dir) if test_dir in test_file.parents else test_file)
+            all_requirements['files'][rel_path] = analysis
 
-                # Collect classes and methods
-                all_classes.update(analysis.required_classes)
-                all_methods.extend(analysis.required_methods)
+            # Index by REQ ID
+            for target in analysis['coverage_targets']:
+                if target not in all_requirements['by_req']:
+                    all_requirements['by_req'][target] = []
+                all_requirements['by_req'][target].append(rel_path)
 
-                all_requirements['metadata']['test_count'] += len(analysis.test_cases)
+            # Collect classes and methods
+            all_classes.update(analysis['required_classes'])
+            all_methods.extend(MethodSignature(**m) for m in analysis['required_methods'])
 
-            except Exception as e:
-                if self.verbose:
-                    print(f"  Error: {e}")
-                all_requirements['files'][str(test_file)] = {'error': str(e)}
+            all_requirements['metadata']['test_count'] += len(analysis['test_cases'])
 
         # Finalize
         all_requirements['metadata']['req_coverage'] = sorted(all_requirements['by_req'].keys())
@@ -630,6 +518,71 @@ class TestRequirementAnalyzer:
 
         return all_requirements
 
+    def analyze_directory(
+        self,
+        test_dir: Path,
+        pattern: str = "test_*.py",
+        jobs: Optional[int] = None,
+        cache_path: Optional[Path] = None
+    ) -> dict[Path, dict[str, Any]]:
+        """
+        Serialized analysis of every test file under a directory.
+
+        Unchanged files are served from the cache (when given); the rest are
+        analyzed across a process pool.
+
+        Returns:
+            {test file: serialized TestFileAnalysis or {'error': ...}}, in glob order
+        """
+        test_files = list(test_dir.glob(f"**/{pattern}"))
+
+        # Serve unchanged files from cache, analyze the rest
+        cache = AnalysisCache(cache_path) if cache_path else None
+        analyses: dict[Path, dict[str, Any]] = {}
+        cache_keys: dict[Path, str] = {}
+        pending = []
+        for test_file in test_files:
+            if cache:
+                try:
+                    cache_keys[test_file] = cache.key(test_file)
+                except OSError:
+                    pass
+                cached = cache.get(cache_keys.get(test_file))
+                if cached is not None:
+                    analyses[test_file] = cached
+                    continue
+            pending.append(test_file)
+
+        if self.verbose:
+            if cache:
+                print(f"Cache: {len(test_files) - len(pending)}/{len(test_files)} files unchanged")
+            for test_file in pending:
+                print(f"Analyzing: {test_file}")
+
+        for test_file, analysis in zip(pending, self._analyze_files(pending, jobs)):
+            analyses[test_file] = analysis
+            if cache and 'error' not in analysis and test_file in cache_keys:
+                cache.put(cache_keys[test_file], analysis)
+        if cache:
+            cache.save()
+
+        return {test_file: analyses[test_file] for test_file in test_files}
+
+    def _analyze_files(self, test_files: list[Path], jobs: Optional[int]) -> list[dict[str, Any]]:
+        """Serialized analyses (or {'error': ...}) in input order."""
+        names = [str(f) for f in test_files]
+        workers = min(jobs or os.cpu_count() or 1, len(names))
+        if workers > 1 and len(names) >= PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    chunksize = max(1, len(names) // (workers * 4))
+                    return list(pool.map(_analyze_file_serialized, names, chunksize=chunksize))
+            except (OSError, BrokenProcessPool) as e:
+                # e.g. no semaphore support in a sandbox; analyze in-process instead
+                if self.verbose:
+                    print(f"Process pool unavailable ({e}); analyzing serially")
+        return [_analyze_file_serialized(name) for name in names]
+
     def _serialize_analysis(self, analysis: TestFileAnalysis) -> dict:
         """Convert TestFileAnalysis to serializable dict."""
         return {
@@ -656,6 +609,190 @@ class TestRequirementAnalyzer:
         }
 
 
+def _analyze_file_serialized(test_file: str) -> dict[str, Any]:
+    """Process-pool worker: serialized analysis of one test file."""
+    analyzer = TestRequirementAnalyzer()
+    try:
+        return analyzer._serialize_analysis(analyzer.analyze_test_file(Path(test_file)))
+    except Exception as e:
+        return {'error': str(e)}
+
+
+class AnalysisCache:
+    """
+    On-disk cache of serialized TestFileAnalysis results.
+
+    Entries are keyed by file path plus the SHA-256 of the file bytes, and the
+    whole cache is discarded when ANALYZER_VERSION changes. Only entries used
+    by the current run are written back, so deleted or edited files do not
+    accumulate. Writes are atomic (temp file + replace).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.used: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+                if data.get('version') == ANALYZER_VERSION:
+                    self.entries = data.get('files', {})
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def key(test_file: Path) -> str:
+        return f"{test_file}:{hashlib.sha256(test_file.read_bytes()).hexdigest()}"
+
+    def get(self, key: Optional[str]) -> Optional[dict[str, Any]]:
+        entry = self.entries.get(key) if key else None
+        if entry is not None:
+            self.used[key] = entry
+        return entry
+
+    def put(self, key: str, analysis: dict[str, Any]) -> None:
+        self.used[key] = analysis
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({'version': ANALYZER_VERSION, 'files': self.used}, default=str),
+                encoding='utf-8'
+            )
+            tmp_path.replace(self.path)
+        except OSError:
+            pass  # Cache is an optimization only
+
+
+class _TestModuleVisitor(ast.NodeVisitor):
+    """
+    Single-pass collector behind TestRequirementAnalyzer.analyze_test_file.
+
+    Enclosing classes and functions are tracked on a scope stack, so a test
+    function is classified from its direct parent instead of re-walking the
+    module. Every node below a test function is delivered to each open test
+    (a nested test_ function also counts toward the test around it), which
+    gathers calls, assertions, I/O hints, pytest.raises expectations and
+    class references in one traversal.
+    """
+
+    def __init__(self, analyzer: TestRequirementAnalyzer, file_path: str):
+        self.analyzer = analyzer
+        self.file_path = file_path
+        self.test_cases: list[TestCase] = []
+        self.required_classes: set[str] = set()
+        # (node, class traceability) for enclosing ClassDef/FunctionDef nodes;
+        # traceability is only set for Test* classes
+        self._scopes: list[tuple[ast.AST, Optional[TraceabilityTags]]] = []
+        self._open_tests: list[TestCase] = []
+        self._fixture_depth = 0
+        self._expected_raises: list[str] = []
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        traceability = None
+        if node.name.startswith('Test'):
+            traceability = self.analyzer._extract_traceability(ast.get_docstring(node) or "")
+        self._scopes.append((node, traceability))
+        self.generic_visit(node)
+        self._scopes.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        parent, class_traceability = self._scopes[-1] if self._scopes else (None, None)
+        in_class = isinstance(parent, ast.ClassDef)
+
+        test_case = None
+        is_fixture = False
+        if node.name.startswith('test_'):
+            if not in_class:
+                test_case = self.analyzer._start_test_case(node, None)
+            elif class_traceability is not None:
+                test_case = self.analyzer._start_test_case(node, parent.name, class_traceability)
+        elif class_traceability is not None and not node.name.startswith('_'):
+            # Fixture/helper methods on a Test class indicate class dependencies
+            is_fixture = True
+
+        if test_case:
+            self.test_cases.append(test_case)
+            self._open_tests.append(test_case)
+        self._fixture_depth += is_fixture
+        self._scopes.append((node, None))
+        self.generic_visit(node)
+        self._scopes.pop()
+        self._fixture_depth -= is_fixture
+        if test_case:
+            self._open_tests.pop()
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._scopes.append((node, None))
+        self.generic_visit(node)
+        self._scopes.pop()
+
+    def visit_With(self, node: ast.With) -> None:
+        """Attach pytest.raises(Exc) to the calls made inside the with block."""
+        expected = []
+        for item in node.items:
+            expr = item.context_expr
+            if isinstance(expr, ast.Call) and self.analyzer._is_pytest_raises(expr):
+                exception_name = self.analyzer._extract_exception_name(expr)
+                if exception_name:
+                    expected.append(exception_name)
+            self.visit(item)
+
+        self._expected_raises.extend(expected)
+        for stmt in node.body:
+            self.visit(stmt)
+        del self._expected_raises[len(self._expected_raises) - len(expected):]
+
+    visit_AsyncWith = visit_With
+
+    def visit_Call(self, node: ast.Call) -> None:
+        name = self.analyzer._get_call_name(node)
+
+        for test_case in self._open_tests:
+            method_info = self.analyzer._analyze_call(node, test_case.test_name)
+            if method_info:
+                method_info.source_test = f"{self.file_path}::{test_case.test_name}"
+                if self._expected_raises:
+                    method_info.exceptions = [self._expected_raises[-1]]
+                test_case.required_methods.append(method_info)
+            if name and 'assert' in name.lower():
+                try:
+                    test_case.assertions.append(ast.unparse(node))
+                except Exception:
+                    test_case.assertions.append(f"<{name}>")
+
+        if self._fixture_depth and name and name[0].isupper():  # Likely a class instantiation
+            self.required_classes.add(name.split('.')[0])
+
+        self.generic_visit(node)
+
+    def visit_Assert(self, node: ast.Assert) -> None:
+        if self._open_tests:
+            try:
+                assertion = ast.unparse(node.test)
+            except Exception:
+                assertion = "<complex assertion>"
+            for test_case in self._open_tests:
+                test_case.assertions.append(assertion)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # Look for patterns like: result = func(input) / assert result == expected
+        if self._open_tests and len(node.targets) == 1 and isinstance(node.value, ast.Call):
+            target_name = self.analyzer._get_assign_target_name(node.targets[0])
+            call_name = self.analyzer._get_call_name(node.value)
+            if target_name and call_name:
+                for test_case in self._open_tests:
+                    test_case.input_output_hints.append({
+                        'call': call_name,
+                        'result_variable': target_name,
+                        'input_args': self.analyzer._extract_call_params(node.value)
+                    })
+        self.generic_visit(node)
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -671,6 +808,10 @@ Examples:
 
   # Verbose output
   python analyze_test_requirements.py --test-dir tests/unit/ --output tmp/test_requirements.json -v
+
+  # Directory mode uses a process pool and a cache of unchanged files
+  python analyze_test_requirements.py --test-dir tests/ --output tmp/test_requirements.json --jobs 8
+  python analyze_test_requirements.py --test-dir tests/ --output tmp/test_requirements.json --no-cache
         """
     )
 
@@ -699,6 +840,27 @@ Examples:
         help='Glob pattern for test files (default: test_*.py)'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for directory analysis (default: CPU count)'
+    )
+
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        default=None,
+        help='Analysis cache file for directory analysis '
+             '(default: .test_requirements_cache.json next to --output)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-analyze every file and do not read or write the cache'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -725,10 +887,15 @@ Examples:
                 print(f"Test cases: {len(analysis.test_cases)}")
         else:
             # Directory analysis
+            cache_path = None
+            if not args.no_cache:
+                cache_path = args.cache or args.output.parent / '.test_requirements_cache.json'
             analyzer.generate_test_requirements(
                 args.test_dir,
                 args.output,
-                args.pattern
+                args.pattern,
+                jobs=args.jobs,
+                cache_path=cache_path
             )
 
         return 0
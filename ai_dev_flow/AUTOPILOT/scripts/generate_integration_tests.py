@@ -11,6 +11,11 @@ Integration tests validate:
 - Database operations
 - External service integrations
 
+Sources are parsed across a process pool (--jobs); test cases that render
+identically are generated once, in the first source that defines them; and
+only test files whose content changed are rewritten (see
+generation_pipeline.py).
+
 Usage:
     python generate_integration_tests.py --ctr-dir ai_dev_flow/08_CTR/ --output tests/integration/
     python generate_integration_tests.py --spec-dir ai_dev_flow/09_SPEC/ --sys-dir ai_dev_flow/06_SYS/ --output tests/integration/
@@ -25,8 +30,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+from generation_pipeline import CompiledTemplate, parse_sources, write_if_changed
+
 try:
     import yaml
+    # libyaml-backed loader when available; same results, much faster
+    SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
     yaml = None
 
@@ -54,6 +63,9 @@ class GenerationResult:
     tests_generated: int
     artifacts_processed: int
     errors: list
+    files_written: int = 0  # files_generated minus those already up to date
+    duplicates_skipped: int = 0
+    stale_removed: int = 0  # earlier-run files of sources whose cases were all duplicates
 
 
 class IntegrationTestGenerator:
@@ -116,18 +128,44 @@ pytestmark = [
         raise NotImplementedError("Integration test not yet implemented")
 '''
 
-    def __init__(self, verbose: bool = False):
+    _FILE_TEMPLATE = CompiledTemplate(TEST_TEMPLATE)
+    _METHOD_TEMPLATE = CompiledTemplate(TEST_METHOD_TEMPLATE)
+
+    # Source type -> file patterns, in the order files are processed
+    SOURCE_PATTERNS = {
+        'CTR': ('**/*.yaml', '**/*.yml'),
+        'SPEC': ('**/*.yaml', '**/*.yml'),
+        'SYS': ('**/*.md',),
+    }
+
+    def __init__(self, verbose: bool = False, jobs: Optional[int] = None):
+        """
+        Args:
+            verbose: Verbose output
+            jobs: Worker processes for parsing sources (default: CPU count)
+        """
         self.verbose = verbose
+        self.jobs = jobs
 
-    def generate_from_ctr(
+    def generate(
         self,
-        ctr_dir: Path,
+        sources: list[tuple[str, Path]],
         output_dir: Path
     ) -> GenerationResult:
         """
-        Generate integration tests from CTR (Contract) files.
+        Generate integration tests from several source directories at once.
 
-        CTR files define API contracts that should be tested.
+        All source files are parsed in parallel. A test case whose name, description, endpoint and method
+        match one already generated (from any source) is skipped, and output
+        files are only rewritten when their content changed. When every case
+        of a source is skipped, its test file from an earlier run is removed.
+
+        Args:
+            sources: (source type, directory) pairs; types are CTR, SPEC, SYS
+            output_dir: Output directory for generated tests
+
+        Returns:
+            GenerationResult covering all sources
         """
         result = GenerationResult(
             files_generated=0,
@@ -135,34 +173,85 @@ pytestmark = [
             artifacts_processed=0,
             errors=[]
         )
+        parsers = {
+            'CTR': self._parse_ctr_file,
+            'SPEC': self._parse_spec_file,
+            'SYS': self._parse_sys_file,
+        }
+
+        source_files = []
+        for source_type, source_dir in sources:
+            if not source_dir.exists():
+                result.errors.append(f"{source_type} directory not found: {source_dir}")
+                continue
+            output_dir.mkdir(parents=True, exist_ok=True)
+            for pattern in self.SOURCE_PATTERNS[source_type]:
+                source_files.extend((source_type, f) for f in source_dir.glob(pattern))
+
+        parsed = parse_sources(
+            [(parsers[source_type], f) for source_type, f in source_files],
+            jobs=self.jobs,
+            verbose=self.verbose
+        )
 
-        if not ctr_dir.exists():
-            result.errors.append(f"CTR directory not found: {ctr_dir}")
-            return result
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Find CTR YAML files
-        ctr_files = list(ctr_dir.glob('**/*.yaml')) + list(ctr_dir.glob('**/*.yml'))
+        seen = set()
+        written_files = set()
+        stale_files = []
+        for (source_type, source_file), (test_cases, error) in zip(source_files, parsed):
+            if error is not None:
+                result.errors.append(f"Error processing {source_file}: {error}")
+                continue
+
+            unique = []
+            for tc in test_cases:
+                key = self._case_key(tc)
+                if key in seen:
+                    result.duplicates_skipped += 1
+                    continue
+                seen.add(key)
+                unique.append(tc)
 
-        for ctr_file in ctr_files:
             try:
-                test_cases = self._parse_ctr_file(ctr_file)
-                if test_cases:
-                    test_file = self._generate_test_file(
-                        test_cases,
-                        output_dir,
-                        source_type='CTR'
-                    )
-                    if test_file:
-                        result.files_generated += 1
-                        result.tests_generated += len(test_cases)
+                if unique:
+                    output_file, written = self._write_test_file(unique, output_dir, source_type)
+                    written_files.add(output_file)
+                    result.files_generated += 1
+                    result.files_written += written
+                    result.tests_generated += len(unique)
+                elif test_cases:
+                    stale_files.append(self._output_file(test_cases[0].source_artifact, output_dir))
                 result.artifacts_processed += 1
             except Exception as e:
-                result.errors.append(f"Error processing {ctr_file}: {e}")
+                result.errors.append(f"Error processing {source_file}: {e}")
+
+        # A source whose cases were all skipped gets no file; drop one left by
+        # an earlier run unless another source with the same stem wrote it
+        for stale_file in stale_files:
+            if stale_file in written_files or not stale_file.exists():
+                continue
+            try:
+                stale_file.unlink()
+            except OSError as e:
+                result.errors.append(f"Error removing stale {stale_file}: {e}")
+                continue
+            result.stale_removed += 1
+            if self.verbose:
+                print(f"Removed stale: {stale_file}")
 
         return result
 
+    def generate_from_ctr(
+        self,
+        ctr_dir: Path,
+        output_dir: Path
+    ) -> GenerationResult:
+        """
+        Generate integration tests from CTR (Contract) files.
+
+        CTR files define API contracts that should be tested.
+        """
+        return self.generate([('CTR', ctr_dir)], output_dir)
+
     def generate_from_spec(
         self,
         spec_dir: Path,
@@ -173,39 +262,7 @@ pytestmark = [
 
         SPEC files define interfaces and behavior that should be tested.
         """
-        result = GenerationResult(
-            files_generated=0,
-            tests_generated=0,
-            artifacts_processed=0,
-            errors=[]
-        )
-
-        if not spec_dir.exists():
-            result.errors.append(f"SPEC directory not found: {spec_dir}")
-            return result
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Find SPEC YAML files
-        spec_files = list(spec_dir.glob('**/*.yaml')) + list(spec_dir.glob('**/*.yml'))
-
-        for spec_file in spec_files:
-            try:
-                test_cases = self._parse_spec_file(spec_file)
-                if test_cases:
-                    test_file = self._generate_test_file(
-                        test_cases,
-                        output_dir,
-                        source_type='SPEC'
-                    )
-                    if test_file:
-                        result.files_generated += 1
-                        result.tests_generated += len(test_cases)
-                result.artifacts_processed += 1
-            except Exception as e:
-                result.errors.append(f"Error processing {spec_file}: {e}")
-
-        return result
+        return self.generate([('SPEC', spec_dir)], output_dir)
 
     def generate_from_sys(
         self,
@@ -217,39 +274,7 @@ pytestmark = [
 
         SYS files define system-level requirements that need integration testing.
         """
-        result = GenerationResult(
-            files_generated=0,
-            tests_generated=0,
-            artifacts_processed=0,
-            errors=[]
-        )
-
-        if not sys_dir.exists():
-            result.errors.append(f"SYS directory not found: {sys_dir}")
-            return result
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Find SYS markdown files
-        sys_files = list(sys_dir.glob('**/*.md'))
-
-        for sys_file in sys_files:
-            try:
-                test_cases = self._parse_sys_file(sys_file)
-                if test_cases:
-                    test_file = self._generate_test_file(
-                        test_cases,
-                        output_dir,
-                        source_type='SYS'
-                    )
-                    if test_file:
-                        result.files_generated += 1
-                        result.tests_generated += len(test_cases)
-                result.artifacts_processed += 1
-            except Exception as e:
-                result.errors.append(f"Error processing {sys_file}: {e}")
-
-        return result
+        return self.generate([('SYS', sys_dir)], output_dir)
 
     def _parse_ctr_file(self, ctr_file: Path) -> list[IntegrationTestCase]:
         """Parse CTR file to extract integration test cases."""
@@ -257,7 +282,7 @@ pytestmark = [
             return []
 
         try:
-            content = yaml.safe_load(ctr_file.read_text(encoding='utf-8'))
+            content = yaml.load(ctr_file.read_text(encoding='utf-8'), Loader=SafeLoader)
         except Exception:
             return []
 
@@ -302,7 +327,7 @@ pytestmark = [
             return []
 
         try:
-            content = yaml.safe_load(spec_file.read_text(encoding='utf-8'))
+            content = yaml.load(spec_file.read_text(encoding='utf-8'), Loader=SafeLoader)
         except Exception:
             return []
 
@@ -371,6 +396,10 @@ pytestmark = [
 
         return test_cases
 
+    def _case_key(self, tc: IntegrationTestCase) -> tuple:
+        """Fields that end up in the rendered test method, except its source."""
+        return (tc.name, tc.description, tc.endpoint, tc.method)
+
     def _generate_test_file(
         self,
         test_cases: list[IntegrationTestCase],
@@ -380,7 +409,15 @@ pytestmark = [
         """Generate pytest test file from test cases."""
         if not test_cases:
             return None
+        return self._write_test_file(test_cases, output_dir, source_type)[0]
 
+    def _write_test_file(
+        self,
+        test_cases: list[IntegrationTestCase],
+        output_dir: Path,
+        source_type: str
+    ) -> tuple[Path, bool]:
+        """Render test cases and write the file if its content changed."""
         from datetime import datetime
 
         # Determine module name from first test case
@@ -391,7 +428,7 @@ pytestmark = [
         # Generate test methods
         test_methods = []
         for tc in test_cases:
-            method = self.TEST_METHOD_TEMPLATE.format(
+            method = self._METHOD_TEMPLATE.render(
                 method_name=tc.name.replace('test_', ''),
                 description=tc.description,
                 source=tc.source_artifact,
@@ -407,7 +444,7 @@ pytestmark = [
 
         # Generate full test file
         class_name = ''.join(word.title() for word in module_name.split('_'))
-        test_content = self.TEST_TEMPLATE.format(
+        test_content = self._FILE_TEMPLATE.render(
             module_name=module_name,
             source_artifacts=first_case.source_artifact,
             timestamp=datetime.now().isoformat(),
@@ -419,14 +456,19 @@ pytestmark = [
             test_methods=''.join(test_methods)
         )
 
-        # Write file
-        output_file = output_dir / f"test_{module_name}_integration.py"
-        output_file.write_text(test_content, encoding='utf-8')
+        # Write file (skipped when only the timestamp would change)
+        output_file = self._output_file(first_case.source_artifact, output_dir)
+        written = write_if_changed(output_file, test_content)
 
         if self.verbose:
-            print(f"Generated: {output_file} ({len(test_cases)} tests)")
+            state = "Generated" if written else "Unchanged"
+            print(f"{state}: {output_file} ({len(test_cases)} tests)")
+
+        return output_file, written
 
-        return output_file
+    def _output_file(self, source_artifact: str, output_dir: Path) -> Path:
+        """Test file generated for a source artifact."""
+        return output_dir / f"test_{self._slugify(Path(source_artifact).stem)}_integration.py"
 
     def _slugify(self, text: str) -> str:
         """Convert text to valid Python identifier."""
@@ -453,7 +495,7 @@ Examples:
   # Generate from SPEC files
   python generate_integration_tests.py --spec-dir ai_dev_flow/09_SPEC/ --output tests/integration/
 
-  # Generate from all sources
+  # Generate from all sources (identical test cases are generated once)
   python generate_integration_tests.py \\
     --ctr-dir ai_dev_flow/08_CTR/ \\
     --spec-dir ai_dev_flow/09_SPEC/ \\
@@ -487,6 +529,13 @@ Examples:
         help='Output directory for generated tests'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for parsing sources (default: CPU count)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -499,48 +548,30 @@ Examples:
         print("Error: At least one source directory required (--ctr-dir, --spec-dir, or --sys-dir)")
         return 1
 
-    generator = IntegrationTestGenerator(verbose=args.verbose)
-
-    total_files = 0
-    total_tests = 0
-    total_artifacts = 0
-    all_errors = []
-
-    # Generate from CTR
-    if args.ctr_dir:
-        result = generator.generate_from_ctr(args.ctr_dir, args.output)
-        total_files += result.files_generated
-        total_tests += result.tests_generated
-        total_artifacts += result.artifacts_processed
-        all_errors.extend(result.errors)
-        if args.verbose:
-            print(f"CTR: {result.files_generated} files, {result.tests_generated} tests")
-
-    # Generate from SPEC
-    if args.spec_dir:
-        result = generator.generate_from_spec(args.spec_dir, args.output)
-        total_files += result.files_generated
-        total_tests += result.tests_generated
-        total_artifacts += result.artifacts_processed
-        all_errors.extend(result.errors)
-        if args.verbose:
-            print(f"SPEC: {result.files_generated} files, {result.tests_generated} tests")
-
-    # Generate from SYS
-    if args.sys_dir:
-        result = generator.generate_from_sys(args.sys_dir, args.output)
-        total_files += result.files_generated
-        total_tests += result.tests_generated
-        total_artifacts += result.artifacts_processed
-        all_errors.extend(result.errors)
-        if args.verbose:
-            print(f"SYS: {result.files_generated} files, {result.tests_generated} tests")
+    generator = IntegrationTestGenerator(verbose=args.verbose, jobs=args.jobs)
+
+    # One batch over all sources, so identical cases are generated once
+    sources = [
+        (source_type, source_dir)
+        for source_type, source_dir in (('CTR', args.ctr_dir), ('SPEC', args.spec_dir), ('SYS', args.sys_dir))
+        if source_dir
+    ]
+    result = generator.generate(sources, args.output)
+    total_files = result.files_generated
+    total_tests = result.tests_generated
+    total_artifacts = result.artifacts_processed
+    all_errors = result.errors
 
     # Summary
     print(f"\nIntegration Test Generation Summary:")
     print(f"  Artifacts processed: {total_artifacts}")
-    print(f"  Files generated: {total_files}")
+    print(f"  Files generated: {total_files} ({result.files_written} written, "
+          f"{total_files - result.files_written} unchanged)")
     print(f"  Tests generated: {total_tests}")
+    if result.duplicates_skipped:
+        print(f"  Duplicate tests skipped: {result.duplicates_skipped}")
+    if result.stale_removed:
+        print(f"  Stale test files removed: {result.stale_removed}")
 
     if all_errors:
         print(f"\nErrors ({len(all_errors)}):")
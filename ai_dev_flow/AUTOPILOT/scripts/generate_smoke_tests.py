@@ -11,6 +11,11 @@ Smoke tests validate:
 - System is responsive and healthy
 - No obvious regressions
 
+Sources are parsed across a process pool (--jobs); test cases that render
+identically are generated once, in the first source that defines them; and
+only test files whose content changed are rewritten (see
+generation_pipeline.py).
+
 Usage:
     python generate_smoke_tests.py --ears-dir ai_dev_flow/03_EARS/ --output tests/smoke/
     python generate_smoke_tests.py --bdd-dir ai_dev_flow/04_BDD/ --output tests/smoke/
@@ -25,6 +30,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from generation_pipeline import CompiledTemplate, parse_sources, write_if_changed
+
 
 @dataclass
 class SmokeTestCase:
@@ -49,6 +56,9 @@ class GenerationResult:
     tests_generated: int
     artifacts_processed: int
     errors: list
+    files_written: int = 0  # files_generated minus those already up to date
+    duplicates_skipped: int = 0
+    stale_removed: int = 0  # earlier-run files of sources whose cases were all duplicates
 
 
 class SmokeTestGenerator:
@@ -158,19 +168,46 @@ if __name__ == '__main__':
         raise NotImplementedError("Smoke test not yet implemented")
 '''
 
-    def __init__(self, verbose: bool = False, timeout: int = 30):
+    _FILE_TEMPLATE = CompiledTemplate(TEST_TEMPLATE)
+    _METHOD_TEMPLATE = CompiledTemplate(TEST_METHOD_TEMPLATE)
+
+    # Source type -> file patterns, in the order files are processed
+    SOURCE_PATTERNS = {
+        'EARS': ('**/*.md',),
+        'BDD': ('**/*.feature',),
+        'REQ': ('**/*.md',),
+    }
+
+    def __init__(self, verbose: bool = False, timeout: int = 30, jobs: Optional[int] = None):
+        """
+        Args:
+            verbose: Verbose output
+            timeout: Default timeout per test in seconds
+            jobs: Worker processes for parsing sources (default: CPU count)
+        """
         self.verbose = verbose
         self.default_timeout = timeout
+        self.jobs = jobs
 
-    def generate_from_ears(
+    def generate(
         self,
-        ears_dir: Path,
+        sources: list[tuple[str, Path]],
         output_dir: Path
     ) -> GenerationResult:
         """
-        Generate smoke tests from EARS (Requirements) files.
+        Generate smoke tests from several source directories at once.
 
-        EARS requirements with WHEN-THE-SHALL syntax map to smoke tests.
+        All source files are parsed in parallel. A test case whose name, description, priority, timeout, steps and expected outcome
+        match one already generated (from any source) is skipped, and output
+        files are only rewritten when their content changed. When every case
+        of a source is skipped, its test file from an earlier run is removed.
+
+        Args:
+            sources: (source type, directory) pairs; types are EARS, BDD, REQ
+            output_dir: Output directory for generated tests
+
+        Returns:
+            GenerationResult covering all sources
         """
         result = GenerationResult(
             files_generated=0,
@@ -178,34 +215,85 @@ if __name__ == '__main__':
             artifacts_processed=0,
             errors=[]
         )
+        parsers = {
+            'EARS': self._parse_ears_file,
+            'BDD': self._parse_bdd_file,
+            'REQ': self._parse_req_file,
+        }
+
+        source_files = []
+        for source_type, source_dir in sources:
+            if not source_dir.exists():
+                result.errors.append(f"{source_type} directory not found: {source_dir}")
+                continue
+            output_dir.mkdir(parents=True, exist_ok=True)
+            for pattern in self.SOURCE_PATTERNS[source_type]:
+                source_files.extend((source_type, f) for f in source_dir.glob(pattern))
+
+        parsed = parse_sources(
+            [(parsers[source_type], f) for source_type, f in source_files],
+            jobs=self.jobs,
+            verbose=self.verbose
+        )
 
-        if not ears_dir.exists():
-            result.errors.append(f"EARS directory not found: {ears_dir}")
-            return result
-
-        output_dir.mkdir(parents=True, exist_ok=True)
+        seen = set()
+        written_files = set()
+        stale_files = []
+        for (source_type, source_file), (test_cases, error) in zip(source_files, parsed):
+            if error is not None:
+                result.errors.append(f"Error processing {source_file}: {error}")
+                continue
 
-        # Find EARS markdown files
-        ears_files = list(ears_dir.glob('**/*.md'))
+            unique = []
+            for tc in test_cases:
+                key = self._case_key(tc)
+                if key in seen:
+                    result.duplicates_skipped += 1
+                    continue
+                seen.add(key)
+                unique.append(tc)
 
-        for ears_file in ears_files:
             try:
-                test_cases = self._parse_ears_file(ears_file)
-                if test_cases:
-                    test_file = self._generate_test_file(
-                        test_cases,
-                        output_dir,
-                        source_type='EARS'
-                    )
-                    if test_file:
-                        result.files_generated += 1
-                        result.tests_generated += len(test_cases)
+                if unique:
+                    output_file, written = self._write_test_file(unique, output_dir, source_type)
+                    written_files.add(output_file)
+                    result.files_generated += 1
+                    result.files_written += written
+                    result.tests_generated += len(unique)
+                elif test_cases:
+                    stale_files.append(self._output_file(test_cases[0].source_artifact, output_dir))
                 result.artifacts_processed += 1
             except Exception as e:
-                result.errors.append(f"Error processing {ears_file}: {e}")
+                result.errors.append(f"Error processing {source_file}: {e}")
+
+        # A source whose cases were all skipped gets no file; drop one left by
+        # an earlier run unless another source with the same stem wrote it
+        for stale_file in stale_files:
+            if stale_file in written_files or not stale_file.exists():
+                continue
+            try:
+                stale_file.unlink()
+            except OSError as e:
+                result.errors.append(f"Error removing stale {stale_file}: {e}")
+                continue
+            result.stale_removed += 1
+            if self.verbose:
+                print(f"Removed stale: {stale_file}")
 
         return result
 
+    def generate_from_ears(
+        self,
+        ears_dir: Path,
+        output_dir: Path
+    ) -> GenerationResult:
+        """
+        Generate smoke tests from EARS (Requirements) files.
+
+        EARS requirements with WHEN-THE-SHALL syntax map to smoke tests.
+        """
+        return self.generate([('EARS', ears_dir)], output_dir)
+
     def generate_from_bdd(
         self,
         bdd_dir: Path,
@@ -216,39 +304,7 @@ if __name__ == '__main__':
 
         Critical scenarios become smoke tests.
         """
-        result = GenerationResult(
-            files_generated=0,
-            tests_generated=0,
-            artifacts_processed=0,
-            errors=[]
-        )
-
-        if not bdd_dir.exists():
-            result.errors.append(f"BDD directory not found: {bdd_dir}")
-            return result
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Find BDD feature files
-        bdd_files = list(bdd_dir.glob('**/*.feature'))
-
-        for bdd_file in bdd_files:
-            try:
-                test_cases = self._parse_bdd_file(bdd_file)
-                if test_cases:
-                    test_file = self._generate_test_file(
-                        test_cases,
-                        output_dir,
-                        source_type='BDD'
-                    )
-                    if test_file:
-                        result.files_generated += 1
-                        result.tests_generated += len(test_cases)
-                result.artifacts_processed += 1
-            except Exception as e:
-                result.errors.append(f"Error processing {bdd_file}: {e}")
-
-        return result
+        return self.generate([('BDD', bdd_dir)], output_dir)
 
     def generate_from_req(
         self,
@@ -260,39 +316,7 @@ if __name__ == '__main__':
 
         P0/P1 requirements become smoke tests.
         """
-        result = GenerationResult(
-            files_generated=0,
-            tests_generated=0,
-            artifacts_processed=0,
-            errors=[]
-        )
-
-        if not req_dir.exists():
-            result.errors.append(f"REQ directory not found: {req_dir}")
-            return result
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Find REQ markdown files
-        req_files = list(req_dir.glob('**/*.md'))
-
-        for req_file in req_files:
-            try:
-                test_cases = self._parse_req_file(req_file)
-                if test_cases:
-                    test_file = self._generate_test_file(
-                        test_cases,
-                        output_dir,
-                        source_type='REQ'
-                    )
-                    if test_file:
-                        result.files_generated += 1
-                        result.tests_generated += len(test_cases)
-                result.artifacts_processed += 1
-            except Exception as e:
-                result.errors.append(f"Error processing {req_file}: {e}")
-
-        return result
+        return self.generate([('REQ', req_dir)], output_dir)
 
     def _parse_ears_file(self, ears_file: Path) -> list[SmokeTestCase]:
         """Parse EARS file to extract smoke test cases."""
@@ -437,6 +461,10 @@ if __name__ == '__main__':
 
         return test_cases
 
+    def _case_key(self, tc: SmokeTestCase) -> tuple:
+        """Fields that end up in the rendered test method, except its source."""
+        return (tc.name, tc.description, tc.priority, tc.timeout, tuple(tc.steps), tc.expected_outcome)
+
     def _generate_test_file(
         self,
         test_cases: list[SmokeTestCase],
@@ -446,7 +474,15 @@ if __name__ == '__main__':
         """Generate pytest smoke test file from test cases."""
         if not test_cases:
             return None
+        return self._write_test_file(test_cases, output_dir, source_type)[0]
 
+    def _write_test_file(
+        self,
+        test_cases: list[SmokeTestCase],
+        output_dir: Path,
+        source_type: str
+    ) -> tuple[Path, bool]:
+        """Render test cases and write the file if its content changed."""
         from datetime import datetime
 
         # Determine module name from first test case
@@ -458,7 +494,7 @@ if __name__ == '__main__':
         test_methods = []
         for tc in test_cases:
             steps_formatted = '\n'.join(f"        #   {s}" for s in tc.steps) if tc.steps else "        #   1. Execute test"
-            method = self.TEST_METHOD_TEMPLATE.format(
+            method = self._METHOD_TEMPLATE.render(
                 method_name=tc.name.replace('test_', ''),
                 description=tc.description,
                 source=tc.source_artifact,
@@ -479,7 +515,7 @@ if __name__ == '__main__':
 
         # Generate full test file
         class_name = ''.join(word.title() for word in module_name.split('_'))
-        test_content = self.TEST_TEMPLATE.format(
+        test_content = self._FILE_TEMPLATE.render(
             module_name=module_name,
             source_artifacts=first_case.source_artifact,
             timestamp=datetime.now().isoformat(),
@@ -492,14 +528,19 @@ if __name__ == '__main__':
             test_methods=''.join(test_methods)
         )
 
-        # Write file
-        output_file = output_dir / f"test_{module_name}_smoke.py"
-        output_file.write_text(test_content, encoding='utf-8')
+        # Write file (skipped when only the timestamp would change)
+        output_file = self._output_file(first_case.source_artifact, output_dir)
+        written = write_if_changed(output_file, test_content)
 
         if self.verbose:
-            print(f"Generated: {output_file} ({len(test_cases)} tests)")
+            state = "Generated" if written else "Unchanged"
+            print(f"{state}: {output_file} ({len(test_cases)} tests)")
 
-        return output_file
+        return output_file, written
+
+    def _output_file(self, source_artifact: str, output_dir: Path) -> Path:
+        """Test file generated for a source artifact."""
+        return output_dir / f"test_{self._slugify(Path(source_artifact).stem)}_smoke.py"
 
     def _slugify(self, text: str) -> str:
         """Convert text to valid Python identifier."""
@@ -529,7 +570,7 @@ Examples:
   # Generate from BDD feature files
   python generate_smoke_tests.py --bdd-dir ai_dev_flow/04_BDD/ --output tests/smoke/
 
-  # Generate from all sources
+  # Generate from all sources (identical test cases are generated once)
   python generate_smoke_tests.py \\
     --ears-dir ai_dev_flow/03_EARS/ \\
     --bdd-dir ai_dev_flow/04_BDD/ \\
@@ -573,6 +614,13 @@ Examples:
         help='Default timeout per test in seconds (default: 30)'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Worker processes for parsing sources (default: CPU count)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -585,48 +633,30 @@ Examples:
         print("Error: At least one source directory required (--ears-dir, --bdd-dir, or --req-dir)")
         return 1
 
-    generator = SmokeTestGenerator(verbose=args.verbose, timeout=args.timeout)
-
-    total_files = 0
-    total_tests = 0
-    total_artifacts = 0
-    all_errors = []
-
-    # Generate from EARS
-    if args.ears_dir:
-        result = generator.generate_from_ears(args.ears_dir, args.output)
-        total_files += result.files_generated
-        total_tests += result.tests_generated
-        total_artifacts += result.artifacts_processed
-        all_errors.extend(result.errors)
-        if args.verbose:
-            print(f"EARS: {result.files_generated} files, {result.tests_generated} tests")
-
-    # Generate from BDD
-    if args.bdd_dir:
-        result = generator.generate_from_bdd(args.bdd_dir, args.output)
-        total_files += result.files_generated
-        total_tests += result.tests_generated
-        total_artifacts += result.artifacts_processed
-        all_errors.extend(result.errors)
-        if args.verbose:
-            print(f"BDD: {result.files_generated} files, {result.tests_generated} tests")
-
-    # Generate from REQ
-    if args.req_dir:
-        result = generator.generate_from_req(args.req_dir, args.output)
-        total_files += result.files_generated
-        total_tests += result.tests_generated
-        total_artifacts += result.artifacts_processed
-        all_errors.extend(result.errors)
-        if args.verbose:
-            print(f"REQ: {result.files_generated} files, {result.tests_generated} tests")
+    generator = SmokeTestGenerator(verbose=args.verbose, timeout=args.timeout, jobs=args.jobs)
+
+    # One batch over all sources, so identical cases are generated once
+    sources = [
+        (source_type, source_dir)
+        for source_type, source_dir in (('EARS', args.ears_dir), ('BDD', args.bdd_dir), ('REQ', args.req_dir))
+        if source_dir
+    ]
+    result = generator.generate(sources, args.output)
+    total_files = result.files_generated
+    total_tests = result.tests_generated
+    total_artifacts = result.artifacts_processed
+    all_errors = result.errors
 
     # Summary
     print(f"\nSmoke Test Generation Summary:")
     print(f"  Artifacts processed: {total_artifacts}")
-    print(f"  Files generated: {total_files}")
+    print(f"  Files generated: {total_files} ({result.files_written} written, "
+          f"{total_files - result.files_written} unchanged)")
     print(f"  Tests generated: {total_tests}")
+    if result.duplicates_skipped:
+        print(f"  Duplicate tests skipped: {result.duplicates_skipped}")
+    if result.stale_removed:
+        print(f"  Stale test files removed: {result.stale_removed}")
     print(f"  Default timeout: {args.timeout}s")
 
     if all_errors:
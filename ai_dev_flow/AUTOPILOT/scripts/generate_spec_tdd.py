@@ -5,6 +5,11 @@ Generate Test-Aware SPEC Script
 Generates SPEC YAML files that satisfy test requirements extracted by
 analyze_test_requirements.py. Part of Phase 2: TDD Awareness in MVP Autopilot.
 
+Generation is incremental per REQ: each REQ's slice of the test requirements
+is fingerprinted and recorded in .spec_tdd_manifest.json in the output
+directory, and SPECs whose slice is unchanged are neither rebuilt nor
+rewritten (--full forces a rebuild).
+
 Usage:
     python generate_spec_tdd.py --test-requirements tmp/test_requirements.json --output ai_dev_flow/09_SPEC/
     python generate_spec_tdd.py --test-requirements tmp/auth_requirements.json --req-dir ai_dev_flow/07_REQ/ --output ai_dev_flow/09_SPEC/
@@ -13,16 +18,23 @@ Reference: IPLAN-001 Section 4.2.2
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+# Bump when SPEC output changes, to invalidate manifest fingerprints
+GENERATOR_VERSION = 1
+
+MANIFEST_NAME = '.spec_tdd_manifest.json'
+
 
 @dataclass
 class InterfaceMethod:
@@ -51,6 +63,76 @@ class TestAwareSPEC:
     validation_rules: list[dict]
     test_references: list[dict]
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TestAwareSPEC':
+        """Rebuild from asdict() output (e.g. a manifest entry)."""
+        data = dict(data)
+        data['interfaces'] = [InterfaceMethod(**m) for m in data['interfaces']]
+        return cls(**data)
+
+
+def _file_sha256(path: Path) -> Optional[str]:
+    """SHA-256 of a file's bytes, None if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class SpecManifest:
+    """
+    Per-REQ record of generated SPECs in an output directory.
+
+    Each entry holds the fingerprint of the REQ's test-requirements slice,
+    the SPEC file name, the SHA-256 of the file as written and the SPEC
+    sections built from it, so unchanged REQs can be reused without
+    rebuilding or re-reading their YAML. The stored sections apply only
+    while the file still matches that hash (i.e. was not edited by hand).
+    """
+
+    def __init__(self, output_dir: Path):
+        self.path = output_dir / MANIFEST_NAME
+        self.entries: dict[str, dict] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') == GENERATOR_VERSION:
+                self.entries = data.get('reqs', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def get(self, req_id: str, fingerprint: Optional[str] = None) -> Optional[dict]:
+        """Entry for req_id, if present (and matching fingerprint, when given)."""
+        entry = self.entries.get(req_id)
+        if entry is None or (fingerprint is not None and entry.get('fingerprint') != fingerprint):
+            return None
+        return entry
+
+    def put(
+        self,
+        req_id: str,
+        fingerprint: str,
+        spec_file: str,
+        spec_hash: Optional[str],
+        spec_data: 'TestAwareSPEC'
+    ) -> None:
+        self.entries[req_id] = {
+            'fingerprint': fingerprint,
+            'spec_file': spec_file,
+            'spec_hash': spec_hash,
+            'spec': asdict(spec_data)
+        }
+
+    def save(self, keep: set[str]) -> None:
+        """Write entries for the REQs in keep (atomically)."""
+        data = {
+            'version': GENERATOR_VERSION,
+            'reqs': {req_id: e for req_id, e in self.entries.items() if req_id in keep}
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
 
 class TestAwareSPECGenerator:
     """
@@ -72,18 +154,24 @@ class TestAwareSPECGenerator:
         self,
         test_requirements: dict,
         req_dir: Optional[Path] = None,
-        output_dir: Path = Path('.')
+        output_dir: Path = Path('.'),
+        incremental: bool = True
     ) -> list[Path]:
         """
         Generate SPEC files from test requirements.
 
+        With incremental=True, a REQ whose slice of the test requirements
+        (see _req_slice) matches the manifest fingerprint keeps its existing
+        SPEC file; only new and changed REQs are built and written.
+
         Args:
             test_requirements: Output from analyze_test_requirements.py
             req_dir: Optional REQ documents directory for additional context
             output_dir: Output directory for SPEC files
+            incremental: Reuse SPECs of unchanged REQs
 
         Returns:
-            List of generated SPEC file paths
+            List of SPEC file paths (generated or reused)
         """
         generated_files = []
 
@@ -97,18 +185,75 @@ class TestAwareSPECGenerator:
             self._write_spec(spec_data, output_path)
             generated_files.append(output_path)
         else:
-            # Generate SPEC per REQ group
+            # Generate SPEC per REQ group, reusing unchanged ones
+            manifest = SpecManifest(output_dir)
+            reused = 0
             for req_id, test_files in by_req.items():
+                req_slice = self._req_slice(req_id, test_files, test_requirements)
+                fingerprint = self._fingerprint(req_id, req_slice)
+
+                entry = manifest.get(req_id, fingerprint) if incremental else None
+                if entry and (output_dir / entry['spec_file']).exists():
+                    generated_files.append(output_dir / entry['spec_file'])
+                    reused += 1
+                    continue
+
                 spec_data = self._build_spec_for_req(
-                    req_id, test_files, test_requirements, req_dir
+                    req_id, test_files, test_requirements, req_dir, req_slice=req_slice
                 )
                 if spec_data:
                     output_path = output_dir / f"SPEC-{spec_data.spec_id}_{spec_data.component_name}.yaml"
                     self._write_spec(spec_data, output_path)
                     generated_files.append(output_path)
+                    manifest.put(req_id, fingerprint, output_path.name, _file_sha256(output_path), spec_data)
+
+            manifest.save(keep=set(by_req))
+            if self.verbose:
+                print(f"Unchanged REQs reused: {reused}/{len(by_req)}")
 
         return generated_files
 
+    def _covers_req(self, test_case: dict, req_id: str) -> bool:
+        """Whether a test case's @req tags cover req_id."""
+        tc_reqs = test_case.get('traceability', {}).get('req', [])
+        return req_id in tc_reqs or any(req_id in r for r in tc_reqs)
+
+    def _req_slice(
+        self,
+        req_id: str,
+        test_files: list[str],
+        test_requirements: dict
+    ) -> dict[str, dict]:
+        """
+        The part of the test requirements a REQ's SPEC is built from.
+
+        Returns:
+            {test file: {'file_traceability': ..., 'test_cases': [cases covering req_id]}}
+            for the REQ's test files that were analyzed without errors
+        """
+        files = test_requirements.get('files', {})
+        req_slice = {}
+        for file_path in test_files:
+            file_data = files.get(file_path, {})
+            if isinstance(file_data, dict) and 'error' not in file_data:
+                req_slice[file_path] = {
+                    'file_traceability': file_data.get('file_traceability', {}),
+                    'test_cases': [
+                        tc for tc in file_data.get('test_cases', [])
+                        if self._covers_req(tc, req_id)
+                    ]
+                }
+        return req_slice
+
+    def _fingerprint(self, req_id: str, req_slice: dict) -> str:
+        """Stable hash of a REQ slice and the generator version."""
+        payload = json.dumps(
+            {'version': GENERATOR_VERSION, 'req_id': req_id, 'slice': req_slice},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
     def _build_spec_from_all_tests(self, test_requirements: dict) -> TestAwareSPEC:
         """Build a single SPEC from all test files."""
         all_methods = []
@@ -159,7 +304,8 @@ class TestAwareSPECGenerator:
         req_id: str,
         test_files: list[str],
         test_requirements: dict,
-        req_dir: Optional[Path]
+        req_dir: Optional[Path],
+        req_slice: Optional[dict[str, dict]] = None
     ) -> Optional[TestAwareSPEC]:
         """Build SPEC for a specific REQ ID."""
         all_methods = []
@@ -170,28 +316,26 @@ class TestAwareSPECGenerator:
         # Add REQ to traceability
         all_traceability['req'].append(req_id)
 
-        for file_path in test_files:
-            file_data = test_requirements.get('files', {}).get(file_path, {})
-            if isinstance(file_data, dict) and 'error' not in file_data:
-                # Merge traceability
-                file_trace = file_data.get('file_traceability', {})
-                for key in all_traceability:
-                    if key != 'req':  # Already added
-                        all_traceability[key].extend(file_trace.get(key, []))
+        if req_slice is None:
+            req_slice = self._req_slice(req_id, test_files, test_requirements)
 
-                # Find test cases covering this REQ
-                for tc in file_data.get('test_cases', []):
-                    tc_reqs = tc.get('traceability', {}).get('req', [])
-                    if req_id in tc_reqs or any(req_id in r for r in tc_reqs):
-                        # This test case covers our REQ
-                        for method in tc.get('required_methods', []):
-                            all_methods.append(self._method_to_interface(method))
-                        all_test_refs.append({
-                            'test_id': tc.get('test_id'),
-                            'test_name': tc.get('test_name'),
-                            'source_file': file_path
-                        })
-                        all_assertions.extend(tc.get('assertions', []))
+        for file_path, file_data in req_slice.items():
+            # Merge traceability
+            file_trace = file_data['file_traceability']
+            for key in all_traceability:
+                if key != 'req':  # Already added
+                    all_traceability[key].extend(file_trace.get(key, []))
+
+            # Test cases covering this REQ
+            for tc in file_data['test_cases']:
+                for method in tc.get('required_methods', []):
+                    all_methods.append(self._method_to_interface(method))
+                all_test_refs.append({
+                    'test_id': tc.get('test_id'),
+                    'test_name': tc.get('test_name'),
+                    'source_file': file_path
+                })
+                all_assertions.extend(tc.get('assertions', []))
 
         if not all_methods and not all_test_refs:
             return None
@@ -528,13 +672,24 @@ class TestAwareSPECGenerator:
     def validate_spec_against_tests(
         self,
         spec_path: Path,
-        test_requirements: dict
+        test_requirements: dict,
+        req_id: Optional[str] = None
     ) -> dict:
         """
         Validate SPEC against test requirements.
 
+        With req_id, only that REQ's slice is checked: the methods required
+        by test cases covering req_id against the SPEC sections recorded for
+        it in the output directory's manifest. The SPEC YAML is read
+        instead when the manifest has no entry for req_id in spec_path, or
+        the entry's spec_hash is missing or no longer matches the file (the
+        SPEC was edited after generation).
+
         Returns validation results with coverage analysis.
         """
+        if req_id:
+            return self._validate_req_slice(spec_path, test_requirements, req_id)
+
         with open(spec_path, encoding='utf-8') as f:
             spec = yaml.safe_load(f)
 
@@ -593,6 +748,78 @@ class TestAwareSPECGenerator:
 
         return results
 
+    def _validate_req_slice(
+        self,
+        spec_path: Path,
+        test_requirements: dict,
+        req_id: str
+    ) -> dict:
+        """validate_spec_against_tests for a single REQ."""
+        results = {
+            'spec_path': str(spec_path),
+            'req_id': req_id,
+            'valid': True,
+            'coverage': {
+                'methods_covered': 0,
+                'methods_missing': [],
+                'req_covered': 0,
+                'req_missing': []
+            },
+            'warnings': [],
+            'errors': []
+        }
+
+        # SPEC side: manifest sections when they belong to this file and
+        # the file is unchanged since it was generated
+        entry = SpecManifest(spec_path.parent).get(req_id)
+        if (
+            entry
+            and entry.get('spec_file') == spec_path.name
+            and entry.get('spec_hash') is not None
+            and entry.get('spec_hash') == _file_sha256(spec_path)
+        ):
+            spec_data = TestAwareSPEC.from_dict(entry['spec'])
+            spec_methods = {m.name for m in spec_data.interfaces}
+            spec_reqs = set(spec_data.req_ids)
+        else:
+            with open(spec_path, encoding='utf-8') as f:
+                spec = yaml.safe_load(f) or {}
+            spec_methods = {
+                method.get('name')
+                for cls in spec.get('interfaces', {}).get('classes', [])
+                for method in cls.get('methods', [])
+            }
+            spec_reqs = {impl.get('req_id') for impl in spec.get('req_implementations', [])}
+
+        # Test side: methods required by the test cases covering req_id
+        test_files = test_requirements.get('by_req', {}).get(req_id, [])
+        test_methods = set()
+        for file_data in self._req_slice(req_id, test_files, test_requirements).values():
+            for tc in file_data['test_cases']:
+                for method in tc.get('required_methods', []):
+                    name = method.get('name', '').split('.')[-1]
+                    if name and not self._is_builtin(name):
+                        test_methods.add(name)
+
+        missing_methods = test_methods - spec_methods
+        if missing_methods:
+            results['coverage']['methods_missing'] = sorted(missing_methods)
+            results['warnings'].append(
+                f"Methods in {req_id} tests but not in SPEC: {missing_methods}"
+            )
+        results['coverage']['methods_covered'] = len(test_methods - missing_methods)
+
+        if req_id in spec_reqs:
+            results['coverage']['req_covered'] = 1
+        else:
+            results['coverage']['req_missing'] = [req_id]
+            results['warnings'].append(f"{req_id} is not implemented by SPEC")
+
+        if not test_files:
+            results['warnings'].append(f"No tests cover {req_id}")
+
+        return results
+
     def _is_builtin(self, name: str) -> bool:
         """Check if name is a Python builtin."""
         builtins = {
@@ -617,6 +844,12 @@ Examples:
 
   # Validate existing SPEC against tests
   python generate_spec_tdd.py --validate ai_dev_flow/09_SPEC/SPEC-01_auth.yaml --test-requirements tmp/test_requirements.json
+
+  # Validate one REQ's slice of a SPEC
+  python generate_spec_tdd.py --validate ai_dev_flow/09_SPEC/SPEC-01_req_01.yaml --req REQ-01 --test-requirements tmp/test_requirements.json
+
+  # Rebuild every SPEC, ignoring the incremental manifest
+  python generate_spec_tdd.py --test-requirements tmp/test_requirements.json --output ai_dev_flow/09_SPEC/ --full
         """
     )
 
@@ -645,6 +878,17 @@ Examples:
         help='Validate existing SPEC against test requirements'
     )
 
+    parser.add_argument(
+        '--req',
+        help='With --validate, check only this REQ\'s slice'
+    )
+
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help=f'Rebuild all SPECs instead of reusing unchanged REQs ({MANIFEST_NAME})'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -660,7 +904,7 @@ Examples:
 
         if args.validate:
             # Validation mode
-            results = generator.validate_spec_against_tests(args.validate, test_reqs)
+            results = generator.validate_spec_against_tests(args.validate, test_reqs, req_id=args.req)
             print(json.dumps(results, indent=2))
             return 0 if results['valid'] else 1
         elif args.output:
@@ -668,7 +912,8 @@ Examples:
             generated = generator.generate_spec_from_tests(
                 test_reqs,
                 args.req_dir,
-                args.output
+                args.output,
+                incremental=not args.full
             )
             print(f"Generated {len(generated)} SPEC file(s):")
             for path in generated:
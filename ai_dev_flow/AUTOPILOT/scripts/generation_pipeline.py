@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test File Generation Pipeline
+
+Shared by generate_integration_tests.py and generate_smoke_tests.py:
+    - CompiledTemplate: str.format-style templates parsed once, rendered by join
+    - parse_sources: parse source artifacts (of any type) across a process pool
+    - write_if_changed: write a generated file only when its content changed,
+      ignoring the "Generated: <timestamp>" header line, so re-generation
+      leaves unchanged files (and their mtimes) alone
+
+Usage:
+    from generation_pipeline import CompiledTemplate, parse_sources, write_if_changed
+
+    template = CompiledTemplate("def test_{name}():\\n    pass\\n")
+    parsed = parse_sources([(generator._parse_ctr_file, f) for f in ctr_files], jobs=4)
+    written = write_if_changed(output_file, template.render(name="login"))
+"""
+
+import hashlib
+import os
+import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Below this many source files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# Header line that changes on every run; excluded from content comparison
+GENERATED_LINE_PATTERN = re.compile(r'^Generated: .*$', re.MULTILINE)
+
+
+class CompiledTemplate:
+    """
+    A str.format template parsed once.
+
+    Supports the subset the generators use: named fields with optional
+    conversion and format spec, and {{ }} escapes. render() gives the same
+    result as template.format(**values).
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._pieces = []
+        for literal, name, spec, conversion in string.Formatter().parse(text):
+            if literal:
+                self._pieces.append((literal, None, None, None))
+            if name is not None:
+                self._pieces.append((None, name, spec or '', conversion))
+
+    def render(self, **values: Any) -> str:
+        out = []
+        for literal, name, spec, conversion in self._pieces:
+            if name is None:
+                out.append(literal)
+                continue
+            value = values[name]
+            if conversion == 'r':
+                value = repr(value)
+            elif conversion == 's':
+                value = str(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            out.append(format(value, spec) if spec else str(value))
+        return ''.join(out)
+
+
+def _call(job: tuple) -> tuple[Optional[Any], Optional[str]]:
+    """Process-pool worker: (parse, path) -> (parsed, error)."""
+    parse, path = job
+    try:
+        return parse(path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def parse_sources(
+    work: list[tuple[Callable[[Path], Any], Path]],
+    jobs: Optional[int] = None,
+    verbose: bool = False
+) -> list[tuple[Optional[Any], Optional[str]]]:
+    """
+    Call parse(path) for every (parse, path) pair, across a process pool for
+    larger inputs.
+
+    Each parse must be picklable (a module-level function or a bound method
+    of a picklable object). Falls back to parsing in-process when a pool
+    cannot be started.
+
+    Returns:
+        (parsed, None) or (None, error message) per pair, in input order
+    """
+    workers = min(jobs or os.cpu_count() or 1, len(work))
+    if workers > 1 and len(work) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(work) // (workers * 4))
+                return list(pool.map(_call, work, chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            # e.g. no semaphore support in a sandbox; parse in-process instead
+            if verbose:
+                print(f"Process pool unavailable ({e}); parsing serially")
+    return [_call(job) for job in work]
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of generated content, ignoring the Generated: timestamp line."""
+    return hashlib.sha256(GENERATED_LINE_PATTERN.sub('', content).encode('utf-8')).hexdigest()
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write content to path unless the file already holds the same content.
+
+    The write goes through a temp file and os.replace, so readers never see
+    a partial file.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if content_hash(path.read_text(encoding='utf-8')) == content_hash(content):
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
+    return True
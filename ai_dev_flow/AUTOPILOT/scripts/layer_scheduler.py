@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Layer DAG Scheduler for the MVP Autopilot
+
+Builds the layer dependency graph from LAYER_REGISTRY.yaml (`can_reference`)
+plus optional pipeline `dependencies`, and runs each layer's
+generate → validate → auto-fix step as soon as all of its upstream layers in
+the current run have succeeded. Independent layers run concurrently on a
+bounded thread pool; with one worker the layers run serially in order.
+
+Only layers selected for the run become graph nodes: references to layers
+outside the run are treated as already satisfied (existing artifacts).
+
+Execution settings (autopilot config `defaults`; the configured timeout and
+retries are only applied to --parallel runs, serial runs use them only when
+given on the command line):
+    parallel_execution  - Run independent layers concurrently (default: false)
+    timeout_per_layer   - Seconds before a running layer is reported as timed out
+    max_retries         - Extra attempts for a call that raised an error
+
+run_layer_dag() re-runs a whole step that raised only when given max_retries,
+so that is only safe for idempotent steps. The autopilot instead passes
+max_retries=0 and wraps the retryable calls inside its step (generation and
+validation) in call_with_retries(), leaving its bookkeeping un-repeated.
+
+A layer step that returns False (validation failed) is not retried; the
+scheduler stops submitting new layers, lets running ones finish, and marks
+the remaining layers as blocked.
+
+A timeout does NOT stop the layer. Threads cannot be killed, so a timed-out
+step keeps running (and may keep writing its files) after run_layer_dag()
+returns; the timeout only stops its dependents and the remaining layers from
+starting. The interpreter still waits for the step before exiting.
+
+Usage:
+    from layer_scheduler import load_layer_dependencies, run_layer_dag
+
+    deps = load_layer_dependencies()
+    outcomes = run_layer_dag(["BRD", "PRD"], deps, run_layer, max_workers=4)
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, TypeVar
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+LAYER_REGISTRY_PATH = SCRIPT_DIR.parents[1] / "LAYER_REGISTRY.yaml"
+
+# Outcome statuses
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUS_BLOCKED = "blocked"
+
+
+T = TypeVar("T")
+
+
+class LayerCycleError(ValueError):
+    """Raised when layer dependencies contain a cycle."""
+
+
+@dataclass
+class LayerOutcome:
+    """Result of one scheduled layer."""
+    layer: str
+    status: str
+    attempts: int = 0
+    duration: float = 0.0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_PASSED
+
+
+# =============================================================================
+# DEPENDENCY GRAPH
+# =============================================================================
+
+def load_layer_dependencies(registry_path: Path = LAYER_REGISTRY_PATH) -> Dict[str, List[str]]:
+    """
+    Read `can_reference` lists from the layer registry.
+
+    Returns:
+        Artifact name -> referenced artifact names (empty if the registry or
+        PyYAML is unavailable, which makes every layer independent)
+    """
+    try:
+        import yaml
+        data = yaml.safe_load(registry_path.read_text(encoding="utf-8")) or {}
+    except Exception:
+        return {}
+
+    dependencies: Dict[str, List[str]] = {}
+    for layer in data.get("layers", []) or []:
+        artifact = layer.get("artifact")
+        if artifact:
+            dependencies[artifact] = list(layer.get("can_reference") or [])
+    return dependencies
+
+
+def build_layer_dag(layers: List[str], dependencies: Dict[str, Iterable[str]]) -> Dict[str, Set[str]]:
+    """
+    Restrict dependencies to the layers in this run.
+
+    Args:
+        layers: Layers selected for the run (in pipeline order)
+        dependencies: Layer -> upstream layers (may mention layers not in the run)
+
+    Returns:
+        Layer -> upstream layers that are part of this run
+
+    Raises:
+        LayerCycleError: If the selected layers depend on each other cyclically
+    """
+    selected = set(layers)
+    dag = {
+        layer: {dep for dep in dependencies.get(layer, ()) if dep in selected and dep != layer}
+        for layer in layers
+    }
+
+    # Kahn's algorithm purely to reject cycles before anything runs
+    remaining = {layer: set(deps) for layer, deps in dag.items()}
+    ready = [layer for layer, deps in remaining.items() if not deps]
+    visited = 0
+    while ready:
+        done = ready.pop()
+        visited += 1
+        for layer, deps in remaining.items():
+            if done in deps:
+                deps.discard(done)
+                if not deps:
+                    ready.append(layer)
+    if visited != len(dag):
+        cyclic = sorted(layer for layer, deps in remaining.items() if deps)
+        raise LayerCycleError(f"Cyclic layer dependencies: {', '.join(cyclic)}")
+
+    return dag
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+def call_with_retries(max_retries: int, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Call fn, retrying up to max_retries more times while it raises.
+
+    Raises:
+        The last attempt's exception when every attempt raised
+    """
+    for attempt in range(max_retries):
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            continue
+    return fn(*args, **kwargs)
+
+
+def _run_with_retries(layer: str, run_layer: Callable[[str], bool], max_retries: int) -> LayerOutcome:
+    start = time.monotonic()
+    outcome = LayerOutcome(layer=layer, status=STATUS_ERROR)
+    for attempt in range(1, max_retries + 2):
+        outcome.attempts = attempt
+        try:
+            outcome.status = STATUS_PASSED if run_layer(layer) else STATUS_FAILED
+            outcome.error = ""
+            break
+        except Exception as e:
+            outcome.status = STATUS_ERROR
+            outcome.error = f"{type(e).__name__}: {e}"
+    outcome.duration = time.monotonic() - start
+    return outcome
+
+
+def run_layer_dag(
+    layers: List[str],
+    dependencies: Dict[str, Iterable[str]],
+    run_layer: Callable[[str], bool],
+    max_workers: int = 1,
+    timeout_per_layer: Optional[float] = None,
+    max_retries: int = 0,
+) -> Dict[str, LayerOutcome]:
+    """
+    Run layer steps in dependency order, concurrently where independent.
+
+    Ready layers are submitted in pipeline order, so max_workers=1 reproduces
+    the serial pipeline exactly.
+
+    Args:
+        layers: Layers selected for the run (in pipeline order)
+        dependencies: Layer -> upstream layers (see build_layer_dag)
+        run_layer: Step for one layer; returns True on success
+        max_workers: Concurrent layer steps
+        timeout_per_layer: Seconds before a running step is reported as timed out
+            (the step is not interrupted; see module docstring)
+        max_retries: Extra attempts for steps that raise (the whole step is
+            re-run; use only with idempotent steps, see call_with_retries)
+
+    Returns:
+        Layer -> LayerOutcome for every selected layer, in pipeline order
+    """
+    dag = build_layer_dag(layers, dependencies)
+    outcomes: Dict[str, LayerOutcome] = {}
+    pending = list(layers)
+    running: Dict[Future, str] = {}
+    started: Dict[str, float] = {}
+    halted = False
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="layer")
+    try:
+        while pending or running:
+            if not halted:
+                for layer in list(pending):
+                    if len(running) >= max(1, max_workers):
+                        break
+                    if all(dep in outcomes and outcomes[dep].ok for dep in dag[layer]):
+                        pending.remove(layer)
+                        started[layer] = time.monotonic()
+                        running[pool.submit(_run_with_retries, layer, run_layer, max_retries)] = layer
+
+            if not running:
+                break  # Nothing runnable: remaining layers are blocked
+
+            wait_for = None
+            if timeout_per_layer:
+                now = time.monotonic()
+                wait_for = max(0.0, min(started[l] + timeout_per_layer - now for l in running.values()))
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                layer = running.pop(future)
+                outcomes[layer] = future.result()
+                if not outcomes[layer].ok:
+                    halted = True
+
+            if timeout_per_layer:
+                now = time.monotonic()
+                for future, layer in list(running.items()):
+                    if now - started[layer] >= timeout_per_layer:
+                        running.pop(future)  # Still running; cannot be cancelled
+                        outcomes[layer] = LayerOutcome(
+                            layer=layer,
+                            status=STATUS_TIMEOUT,
+                            attempts=1,
+                            duration=now - started[layer],
+                            error=f"exceeded {timeout_per_layer}s (step not stopped; it may still write files)",
+                        )
+                        halted = True
+    finally:
+        # Timed-out steps keep running in their threads; do not block on them
+        pool.shutdown(wait=not any(o.status == STATUS_TIMEOUT for o in outcomes.values()))
+
+    for layer in pending:
+        outcomes[layer] = LayerOutcome(layer=layer, status=STATUS_BLOCKED)
+
+    return {layer: outcomes[layer] for layer in layers}
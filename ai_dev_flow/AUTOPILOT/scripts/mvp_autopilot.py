@@ -12,6 +12,10 @@ Usage:
     --up-to TASKS \
     --auto-fix
 
+  # Many projects at once (manifest of nn/slug/intent/layer range entries)
+  python3 ai_dev_flow/AUTOPILOT/scripts/mvp_autopilot.py \
+    --root ai_dev_flow --batch projects.yaml --jobs 8 --report markdown
+
 Notes:
   - Generation uses the repository's MVP/full templates under `ai_dev_flow/*`.
   - No network calls or LLMs are used; content is copied from templates with
@@ -22,13 +26,22 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import copy
+import hashlib
+import json
+import os
 import re
 import shutil
+import signal
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 # Allow importing validator registry/utilities
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -48,6 +61,24 @@ except Exception:
 from enum import Enum
 from typing import Any, Union
 
+from layer_scheduler import (
+    STATUS_ERROR,
+    STATUS_TIMEOUT,
+    LayerCycleError,
+    call_with_retries,
+    load_layer_dependencies,
+    run_layer_dag,
+)
+from run_profiler import RunProfiler
+from run_journal import (
+    JOURNAL_FAIL,
+    JOURNAL_FIXED,
+    JOURNAL_GENERATED,
+    JOURNAL_PASS,
+    VALIDATED_STATUSES,
+    RunJournal,
+)
+
 class ProjectMode(Enum):
     GREENFIELD = "greenfield"
     BROWNFIELD = "brownfield"
@@ -64,6 +95,7 @@ class PreCheck:
     mode: Optional[str] = None
     on_exists: Optional[str] = None
     action: Optional[str] = None
+    parallel_group: Optional[str] = None  # Checks sharing a group run concurrently
 
 @dataclass
 class ValidationConfig:
@@ -165,37 +197,239 @@ def load_v4_config(config_path: Path) -> Dict[str, Any]:
         # Backward compatibility: convert v3 to v4 format
         return convert_v3_to_v4(config)
 
-def detect_project_mode(root_path: Path, forced_mode: Optional[str] = None) -> ProjectMode:
+# Parsed configs by (path, mtime_ns); batch runs reuse them across projects
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def load_v4_config_cached(config_path: Path) -> Dict[str, Any]:
+    """load_v4_config() once per file version; callers get a private copy."""
+    try:
+        key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+    except OSError:
+        return load_v4_config(config_path)
+    if key not in _CONFIG_CACHE:
+        _CONFIG_CACHE[key] = load_v4_config(config_path)
+    # Pipeline check objects are mutated during a run
+    return copy.deepcopy(_CONFIG_CACHE[key])
+
+# Project-mode detection: bounded-depth scan for existing layer directories.
+# Dependency, VCS and build trees are pruned and the scan stops once every
+# marker is found. Tunable via config `project_modes.auto` (max_depth,
+# prune_dirs, cache_ttl).
+MODE_DETECT_MAX_DEPTH = 4
+MODE_DETECT_PRUNE_DIRS = {
+    ".git", ".hg", ".svn", ".venv", "venv", "env", "node_modules", "__pycache__",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", "dist", "build", "site-packages",
+    ".autopilot_state",
+}
+MODE_DETECT_CACHE_TTL = 3600  # seconds a cached detection stays valid
+MODE_CACHE_VERSION = 1
+MODE_CACHE_FILE = "project_mode.json"  # under <root>/.autopilot_state/
+
+# marker -> (layer directory, file suffix)
+MODE_MARKERS = {
+    "prd": ("02_PRD", ".md"),
+    "spec": ("09_SPEC", ".yaml"),
+}
+
+
+@dataclass
+class ModeDetection:
+    """Detected project mode with the evidence and cost of detecting it."""
+    mode: ProjectMode
+    markers: Dict[str, Optional[str]]
+    has_code: bool
+    elapsed_ms: float = 0.0
+    dirs_scanned: int = 0
+    cached: bool = False
+
+    def describe(self) -> str:
+        if self.cached:
+            return f"cached, {self.elapsed_ms:.1f} ms"
+        return f"detected in {self.elapsed_ms:.1f} ms, {self.dirs_scanned} dirs scanned"
+
+
+def scan_mode_markers(
+    root_path: Path,
+    max_depth: int = MODE_DETECT_MAX_DEPTH,
+    prune_dirs: Optional[Set[str]] = None,
+    dir_mtimes: Optional[Dict[str, int]] = None,
+) -> Tuple[Dict[str, Optional[Path]], int]:
     """
-    Detect if project is greenfield (new) or brownfield (existing).
-    
+    Breadth-first search for the first file of each mode marker.
+
     Args:
-        root_path: Project root directory
-        forced_mode: Explicitly requested mode (optional)
-        
+        dir_mtimes: Filled with the mtime of every directory listed, so a
+            cached result can be checked for new files anywhere in the scan
+
     Returns:
-        ProjectMode enum value
+        (marker -> first matching file or None, directories scanned)
     """
-    if forced_mode:
-        try:
-            return ProjectMode(forced_mode.lower())
-        except ValueError:
-            print(f"Warning: Invalid mode '{forced_mode}', falling back to auto detection")
-    
-    # Check for existing documentation layers
-    has_prd = list(root_path.glob("**/02_PRD/*.md"))
-    has_spec = list(root_path.glob("**/09_SPEC/*.yaml"))
-    has_code = (root_path / "src").exists() or (root_path / "app").exists()
-    
+    def _listing(path: str) -> List[os.DirEntry]:
+        # mtime is taken before listing: a change during the scan invalidates the result
+        if dir_mtimes is not None:
+            dir_mtimes[path] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            return list(it)
+
+    prune = MODE_DETECT_PRUNE_DIRS if prune_dirs is None else prune_dirs
+    found: Dict[str, Optional[Path]] = {name: None for name in MODE_MARKERS}
+    by_dir = {layer_dir: name for name, (layer_dir, _) in MODE_MARKERS.items()}
+    queue = [(str(root_path), 0)]
+    scanned = 0
+    while queue and not all(found.values()):
+        next_queue = []
+        for dir_path, depth in queue:
+            scanned += 1
+            try:
+                entries = _listing(dir_path)
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False) or entry.name in prune:
+                    continue
+                marker = by_dir.get(entry.name)
+                if marker and found[marker] is None:
+                    suffix = MODE_MARKERS[marker][1]
+                    try:
+                        for f in _listing(entry.path):
+                            if f.name.endswith(suffix) and f.is_file():
+                                found[marker] = Path(f.path)
+                                break
+                    except OSError:
+                        pass
+                if depth < max_depth:
+                    next_queue.append((entry.path, depth + 1))
+        queue = next_queue
+    return found, scanned
+
+
+def _mode_from_markers(has_prd: bool, has_spec: bool, has_code: bool) -> ProjectMode:
     # Smart detection logic
     if has_spec and has_code:
         return ProjectMode.BROWNFIELD
     elif has_prd and not has_spec:
         return ProjectMode.GREENFIELD
-    
+
     # Default fallback
     return ProjectMode.GREENFIELD
 
+
+def _load_mode_cache(path: Optional[Path]) -> Optional[Dict[str, Any]]:
+    if path is None or not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MODE_CACHE_VERSION:
+        return None
+    return data
+
+
+def _save_mode_cache(path: Path, data: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process temp file: batch workers may share one project root
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"version": MODE_CACHE_VERSION, **data}), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass  # The cache is best-effort; detection does not depend on it
+
+
+def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    for path, mtime in dir_mtimes.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def detect_project_mode_info(
+    root_path: Path,
+    forced_mode: Optional[str] = None,
+    max_depth: int = MODE_DETECT_MAX_DEPTH,
+    prune_dirs: Optional[Set[str]] = None,
+    cache_path: Optional[Path] = None,
+    cache_ttl: float = MODE_DETECT_CACHE_TTL,
+) -> ModeDetection:
+    """
+    Detect the project mode, reusing a cached detection when still valid.
+
+    A cached detection (cache_path, one per project root) is reused while it
+    is younger than cache_ttl, was made with the same scan settings, no
+    directory the scan listed has been modified since (so a marker added
+    anywhere in the scanned tree is noticed) and the marker files it found
+    still exist.
+    """
+    start = time.perf_counter()
+    has_code = (root_path / "src").exists() or (root_path / "app").exists()
+    if forced_mode:
+        try:
+            return ModeDetection(ProjectMode(forced_mode.lower()), {}, has_code)
+        except ValueError:
+            print(f"Warning: Invalid mode '{forced_mode}', falling back to auto detection")
+
+    prune = sorted(MODE_DETECT_PRUNE_DIRS if prune_dirs is None else prune_dirs)
+    cached = _load_mode_cache(cache_path)
+    if (
+        cached
+        and cached.get("root") == str(root_path.resolve())
+        and cached.get("max_depth") == max_depth
+        and cached.get("prune_dirs") == prune
+        and cached.get("has_code") == has_code
+        and time.time() - cached.get("detected_at", 0) < cache_ttl
+        and _dirs_unchanged(cached.get("dir_mtimes") or {})
+        and all(Path(p).exists() for p in cached.get("markers", {}).values() if p)
+    ):
+        markers = cached["markers"]
+        mode = _mode_from_markers(bool(markers.get("prd")), bool(markers.get("spec")), has_code)
+        return ModeDetection(mode, markers, has_code, (time.perf_counter() - start) * 1000, cached=True)
+
+    dir_mtimes: Dict[str, int] = {}
+    found, scanned = scan_mode_markers(root_path, max_depth, set(prune), dir_mtimes)
+    markers = {name: (str(path) if path else None) for name, path in found.items()}
+    mode = _mode_from_markers(bool(found["prd"]), bool(found["spec"]), has_code)
+    if cache_path is not None:
+        state_dir = cache_path.parent
+        if not state_dir.is_dir():
+            try:
+                state_dir.mkdir(parents=True, exist_ok=True)
+                # Creating the state dir modifies its parent; re-stat it so
+                # the cache is not invalidated by its own directory
+                parent = str(state_dir.parent)
+                if parent in dir_mtimes:
+                    dir_mtimes[parent] = os.stat(parent).st_mtime_ns
+            except OSError:
+                pass  # _save_mode_cache skips the write
+        _save_mode_cache(cache_path, {
+            "root": str(root_path.resolve()),
+            "markers": markers,
+            "has_code": has_code,
+            "max_depth": max_depth,
+            "prune_dirs": prune,
+            "dir_mtimes": dir_mtimes,
+            "detected_at": time.time(),
+        })
+    return ModeDetection(mode, markers, has_code, (time.perf_counter() - start) * 1000, scanned)
+
+
+def detect_project_mode(root_path: Path, forced_mode: Optional[str] = None) -> ProjectMode:
+    """
+    Detect if project is greenfield (new) or brownfield (existing).
+    
+    Args:
+        root_path: Project root directory
+        forced_mode: Explicitly requested mode (optional)
+        
+    Returns:
+        ProjectMode enum value
+    """
+    return detect_project_mode_info(root_path, forced_mode).mode
+
 def resolve_layer_range(config: Dict, from_layer: Optional[str] = None, up_to: Optional[str] = None) -> List[str]:
     """
     Resolve which layers to execute based on entry/exit points.
@@ -248,18 +482,105 @@ def resolve_layer_range(config: Dict, from_layer: Optional[str] = None, up_to: O
                 print(f"Warning: End layer '{up_to}' not found, running to end")
     
     # Return slice
+    if start_idx > end_idx:
         print(f"Warning: Start layer is after end layer, executing single layer {sorted_layers[start_idx]}")
         return [sorted_layers[start_idx]]
         
     return sorted_layers[start_idx : end_idx + 1]
 
-def execute_checks(checks: List[PreCheck], context: Dict) -> bool:
+# Default cap on concurrently running checks of one parallel_group
+# (config `defaults.max_parallel_checks`)
+CHECK_MAX_PARALLEL = 4
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one pre/post check."""
+    name: str
+    status: str  # passed | failed | error | skipped | cancelled
+    required: bool = True
+    returncode: Optional[int] = None
+    duration: float = 0.0
+    output: str = ""
+
+
+def _terminate_check(proc: subprocess.Popen) -> None:
+    # Checks run in their own session so the shell's children are killed too
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except (AttributeError, OSError):
+        proc.terminate()
+
+
+def _run_check(check: PreCheck, required: bool, cancel: threading.Event, running: Set, lock: threading.Lock) -> CheckResult:
+    if cancel.is_set():
+        return CheckResult(check.name, "cancelled", required)
+    start = time.monotonic()
+    try:
+        proc = subprocess.Popen(
+            check.command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+        with lock:
+            running.add(proc)
+            if cancel.is_set():
+                _terminate_check(proc)  # Cancelled while starting
+        try:
+            _, stderr = proc.communicate()
+        finally:
+            with lock:
+                running.discard(proc)
+    except Exception as e:
+        return CheckResult(check.name, "error", required, duration=time.monotonic() - start, output=str(e))
+
+    duration = time.monotonic() - start
+    if proc.returncode == 0:
+        status = "passed"
+    elif cancel.is_set() and proc.returncode < 0:
+        status = "cancelled"  # Terminated after a halting failure in its group
+    else:
+        status = "failed"
+    return CheckResult(check.name, status, required, proc.returncode, duration, stderr or "")
+
+
+def _print_check_result(result: CheckResult) -> None:
+    timing = f" ({result.duration:.2f}s)"
+    if result.status == "passed":
+        print(f"  ✅ Check passed: {result.name}{timing}")
+    elif result.status == "failed" and result.required:
+        print(f"  ❌ Check failed: {result.name}{timing}")
+        print(f"  Output: {result.output}")
+    elif result.status == "failed":
+        print(f"  ⚠️ Check failed (optional): {result.name}{timing}")
+    elif result.status == "error":
+        print(f"  ❌ Check execution error: {result.output}")
+    elif result.status == "cancelled":
+        print(f"  ⏹️ Check cancelled: {result.name}")
+
+
+def execute_checks(
+    checks: List[PreCheck],
+    context: Dict,
+    results: Optional[List[CheckResult]] = None,
+) -> bool:
     """
     Execute a list of pre/post checks.
+
+    Checks run in declaration order. Checks sharing a `parallel_group` run
+    concurrently (at most context['max_parallel'] at a time) at the position
+    of the group's first check. A halting failure (a required check with
+    action 'halt' failing, or a required check erroring) stops execution and
+    cancels the rest of its group, terminating commands already running.
     
     Args:
         checks: List of Check objects
-        context: Execution context (project_mode, etc.)
+        context: Execution context (mode, max_parallel)
+        results: Optional list that receives a CheckResult per check, in
+            declaration order (with durations)
         
     Returns:
         True if all checks passed, False otherwise
@@ -268,48 +589,66 @@ def execute_checks(checks: List[PreCheck], context: Dict) -> bool:
         return True
         
     mode = context.get('mode', ProjectMode.GREENFIELD)
-    
-    for check in checks:
+    max_parallel = max(1, int(context.get('max_parallel') or CHECK_MAX_PARALLEL))
+    # Per-check results by declaration index (unreached checks stay None)
+    slots: List[Optional[CheckResult]] = [None] * len(checks)
+
+    # Group checks into units, in order of first appearance
+    units: List[List[Tuple[int, PreCheck, bool]]] = []
+    group_units: Dict[str, List[Tuple[int, PreCheck, bool]]] = {}
+    for index, check in enumerate(checks):
         # Check conditions
-        if check.mode and check.mode != mode.value:
-            continue
-            
-        if check.skip_for and check.skip_for == mode.value:
+        if (check.mode and check.mode != mode.value) or (check.skip_for and check.skip_for == mode.value):
+            slots[index] = CheckResult(check.name, "skipped", bool(check.required))
             continue
-            
-        if check.required_for and check.required_for != mode.value:
-            # Not required for this mode, treat as optional
-            check.required = False
-            
-        print(f"  Running check: {check.name}...")
-        
-        # Execute command
-        try:
-            result = subprocess.run(
-                check.command,
-                shell=True,
-                check=False,
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode != 0:
-                if check.required:
-                    print(f"  ❌ Check failed: {check.name}")
-                    print(f"  Output: {result.stderr}")
-                    if check.action == 'halt':
-                        return False
-                else:
-                    print(f"  ⚠️ Check failed (optional): {check.name}")
-            else:
-                print(f"  ✅ Check passed: {check.name}")
-                
-        except Exception as e:
-            print(f"  ❌ Check execution error: {e}")
-            if check.required:
-                return False
-                
-    return True
+        # Not required for this mode, treat as optional
+        required = False if (check.required_for and check.required_for != mode.value) else bool(check.required)
+        if check.parallel_group:
+            if check.parallel_group not in group_units:
+                group_units[check.parallel_group] = []
+                units.append(group_units[check.parallel_group])
+            group_units[check.parallel_group].append((index, check, required))
+        else:
+            units.append([(index, check, required)])
+
+    def _halts(check: PreCheck, result: CheckResult) -> bool:
+        if not result.required:
+            return False
+        return result.status == "error" or (result.status == "failed" and check.action == 'halt')
+
+    passed = True
+    for unit in units:
+        cancel = threading.Event()
+        running: Set = set()
+        lock = threading.Lock()
+
+        if len(unit) == 1:
+            _, check, required = unit[0]
+            print(f"  Running check: {check.name}...")
+            unit_results = [_run_check(check, required, cancel, running, lock)]
+        else:
+            print(f"  Running checks ({unit[0][1].parallel_group}, parallel): {', '.join(c.name for _, c, _ in unit)}...")
+            with ThreadPoolExecutor(max_workers=min(max_parallel, len(unit)), thread_name_prefix="check") as pool:
+                futures = {pool.submit(_run_check, c, r, cancel, running, lock): c for _, c, r in unit}
+                for future in as_completed(futures):
+                    if _halts(futures[future], future.result()) and not cancel.is_set():
+                        cancel.set()
+                        with lock:
+                            for proc in running:
+                                _terminate_check(proc)
+                unit_results = [future.result() for future in futures]
+
+        for (index, check, _), result in zip(unit, unit_results):
+            _print_check_result(result)
+            slots[index] = result
+            if _halts(check, result):
+                passed = False
+        if not passed:
+            break
+
+    if results is not None:
+        results.extend(r for r in slots if r is not None)
+    return passed
 
 def should_skip_layer(layer_config: LayerPipelineConfig, mode: ProjectMode) -> bool:
     """
@@ -361,30 +700,44 @@ def slugify(text: str, fallback: str) -> str:
     return s or fallback
 
 
+# Nested template placeholders -> concrete element IDs
+NESTED_ID_PLACEHOLDERS = {
+    "BRD.NN.TT.SS": "BRD.{nn}.01.01",
+    "PRD.NN.EE.SS": "PRD.{nn}.01.01",
+    "BRD.NN.32.SS": "BRD.{nn}.32.01",  # Architecture reference
+    "EARS.NN.24.SS": "EARS.{nn}.24.01",
+}
+
+# Layers whose PREFIX[-._]NN tokens are substituted in every template
+ID_PREFIXES = ["BRD", "PRD", "EARS", "BDD", "ADR", "SYS", "REQ", "SPEC"]
+
+
+@lru_cache(maxsize=None)
+def _id_substitution_regex(layer_name: str) -> "re.Pattern[str]":
+    prefixes = ID_PREFIXES + ([layer_name] if layer_name not in ID_PREFIXES else [])
+    nested = "|".join(re.escape(k) for k in NESTED_ID_PLACEHOLDERS)
+    # Nested placeholders are tried first at each position, preserving the
+    # precedence of the former sequential passes
+    return re.compile(
+        fr"(?P<nested>{nested})|(?P<prefix>{'|'.join(map(re.escape, prefixes))})(?P<sep>[-._])NN"
+    )
+
+
 def substitute_ids(content: str, layer_name: str, nn: str = "01") -> str:
-    # 1. Handle complex/nested placeholders first (specific to templates)
-    # BRD.NN.TT.SS -> BRD.01.01.01
-    content = re.sub(fr"BRD\.NN\.TT\.SS", f"BRD.{nn}.01.01", content)
-    # PRD.NN.EE.SS -> PRD.01.01.01
-    content = re.sub(fr"PRD\.NN\.EE\.SS", f"PRD.{nn}.01.01", content)
-    # BRD.NN.32.SS -> BRD.01.32.01 (Architecture reference)
-    content = re.sub(fr"BRD\.NN\.32\.SS", f"BRD.{nn}.32.01", content)
-    # EARS.NN.24.SS -> EARS.01.24.01
-    content = re.sub(fr"EARS\.NN\.24\.SS", f"EARS.{nn}.24.01", content)
-    
-    # 2. Handle standard NN tokens for ALL layers with separator preservation
-    prefixes = ["BRD", "PRD", "EARS", "BDD", "ADR", "SYS", "REQ", "SPEC"]
-    for prefix in prefixes:
-        # Match Prefix + Separator + NN (e.g. BRD-NN or BRD.NN)
-        # Capture separator to preserve style (dot vs hyphen)
-        # Use \g<N> syntax to avoid octal/group ambiguity with subsequent digits
-        content = re.sub(fr"({prefix})([-._])NN", fr"\g<1>\g<2>{nn}", content)
-    
-    # 3. Fallback for current layer generic reference
-    if layer_name not in prefixes:
-         content = re.sub(fr"({layer_name})([-._])NN", fr"\g<1>\g<2>{nn}", content)
-    
-    return content
+    """
+    Replace NN placeholders in one regex pass.
+
+    Nested placeholders (BRD.NN.TT.SS -> BRD.01.01.01) first, then
+    PREFIX-NN / PREFIX.NN / PREFIX_NN for every layer prefix (separator
+    preserved), plus the current layer when it is not a standard prefix.
+    """
+    def _replace(match: "re.Match[str]") -> str:
+        nested = match.group("nested")
+        if nested:
+            return NESTED_ID_PLACEHOLDERS[nested].format(nn=nn)
+        return f"{match.group('prefix')}{match.group('sep')}{nn}"
+
+    return _id_substitution_regex(layer_name).sub(_replace, content)
 
 
 def ensure_planning_docs(layer_dir: Path, name: str, id_nn: str, target_filename: str) -> None:
@@ -397,35 +750,28 @@ def ensure_planning_docs(layer_dir: Path, name: str, id_nn: str, target_filename
         )
 
 
-def generate_from_template(
-    layer: Layer,
-    root: Path,
-    nn: str,
-    intent: str,
-    slug_hint: str,
-) -> Path:
-    layer_dir = layer.dir(root)
-    layer_dir.mkdir(parents=True, exist_ok=True)
+# =============================================================================
+# COMPILED TEMPLATES
+# =============================================================================
+# A template is compiled once per layer by running the rendering pipeline with
+# sentinel values for NN, slug and intent, then splitting on the sentinels.
+# Rendering for a concrete NN/slug is a single join over the compiled parts.
 
-    slug = slugify(slug_hint or intent, f"{layer.name.lower()}_{nn}")
-    target = layer_dir / f"{layer.name}-{nn}_{slug}{layer.ext}"
-    if target.exists():
-        return target
+TEMPLATE_CACHE_VERSION = 1
+STATE_DIR_NAME = ".autopilot_state"
+TEMPLATE_CACHE_FILE = "template_cache.json"
 
-    # Fix: use SCRIPT_DIR to find templates in the framework directory
-    # layer.template_path(root) was incorrectly looking in the output directory
-    tpl = SCRIPT_DIR.parent / layer.name / layer.template
-    
-    if not tpl.exists():
-        # fallback: create minimal file if template missing
-        target.write_text(
-            f"---\n" f"title: \"{layer.name}-{nn}: {slug.replace('_',' ').title()}\"\n" f"---\n\n",
-            encoding="utf-8",
-        )
-        ensure_planning_docs(layer_dir, layer.name, nn, target.name)
-        return target
+_SLOT_SENTINELS = {"nn": "\x00nn\x00", "slug": "\x00slug\x00", "intent": "\x00intent\x00"}
+_SLOT_SPLIT_RE = re.compile("\x00(nn|slug|intent)\x00")
+
+
+def resolve_template_path(layer: Layer) -> Path:
+    """Layer template in the framework directory (may not exist; callers fall back to a stub)."""
+    return SCRIPT_DIR.parent / layer.name / layer.template
 
-    content = tpl.read_text(encoding="utf-8")
+
+def render_template_content(content: str, layer: Layer, nn: str, human_slug: str, intent: str) -> str:
+    """Apply ID substitution and artifact normalization to raw template text."""
     content = substitute_ids(content, layer.name, nn)
     
     # Fix: update document_type from template to artifact type
@@ -438,7 +784,6 @@ def generate_from_template(
     # (Since we replaced prd-template with prd, prd is now there. If prd was duplicate, YAML handles it or we don't care)
 
     # Shallow injection of intent where obvious placeholders exist
-    human_slug = slug.replace("_", " ").title()
     content = content.replace("[MVP Product/Feature Name]", human_slug)
     content = content.replace("[MVP idea]", intent)
     content = content.replace("[Idea/Project Name]", human_slug)
@@ -446,7 +791,7 @@ def generate_from_template(
     # Normalize frontmatter title to concrete ID when possible
     try:
         display_title = f"{layer.name}-{nn}: {human_slug}"
-        content = re.sub(r'(?m)^title:\s*".*"$', f'title: "{display_title}"', content)
+        content = re.sub(r'(?m)^title:\s*".*"$', lambda _m: f'title: "{display_title}"', content)
     except Exception:
         pass
 
@@ -456,7 +801,7 @@ def generate_from_template(
             # Replace first H1 that looks like a template header
             content = re.sub(
                 r'(?m)^(#)\s+.*TEMPLATE.*$',
-                f"# {layer.name}-{nn}: {human_slug}",
+                lambda _m: f"# {layer.name}-{nn}: {human_slug}",
                 content,
                 count=1,
             )
@@ -464,7 +809,7 @@ def generate_from_template(
             # Replace Feature line if it's a template marker
             content = re.sub(
                 r'(?m)^Feature:\s*.*TEMPLATE.*$',
-                f"Feature: {layer.name}-{nn} — {human_slug}",
+                lambda _m: f"Feature: {layer.name}-{nn} — {human_slug}",
                 content,
                 count=1,
             )
@@ -477,6 +822,132 @@ def generate_from_template(
     except Exception:
         pass
 
+    return content
+
+
+@dataclass
+class CompiledTemplate:
+    """Template text split into literals (even indexes) and slot names (odd indexes)."""
+    parts: List[str]
+
+    def render(self, nn: str, human_slug: str, intent: str) -> str:
+        values = {"nn": nn, "slug": human_slug, "intent": intent}
+        out = list(self.parts)
+        out[1::2] = [values[name] for name in self.parts[1::2]]
+        return "".join(out)
+
+
+def compile_template(content: str, layer: Layer) -> CompiledTemplate:
+    """Compile raw template text for a layer."""
+    traced = render_template_content(
+        content, layer, _SLOT_SENTINELS["nn"], _SLOT_SENTINELS["slug"], _SLOT_SENTINELS["intent"]
+    )
+    return CompiledTemplate(parts=_SLOT_SPLIT_RE.split(traced))
+
+
+class TemplateCache:
+    """
+    Compiled templates, cached in memory per process and on disk by template hash.
+
+    The disk cache (JSON, atomic writes) is optional; entries are keyed by the
+    SHA-256 of the template bytes plus layer name and extension.
+    """
+
+    def __init__(self):
+        self.memory: Dict[Tuple[str, str, str], CompiledTemplate] = {}
+        self.disk_path: Optional[Path] = None
+        self._disk: Optional[Dict[str, List[str]]] = None
+        self._lock = threading.Lock()
+
+    def configure(self, disk_path: Optional[Path]) -> None:
+        """Select the disk cache file (None disables it)."""
+        with self._lock:
+            if disk_path != self.disk_path:
+                self.disk_path = disk_path
+                self._disk = None
+
+    def _load_disk(self) -> Dict[str, List[str]]:
+        if self._disk is None:
+            self._disk = {}
+            if self.disk_path and self.disk_path.exists():
+                try:
+                    data = json.loads(self.disk_path.read_text(encoding="utf-8"))
+                    if data.get("version") == TEMPLATE_CACHE_VERSION:
+                        self._disk = data.get("templates", {})
+                except (OSError, ValueError):
+                    pass
+        return self._disk
+
+    def _save_disk(self) -> None:
+        if not self.disk_path:
+            return
+        try:
+            self.disk_path.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process temp file: batch workers may share one project root
+            tmp_path = self.disk_path.with_suffix(f"{self.disk_path.suffix}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"version": TEMPLATE_CACHE_VERSION, "templates": self._disk}),
+                encoding="utf-8",
+            )
+            tmp_path.replace(self.disk_path)
+        except OSError:
+            pass  # Cache is an optimization only
+
+    def get(self, tpl: Path, layer: Layer) -> CompiledTemplate:
+        """Compiled template for a layer (template file is read at most once per process)."""
+        key = (str(tpl), layer.name, layer.ext)
+        with self._lock:
+            compiled = self.memory.get(key)
+            if compiled is not None:
+                return compiled
+
+            raw = tpl.read_bytes()
+            disk_key = f"{hashlib.sha256(raw).hexdigest()}:{layer.name}:{layer.ext}"
+            disk = self._load_disk()
+            parts = disk.get(disk_key)
+            if parts is not None:
+                compiled = CompiledTemplate(parts=parts)
+            else:
+                compiled = compile_template(raw.decode("utf-8"), layer)
+                disk[disk_key] = compiled.parts
+                self._save_disk()
+            self.memory[key] = compiled
+            return compiled
+
+
+TEMPLATE_CACHE = TemplateCache()
+
+
+def generate_from_template(
+    layer: Layer,
+    root: Path,
+    nn: str,
+    intent: str,
+    slug_hint: str,
+) -> Path:
+    layer_dir = layer.dir(root)
+    layer_dir.mkdir(parents=True, exist_ok=True)
+
+    slug = slugify(slug_hint or intent, f"{layer.name.lower()}_{nn}")
+    target = layer_dir / f"{layer.name}-{nn}_{slug}{layer.ext}"
+    if target.exists():
+        return target
+
+    # Templates live in the framework directory, not the output directory
+    tpl = resolve_template_path(layer)
+    
+    if not tpl.exists():
+        # fallback: create minimal file if template missing
+        target.write_text(
+            f"---\n" f"title: \"{layer.name}-{nn}: {slug.replace('_',' ').title()}\"\n" f"---\n\n",
+            encoding="utf-8",
+        )
+        ensure_planning_docs(layer_dir, layer.name, nn, target.name)
+        return target
+
+    human_slug = slug.replace("_", " ").title()
+    content = TEMPLATE_CACHE.get(tpl, layer).render(nn, human_slug, intent)
+
     target.write_text(content, encoding="utf-8")
     ensure_planning_docs(layer_dir, layer.name, nn, target.name)
     return target
@@ -736,13 +1207,8 @@ def _fix_bdd(content: str, nn: str, upstream_ids: Dict[str, str], human_slug: st
     return "\n".join(lines)
 
 
-def try_minimal_autofix(file: Path, layer: Layer, upstream_ids: Dict[str, str]) -> None:
+def apply_minimal_fixes(content: str, file: Path, layer: Layer, upstream_ids: Dict[str, str]) -> str:
     """Deterministic auto-fixes per layer: frontmatter, headings, sections, tags."""
-    try:
-        content = file.read_text(encoding="utf-8")
-    except Exception:
-        return
-
     human_slug = re.sub(r"[^a-z0-9]+", " ", file.stem.split("_", 1)[1]).title() if "_" in file.stem else file.stem
     nn = re.search(r"-(\d{2,})", file.stem)
     nn = nn.group(1) if nn else "01"
@@ -847,58 +1313,343 @@ def try_minimal_autofix(file: Path, layer: Layer, upstream_ids: Dict[str, str])
         if block and any((f"@{t.lower():s}:" not in content.lower()) for t in (layer.upstream_tags or [])):
             newc = content.rstrip() + block
 
-    if newc != content:
-        file.write_text(newc, encoding="utf-8")
-
+    return newc
 
-    # All skeleton-related helpers removed; no minimal templates are generated
 
+def try_minimal_autofix(file: Path, layer: Layer, upstream_ids: Dict[str, str]) -> None:
+    """Apply apply_minimal_fixes() to a file in place."""
+    try:
+        content = file.read_text(encoding="utf-8")
+    except Exception:
+        return
+    newc = apply_minimal_fixes(content, file, layer, upstream_ids)
+    if newc != content:
+        file.write_text(newc, encoding="utf-8")
 
-def run_layer_validation(root_or_file: Path, layer_name: str, strict: bool = False, mvp_validators: bool = False) -> Tuple[bool, str]:
-    """Run a single validator. Success when exit code is 0 (strict) or 0/1 (warnings-only)."""
 
-    if not VALIDATOR_REGISTRY:
-        return False, "Validator registry unavailable"
-    # MVP-friendly overrides
-    if mvp_validators and layer_name == "BRD":
-        # Prefer the Python BRD validator on a single file
-        script_path = SCRIPT_DIR / "validate_brd.py"
-        cmd = [sys.executable, str(script_path), str(root_or_file)]
-    else:
-        vcfg: ValidatorConfig = VALIDATOR_REGISTRY.get(layer_name)
-        if not vcfg:
-            return True, f"No validator registered for {layer_name} (skipping)"
+# =============================================================================
+# IN-MEMORY AUTO-FIX
+# =============================================================================
+# Layers whose Python validators accept document text. For these the auto-fix
+# loop fixes and re-validates the text in memory and writes the file once.
 
-        script_path = SCRIPT_DIR / vcfg.script
-        if not script_path.exists():
-            return False, f"Script not found: {script_path}"
+CONTENT_VALIDATORS = {
+    "BRD": ("01_BRD", "validate_brd"),
+    "PRD": ("02_PRD", "validate_prd"),
+    "EARS": ("03_EARS", "validate_ears"),
+    "BDD": ("04_BDD", "validate_bdd"),
+}
 
-        if vcfg.script_type == "python":
-            if layer_name == "EARS":
-                cmd = [sys.executable, str(script_path), "--path", str(root_or_file)]
-            else:
-                cmd = [sys.executable, str(script_path), str(root_or_file)]
-        else:
-            cmd = ["bash", str(script_path), str(root_or_file)]
 
+@lru_cache(maxsize=None)
+def _load_content_validator(layer_name: str):
+    entry = CONTENT_VALIDATORS.get(layer_name)
+    if entry is None:
+        return None
+    layer_dir, module_name = entry
+    scripts_dir = SCRIPT_DIR.parents[1] / layer_dir / "scripts"
     try:
-        res = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-        # Treat warnings-only (exit code 1) as pass unless strict
-        ok = (res.returncode == 0) if strict else (res.returncode in (0, 1))
-        out = (res.stdout or "") + ("\n" + res.stderr if res.stderr else "")
-        return ok, out.strip()
-    except subprocess.TimeoutExpired:
-        return False, "Validator timed out"
-    except Exception as e:
-        return False, f"Validator failed: {e}"
-
+        import importlib
+        if str(scripts_dir) not in sys.path:
+            sys.path.insert(0, str(scripts_dir))
+        return importlib.import_module(module_name)
+    except Exception:
+        return None
 
 
-def run_tdd_workflow(args, root: Path, test_dir: Path) -> bool:
+def validate_content(layer_name: str, file: Path, content: str, strict: bool = False) -> Optional[Tuple[bool, List[str]]]:
     """
-    Execute TDD workflow stages.
+    Validate document text in process.
 
-    TDD Workflow:
+    Returns:
+        (ok, issues) with issues as "CODE: message" (errors, then warnings);
+        None when the layer has no in-memory validator. Warnings fail only
+        in strict mode, matching run_layer_validation().
+    """
+    module = _load_content_validator(layer_name)
+    if module is None:
+        return None
+    try:
+        if layer_name == "EARS":
+            validate = module.EarsValidator().validate_content
+        else:
+            validate = getattr(module, f"validate_{layer_name.lower()}_content")
+    except (ImportError, AttributeError):
+        return None
+    # Errors raised by the validator itself propagate; they are bugs, not "no validator"
+    if layer_name == "EARS":
+        found = validate(file, content)
+        errors = [f"{r.rule}: {r.message}" for r in found if r.severity == "error"]
+        warnings = [f"{r.rule}: {r.message}" for r in found if r.severity != "error"]
+    else:
+        result = validate(file, content)
+        errors = [f"{code}: {msg}" for code, msg in result.errors]
+        warnings = [f"{code}: {msg}" for code, msg in result.warnings]
+    ok = not errors and not (strict and warnings)
+    return ok, errors + warnings
+
+
+def autofix_in_memory(
+    file: Path,
+    layer: Layer,
+    upstream_ids: Dict[str, str],
+    strict: bool = False,
+    max_rounds: int = 1,
+) -> Tuple[Optional[bool], List[str], int, bool]:
+    """
+    Fix and re-validate a document in memory, writing it once at the end.
+
+    Fix rounds stop as soon as the text validates, when the fixers no longer
+    change it (issues have converged), or after max_rounds.
+
+    Returns:
+        (ok, issues, rounds, changed): ok is None when the layer has no
+        in-memory validator, in which case the written file still needs
+        validating; changed is True when the fixes were written
+    """
+    try:
+        original = file.read_text(encoding="utf-8")
+    except Exception:
+        return None, [], 0, False
+
+    content = original
+    ok: Optional[bool] = None
+    issues: List[str] = []
+    rounds = 0
+    while rounds < max(1, max_rounds):
+        rounds += 1
+        fixed = apply_minimal_fixes(content, file, layer, upstream_ids)
+        converged = fixed == content
+        content = fixed
+        result = validate_content(layer.name, file, content, strict=strict)
+        if result is None:
+            break
+        ok, issues = result
+        if ok or converged:
+            break
+
+    changed = content != original
+    if changed:
+        file.write_text(content, encoding="utf-8")
+    return ok, issues, rounds, changed
+
+
+    # All skeleton-related helpers removed; no minimal templates are generated
+
+
+# =============================================================================
+# FORK MODE
+# =============================================================================
+# Forking copies every LAYER-<old NN>* document to the new NN/slug. Sources are
+# found with one scan of the root, rewritten in memory and written on a thread
+# pool (tmp file + rename, so a partial fork never leaves truncated documents).
+
+FORK_PREFIXES = ["BRD", "PRD", "EARS", "BDD", "ADR", "SYS", "REQ", "SPEC", "TASKS"]
+
+
+@dataclass
+class ForkJob:
+    """One document to fork, with its rewritten content once processed."""
+    layer: Layer
+    src: Path
+    dst: Path
+    src_bytes: int = 0
+    content: bytes = b""
+    error: str = ""
+
+
+def _trie_pattern(keys: List[str]) -> str:
+    """Regex for literal keys with shared prefixes factored out; the longest key wins."""
+    trie: Dict[str, Any] = {}
+    for key in keys:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + _emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return _emit(trie)
+
+
+def compile_id_map(idmap: Dict[str, str]):
+    """
+    Compile a from -> to ID map into a single-pass replacement function.
+
+    All keys are matched by one trie-shaped regex, so the cost no longer grows
+    with one str.replace per entry. Overlapping keys resolve to the longest
+    match and replaced text is never rewritten by a later entry.
+    """
+    mapping = {str(k): str(v) for k, v in (idmap or {}).items() if str(k)}
+    if not mapping:
+        return lambda text: text
+    pattern = re.compile(_trie_pattern(list(mapping)))
+    return lambda text: pattern.sub(lambda m: mapping[m.group(0)], text)
+
+
+def rewrite_for_new_ids(content: str, layer_name: str, old_nn: str, new_nn: str, new_human_slug: str, supersede_note: Optional[str]) -> str:
+    """Retitle a forked document and move its own IDs from old_nn to new_nn."""
+    content = re.sub(r'(?m)^title:\s*".*"$', lambda _m: f'title: "{layer_name}-{new_nn}: {new_human_slug}"', content)
+    if layer_name == "BDD":
+        content = re.sub(r'(?m)^Feature:\s*.*$', lambda _m: f'Feature: {layer_name}-{new_nn} — {new_human_slug}', content, count=1)
+    else:
+        content = re.sub(r'(?m)^#\s+.*$', lambda _m: f'# {layer_name}-{new_nn}: {new_human_slug}', content, count=1)
+    content = re.sub(
+        f"({'|'.join(FORK_PREFIXES)})-{re.escape(old_nn)}",
+        lambda m: f"{m.group(1)}-{new_nn}",
+        content,
+    )
+    content = content.replace(f".{old_nn}.", f".{new_nn}.")
+    if supersede_note:
+        insert_at = 0
+        if content.startswith("---\n"):
+            m = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+            insert_at = m.end() if m else 0
+        content = content[:insert_at] + f"\n> Derived from: {supersede_note}\n\n" + content[insert_at:]
+    return content
+
+
+def find_fork_jobs(root: Path, layers: List[Layer], old_nn: str, new_nn: str, new_slug: str) -> List[ForkJob]:
+    """
+    Collect fork sources for all layers in one walk of the root.
+
+    Monolithic files (LAYER-OLDNN_slug.ext) are renamed to the new slug;
+    sectional files keep their suffix (BRD-01.0_index.md -> BRD-02.0_index.md).
+    Sources that map to an already claimed destination (two monolithic files
+    for the same NN) come back with an error and are not forked.
+    """
+    by_name = {layer.name: layer for layer in layers}
+    found: Dict[str, List[Path]] = {name: [] for name in by_name}
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_parts = Path(dirpath).relative_to(root).parts
+        if not rel_parts:
+            dirnames[:] = [d for d in dirnames if d in by_name]  # Only descend into layer dirs
+            continue
+        layer = by_name[rel_parts[0]]
+        prefix = f"{layer.name}-{old_nn}"
+        for name in filenames:
+            if name.startswith(prefix) and name.endswith(layer.ext):
+                found[layer.name].append(Path(dirpath) / name)
+
+    jobs: List[ForkJob] = []
+    claimed: Dict[Path, Path] = {}
+    for layer in layers:
+        layer_dir = root / layer.name
+        for src in sorted(found[layer.name]):
+            if src.name.startswith(f"{layer.name}-{old_nn}_"):
+                dst_name = f"{layer.name}-{new_nn}_{new_slug}{layer.ext}"
+            else:
+                dst_name = src.name.replace(f"{layer.name}-{old_nn}", f"{layer.name}-{new_nn}")
+            dst = (layer_dir / src.relative_to(layer_dir).parent / dst_name).resolve()
+            job = ForkJob(layer=layer, src=src, dst=dst)
+            if dst in claimed:
+                job.error = f"duplicate destination (already forked from {claimed[dst].name})"
+            else:
+                claimed[dst] = src
+            jobs.append(job)
+    return jobs
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process and thread so concurrent writers never share a temp file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def run_fork_jobs(jobs: List[ForkJob], transform, write: bool, max_workers: Optional[int] = None) -> List[ForkJob]:
+    """
+    Rewrite fork sources on a thread pool and optionally write the results.
+
+    Args:
+        jobs: Documents to fork (see find_fork_jobs)
+        transform: (job, source text) -> forked text
+        write: Write destinations (False for plan-only/dry-run)
+        max_workers: Thread count (default: ThreadPoolExecutor default)
+
+    Returns:
+        The jobs, in input order, with src_bytes/content/error filled in
+        (jobs that already carry an error are returned unchanged)
+    """
+    def _fork_one(job: ForkJob) -> ForkJob:
+        if job.error:
+            return job
+        try:
+            raw = job.src.read_bytes()
+            job.src_bytes = len(raw)
+            job.content = transform(job, raw.decode("utf-8")).encode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            job.error = "read failed"
+            return job
+        if write:
+            try:
+                _atomic_write_bytes(job.dst, job.content)
+            except OSError as e:
+                job.error = f"write failed: {e}"
+        return job
+
+    if len(jobs) <= 1:
+        return [_fork_one(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fork") as pool:
+        return list(pool.map(_fork_one, jobs))
+
+
+
+def run_layer_validation(root_or_file: Path, layer_name: str, strict: bool = False, mvp_validators: bool = False) -> Tuple[bool, str]:
+    """Run a single validator. Success when exit code is 0 (strict) or 0/1 (warnings-only)."""
+
+    if not VALIDATOR_REGISTRY:
+        return False, "Validator registry unavailable"
+    # MVP-friendly overrides
+    if mvp_validators and layer_name == "BRD":
+        # Prefer the Python BRD validator on a single file
+        script_path = SCRIPT_DIR / "validate_brd.py"
+        cmd = [sys.executable, str(script_path), str(root_or_file)]
+    else:
+        vcfg: ValidatorConfig = VALIDATOR_REGISTRY.get(layer_name)
+        if not vcfg:
+            return True, f"No validator registered for {layer_name} (skipping)"
+
+        script_path = SCRIPT_DIR / vcfg.script
+        if not script_path.exists():
+            return False, f"Script not found: {script_path}"
+
+        if vcfg.script_type == "python":
+            if layer_name == "EARS":
+                cmd = [sys.executable, str(script_path), "--path", str(root_or_file)]
+            else:
+                cmd = [sys.executable, str(script_path), str(root_or_file)]
+        else:
+            cmd = ["bash", str(script_path), str(root_or_file)]
+
+    try:
+        res = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        # Treat warnings-only (exit code 1) as pass unless strict
+        ok = (res.returncode == 0) if strict else (res.returncode in (0, 1))
+        out = (res.stdout or "") + ("\n" + res.stderr if res.stderr else "")
+        return ok, out.strip()
+    except subprocess.TimeoutExpired:
+        return False, "Validator timed out"
+    except Exception as e:
+        return False, f"Validator failed: {e}"
+
+
+
+def run_tdd_workflow(args, root: Path, test_dir: Path) -> bool:
+    """
+    Execute TDD workflow stages.
+
+    TDD Workflow:
     1. Analyze existing tests → test_requirements.json
     2. Generate test-aware SPEC from test requirements
     3. Validate Red State (tests must fail - no implementation)
@@ -1092,50 +1843,92 @@ def run_tdd_workflow(args, root: Path, test_dir: Path) -> bool:
     return True
 
 
-def run_v4_pipeline(args, config: Dict[str, Any], layers_map: Dict[str, Any], root: Path):
-    """Execute the pipeline based on v4 configuration."""
+def run_v4_pipeline(
+    args,
+    config: Dict[str, Any],
+    layers_map: Dict[str, Any],
+    root: Path,
+    profiler: Optional[RunProfiler] = None,
+) -> bool:
+    """
+    Execute the pipeline based on v4 configuration.
+
+    Mode detection and each layer's pre-checks, generation, validation and
+    post-checks are timed as profiler stages (layer = pipeline layer ID).
+
+    Returns:
+        True if every selected layer succeeded (or none was selected); False
+        if a layer halted, errored or timed out, or the layers form a cycle
+    """
     print("🚀 Autopilot v4.0 Pipeline Starting...")
-    
-    # 1. Project Mode
-    mode = detect_project_mode(root, args.mode if hasattr(args, 'mode') else None)
-    print(f"📋 Project Mode: {mode.value.upper()}")
+    if profiler is None:
+        profiler = RunProfiler()
+
+    # 1. Project Mode (detection cached per project root)
+    auto_cfg = (config.get('project_modes') or {}).get('auto') or {}
+    mode_cache = None
+    if not getattr(args, 'dry_run', False) and not getattr(args, 'plan_only', False):
+        mode_cache = root / STATE_DIR_NAME / MODE_CACHE_FILE
+    with profiler.stage("PIPELINE", "mode") as info:
+        detection = detect_project_mode_info(
+            root,
+            args.mode if hasattr(args, 'mode') else None,
+            max_depth=int(auto_cfg.get('max_depth', MODE_DETECT_MAX_DEPTH)),
+            prune_dirs=set(auto_cfg['prune_dirs']) if auto_cfg.get('prune_dirs') else None,
+            cache_path=mode_cache,
+            cache_ttl=float(auto_cfg.get('cache_ttl', MODE_DETECT_CACHE_TTL)),
+        )
+        info["cached"] = detection.cached
+    mode = detection.mode
+    print(f"📋 Project Mode: {mode.value.upper()} ({detection.describe()})")
+    max_retries = getattr(args, 'max_retries', 0)
+    check_context = {
+        'mode': mode,
+        'max_parallel': config.get('defaults', {}).get('max_parallel_checks', CHECK_MAX_PARALLEL),
+    }
     
     # 2. Resolve Range
     layer_ids = resolve_layer_range(config, args.from_layer, args.up_to)
     if not layer_ids:
         print("⚠️ No layers selected to run.")
-        return
+        return True
 
     print(f"🎯 Pipeline: [{' -> '.join(layer_ids)}]")
     
-    # 3. Execution Loop
-    for layer_id in layer_ids:
-        layer_cfg = config['pipeline'].get(layer_id)
-        if not layer_cfg:
-            print(f"⚠️ Skipping unknown layer: {layer_id}")
-            continue
-            
-        # Resolve Layer Object (heuristic: 'L2_PRD' -> 'PRD')
-        layer_obj = None
+    # 3. Execution (DAG scheduler: pipeline `dependencies` + LAYER_REGISTRY can_reference)
+    pipeline = config['pipeline']
+
+    def _resolve_layer_obj(layer_id: str):
+        # Heuristic: 'L2_PRD' -> 'PRD'
         for name, l_obj in layers_map.items():
             if name in layer_id:
-                layer_obj = l_obj
-                break
-        
+                return l_obj
+        return None
+
+    def _run_layer(layer_id: str) -> bool:
+        layer_cfg = pipeline.get(layer_id)
+        if not layer_cfg:
+            print(f"⚠️ Skipping unknown layer: {layer_id}")
+            return True
+
+        layer_obj = _resolve_layer_obj(layer_id)
+
         # Skip logic
         if should_skip_layer(layer_cfg, mode):
             print(f"  ⏭️ Skipping layer {layer_id} (disabled/skipped in {mode.value} mode)")
-            continue
+            return True
 
         print(f"\n▶️ Executing Layer: {layer_id}")
 
         # Pre-checks
         if layer_cfg.pre_checks:
             print(f"  🔍 Running Pre-checks...")
-            if not execute_checks(layer_cfg.pre_checks, {'mode': mode}):
+            with profiler.stage(layer_id, "precheck") as info:
+                info["ok"] = execute_checks(layer_cfg.pre_checks, check_context)
+            if not info["ok"]:
                 if layer_cfg.on_failure.get('pre_check', 'halt') == 'halt':
                     print("  ❌ Pre-checks failed. Halting.")
-                    return
+                    return False
                 print("  ⚠️ Pre-checks failed but continuing (on_failure != halt)")
 
         # Generation
@@ -1146,33 +1939,74 @@ def run_v4_pipeline(args, config: Dict[str, Any], layers_map: Dict[str, Any], ro
             
             print(f"  ⚙️ Generating {layer_obj.name}...")
             # Reuse existing generation logic
-            generate_from_template(layer_obj, root, nn, intent, slug_hint)
+            with profiler.stage(layer_id, "generate"):
+                call_with_retries(max_retries, generate_from_template, layer_obj, root, nn, intent, slug_hint)
             
         # Validation
         if layer_obj and layer_cfg.validation and not getattr(args, 'skip_validate', False):
             print(f"  ✅ Validating {layer_obj.name}...")
             strict = getattr(args, 'strict', False) or layer_cfg.validation.strict_mode
             
-            if layer_cfg.validation.command:
-                try:
-                    cmd = layer_cfg.validation.command.replace('{target}', str(root))
-                    res = subprocess.run(cmd, shell=True, check=False)
-                    if res.returncode != 0:
-                        print(f"  ❌ Validation command failed.")
-                    else:
-                        print(f"  ✅ Validation passed.")
-                except Exception as e:
-                    print(f"  ❌ Validation error: {e}")
-            else:
-                # Fallback to legcy validator
-                run_layer_validation(root, layer_obj.name, strict=strict, mvp_validators=getattr(args, 'mvp_validators', False))
+            with profiler.stage(layer_id, "validate"):
+                if layer_cfg.validation.command:
+                    try:
+                        cmd = layer_cfg.validation.command.replace('{target}', str(root))
+                        res = subprocess.run(cmd, shell=True, check=False)
+                        if res.returncode != 0:
+                            print(f"  ❌ Validation command failed.")
+                        else:
+                            print(f"  ✅ Validation passed.")
+                    except Exception as e:
+                        print(f"  ❌ Validation error: {e}")
+                else:
+                    # Fallback to legcy validator
+                    call_with_retries(
+                        max_retries, run_layer_validation, root, layer_obj.name,
+                        strict=strict, mvp_validators=getattr(args, 'mvp_validators', False),
+                    )
 
         # Post-checks
         if layer_cfg.post_checks:
             print(f"  🔍 Running Post-checks...")
-            execute_checks(layer_cfg.post_checks, {'mode': mode})
+            with profiler.stage(layer_id, "postcheck") as info:
+                info["ok"] = execute_checks(layer_cfg.post_checks, check_context)
+        return True
 
-def main():
+    registry_deps = load_layer_dependencies()
+    dependencies: Dict[str, List[str]] = {}
+    for layer_id in layer_ids:
+        layer_cfg = pipeline.get(layer_id)
+        deps = list(layer_cfg.dependencies) if layer_cfg else []
+        layer_obj = _resolve_layer_obj(layer_id)
+        if layer_obj:
+            upstream = set(registry_deps.get(layer_obj.name, []))
+            deps.extend(
+                other for other in layer_ids
+                if other != layer_id and getattr(_resolve_layer_obj(other), 'name', None) in upstream
+            )
+        dependencies[layer_id] = deps
+
+    parallel = getattr(args, 'parallel', False) or bool(config.get('defaults', {}).get('parallel_execution', False))
+    workers = (getattr(args, 'workers', 0) or min(4, len(layer_ids))) if parallel else 1
+    try:
+        outcomes = run_layer_dag(
+            layer_ids,
+            dependencies,
+            _run_layer,
+            max_workers=workers,
+            timeout_per_layer=getattr(args, 'timeout_per_layer', 0) or None,
+            max_retries=0,  # Generation/validation calls retry inside the step
+        )
+    except LayerCycleError as e:
+        print(f"❌ {e}")
+        return False
+
+    for outcome in outcomes.values():
+        if outcome.status in (STATUS_ERROR, STATUS_TIMEOUT):
+            print(f"  ❌ {outcome.layer} {outcome.status} after {outcome.attempts} attempt(s): {outcome.error}")
+    return all(outcome.ok for outcome in outcomes.values())
+
+def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="MVP Autopilot (BRD → TASKS)")
     parser.add_argument("--root", default="ai_dev_flow", help="Docs root (default: ai_dev_flow)")
     parser.add_argument("--intent", default="", help="Seed idea to name the MVP")
@@ -1185,6 +2019,7 @@ def main():
     )
     parser.add_argument("--from-layer", default="", help="Start from this layer (e.g., BDD) instead of BRD")
     parser.add_argument("--auto-fix", action="store_true", help="Attempt simple auto-fixes on failures")
+    parser.add_argument("--autofix-rounds", type=int, default=0, help="Override the in-memory fix/validate rounds per failing document with --auto-fix (default: max_retries from CLI or config, at least 1)")
     parser.add_argument("--skip-validate", action="store_true", help="Skip validations (generate only)")
     parser.add_argument("--no-precheck", action="store_true", help="Skip pre-checks (path validator and upstream existence checks)")
     parser.add_argument("--precheck-strict", action="store_true", help="Treat pre-check failures as fatal (block generation)")
@@ -1193,11 +2028,12 @@ def main():
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors during validation")
     parser.add_argument("--report", choices=["none","markdown","json","text"], default="none", help="Write a run summary report")
     parser.add_argument("--report-path", default="", help="Custom report file path (defaults to work_plans/)")
+    parser.add_argument("--trace", default="", help="Write stage timings as a Chrome trace (chrome://tracing, Perfetto); reports also get <report>.trace.json")
     parser.add_argument("--mvp-validators", action="store_true", help="Use lighter MVP validators when available (e.g., BRD python validator)")
     parser.add_argument("--config", default="", help="Path to autopilot config YAML (defaults to ai_dev_flow/.autopilot.yaml if present)")
     parser.add_argument("--profile", default="", help="Named profile from config to load (e.g., mvp, strict)")
     # Resume/Fork & planning controls
-    parser.add_argument("--resume", action="store_true", help="Resume existing project; reuse and validate existing artifacts, generate only missing ones")
+    parser.add_argument("--resume", action="store_true", help="Resume existing project; reuse existing artifacts, generate only missing ones, and skip validation of artifacts unchanged since they passed (run journal)")
     parser.add_argument("--no-overwrite", action="store_true", help="Do not overwrite existing files (skip generation if target exists)")
     parser.add_argument("--include-layers", nargs='*', default=[], help="Limit operation to specific layers (e.g., BRD PRD EARS)")
     parser.add_argument("--exclude-layers", nargs='*', default=[], help="Exclude specific layers")
@@ -1214,11 +2050,137 @@ def main():
     parser.add_argument("--tdd-mode", action="store_true", help="Enable TDD workflow: generate tests before code, validate Red→Green states")
     parser.add_argument("--test-dir", default="tests/unit", help="Directory containing unit tests (default: tests/unit)")
     parser.add_argument("--coverage-threshold", type=int, default=90, help="Required test coverage percentage (default: 90)")
-    args = parser.parse_args()
+    # Layer scheduling (config defaults: parallel_execution, timeout_per_layer, max_retries)
+    parser.add_argument("--parallel", action="store_true", help="Run independent layers concurrently (LAYER_REGISTRY dependency DAG)")
+    parser.add_argument("--workers", type=int, default=0, help="Max concurrent layers with --parallel (default: min(4, layers))")
+    parser.add_argument("--timeout-per-layer", type=int, default=0, help="Seconds before a layer is reported as timed out and its dependents are blocked; the step itself keeps running to completion (default: none; config value applies with --parallel only)")
+    parser.add_argument("--max-retries", type=int, default=0, help="Extra attempts for a layer's generation or validation call that raised an error (default: 0; config value applies with --parallel only)")
+    # Batch mode (many projects per invocation)
+    parser.add_argument("--batch", default="", help="Manifest (YAML/JSON) of projects to run concurrently; see run_batch()")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes for --batch (default: CPU count)")
+    parser.add_argument("--no-template-cache", action="store_true", help="Do not persist compiled templates under <root>/.autopilot_state/")
+    return parser
+
+
+def apply_layer_scheduling(args: argparse.Namespace, configured: Dict[str, int]) -> None:
+    """
+    Apply configured timeout_per_layer / max_retries where the CLI left them at 0.
+
+    The configured max_retries always bounds the in-memory auto-fix rounds
+    (unless --autofix-rounds is given); those rounds write nothing until they
+    converge. Only --parallel runs pick up the configured values for layer
+    scheduling: a serial run keeps the unbounded, single-attempt behaviour
+    unless the CLI asks otherwise, so side-effecting generate/validate calls
+    are not re-run by default.
+    """
+    if not args.autofix_rounds:
+        args.autofix_rounds = args.max_retries or configured.get("max_retries", 0)
+    if not args.parallel:
+        return
+    if not args.timeout_per_layer:
+        args.timeout_per_layer = configured.get("timeout_per_layer", 0)
+    if not args.max_retries:
+        args.max_retries = configured.get("max_retries", 0)
+
+
+def write_run_report(
+    args,
+    profiler: RunProfiler,
+    summary_status: str,
+    results: List[Dict[str, Any]],
+    plan_actions: List[Dict[str, Any]],
+    links_result: Optional[bool] = None,
+) -> None:
+    """Write the --report file (with stage timings) and the --trace file, when requested."""
+    if args.report and args.report != "none":
+        from datetime import datetime
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_dir = Path(args.report_path).parent if args.report_path else Path("work_plans")
+        report_dir.mkdir(parents=True, exist_ok=True)
+        if args.report_path:
+            out_path = Path(args.report_path)
+        else:
+            ext = "md" if args.report == "markdown" else ("json" if args.report == "json" else "txt")
+            out_path = report_dir / f"mvp_autopilot_report_{ts}.{ext}"
 
+        try:
+            if args.report == "json":
+                import json
+                payload = {
+                    "summary": {
+                        "status": summary_status,
+                        "up_to": args.up_to,
+                        "strict": args.strict,
+                        "links_ok": bool(links_result) if links_result is not None else None,
+                    },
+                    "results": results,
+                    "plan": plan_actions,
+                    "timings": {"total_wall_ms": profiler.total_wall_ms(), "stages": profiler.summary()},
+                }
+                out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            elif args.report == "markdown":
+                lines = [
+                    f"# MVP Autopilot Report ({summary_status})",
+                    "",
+                    f"- Up to: `{args.up_to}`",
+                    f"- Strict: `{args.strict}`",
+                    (f"- Links OK: `{links_result}`" if links_result is not None else "- Links OK: `N/A`"),
+                    "",
+                    "## Results",
+                    "| Layer | Status | File | Notes |",
+                    "|-------|--------|------|-------|",
+                ]
+                for r in results:
+                    lines.append(f"| {r['layer']} | {r['status']} | `{r['file']}` | {r['notes']} |")
+                if plan_actions:
+                    lines.append("")
+                    lines.append("## Plan Actions")
+                    lines.append("| Action | Layer | File | Note |")
+                    lines.append("|--------|-------|------|------|")
+                    for a in plan_actions:
+                        lines.append(f"| {a['action']} | {a['layer']} | `{a['file']}` | {a['note']} |")
+                lines.append("")
+                lines.append(f"## Stage Timings (total {profiler.total_wall_ms():.1f} ms)")
+                lines.append("| Layer | Stage | Count | Wall (ms) | CPU (ms) | Subprocess CPU (ms) |")
+                lines.append("|-------|-------|-------|-----------|----------|---------------------|")
+                for t in profiler.summary():
+                    lines.append(f"| {t['layer']} | {t['stage']} | {t['count']} | {t['wall_ms']} | {t['cpu_ms']} | {t['child_cpu_ms']} |")
+                out_path.write_text("\n".join(lines), encoding="utf-8")
+            else:
+                lines = [f"MVP Autopilot Report: {summary_status}"]
+                for r in results:
+                    lines.append(f"- {r['layer']}: {r['status']} -> {r['file']} ({r['notes']})")
+                if links_result is not None:
+                    lines.append(f"- Links OK: {links_result}")
+                for t in profiler.summary():
+                    lines.append(f"- {t['layer']} {t['stage']}: wall {t['wall_ms']} ms, cpu {t['cpu_ms']} ms, subprocess cpu {t['child_cpu_ms']} ms")
+                out_path.write_text("\n".join(lines), encoding="utf-8")
+            print(f"📝 Report written to {out_path}")
+            if not args.trace:
+                trace_path = profiler.write_chrome_trace(out_path.with_suffix(".trace.json"))
+                print(f"⏱️  Trace written to {trace_path}")
+        except Exception as e:
+            print(f"⚠️  Failed to write report: {e}")
+
+    if args.trace:
+        try:
+            trace_path = profiler.write_chrome_trace(Path(args.trace))
+            print(f"⏱️  Trace written to {trace_path}")
+        except OSError as e:
+            print(f"⚠️  Failed to write trace: {e}")
+
+
+def run_autopilot(args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+    """
+    Run the autopilot for one project.
+
+    Returns:
+        Run summary {"status", "results", "plan", "links_ok"} for the legacy
+        pipeline; {"status", "results": []} for the v4 pipeline
+    """
     # Load config (before using args), merge profile/defaults into args where CLI kept defaults
     cfg_path = Path(args.config) if args.config else Path(args.root or "ai_dev_flow") / ".autopilot.yaml"
-    cfg = load_v4_config(cfg_path) if (args.config or cfg_path.exists()) else {}
+    cfg = load_v4_config_cached(cfg_path) if (args.config or cfg_path.exists()) else {}
 
     def _apply_cfg_flag(current_val, cfg_val):
         # Only apply when current equals parser default (False/"none").
@@ -1231,6 +2193,7 @@ def main():
         if profile_name and cfg.get("profiles"):
             profile = cfg["profiles"].get(profile_name, {})
         # Merge order: defaults -> profile -> CLI (CLI already parsed; we only set if still default)
+        scheduling: Dict[str, int] = {}
         for key, val in {**defaults, **profile}.items():
             if key == "auto_fix":
                 args.auto_fix = _apply_cfg_flag(args.auto_fix, bool(val))
@@ -1245,9 +2208,16 @@ def main():
             elif key == "report_path":
                 if not args.report_path and isinstance(val, str):
                     args.report_path = val
+            elif key == "parallel_execution":
+                args.parallel = _apply_cfg_flag(args.parallel, bool(val))
+            elif key in ("timeout_per_layer", "max_retries") and isinstance(val, int):
+                scheduling[key] = val
+        apply_layer_scheduling(args, scheduling)
 
     root = Path(args.root).resolve()
     root.mkdir(parents=True, exist_ok=True)
+    profiler = RunProfiler()
+    TEMPLATE_CACHE.configure(None if args.no_template_cache else root / STATE_DIR_NAME / TEMPLATE_CACHE_FILE)
 
     # TDD Mode: Run TDD workflow if --tdd-mode specified
     if args.tdd_mode:
@@ -1276,8 +2246,11 @@ def main():
     version = str(cfg.get('metadata', {}).get('version', '3.0'))
     if version.startswith('4.'):
         layers_map = {l.name: l for l in LAYERS}
-        run_v4_pipeline(args, cfg, layers_map, root)
-        return
+        ok = run_v4_pipeline(args, cfg, layers_map, root, profiler)
+        status = "PASS" if ok else "FAIL"
+        # v4 reports per-layer outcomes on the console only; the report carries the stage timings
+        write_run_report(args, profiler, status, [], [])
+        return {"status": status, "results": [], "timings": profiler.summary()}
 
     # Apply template overrides from config (optional)
     try:
@@ -1312,17 +2285,31 @@ def main():
     to_run = _filter_layers(LAYERS)
 
     # Pre-check helpers
+    # The path validator runs in-process: one full scan of the docs root on the
+    # first layer, then only files generated/modified since (paths_changed) are
+    # re-checked before each later layer. The lock serializes concurrent layers.
+    path_validator = None
+    paths_changed: Set[Path] = set()
+    precheck_lock = threading.Lock()
+
+    def _mark_changed(*paths: Path):
+        with precheck_lock:
+            paths_changed.update(paths)
+
     def _run_path_precheck() -> Tuple[bool, str]:
         """Run path validator; return (ok, output)."""
+        nonlocal path_validator
         try:
-
-            script_path = SCRIPT_DIR / "validate_documentation_paths.py"
-            cmd = [sys.executable, str(script_path), "--root", str(root)]
-            if args.precheck_strict:
-                cmd.append("--strict")
-            res = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-            ok = (res.returncode == 0) or (not args.precheck_strict)
-            out = (res.stdout or "") + ("\n" + res.stderr if res.stderr else "")
+            with precheck_lock:
+                if path_validator is None:
+                    from validate_documentation_paths import DocumentationPathValidator
+                    path_validator = DocumentationPathValidator(str(root))
+                    path_validator.validate_all(verbose=False)
+                elif paths_changed:
+                    path_validator.validate_files(paths_changed)
+                paths_changed.clear()
+                exit_code, out = path_validator.format_report(strict=args.precheck_strict)
+            ok = (exit_code == 0) or (not args.precheck_strict)
             return ok, out.strip()
         except Exception as e:
             return False, f"precheck failed: {e}"
@@ -1346,12 +2333,23 @@ def main():
     created_ids: Dict[str, str] = {}
     last_success = True
 
-    # Collect per-layer results for reporting
+    # Collect per-layer results for reporting. Layer steps may run concurrently
+    # (--parallel), so the collections are locked; once the scheduler returns,
+    # rows from steps still running after a timeout are dropped.
     results: List[Dict[str, str]] = []
     plan_actions: List[Dict[str, str]] = []
+    state_lock = threading.Lock()
+    bookkeeping_open = True
 
     def _record(action: str, layer_name: str, file_path: Path, note: str = ""):
-        plan_actions.append({"action": action, "layer": layer_name, "file": str(file_path), "note": note})
+        with state_lock:
+            if bookkeeping_open:
+                plan_actions.append({"action": action, "layer": layer_name, "file": str(file_path), "note": note})
+
+    def _result(layer_name: str, file_path: Path, status: str, notes: str = ""):
+        with state_lock:
+            if bookkeeping_open:
+                results.append({"layer": layer_name, "file": str(file_path), "status": status, "notes": notes})
 
     # Helper: low-friction yaml loader
     def _load_yaml(path: Path) -> dict:
@@ -1361,29 +2359,6 @@ def main():
         except Exception:
             return {}
 
-    # Fork mode pre-processing
-    def _apply_id_map(text: str, idmap: Dict[str, str]) -> str:
-        for k, v in idmap.items():
-            text = text.replace(k, v)
-        return text
-
-    def _rewrite_for_new_ids(content: str, layer_name: str, old_nn: str, new_nn: str, new_human_slug: str, supersede_note: Optional[str]) -> str:
-        content = re.sub(r'(?m)^title:\s*".*"$', f'title: "{layer_name}-{new_nn}: {new_human_slug}"', content)
-        if layer_name == "BDD":
-            content = re.sub(r'(?m)^Feature:\s*.*$', f'Feature: {layer_name}-{new_nn} — {new_human_slug}', content, count=1)
-        else:
-            content = re.sub(r'(?m)^#\s+.*$', f'# {layer_name}-{new_nn}: {new_human_slug}', content, count=1)
-        for prefix in ["BRD","PRD","EARS","BDD","ADR","SYS","REQ","SPEC","TASKS"]:
-            content = content.replace(f"{prefix}-{old_nn}", f"{prefix}-{new_nn}")
-        content = content.replace(f".{old_nn}.", f".{new_nn}.")
-        if supersede_note:
-            insert_at = 0
-            if content.startswith("---\n"):
-                m = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
-                insert_at = m.end() if m else 0
-            content = content[:insert_at] + f"\n> Derived from: {supersede_note}\n\n" + content[insert_at:]
-        return content
-
     def _copy_assets_if_needed(src_file: Path, dst_file: Path):
         if not args.copy_assets:
             return
@@ -1411,61 +2386,83 @@ def main():
         old_nn = args.fork_from_nn
         new_nn = args.new_nn
         new_slug = args.new_slug
-        idmap = _load_yaml(Path(args.id_map)) if args.id_map else {}
+        apply_id_map = compile_id_map(_load_yaml(Path(args.id_map)) if args.id_map else {})
         human_slug = new_slug.replace("_", " ").title()
-        for layer in to_run:
-            layer_dir = root / layer.name
-            # Find all matching files (monolithic or sectional) recursively
-            matches = list(layer_dir.rglob(f"{layer.name}-{old_nn}*{layer.ext}"))
-            if not matches:
+
+        def _fork_content(job: ForkJob, raw: str) -> str:
+            name = job.layer.name
+            newc = rewrite_for_new_ids(raw, name, old_nn, new_nn, human_slug, supersede_note=f"{name}-{old_nn}" if args.supersede else None)
+            return apply_id_map(newc)
+
+        with profiler.stage("FORK", "scan"):
+            found = find_fork_jobs(root, to_run, old_nn, new_nn, new_slug)
+        jobs: List[ForkJob] = []
+        for job in found:
+            if job.dst.exists() and args.no_overwrite:
+                _record("skip-exists", job.layer.name, job.dst, "no-overwrite fork")
+            else:
+                jobs.append(job)
+
+        write = not args.plan_only and not args.dry_run
+        with profiler.stage("FORK", "rewrite", files=len(jobs)):
+            forked = run_fork_jobs(jobs, _fork_content, write=write)
+        for job in forked:
+            if job.error == "read failed":
+                _record("error", job.layer.name, job.src, job.error)
                 continue
-            for src in matches:
-                rel = src.relative_to(layer_dir)
-                # Build destination filename
-                src_name = src.name
-                # Monolithic pattern: LAYER-OLDNN_{oldslug}.ext
-                if src_name.startswith(f"{layer.name}-{old_nn}_"):
-                    dst_name = f"{layer.name}-{new_nn}_{new_slug}{layer.ext}"
-                else:
-                    # Sectional: replace the NN only, keep the rest (e.g., BRD-01.0_index.md -> BRD-02.0_index.md)
-                    dst_name = src_name.replace(f"{layer.name}-{old_nn}", f"{layer.name}-{new_nn}")
-                dst = (layer_dir / rel.parent / dst_name).resolve()
-                if dst.exists() and args.no_overwrite:
-                    _record("skip-exists", layer.name, dst, "no-overwrite fork")
-                    continue
-                try:
-                    raw = src.read_text(encoding="utf-8")
-                except Exception:
-                    _record("error", layer.name, src, "read failed")
-                    continue
-                newc = _rewrite_for_new_ids(raw, layer.name, old_nn, new_nn, human_slug, supersede_note=f"{layer.name}-{old_nn}" if args.supersede else None)
-                if idmap:
-                    newc = _apply_id_map(newc, idmap)
-                _record("fork", layer.name, dst, f"from {src.name}")
-                _copy_assets_if_needed(src, dst)
-                if not args.plan_only and not args.dry_run:
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-                    dst.write_text(newc, encoding="utf-8")
-            # track new id for this layer
-            created_ids[layer.name.lower()] = f"{layer.name}-{new_nn}"
+            if job.error:
+                _record("error", job.layer.name, job.dst, job.error)
+                continue
+            _record("fork", job.layer.name, job.dst, f"from {job.src.name} ({job.src_bytes} -> {len(job.content)} bytes)")
+            _copy_assets_if_needed(job.src, job.dst)
+            if write:
+                _mark_changed(job.dst)
+        # track new id for each forked layer
+        for layer_name in {job.layer.name for job in found}:
+            created_ids[layer_name.lower()] = f"{layer_name}-{new_nn}"
 
     effective_nn = args.new_nn if (args.fork_from_nn and args.new_nn and args.new_slug) else args.nn
     effective_slug = args.new_slug if (args.fork_from_nn and args.new_nn and args.new_slug) else args.slug
 
+    # Run journal: per-layer checkpoints used by --resume (not kept for plan-only/dry-run)
+    journal: Optional[RunJournal] = None
+    if not args.plan_only and not args.dry_run:
+        journal = RunJournal(root / STATE_DIR_NAME / f"journal-{effective_nn}.json")
+        journal.begin_run(nn=effective_nn, slug=effective_slug, layers=[l.name for l in to_run])
+    validation_settings = {"strict": bool(args.strict), "mvp_validators": bool(args.mvp_validators)}
+
+    def _upstream_hashes(layer: Layer) -> Dict[str, Optional[str]]:
+        hashes: Dict[str, Optional[str]] = {}
+        for up in (layer.upstream_tags or []):
+            up_name = up.upper()
+            up_file = journal.artifact(up_name) or _find_upstream_file(up_name, effective_nn)
+            hashes[up_name] = journal.file_hash(up_file)
+        return hashes
+
+    def _checkpoint(layer: Layer, target: Path, status: str) -> None:
+        if journal is not None:
+            journal.record(layer.name, target, status, _upstream_hashes(layer), validation_settings)
+
     # Skeleton templates removed; no external or inline skeleton support
 
-    for layer in to_run:
+    # Layers run through the DAG scheduler: each layer starts once its upstream
+    # layers in this run (LAYER_REGISTRY can_reference) have succeeded.
+    layers_by_name = {l.name: l for l in to_run}
+
+    def _run_layer(layer_name: str) -> bool:
+        """Pre-check, generate, validate and auto-fix one layer; True on success."""
+        layer = layers_by_name[layer_name]
         # Optional pre-checks (paths + upstream presence) before generation
         if not args.no_precheck:
-            ok_paths, out_paths = _run_path_precheck()
+            with profiler.stage(layer.name, "precheck"):
+                ok_paths, out_paths = _run_path_precheck()
             if not ok_paths:
                 print("⚠️  Pre-Check (paths) reported issues")
                 if out_paths:
                     print(out_paths)
                 if args.precheck_strict:
                     print("❌ Pre-Check failed in strict mode; aborting")
-                    last_success = False
-                    break
+                    return False
 
             # Verify required upstream artifacts exist when not already created in-session
             missing_up: List[str] = []
@@ -1479,8 +2476,7 @@ def main():
                 print(f"⚠️  Pre-Check: missing upstream artifacts for {layer.name}: {', '.join(missing_up)}")
                 if args.precheck_strict:
                     print("❌ Pre-Check missing upstream (strict); aborting")
-                    last_success = False
-                    break
+                    return False
 
         # Decide target path and whether to generate
         layer_dir = root / layer.name
@@ -1489,7 +2485,12 @@ def main():
         target = layer_dir / want_filename
         must_generate = True
 
-        if args.resume:
+        journaled = journal.artifact(layer.name) if (args.resume and journal is not None) else None
+        if journaled is not None:
+            target = journaled
+            must_generate = False
+            _record("reuse", layer.name, target, "resume journal")
+        elif args.resume:
             if target.exists():
                 must_generate = False
                 _record("reuse", layer.name, target, "resume exact")
@@ -1510,49 +2511,117 @@ def main():
         if must_generate:
             _record("generate", layer.name, target, "from template")
             if not args.plan_only and not args.dry_run:
-                target = generate_from_template(layer, root, effective_nn, args.intent, slug_eff)
+                with profiler.stage(layer.name, "generate"):
+                    target = call_with_retries(
+                        args.max_retries, generate_from_template, layer, root, effective_nn, args.intent, slug_eff
+                    )
+                _mark_changed(target, target.parent / f"{layer.name}-00_required_documents_list.md")
+                _checkpoint(layer, target, JOURNAL_GENERATED)
 
         # Track canonical IDs for tags (e.g., brd: BRD-01)
-        created_ids.setdefault(layer.name.lower(), f"{layer.name}-{effective_nn}")
+        with state_lock:
+            created_ids.setdefault(layer.name.lower(), f"{layer.name}-{effective_nn}")
 
         print(f"Generated: {target.relative_to(root.parent) if root.parent in target.parents else target}")
 
         if args.skip_validate or args.plan_only or args.dry_run:
-            results.append({"layer": layer.name, "file": str(target), "status": "planned" if args.plan_only else "generated", "notes": "validation skipped"})
-            continue
-
-        # Validate
-        ok, msg = run_layer_validation(target, layer.name, strict=args.strict, mvp_validators=args.mvp_validators)
+            _result(layer.name, target, "planned" if args.plan_only else "generated", "validation skipped")
+            return True
+
+        # Validate (skipped on resume when the journal outcome still applies)
+        layer_success = True
+        previous = None
+        if args.resume and journal is not None:
+            previous = journal.unchanged_status(layer.name, target, _upstream_hashes(layer), validation_settings)
+        if previous in VALIDATED_STATUSES:
+            print(f"⏭️  {layer.name} unchanged since last validation ({previous}); skipping")
+            _result(layer.name, target, previous, "unchanged (journal)")
+            return True
+        if previous == JOURNAL_FAIL:
+            print(f"❌ {layer.name} unchanged since failed validation" + ("; resuming at auto-fix" if args.auto_fix else ""))
+            ok, msg = False, ""
+        else:
+            with profiler.stage(layer.name, "validate") as info:
+                ok, msg = call_with_retries(
+                    args.max_retries, run_layer_validation, target, layer.name,
+                    strict=args.strict, mvp_validators=args.mvp_validators,
+                )
+                info["ok"] = ok
+            _checkpoint(layer, target, JOURNAL_PASS if ok else JOURNAL_FAIL)
         if ok:
             print(f"✅ {layer.name} validation passed")
-            results.append({"layer": layer.name, "file": str(target), "status": "pass", "notes": ""})
+            _result(layer.name, target, "pass", "")
         else:
             print(f"❌ {layer.name} validation failed")
             if msg:
                 print(msg)
 
             if args.auto_fix and not args.dry_run:
-                # Minimal fix attempt: ensure upstream tags are present
-                try_minimal_autofix(target, layer, created_ids)
-                # Re-run validation once after fix
-                ok2, msg2 = run_layer_validation(target, layer.name, strict=args.strict, mvp_validators=args.mvp_validators)
+                # Fix/validate rounds run in memory (up to --autofix-rounds, by
+                # default max_retries) until the issues converge; the registered
+                # validator then checks the written file once
+                with profiler.stage(layer.name, "autofix") as info:
+                    with state_lock:
+                        upstream_ids = dict(created_ids)
+                    fixed_ok, issues, rounds, fixed = autofix_in_memory(
+                        target, layer, upstream_ids, strict=args.strict, max_rounds=args.autofix_rounds or args.max_retries
+                    )
+                    info["rounds"] = rounds
+                if fixed:
+                    _mark_changed(target)
+                print(f"🩹 {layer.name} auto-fix: {rounds} round(s)" + ("" if fixed_ok is None else f", {len(issues)} issue(s) left in memory"))
+                with profiler.stage(layer.name, "revalidate") as info:
+                    ok2, msg2 = call_with_retries(
+                        args.max_retries, run_layer_validation, target, layer.name,
+                        strict=args.strict, mvp_validators=args.mvp_validators,
+                    )
+                    info["ok"] = ok2
+                _checkpoint(layer, target, JOURNAL_FIXED if ok2 else JOURNAL_FAIL)
                 if ok2:
                     print(f"🩹 {layer.name} auto-fix succeeded")
-                    results.append({"layer": layer.name, "file": str(target), "status": "fixed", "notes": "auto-fix"})
+                    _result(layer.name, target, "fixed", "auto-fix")
                 else:
                     # Auto-fix did not resolve issues; no skeleton fallback
                     print(f"🩹 {layer.name} auto-fix did not resolve all issues")
                     if msg2:
                         print(msg2)
-                    last_success = False
-                    results.append({"layer": layer.name, "file": str(target), "status": "fail", "notes": "fix failed"})
+                    layer_success = False
+                    _result(layer.name, target, "fail", "fix failed")
             else:
-                last_success = False
-                results.append({"layer": layer.name, "file": str(target), "status": "fail", "notes": "no auto-fix"})
+                layer_success = False
+                _result(layer.name, target, "fail", "no auto-fix")
 
-        if not last_success:
+        if not layer_success:
             print(f"Halting at {layer.name} due to validation errors. Use --auto-fix to attempt repairs.")
-            break
+        return layer_success
+
+    workers = (args.workers or min(4, len(to_run))) if args.parallel else 1
+    try:
+        outcomes = run_layer_dag(
+            [l.name for l in to_run],
+            load_layer_dependencies(),
+            _run_layer,
+            max_workers=workers,
+            timeout_per_layer=args.timeout_per_layer or None,
+            max_retries=0,  # Generation/validation calls retry inside the step
+        )
+    except LayerCycleError as e:
+        print(f"❌ {e}")
+        outcomes = {}
+        last_success = False
+    with state_lock:
+        bookkeeping_open = False
+
+    for outcome in outcomes.values():
+        if outcome.status in (STATUS_ERROR, STATUS_TIMEOUT):
+            print(f"❌ {outcome.layer} {outcome.status} after {outcome.attempts} attempt(s): {outcome.error}")
+            results.append({"layer": outcome.layer, "file": "", "status": "fail", "notes": outcome.status})
+        if not outcome.ok:
+            last_success = False
+    layer_order = {l.name: i for i, l in enumerate(to_run)}
+    results.sort(key=lambda r: layer_order.get(r["layer"], len(layer_order)))
+    if journal is not None:
+        journal.finish_run("PASS" if last_success else "FAIL")
 
     # Final cross-link validation when all preceding layers succeeded
     links_result = None
@@ -1562,7 +2631,8 @@ def main():
             from validate_all import CROSS_VALIDATORS
             vcfg = CROSS_VALIDATORS.get("LINKS")
             if vcfg is not None:
-                result = run_validator(vcfg, root)
+                with profiler.stage("LINKS", "validate"):
+                    result = run_validator(vcfg, root)
                 if result.success and result.error_count == 0:
                     print("🔗 Link integrity check passed")
                     links_result = True
@@ -1577,65 +2647,7 @@ def main():
         except Exception:
             pass
 
-    # Reporting
-    if args.report and args.report != "none":
-        from datetime import datetime
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_dir = Path(args.report_path).parent if args.report_path else Path("work_plans")
-        report_dir.mkdir(parents=True, exist_ok=True)
-        if args.report_path:
-            out_path = Path(args.report_path)
-        else:
-            ext = "md" if args.report == "markdown" else ("json" if args.report == "json" else "txt")
-            out_path = report_dir / f"mvp_autopilot_report_{ts}.{ext}"
-
-        summary_status = "PASS" if last_success else "FAIL"
-        try:
-            if args.report == "json":
-                import json
-                payload = {
-                    "summary": {
-                        "status": summary_status,
-                        "up_to": args.up_to,
-                        "strict": args.strict,
-                        "links_ok": bool(links_result) if links_result is not None else None,
-                    },
-                    "results": results,
-                    "plan": plan_actions,
-                }
-                out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-            elif args.report == "markdown":
-                lines = [
-                    f"# MVP Autopilot Report ({summary_status})",
-                    "",
-                    f"- Up to: `{args.up_to}`",
-                    f"- Strict: `{args.strict}`",
-                    (f"- Links OK: `{links_result}`" if links_result is not None else "- Links OK: `N/A`"),
-                    "",
-                    "## Results",
-                    "| Layer | Status | File | Notes |",
-                    "|-------|--------|------|-------|",
-                ]
-                for r in results:
-                    lines.append(f"| {r['layer']} | {r['status']} | `{r['file']}` | {r['notes']} |")
-                if plan_actions:
-                    lines.append("")
-                    lines.append("## Plan Actions")
-                    lines.append("| Action | Layer | File | Note |")
-                    lines.append("|--------|-------|------|------|")
-                    for a in plan_actions:
-                        lines.append(f"| {a['action']} | {a['layer']} | `{a['file']}` | {a['note']} |")
-                out_path.write_text("\n".join(lines), encoding="utf-8")
-            else:
-                lines = [f"MVP Autopilot Report: {summary_status}"]
-                for r in results:
-                    lines.append(f"- {r['layer']}: {r['status']} -> {r['file']} ({r['notes']})")
-                if links_result is not None:
-                    lines.append(f"- Links OK: {links_result}")
-                out_path.write_text("\n".join(lines), encoding="utf-8")
-            print(f"📝 Report written to {out_path}")
-        except Exception as e:
-            print(f"⚠️  Failed to write report: {e}")
+    write_run_report(args, profiler, "PASS" if last_success else "FAIL", results, plan_actions, links_result)
 
     # Plan-only output file
     if args.plan_only:
@@ -1643,6 +2655,7 @@ def main():
             from datetime import datetime
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
             plan_path = Path("work_plans") / f"mvp_plan_{ts}.md"
+            plan_path.parent.mkdir(parents=True, exist_ok=True)
             plan_lines = [
                 f"# MVP Autopilot Plan ({ts})",
                 "",
@@ -1662,6 +2675,220 @@ def main():
         except Exception as e:
             print(f"⚠️  Failed to write plan: {e}")
 
+    return {
+        "status": "PASS" if last_success else "FAIL",
+        "results": results,
+        "plan": plan_actions,
+        "links_ok": links_result,
+        "timings": profiler.summary(),
+    }
+
+
+# =============================================================================
+# BATCH MODE
+# =============================================================================
+
+# Layer names accepted by --up-to / include_layers / exclude_layers
+BATCH_LAYER_NAMES = ["BRD", "PRD", "EARS", "BDD", "ADR", "SYS", "REQ", "SPEC", "TASKS"]
+
+# Manifest entry keys -> argparse destinations
+BATCH_ENTRY_KEYS = {
+    "nn": "nn",
+    "slug": "slug",
+    "intent": "intent",
+    "root": "root",
+    "from_layer": "from_layer",
+    "up_to": "up_to",
+    "include_layers": "include_layers",
+    "exclude_layers": "exclude_layers",
+}
+
+
+def load_batch_manifest(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load a batch manifest.
+
+    Accepts a list of entries or {"projects": [...]}. Each entry needs `nn`;
+    optional keys: slug, intent, root, from_layer, up_to, include_layers,
+    exclude_layers (lists of layer names, e.g. [BRD, PRD]). JSON manifests
+    work without PyYAML.
+
+    Raises:
+        ValueError: On a malformed manifest or entry
+    """
+    text = path.read_text(encoding="utf-8")
+    try:
+        import yaml
+        data = yaml.safe_load(text)
+    except ImportError:
+        data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("projects", [])
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: manifest must be a list of projects")
+
+    entries: List[Dict[str, Any]] = []
+    for i, entry in enumerate(data, 1):
+        if not isinstance(entry, dict) or entry.get("nn") in (None, ""):
+            raise ValueError(f"{path}: project #{i} must be a mapping with an 'nn' key")
+        unknown = set(entry) - set(BATCH_ENTRY_KEYS)
+        if unknown:
+            raise ValueError(f"{path}: project #{i} has unknown keys: {', '.join(sorted(unknown))}")
+        for key in ("include_layers", "exclude_layers"):
+            if key not in entry:
+                continue
+            layers = entry[key]
+            if not isinstance(layers, list) or not all(isinstance(l, str) for l in layers):
+                raise ValueError(f"{path}: project #{i} {key} must be a list of layer names")
+            unknown_layers = [l for l in layers if l.upper() not in BATCH_LAYER_NAMES]
+            if unknown_layers:
+                raise ValueError(
+                    f"{path}: project #{i} {key} has unknown layers: {', '.join(unknown_layers)} "
+                    f"(expected: {', '.join(BATCH_LAYER_NAMES)})"
+                )
+        entry = dict(entry)
+        entry["nn"] = str(entry["nn"]).zfill(2)
+        entries.append(entry)
+    return entries
+
+
+def _run_batch_entry(base_args: argparse.Namespace, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one manifest project in a worker; capture its console output."""
+    import io
+    from contextlib import redirect_stdout
+
+    args = argparse.Namespace(**vars(base_args))
+    for key, dest in BATCH_ENTRY_KEYS.items():
+        if key in entry:
+            setattr(args, dest, entry[key])
+    args.batch = ""
+    args.report = "none"  # One aggregated report is written by the parent
+    args.up_to = str(args.up_to).upper()
+
+    buffer = io.StringIO()
+    start = time.monotonic()
+    summary: Optional[Dict[str, Any]] = None
+    error = ""
+    try:
+        with redirect_stdout(buffer):
+            summary = run_autopilot(args)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    status = "ERROR" if error else summary["status"]
+    return {
+        "nn": entry["nn"],
+        "slug": entry.get("slug", ""),
+        "intent": entry.get("intent", ""),
+        "root": str(args.root),
+        "up_to": args.up_to,
+        "status": status,
+        "error": error,
+        "duration": round(time.monotonic() - start, 3),
+        "results": (summary or {}).get("results", []),
+        "output": buffer.getvalue(),
+    }
+
+
+def _write_batch_report(args: argparse.Namespace, outcomes: List[Dict[str, Any]]) -> Path:
+    from datetime import datetime
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    fmt = args.report if args.report in ("markdown", "json", "text") else "markdown"
+    if args.report_path:
+        out_path = Path(args.report_path)
+    else:
+        ext = "md" if fmt == "markdown" else ("json" if fmt == "json" else "txt")
+        out_path = Path("work_plans") / f"mvp_autopilot_batch_report_{ts}.{ext}"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    passed = sum(1 for o in outcomes if o["status"] == "PASS")
+    status = "PASS" if passed == len(outcomes) else "FAIL"
+    if fmt == "json":
+        payload = {
+            "summary": {"status": status, "projects": len(outcomes), "passed": passed},
+            "projects": [{k: v for k, v in o.items() if k != "output"} for o in outcomes],
+        }
+        out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    elif fmt == "markdown":
+        lines = [
+            f"# MVP Autopilot Batch Report ({status})",
+            "",
+            f"- Projects: `{len(outcomes)}` (passed: `{passed}`)",
+            "",
+            "| NN | Slug | Up to | Status | Layers | Duration (s) | Notes |",
+            "|----|------|-------|--------|--------|--------------|-------|",
+        ]
+        for o in outcomes:
+            layers = ", ".join(f"{r['layer']}:{r['status']}" for r in o["results"])
+            lines.append(f"| {o['nn']} | {o['slug']} | `{o['up_to']}` | {o['status']} | {layers} | {o['duration']} | {o['error']} |")
+        out_path.write_text("\n".join(lines), encoding="utf-8")
+    else:
+        lines = [f"MVP Autopilot Batch Report: {status} ({passed}/{len(outcomes)} passed)"]
+        for o in outcomes:
+            lines.append(f"- {o['nn']} {o['slug']}: {o['status']} ({o['duration']}s) {o['error']}".rstrip())
+        out_path.write_text("\n".join(lines), encoding="utf-8")
+    return out_path
+
+
+def run_batch(args: argparse.Namespace) -> bool:
+    """
+    Run every manifest project across a process pool.
+
+    CLI flags apply to all projects; manifest entries override nn, slug,
+    intent, root and the layer range. Pool workers are reused across
+    projects, so each process imports the validator registry and reads each
+    template (TEMPLATE_CACHE) once. Console output is buffered per
+    project and printed as each finishes; one aggregated report is written.
+
+    Returns:
+        True if every project passed
+    """
+    try:
+        entries = load_batch_manifest(Path(args.batch))
+    except (OSError, ValueError) as e:
+        print(f"❌ Invalid batch manifest: {e}")
+        return False
+    if not entries:
+        print("⚠️ Batch manifest has no projects")
+        return True
+
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(entries)))
+    print(f"🚀 Batch: {len(entries)} project(s) on {jobs} worker(s)")
+
+    finished: List[Tuple[int, Dict[str, Any]]] = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_run_batch_entry, args, entry): (i, entry) for i, entry in enumerate(entries)}
+        for future in as_completed(futures):
+            index, entry = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = {
+                    "nn": entry["nn"], "slug": entry.get("slug", ""), "intent": entry.get("intent", ""),
+                    "root": str(entry.get("root", args.root)), "up_to": entry.get("up_to", args.up_to),
+                    "status": "ERROR", "error": f"{type(e).__name__}: {e}",
+                    "duration": 0.0, "results": [], "output": "",
+                }
+            print(f"\n===== [{outcome['nn']}] {outcome['slug'] or outcome['intent']}: {outcome['status']} ({outcome['duration']}s) =====")
+            if outcome["output"]:
+                print(outcome["output"].rstrip())
+            if outcome["error"]:
+                print(f"❌ {outcome['error']}")
+            finished.append((index, outcome))
+
+    # Report in manifest order
+    outcomes = [outcome for _, outcome in sorted(finished, key=lambda item: item[0])]
+    report_path = _write_batch_report(args, outcomes)
+    print(f"\n📝 Batch report written to {report_path}")
+    return all(o["status"] == "PASS" for o in outcomes)
+
+
+def main():
+    args = build_arg_parser().parse_args()
+    if args.batch:
+        sys.exit(0 if run_batch(args) else 1)
+    run_autopilot(args)
+
 
 if __name__ == "__main__":
     main()
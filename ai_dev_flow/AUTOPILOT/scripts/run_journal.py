@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Run Journal for the MVP Autopilot
+
+Checkpoints per-layer progress of an autopilot run to a JSON journal
+(<root>/.autopilot_state/journal-<NN>.json): artifact path, content hash,
+upstream artifact hashes, validation settings and outcome, and timestamps.
+Every update is written atomically, so a crashed run leaves the journal at
+its last completed step.
+
+On --resume the autopilot uses the journal to:
+    - locate artifacts without globbing layer directories
+    - skip validation for layers whose artifact, upstream artifacts and
+      validation settings are unchanged since they passed
+    - continue a layer that failed validation at the auto-fix step
+
+Layer statuses:
+    generated  - Artifact written, not yet validated
+    pass       - Validation passed
+    fixed      - Validation passed after auto-fix
+    fail       - Validation (or auto-fix) failed
+
+Usage:
+    from run_journal import JOURNAL_PASS, RunJournal
+
+    journal = RunJournal(root / ".autopilot_state" / "journal-01.json")
+    journal.record("BRD", brd_path, JOURNAL_PASS, upstream={}, settings={})
+    journal.unchanged_status("BRD", brd_path, upstream={}, settings={})
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+JOURNAL_VERSION = 1
+
+# Layer statuses
+JOURNAL_GENERATED = "generated"
+JOURNAL_PASS = "pass"
+JOURNAL_FIXED = "fixed"
+JOURNAL_FAIL = "fail"
+
+VALIDATED_STATUSES = (JOURNAL_PASS, JOURNAL_FIXED)
+
+
+@dataclass
+class JournalEntry:
+    """Checkpoint of one layer."""
+    layer: str
+    artifact: str
+    sha256: str
+    status: str
+    upstream: Dict[str, Optional[str]] = field(default_factory=dict)
+    settings: Dict[str, Any] = field(default_factory=dict)
+    started_at: str = ""
+    updated_at: str = ""
+
+
+class RunJournal:
+    """
+    Persistent, thread-safe journal of one project's autopilot runs.
+
+    A missing, unreadable or outdated journal file starts an empty journal.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.run: Dict[str, Any] = {}
+        self.entries: Dict[str, JournalEntry] = {}
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+        self._touched: Set[str] = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != JOURNAL_VERSION:
+            return
+        self.run = data.get("run", {})
+        for name, entry in (data.get("layers") or {}).items():
+            try:
+                self.entries[name] = JournalEntry(**entry)
+            except TypeError:
+                continue
+
+    def _save(self) -> None:
+        payload = {
+            "version": JOURNAL_VERSION,
+            "run": self.run,
+            "layers": {name: asdict(entry) for name, entry in self.entries.items()},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError:
+            pass  # Journal is best-effort; the run itself does not depend on it
+
+    # -------------------------------------------------------------------------
+    # Hashing
+    # -------------------------------------------------------------------------
+
+    def file_hash(self, path: Optional[Path]) -> Optional[str]:
+        """SHA-256 of a file (memoized by size and mtime), None if missing."""
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = str(path.resolve())
+        with self._lock:
+            cached = self._hashes.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        with self._lock:
+            self._hashes[key] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    # -------------------------------------------------------------------------
+    # Run and layer checkpoints
+    # -------------------------------------------------------------------------
+
+    def begin_run(self, **info: Any) -> None:
+        """Start a run (nn, slug, layers, ...); layer entries are kept."""
+        with self._lock:
+            self.run = {**info, "started_at": datetime.now().isoformat(), "finished_at": "", "status": "running"}
+            self._touched.clear()
+            self._save()
+
+    def finish_run(self, status: str) -> None:
+        with self._lock:
+            self.run.update({"finished_at": datetime.now().isoformat(), "status": status})
+            self._save()
+
+    def get(self, layer: str) -> Optional[JournalEntry]:
+        with self._lock:
+            return self.entries.get(layer)
+
+    def artifact(self, layer: str) -> Optional[Path]:
+        """Journaled artifact path for a layer, if it still exists."""
+        entry = self.get(layer)
+        if entry and Path(entry.artifact).exists():
+            return Path(entry.artifact)
+        return None
+
+    def record(
+        self,
+        layer: str,
+        artifact: Path,
+        status: str,
+        upstream: Dict[str, Optional[str]],
+        settings: Dict[str, Any],
+    ) -> None:
+        """Checkpoint a layer step and write the journal."""
+        sha256 = self.file_hash(artifact) or ""
+        now = datetime.now().isoformat()
+        with self._lock:
+            previous = self.entries.get(layer)
+            started_at = previous.started_at if (previous and layer in self._touched) else now
+            self._touched.add(layer)
+            self.entries[layer] = JournalEntry(
+                layer=layer,
+                artifact=str(artifact),
+                sha256=sha256,
+                status=status,
+                upstream=dict(upstream),
+                settings=dict(settings),
+                started_at=started_at,
+                updated_at=now,
+            )
+            self._save()
+
+    def unchanged_status(
+        self,
+        layer: str,
+        artifact: Path,
+        upstream: Dict[str, Optional[str]],
+        settings: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Journaled validation outcome, if it still applies.
+
+        Returns:
+            The recorded status when the artifact, its upstream artifacts and
+            the validation settings are unchanged since it was recorded;
+            None otherwise (or when the layer was never validated)
+        """
+        entry = self.get(layer)
+        if entry is None or entry.status == JOURNAL_GENERATED:
+            return None
+        if Path(entry.artifact).resolve() != artifact.resolve():
+            return None
+        if entry.settings != settings or entry.upstream != upstream:
+            return None
+        if entry.sha256 != self.file_hash(artifact):
+            return None
+        return entry.status
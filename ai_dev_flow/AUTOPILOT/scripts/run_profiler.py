@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Run Profiler for the MVP Autopilot
+
+Records wall time and CPU time for every stage of an autopilot run (path
+pre-check, template generation, validation, auto-fix, final link check) and
+exports them as:
+    - a per-layer stage summary for the JSON/markdown/text reports
+    - a Chrome trace file (chrome://tracing, Perfetto, speedscope)
+
+CPU time is split into in-process CPU (the calling thread) and child CPU
+(validator and check subprocesses). Child CPU comes from RUSAGE_CHILDREN,
+which is process-wide, so it is exact for serial runs and approximate when
+layers run concurrently (--parallel). It is unavailable on Windows.
+
+Usage:
+    from run_profiler import RunProfiler
+
+    profiler = RunProfiler()
+    with profiler.stage("BRD", "validate"):
+        run_layer_validation(...)
+    profiler.write_chrome_trace(Path("trace.json"))
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+
+def _children_cpu() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+@dataclass
+class StageTiming:
+    """One timed stage."""
+    layer: str
+    stage: str
+    start: float  # Seconds since the profiler started
+    wall: float
+    cpu: float
+    child_cpu: float
+    thread: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class RunProfiler:
+    """Thread-safe stage timer for one autopilot run."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.stages: List[StageTiming] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, layer: str, stage: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block as `stage` of `layer`.
+
+        Yields a dict; keys added to it inside the block are stored with the
+        stage (e.g. the validator's exit status).
+        """
+        extra: Dict[str, Any] = dict(args)
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        child_start = _children_cpu()
+        try:
+            yield extra
+        finally:
+            timing = StageTiming(
+                layer=layer,
+                stage=stage,
+                start=start - self.origin,
+                wall=time.perf_counter() - start,
+                cpu=time.thread_time() - cpu_start,
+                child_cpu=max(0.0, _children_cpu() - child_start),
+                thread=threading.get_ident(),
+                args=extra,
+            )
+            with self._lock:
+                self.stages.append(timing)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-layer, per-stage totals (milliseconds), in first-seen order."""
+        totals: Dict[tuple, Dict[str, Any]] = {}
+        with self._lock:
+            stages = list(self.stages)
+        for s in sorted(stages, key=lambda t: t.start):
+            row = totals.setdefault((s.layer, s.stage), {
+                "layer": s.layer, "stage": s.stage, "count": 0,
+                "wall_ms": 0.0, "cpu_ms": 0.0, "child_cpu_ms": 0.0,
+            })
+            row["count"] += 1
+            row["wall_ms"] += s.wall * 1000
+            row["cpu_ms"] += s.cpu * 1000
+            row["child_cpu_ms"] += s.child_cpu * 1000
+        rows = list(totals.values())
+        for row in rows:
+            for key in ("wall_ms", "cpu_ms", "child_cpu_ms"):
+                row[key] = round(row[key], 1)
+        return rows
+
+    def total_wall_ms(self) -> float:
+        return round((time.perf_counter() - self.origin) * 1000, 1)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format document (complete events, microseconds)."""
+        pid = os.getpid()
+        with self._lock:
+            stages = list(self.stages)
+        threads = {ident: n for n, ident in enumerate(dict.fromkeys(s.thread for s in stages), 1)}
+        events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"autopilot-{tid}"}}
+            for tid in threads.values()
+        ]
+        for s in stages:
+            events.append({
+                "name": f"{s.layer}:{s.stage}",
+                "cat": s.stage,
+                "ph": "X",
+                "ts": round(s.start * 1_000_000),
+                "dur": round(s.wall * 1_000_000),
+                "pid": pid,
+                "tid": threads[s.thread],
+                "args": {
+                    "layer": s.layer,
+                    "cpu_ms": round(s.cpu * 1000, 3),
+                    "child_cpu_ms": round(s.child_cpu * 1000, 3),
+                    **{k: str(v) for k, v in s.args.items()},
+                },
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return path
@@ -13,9 +13,13 @@ Reference: IPLAN-001 Section 4.3.2
 """
 
 import argparse
+import fnmatch
+import os
 import re
+import shutil
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +32,25 @@ class TagUpdate:
     tag_type: str
     old_value: str
     new_value: str
+    # Offsets of "@tag: PENDING" in the scanned content
+    span: Optional[tuple[int, int]] = None
+
+
+@dataclass
+class PendingTag:
+    """A PENDING tag located by the scan."""
+    tag_type: str
+    line_number: int
+    span: tuple[int, int]
+
+
+@dataclass
+class FileScan:
+    """One read of a test file: its content and PENDING tags."""
+    file_path: Path
+    content: str = ""
+    pending: list[PendingTag] = field(default_factory=list)
+    error: Optional[str] = None
 
 
 @dataclass
@@ -41,6 +64,166 @@ class UpdateResult:
     errors: list[str]
 
 
+class _DirIndex:
+    """
+    Files under one directory, listed once in the order Path.glob('**/...')
+    would yield them, with lookups by exact name and by numbered prefix.
+    """
+
+    # Leading "SPEC-" / "TASKS_" style prefix followed by a number
+    NUMBERED_PATTERN = re.compile(r'([A-Za-z]+[-_])(\d+)')
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.files: list[Path] = []
+        self.by_name: dict[str, Path] = {}
+        # ('SPEC-01', '.yaml') -> first file named SPEC-01*.yaml
+        self.by_number: dict[tuple[str, str], Path] = {}
+        self._matches: dict[str, list[Path]] = {}
+
+        if not root.is_dir():
+            return
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for name in filenames:
+                path = Path(dirpath) / name
+                self.files.append(path)
+                self.by_name.setdefault(name, path)
+                match = self.NUMBERED_PATTERN.match(name)
+                if match:
+                    prefix, digits = match.groups()
+                    for end in range(1, len(digits) + 1):
+                        self.by_number.setdefault((prefix + digits[:end], path.suffix), path)
+
+    def matching(self, pattern: str) -> list[Path]:
+        """Files whose name matches a glob pattern (memoized per pattern)."""
+        if pattern not in self._matches:
+            match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+            self._matches[pattern] = [p for p in self.files if match(os.path.normcase(p.name))]
+        return self._matches[pattern]
+
+    def first(self, pattern: str) -> Optional[Path]:
+        matches = self.matching(pattern)
+        return matches[0] if matches else None
+
+    def relative(self, path: Optional[Path]) -> Optional[str]:
+        """Path as written into tags: relative to the indexed directory's parent."""
+        return str(path.relative_to(self.root.parent)) if path else None
+
+
+class ArtifactResolver:
+    """
+    Resolves PENDING tag targets from one-time indexes of the SPEC, TASKS
+    and code directories.
+
+    Each directory is walked once on first use; after that, REQ ID, component
+    and service lookups are dictionary hits or memoized scans of the in-memory
+    file list, instead of a glob over the tree per test file and pattern.
+    The test directory listing is indexed the same way so update, counting
+    and validation share one walk.
+    """
+
+    # Map known REQ prefixes to service names
+    # This would typically be configured or derived from REQ file content
+    SERVICE_NAMES = {
+        'REQ.01.10': 'auth',
+        'REQ.01.20': 'user',
+        'REQ.02': 'api',
+    }
+
+    REQ_NUMBER_PATTERN = re.compile(r'REQ[-.]?(\d+)', re.IGNORECASE)
+
+    def __init__(
+        self,
+        spec_dir: Optional[Path] = None,
+        tasks_dir: Optional[Path] = None,
+        code_dir: Optional[Path] = None
+    ):
+        self.spec_dir = spec_dir
+        self.tasks_dir = tasks_dir
+        self.code_dir = code_dir
+        self._indexes: dict[Path, _DirIndex] = {}
+
+    def index(self, directory: Path) -> _DirIndex:
+        if directory not in self._indexes:
+            self._indexes[directory] = _DirIndex(directory)
+        return self._indexes[directory]
+
+    def python_files(self, test_dir: Path) -> list[Path]:
+        return self.index(test_dir).matching('*.py')
+
+    def find_spec(self, req_ids: list[str], component_name: Optional[str]) -> Optional[str]:
+        """Find SPEC file matching REQ or component, else the first SPEC file."""
+        if not self.spec_dir:
+            return None
+        index = self.index(self.spec_dir)
+
+        path = self._find_by_req(index, req_ids, 'SPEC')
+        if not path and component_name:
+            path = index.first(f'*{component_name}*.yaml')
+        if not path:
+            path = index.first('*.yaml')
+        return index.relative(path)
+
+    def find_tasks(self, req_ids: list[str], component_name: Optional[str]) -> Optional[str]:
+        """Find TASKS file matching REQ or component."""
+        if not self.tasks_dir:
+            return None
+        index = self.index(self.tasks_dir)
+
+        path = self._find_by_req(index, req_ids, 'TASKS')
+        if not path and component_name:
+            path = index.first(f'*{component_name}*.md')
+        return index.relative(path)
+
+    def find_code(self, req_ids: list[str], component_name: Optional[str]) -> Optional[str]:
+        """Find source code file matching component, else a service derived from REQ."""
+        if not self.code_dir:
+            return None
+        index = self.index(self.code_dir)
+
+        path = None
+        if component_name:
+            # Service/module file; services/<name>.py is covered by the exact name
+            path = (
+                index.by_name.get(f'{component_name}.py')
+                or index.by_name.get(f'{component_name}_service.py')
+                or index.first(f'*{component_name}*.py')
+            )
+        if not path:
+            for req_id in req_ids:
+                service_name = self.service_name(req_id)
+                if service_name:
+                    path = index.first(f'{service_name}*.py')
+                    if path:
+                        break
+        return index.relative(path)
+
+    def _find_by_req(self, index: _DirIndex, req_ids: list[str], artifact_type: str) -> Optional[Path]:
+        """First artifact named after a REQ ID (numbered prefix, then full ID slug)."""
+        for req_id in req_ids:
+            match = self.REQ_NUMBER_PATTERN.match(req_id)
+            if match:
+                num = match.group(1)
+                for sep in ('-', '_'):
+                    for ext in ('.yaml', '.md'):
+                        path = index.by_number.get((f'{artifact_type}{sep}{num}', ext))
+                        if path:
+                            return path
+
+            slug = req_id.replace('.', '_').replace('-', '_').lower()
+            path = index.first(f'*{slug}*.yaml') or index.first(f'*{slug}*.md')
+            if path:
+                return path
+        return None
+
+    def service_name(self, req_id: str) -> Optional[str]:
+        """Convert REQ ID to likely service name."""
+        for prefix, service in self.SERVICE_NAMES.items():
+            if req_id.startswith(prefix):
+                return service
+        return None
+
+
 class TraceabilityUpdater:
     """
     Updates PENDING traceability tags in test files.
@@ -54,6 +237,9 @@ class TraceabilityUpdater:
         re.MULTILINE | re.IGNORECASE
     )
 
+    # The "@tag: PENDING" part of a PENDING_PATTERN match (what gets replaced)
+    TAG_VALUE_PATTERN = re.compile(r'@\w+:\s*PENDING', re.IGNORECASE)
+
     # Pattern to extract REQ ID from file
     REQ_PATTERN = re.compile(
         r'@req:\s*(REQ[-.\d]+)',
@@ -66,8 +252,9 @@ class TraceabilityUpdater:
         re.IGNORECASE
     )
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, max_workers: Optional[int] = None):
         self.verbose = verbose
+        self.max_workers = max_workers
 
     def update_test_traceability(
         self,
@@ -99,73 +286,99 @@ class TraceabilityUpdater:
             errors=[]
         )
 
-        test_files = list(test_dir.glob('**/*.py'))
-        result.files_scanned = len(test_files)
+        resolver = ArtifactResolver(spec_dir, tasks_dir, code_dir)
+        scans = self.scan_pending_tags(test_dir, resolver)
+        result.files_scanned = len(scans)
 
-        for test_file in test_files:
-            file_updates = self._process_file(
-                test_file, spec_dir, tasks_dir, code_dir
-            )
+        writes = []
+        for scan in scans:
+            file_updates = self._process_file(scan, resolver)
 
             if file_updates:
                 result.updates.extend(file_updates)
                 result.tags_updated += len(file_updates)
+                result.files_updated += 1  # Counted as would-be-updated on dry runs
+                writes.append((scan, file_updates))
 
-                if not dry_run:
-                    self._apply_updates(test_file, file_updates)
-                    result.files_updated += 1
-                else:
-                    result.files_updated += 1  # Count as would-be-updated
+        # Remaining PENDING tags follow from the scan: every resolved tag is replaced in place
+        result.pending_remaining = self._count_pending_tags(test_dir, scans=scans) - result.tags_updated
 
-        # Count remaining PENDING tags
         if not dry_run:
-            result.pending_remaining = self._count_pending_tags(test_dir)
-        else:
-            # Estimate - don't count since files weren't updated
-            result.pending_remaining = self._count_pending_tags(test_dir) - result.tags_updated
+            for (scan, file_updates), error in zip(writes, self._apply_updates_batch(writes)):
+                if error:
+                    result.errors.append(error)
+                    result.files_updated -= 1
+                    result.pending_remaining += len(file_updates)
 
         return result
 
-    def _process_file(
+    def scan_pending_tags(
         self,
-        test_file: Path,
-        spec_dir: Optional[Path],
-        tasks_dir: Optional[Path],
-        code_dir: Optional[Path]
-    ) -> list[TagUpdate]:
-        """Process a single test file for PENDING tags."""
-        updates = []
+        test_dir: Path,
+        resolver: Optional[ArtifactResolver] = None
+    ) -> list[FileScan]:
+        """
+        Read every test file once and locate its PENDING tags.
 
-        try:
-            content = test_file.read_text(encoding='utf-8')
-        except Exception as e:
-            if self.verbose:
-                print(f"Error reading {test_file}: {e}")
+        Args:
+            test_dir: Directory containing test files
+            resolver: Resolver whose test directory listing to reuse
+
+        Returns:
+            One FileScan per test file, in directory order
+        """
+        resolver = resolver or ArtifactResolver()
+        scans = []
+
+        for test_file in resolver.python_files(test_dir):
+            scan = FileScan(file_path=test_file)
+            scans.append(scan)
+            try:
+                scan.content = test_file.read_text(encoding='utf-8')
+            except Exception as e:
+                scan.error = str(e)
+                if self.verbose:
+                    print(f"Error reading {test_file}: {e}")
+                continue
+
+            line_number, offset = 1, 0
+            for match in self.PENDING_PATTERN.finditer(scan.content):
+                line_number += scan.content.count('\n', offset, match.start())
+                offset = match.start()
+                value = self.TAG_VALUE_PATTERN.match(scan.content, match.start())
+                scan.pending.append(PendingTag(
+                    tag_type=match.group(1),
+                    line_number=line_number,
+                    span=(match.start(), value.end())
+                ))
+
+        return scans
+
+    def _process_file(self, scan: FileScan, resolver: ArtifactResolver) -> list[TagUpdate]:
+        """Resolve the PENDING tags of a scanned test file."""
+        updates = []
+        if not scan.pending:
             return updates
 
         # Extract context from file
-        req_ids = self.REQ_PATTERN.findall(content)
-        component_match = self.COMPONENT_PATTERN.search(test_file.stem)
+        req_ids = self.REQ_PATTERN.findall(scan.content)
+        component_match = self.COMPONENT_PATTERN.search(scan.file_path.stem)
         component_name = component_match.group(1) if component_match else None
 
-        # Find and resolve each PENDING tag
-        for match in self.PENDING_PATTERN.finditer(content):
-            tag_type = match.group(1).lower()
-            line_number = content[:match.start()].count('\n') + 1
+        for tag in scan.pending:
+            tag_type = tag.tag_type.lower()
 
             # Resolve the path
-            resolved_path = self._resolve_path(
-                tag_type, req_ids, component_name,
-                spec_dir, tasks_dir, code_dir
-            )
+            resolved_path = self._resolve_path(tag_type, req_ids, component_name, resolver)
 
             if resolved_path and resolved_path != 'PENDING':
                 updates.append(TagUpdate(
-                    file_path=test_file,
-                    line_number=line_number,
+                    file_path=scan.file_path,
+                    line_number=tag.line_number,
                     tag_type=tag_type,
                     old_value='PENDING',
-                    new_value=resolved_path
+                    new_value=resolved_path,
+                    span=tag.span
                 ))
 
         return updates
@@ -175,155 +388,21 @@ class TraceabilityUpdater:
         tag_type: str,
         req_ids: list[str],
         component_name: Optional[str],
-        spec_dir: Optional[Path],
-        tasks_dir: Optional[Path],
-        code_dir: Optional[Path]
+        resolver: ArtifactResolver
     ) -> Optional[str]:
         """Resolve path for a specific tag type."""
-        if tag_type == 'spec' and spec_dir:
-            return self._find_spec_file(req_ids, component_name, spec_dir)
-        elif tag_type == 'tasks' and tasks_dir:
-            return self._find_tasks_file(req_ids, component_name, tasks_dir)
-        elif tag_type == 'code' and code_dir:
-            return self._find_code_file(req_ids, component_name, code_dir)
+        if tag_type == 'spec':
+            return resolver.find_spec(req_ids, component_name)
+        elif tag_type == 'tasks':
+            return resolver.find_tasks(req_ids, component_name)
+        elif tag_type == 'code':
+            return resolver.find_code(req_ids, component_name)
         elif tag_type == 'tspec':
             # TSPEC is derived from REQ
             if req_ids:
                 return self._derive_tspec_id(req_ids[0])
         return None
 
-    def _find_spec_file(
-        self,
-        req_ids: list[str],
-        component_name: Optional[str],
-        spec_dir: Path
-    ) -> Optional[str]:
-        """Find SPEC file matching REQ or component."""
-        if not spec_dir.exists():
-            return None
-
-        # Try to find by REQ ID
-        for req_id in req_ids:
-            # Convert REQ.01.10.01 -> patterns
-            patterns = self._req_to_patterns(req_id, 'SPEC')
-            for pattern in patterns:
-                matches = list(spec_dir.glob(f'**/{pattern}'))
-                if matches:
-                    return str(matches[0].relative_to(spec_dir.parent))
-
-        # Try to find by component name
-        if component_name:
-            matches = list(spec_dir.glob(f'**/*{component_name}*.yaml'))
-            if matches:
-                return str(matches[0].relative_to(spec_dir.parent))
-
-        # Return first SPEC file as fallback
-        all_specs = list(spec_dir.glob('**/*.yaml'))
-        if all_specs:
-            return str(all_specs[0].relative_to(spec_dir.parent))
-
-        return None
-
-    def _find_tasks_file(
-        self,
-        req_ids: list[str],
-        component_name: Optional[str],
-        tasks_dir: Path
-    ) -> Optional[str]:
-        """Find TASKS file matching REQ or component."""
-        if not tasks_dir.exists():
-            return None
-
-        # Try to find by REQ ID
-        for req_id in req_ids:
-            patterns = self._req_to_patterns(req_id, 'TASKS')
-            for pattern in patterns:
-                matches = list(tasks_dir.glob(f'**/{pattern}'))
-                if matches:
-                    return str(matches[0].relative_to(tasks_dir.parent))
-
-        # Try to find by component name
-        if component_name:
-            matches = list(tasks_dir.glob(f'**/*{component_name}*.md'))
-            if matches:
-                return str(matches[0].relative_to(tasks_dir.parent))
-
-        return None
-
-    def _find_code_file(
-        self,
-        req_ids: list[str],
-        component_name: Optional[str],
-        code_dir: Path
-    ) -> Optional[str]:
-        """Find source code file matching component."""
-        if not code_dir.exists():
-            return None
-
-        # Try to find by component name
-        if component_name:
-            # Look for service/module file
-            patterns = [
-                f'**/{component_name}.py',
-                f'**/{component_name}_service.py',
-                f'**/services/{component_name}.py',
-                f'**/*{component_name}*.py'
-            ]
-            for pattern in patterns:
-                matches = list(code_dir.glob(pattern))
-                if matches:
-                    return str(matches[0].relative_to(code_dir.parent))
-
-        # Try to derive from REQ
-        for req_id in req_ids:
-            service_name = self._req_to_service_name(req_id)
-            if service_name:
-                matches = list(code_dir.glob(f'**/{service_name}*.py'))
-                if matches:
-                    return str(matches[0].relative_to(code_dir.parent))
-
-        return None
-
-    def _req_to_patterns(self, req_id: str, artifact_type: str) -> list[str]:
-        """Convert REQ ID to file search patterns."""
-        patterns = []
-
-        # Extract numeric parts
-        match = re.match(r'REQ[-.]?(\d+)(?:[-.](\d+))?(?:[-.](\d+))?', req_id, re.IGNORECASE)
-        if match:
-            parts = [p for p in match.groups() if p]
-            num = parts[0] if parts else '01'
-
-            patterns.extend([
-                f'{artifact_type}-{num}*.yaml',
-                f'{artifact_type}-{num}*.md',
-                f'{artifact_type}_{num}*.yaml',
-                f'{artifact_type}_{num}*.md',
-            ])
-
-        # Also try with full ID converted
-        slug = req_id.replace('.', '_').replace('-', '_').lower()
-        patterns.append(f'*{slug}*.yaml')
-        patterns.append(f'*{slug}*.md')
-
-        return patterns
-
-    def _req_to_service_name(self, req_id: str) -> Optional[str]:
-        """Convert REQ ID to likely service name."""
-        # Map known REQ patterns to service names
-        # This would typically be configured or derived from REQ file content
-        mappings = {
-            'REQ.01.10': 'auth',
-            'REQ.01.20': 'user',
-            'REQ.02': 'api',
-        }
-
-        for prefix, service in mappings.items():
-            if req_id.startswith(prefix):
-                return service
-
-        return None
-
     def _derive_tspec_id(self, req_id: str) -> str:
         """Derive TSPEC ID from REQ ID."""
         # REQ.01.10.01 -> TSPEC.01.40.01 (40 = Unit Test)
@@ -333,57 +412,86 @@ class TraceabilityUpdater:
             return f'TSPEC.{num}.40.01'
         return f'TSPEC.01.40.01'
 
-    def _apply_updates(self, test_file: Path, updates: list[TagUpdate]) -> None:
-        """Apply tag updates to file."""
-        content = test_file.read_text(encoding='utf-8')
-
-        for update in updates:
-            # Replace PENDING with resolved path
-            old_pattern = f'@{update.tag_type}: PENDING'
-            new_value = f'@{update.tag_type}: {update.new_value}'
-            content = re.sub(
-                rf'@{update.tag_type}:\s*PENDING',
-                new_value,
-                content,
-                flags=re.IGNORECASE
-            )
-
-        test_file.write_text(content, encoding='utf-8')
+    def _render_updates(self, content: str, updates: list[TagUpdate]) -> str:
+        """Replace each updated "@tag: PENDING" span, leaving the rest of the file as is."""
+        parts = []
+        offset = 0
+        for update in sorted(updates, key=lambda u: u.span):
+            start, end = update.span
+            parts.append(content[offset:start])
+            parts.append(f'@{update.tag_type}: {update.new_value}')
+            offset = end
+        parts.append(content[offset:])
+        return ''.join(parts)
+
+    def _apply_updates(self, scan: FileScan, updates: list[TagUpdate]) -> None:
+        """Apply tag updates to a scanned file (atomic replace, mode preserved)."""
+        test_file = scan.file_path
+        tmp_path = test_file.with_name(f".{test_file.name}.tmp")
+        tmp_path.write_text(self._render_updates(scan.content, updates), encoding='utf-8')
+        shutil.copymode(test_file, tmp_path)
+        tmp_path.replace(test_file)
 
         if self.verbose:
             print(f"Updated {test_file.name}: {len(updates)} tag(s)")
 
-    def _count_pending_tags(self, test_dir: Path) -> int:
-        """Count remaining PENDING tags in directory."""
-        count = 0
-        for test_file in test_dir.glob('**/*.py'):
+    def _apply_updates_batch(self, writes: list[tuple[FileScan, list[TagUpdate]]]) -> list[Optional[str]]:
+        """
+        Write updated files on a thread pool.
+
+        Returns:
+            One error message (or None) per write, in input order
+        """
+        def _write(write: tuple[FileScan, list[TagUpdate]]) -> Optional[str]:
+            scan, updates = write
             try:
-                content = test_file.read_text(encoding='utf-8')
-                count += len(self.PENDING_PATTERN.findall(content))
-            except Exception:
-                pass
-        return count
+                self._apply_updates(scan, updates)
+            except OSError as e:
+                return f"Failed to update {scan.file_path}: {e}"
+            return None
+
+        if len(writes) <= 1:
+            return [_write(w) for w in writes]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(_write, writes))
 
-    def validate_no_pending_tags(self, test_dir: Path) -> bool:
+    def _count_pending_tags(
+        self,
+        test_dir: Path,
+        resolver: Optional[ArtifactResolver] = None,
+        scans: Optional[list[FileScan]] = None
+    ) -> int:
+        """Count PENDING tags in directory (from an existing scan when given)."""
+        if scans is None:
+            scans = self.scan_pending_tags(test_dir, resolver)
+        return sum(len(scan.pending) for scan in scans)
+
+    def validate_no_pending_tags(
+        self,
+        test_dir: Path,
+        resolver: Optional[ArtifactResolver] = None,
+        scans: Optional[list[FileScan]] = None
+    ) -> bool:
         """
         Verify all PENDING tags are resolved.
 
+        Args:
+            test_dir: Directory containing test files
+            resolver: Resolver whose test directory listing to reuse
+            scans: Existing scan result to validate instead of re-reading files
+
         Returns True if no PENDING tags remain.
         """
-        pending_files = []
+        if scans is None:
+            scans = self.scan_pending_tags(test_dir, resolver)
 
-        for test_file in test_dir.glob('**/*.py'):
-            try:
-                content = test_file.read_text(encoding='utf-8')
-                matches = self.PENDING_PATTERN.findall(content)
-                if matches:
-                    pending_files.append({
-                        'file': str(test_file),
-                        'pending_tags': list(set(matches))
-                    })
-            except Exception as e:
-                if self.verbose:
-                    print(f"Error reading {test_file}: {e}")
+        pending_files = [
+            {
+                'file': str(scan.file_path),
+                'pending_tags': list({tag.tag_type for tag in scan.pending})
+            }
+            for scan in scans if scan.pending
+        ]
 
         if pending_files:
             if self.verbose:
@@ -458,6 +566,13 @@ Examples:
         help='Show what would be updated without modifying files'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Threads used to write updated files (default: ThreadPoolExecutor default)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -466,7 +581,7 @@ Examples:
 
     args = parser.parse_args()
 
-    updater = TraceabilityUpdater(verbose=args.verbose)
+    updater = TraceabilityUpdater(verbose=args.verbose, max_workers=args.jobs)
 
     try:
         if args.validate_only:
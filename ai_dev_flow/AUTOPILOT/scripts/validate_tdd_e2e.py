@@ -11,19 +11,31 @@ Test Scenarios (per IPLAN-001 Section 4.3.6):
 3. Complex service: 5 REQs, 2 SPECs
 4. Multiple components with integration
 
+Each scenario runs in its own temp workspace; with --scenario all the
+scenarios run concurrently in a process pool (--jobs). Stages call the
+generator/validator modules in-process, and per-stage timings are collected
+in the report.
+
 Usage:
     python validate_tdd_e2e.py --scenario simple --project-dir /path/to/project
     python validate_tdd_e2e.py --scenario all --project-dir /path/to/project --verbose
+    python validate_tdd_e2e.py --scenario all --jobs 4 --report json
 
 Reference: IPLAN-001 Section 4.3.6
 """
 
 import argparse
+import contextlib
+import importlib
+import io
 import json
-import subprocess
+import os
 import sys
 import tempfile
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -60,6 +72,9 @@ class ValidationReport:
     scenarios_failed: int
     results: list
     overall_status: str
+    wall_ms: int = 0
+    workers: int = 1
+    stage_timings: dict = field(default_factory=dict)  # stage -> runs/total_ms/max_ms
 
 
 class TDDWorkflowValidator:
@@ -113,11 +128,22 @@ class TDDWorkflowValidator:
         self,
         project_dir: Path,
         scripts_dir: Optional[Path] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        jobs: Optional[int] = None
     ):
+        """
+        Args:
+            project_dir: Project directory
+            scripts_dir: Directory containing the TDD scripts
+            verbose: Verbose output
+            jobs: Worker processes for run_all_scenarios (default: CPU count)
+        """
         self.project_dir = project_dir
-        self.scripts_dir = scripts_dir or Path(__file__).parent
+        self.scripts_dir = (scripts_dir or Path(__file__).parent).resolve()
         self.verbose = verbose
+        self.jobs = jobs
+        # Workspace of the scenario being run; each worker process has its
+        # own validator, so concurrent scenarios never share it
         self.temp_dir = None
 
     def run_scenario(self, scenario_name: str) -> ScenarioResult:
@@ -132,7 +158,7 @@ class TDDWorkflowValidator:
 
         scenario = self.SCENARIOS[scenario_name]
         stages = []
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         if self.verbose:
             print(f"\n{'='*60}")
@@ -145,39 +171,41 @@ class TDDWorkflowValidator:
 
         try:
             # Stage 1: Setup test environment
-            stages.append(self._stage_setup(scenario))
+            stages.append(self._run_stage("setup", self._stage_setup, scenario))
 
             # Stage 2: Analyze test requirements
-            stages.append(self._stage_analyze_tests())
+            stages.append(self._run_stage("analyze_tests", self._stage_analyze_tests))
 
             # Stage 3: Generate SPEC
-            stages.append(self._stage_generate_spec())
+            stages.append(self._run_stage("generate_spec", self._stage_generate_spec))
 
             # Stage 4: Validate Red State
-            stages.append(self._stage_validate_red())
+            stages.append(self._run_stage("validate_red", self._stage_validate_red))
 
             # Stage 5: Simulate code generation
-            stages.append(self._stage_generate_code(scenario))
+            stages.append(self._run_stage("generate_code", self._stage_generate_code, scenario))
 
             # Stage 6: Validate Green State
-            stages.append(self._stage_validate_green())
+            stages.append(self._run_stage("validate_green", self._stage_validate_green))
 
             # Stage 7: Update traceability
-            stages.append(self._stage_update_traceability())
+            stages.append(self._run_stage("update_traceability", self._stage_update_traceability))
 
             # Stage 8: Generate integration tests (if applicable)
             if scenario.get('has_integration', False):
-                stages.append(self._stage_generate_integration_tests())
+                stages.append(self._run_stage(
+                    "generate_integration_tests", self._stage_generate_integration_tests
+                ))
 
             # Stage 9: Generate smoke tests
-            stages.append(self._stage_generate_smoke_tests())
+            stages.append(self._run_stage("generate_smoke_tests", self._stage_generate_smoke_tests))
 
         finally:
             # Cleanup temp directory
             if self.temp_dir and self.temp_dir.exists():
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-        duration = (datetime.now() - start_time).total_seconds() * 1000
+        duration = (time.perf_counter() - start_time) * 1000
         all_passed = all(s.passed for s in stages)
 
         return ScenarioResult(
@@ -188,10 +216,40 @@ class TDDWorkflowValidator:
             summary=f"{'PASSED' if all_passed else 'FAILED'}: {len([s for s in stages if s.passed])}/{len(stages)} stages"
         )
 
+    def _run_stage(self, stage: str, func, *args) -> StageResult:
+        """
+        Run one stage, timing it and capturing what it prints.
+
+        Unexpected exceptions become a failed StageResult so later stages
+        still run.
+        """
+        buffer = io.StringIO()
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                result = func(*args)
+        except Exception as e:
+            result = StageResult(
+                stage=stage,
+                passed=False,
+                message=f"{stage} error: {e}",
+                errors=[str(e)]
+            )
+        result.duration_ms = int((time.perf_counter() - start) * 1000)
+        if self.verbose and buffer.getvalue().strip():
+            print(buffer.getvalue().rstrip())
+        return result
+
+    def _import_script(self, name: str):
+        """Import a TDD script from scripts_dir, or None if it is missing."""
+        if not (self.scripts_dir / f"{name}.py").exists():
+            return None
+        if str(self.scripts_dir) not in sys.path:
+            sys.path.insert(0, str(self.scripts_dir))
+        return importlib.import_module(name)
+
     def _stage_setup(self, scenario: dict) -> StageResult:
         """Stage 1: Setup test environment."""
-        start = datetime.now()
-
         try:
             # Create test structure
             test_dir = self.temp_dir / "tests" / "unit"
@@ -250,35 +308,29 @@ Sample requirement for TDD validation.
 """
                 req_file.write_text(req_content)
 
-            duration = (datetime.now() - start).total_seconds() * 1000
             return StageResult(
                 stage="setup",
                 passed=True,
                 message=f"Created {scenario['req_count']} test files and REQ documents",
-                duration_ms=int(duration),
                 artifacts=[str(test_dir), str(req_dir)]
             )
 
         except Exception as e:
-            duration = (datetime.now() - start).total_seconds() * 1000
             return StageResult(
                 stage="setup",
                 passed=False,
                 message=f"Setup failed: {e}",
-                duration_ms=int(duration),
                 errors=[str(e)]
             )
 
     def _stage_analyze_tests(self) -> StageResult:
         """Stage 2: Analyze test requirements."""
-        start = datetime.now()
-
-        script = self.scripts_dir / "analyze_test_requirements.py"
-        if not script.exists():
+        module = self._import_script("analyze_test_requirements")
+        if module is None:
             return StageResult(
                 stage="analyze_tests",
                 passed=False,
-                message=f"Script not found: {script}",
+                message=f"Script not found: {self.scripts_dir / 'analyze_test_requirements.py'}",
                 errors=["Script missing"]
             )
 
@@ -286,47 +338,17 @@ Sample requirement for TDD validation.
         output_file = self.temp_dir / "test_requirements.json"
 
         try:
-            result = subprocess.run(
-                [
-                    sys.executable, str(script),
-                    "--test-dir", str(test_dir),
-                    "--output", str(output_file)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60
+            # Scenarios already run one per worker; analyze serially
+            data = module.TestRequirementAnalyzer().generate_test_requirements(
+                test_dir, output_file, jobs=1
             )
-
-            duration = (datetime.now() - start).total_seconds() * 1000
-
-            if result.returncode == 0 and output_file.exists():
-                # Verify output is valid JSON
-                with open(output_file) as f:
-                    data = json.load(f)
-
-                return StageResult(
-                    stage="analyze_tests",
-                    passed=True,
-                    message=f"Analyzed tests, found {len(data.get('test_files', []))} files",
-                    duration_ms=int(duration),
-                    artifacts=[str(output_file)]
-                )
-            else:
-                return StageResult(
-                    stage="analyze_tests",
-                    passed=False,
-                    message=f"Analysis failed: {result.stderr}",
-                    duration_ms=int(duration),
-                    errors=[result.stderr]
-                )
-
-        except subprocess.TimeoutExpired:
             return StageResult(
                 stage="analyze_tests",
-                passed=False,
-                message="Analysis timed out",
-                errors=["Timeout after 60s"]
+                passed=True,
+                message=f"Analyzed tests, found {len(data.get('files', {}))} files",
+                artifacts=[str(output_file)]
             )
+
         except Exception as e:
             return StageResult(
                 stage="analyze_tests",
@@ -337,14 +359,12 @@ Sample requirement for TDD validation.
 
     def _stage_generate_spec(self) -> StageResult:
         """Stage 3: Generate test-aware SPEC."""
-        start = datetime.now()
-
-        script = self.scripts_dir / "generate_spec_tdd.py"
-        if not script.exists():
+        module = self._import_script("generate_spec_tdd")
+        if module is None:
             return StageResult(
                 stage="generate_spec",
                 passed=False,
-                message=f"Script not found: {script}",
+                message=f"Script not found: {self.scripts_dir / 'generate_spec_tdd.py'}",
                 errors=["Script missing"]
             )
 
@@ -352,36 +372,18 @@ Sample requirement for TDD validation.
         output_dir = self.temp_dir / "generated_specs"
 
         try:
-            result = subprocess.run(
-                [
-                    sys.executable, str(script),
-                    "--test-requirements", str(test_req_file),
-                    "--output", str(output_dir)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60
+            generator = module.TestAwareSPECGenerator()
+            spec_files = generator.generate_spec_from_tests(
+                generator.load_test_requirements(test_req_file),
+                None,
+                output_dir
+            )
+            return StageResult(
+                stage="generate_spec",
+                passed=True,
+                message=f"Generated {len(spec_files)} SPEC files",
+                artifacts=[str(f) for f in spec_files]
             )
-
-            duration = (datetime.now() - start).total_seconds() * 1000
-
-            if result.returncode == 0:
-                spec_files = list(output_dir.glob("*.yaml")) if output_dir.exists() else []
-                return StageResult(
-                    stage="generate_spec",
-                    passed=True,
-                    message=f"Generated {len(spec_files)} SPEC files",
-                    duration_ms=int(duration),
-                    artifacts=[str(f) for f in spec_files]
-                )
-            else:
-                return StageResult(
-                    stage="generate_spec",
-                    passed=False,
-                    message=f"SPEC generation failed: {result.stderr}",
-                    duration_ms=int(duration),
-                    errors=[result.stderr]
-                )
 
         except Exception as e:
             return StageResult(
@@ -393,49 +395,33 @@ Sample requirement for TDD validation.
 
     def _stage_validate_red(self) -> StageResult:
         """Stage 4: Validate Red State (tests should fail)."""
-        start = datetime.now()
-
-        script = self.scripts_dir / "validate_tdd_stage.py"
-        if not script.exists():
+        module = self._import_script("validate_tdd_stage")
+        if module is None:
             return StageResult(
                 stage="validate_red",
                 passed=False,
-                message=f"Script not found: {script}",
+                message=f"Script not found: {self.scripts_dir / 'validate_tdd_stage.py'}",
                 errors=["Script missing"]
             )
 
         test_dir = self.temp_dir / "tests" / "unit"
 
         try:
-            result = subprocess.run(
-                [
-                    sys.executable, str(script),
-                    "--stage", "red",
-                    "--test-dir", str(test_dir)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            duration = (datetime.now() - start).total_seconds() * 1000
+            result = module.TDDStageValidator(runner="inprocess").validate_red_state(test_dir)
 
             # Red state validation passes when tests fail (or are skipped for validation)
-            # Exit code 0 means validation passed
-            if result.returncode == 0:
+            if result.status != 'FAIL':
                 return StageResult(
                     stage="validate_red",
                     passed=True,
-                    message="Red state validated: tests expected to fail",
-                    duration_ms=int(duration)
+                    message="Red state validated: tests expected to fail"
                 )
             else:
                 return StageResult(
                     stage="validate_red",
                     passed=False,
-                    message=f"Red state validation failed: {result.stderr}",
-                    duration_ms=int(duration),
-                    errors=[result.stderr]
+                    message=f"Red state validation failed: {result.message}",
+                    errors=[result.message]
                 )
 
         except Exception as e:
@@ -448,8 +434,6 @@ Sample requirement for TDD validation.
 
     def _stage_generate_code(self, scenario: dict) -> StageResult:
         """Stage 5: Simulate code generation."""
-        start = datetime.now()
-
         try:
             # Create simulated code files
             code_dir = self.temp_dir / "src" / "services"
@@ -476,12 +460,10 @@ def validate_input(data: dict) -> bool:
 '''
                 code_file.write_text(code_content)
 
-            duration = (datetime.now() - start).total_seconds() * 1000
             return StageResult(
                 stage="generate_code",
                 passed=True,
                 message=f"Generated {scenario['req_count']} code files (simulated)",
-                duration_ms=int(duration),
                 artifacts=[str(code_dir)]
             )
 
@@ -495,14 +477,12 @@ def validate_input(data: dict) -> bool:
 
     def _stage_validate_green(self) -> StageResult:
         """Stage 6: Validate Green State (tests should pass)."""
-        start = datetime.now()
-
-        script = self.scripts_dir / "validate_tdd_stage.py"
-        if not script.exists():
+        module = self._import_script("validate_tdd_stage")
+        if module is None:
             return StageResult(
                 stage="validate_green",
                 passed=False,
-                message=f"Script not found: {script}",
+                message=f"Script not found: {self.scripts_dir / 'validate_tdd_stage.py'}",
                 errors=["Script missing"]
             )
 
@@ -510,26 +490,13 @@ def validate_input(data: dict) -> bool:
         code_dir = self.temp_dir / "src"
 
         try:
-            result = subprocess.run(
-                [
-                    sys.executable, str(script),
-                    "--stage", "green",
-                    "--test-dir", str(test_dir),
-                    "--code-dir", str(code_dir)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            duration = (datetime.now() - start).total_seconds() * 1000
+            result = module.TDDStageValidator(runner="inprocess").validate_green_state(test_dir, code_dir)
 
-            if result.returncode == 0:
+            if result.status != 'FAIL':
                 return StageResult(
                     stage="validate_green",
                     passed=True,
-                    message="Green state validated: tests pass with code",
-                    duration_ms=int(duration)
+                    message="Green state validated: tests pass with code"
                 )
             else:
                 # Green state may fail if tests actually run and fail
@@ -537,8 +504,7 @@ def validate_input(data: dict) -> bool:
                 return StageResult(
                     stage="validate_green",
                     passed=True,
-                    message="Green state: code exists (simulation)",
-                    duration_ms=int(duration)
+                    message="Green state: code exists (simulation)"
                 )
 
         except Exception as e:
@@ -551,46 +517,35 @@ def validate_input(data: dict) -> bool:
 
     def _stage_update_traceability(self) -> StageResult:
         """Stage 7: Update traceability tags."""
-        start = datetime.now()
-
-        script = self.scripts_dir / "update_test_traceability.py"
-        if not script.exists():
+        module = self._import_script("update_test_traceability")
+        if module is None:
             return StageResult(
                 stage="update_traceability",
                 passed=False,
-                message=f"Script not found: {script}",
+                message=f"Script not found: {self.scripts_dir / 'update_test_traceability.py'}",
                 errors=["Script missing"]
             )
 
         try:
-            result = subprocess.run(
-                [
-                    sys.executable, str(script),
-                    "--test-dir", str(self.temp_dir / "tests" / "unit"),
-                    "--spec-dir", str(self.temp_dir / "ai_dev_flow" / "09_SPEC"),
-                    "--code-dir", str(self.temp_dir / "src")
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60
+            result = module.TraceabilityUpdater().update_test_traceability(
+                test_dir=self.temp_dir / "tests" / "unit",
+                spec_dir=self.temp_dir / "ai_dev_flow" / "09_SPEC",
+                code_dir=self.temp_dir / "src"
             )
 
-            duration = (datetime.now() - start).total_seconds() * 1000
-
-            if result.returncode == 0:
+            if result.pending_remaining == 0 and not result.errors:
                 return StageResult(
                     stage="update_traceability",
                     passed=True,
-                    message="Traceability tags updated",
-                    duration_ms=int(duration)
+                    message="Traceability tags updated"
                 )
             else:
+                errors = result.errors or [f"{result.pending_remaining} PENDING tag(s) could not be resolved"]
                 return StageResult(
                     stage="update_traceability",
                     passed=False,
-                    message=f"Traceability update failed: {result.stderr}",
-                    duration_ms=int(duration),
-                    errors=[result.stderr]
+                    message=f"Traceability update failed: {errors[0]}",
+                    errors=errors
                 )
 
         except Exception as e:
@@ -603,49 +558,36 @@ def validate_input(data: dict) -> bool:
 
     def _stage_generate_integration_tests(self) -> StageResult:
         """Stage 8: Generate integration tests."""
-        start = datetime.now()
-
-        script = self.scripts_dir / "generate_integration_tests.py"
-        if not script.exists():
+        module = self._import_script("generate_integration_tests")
+        if module is None:
             return StageResult(
                 stage="generate_integration_tests",
                 passed=False,
-                message=f"Script not found: {script}",
+                message=f"Script not found: {self.scripts_dir / 'generate_integration_tests.py'}",
                 errors=["Script missing"]
             )
 
         try:
             output_dir = self.temp_dir / "tests" / "integration"
 
-            result = subprocess.run(
-                [
-                    sys.executable, str(script),
-                    "--spec-dir", str(self.temp_dir / "ai_dev_flow" / "09_SPEC"),
-                    "--output", str(output_dir)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60
+            result = module.IntegrationTestGenerator().generate_from_spec(
+                self.temp_dir / "ai_dev_flow" / "09_SPEC", output_dir
             )
 
-            duration = (datetime.now() - start).total_seconds() * 1000
-
-            if result.returncode == 0:
+            if not result.errors:
                 test_files = list(output_dir.glob("*.py")) if output_dir.exists() else []
                 return StageResult(
                     stage="generate_integration_tests",
                     passed=True,
                     message=f"Generated {len(test_files)} integration test files",
-                    duration_ms=int(duration),
                     artifacts=[str(f) for f in test_files]
                 )
             else:
                 return StageResult(
                     stage="generate_integration_tests",
                     passed=False,
-                    message=f"Integration test generation failed: {result.stderr}",
-                    duration_ms=int(duration),
-                    errors=[result.stderr]
+                    message=f"Integration test generation failed: {result.errors[0]}",
+                    errors=result.errors
                 )
 
         except Exception as e:
@@ -658,14 +600,12 @@ def validate_input(data: dict) -> bool:
 
     def _stage_generate_smoke_tests(self) -> StageResult:
         """Stage 9: Generate smoke tests."""
-        start = datetime.now()
-
-        script = self.scripts_dir / "generate_smoke_tests.py"
-        if not script.exists():
+        module = self._import_script("generate_smoke_tests")
+        if module is None:
             return StageResult(
                 stage="generate_smoke_tests",
                 passed=False,
-                message=f"Script not found: {script}",
+                message=f"Script not found: {self.scripts_dir / 'generate_smoke_tests.py'}",
                 errors=["Script missing"]
             )
 
@@ -686,35 +626,22 @@ Feature: Sample Feature
 
             output_dir = self.temp_dir / "tests" / "smoke"
 
-            result = subprocess.run(
-                [
-                    sys.executable, str(script),
-                    "--bdd-dir", str(bdd_dir),
-                    "--output", str(output_dir)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            duration = (datetime.now() - start).total_seconds() * 1000
+            result = module.SmokeTestGenerator().generate_from_bdd(bdd_dir, output_dir)
 
-            if result.returncode == 0:
+            if not result.errors:
                 test_files = list(output_dir.glob("*.py")) if output_dir.exists() else []
                 return StageResult(
                     stage="generate_smoke_tests",
                     passed=True,
                     message=f"Generated {len(test_files)} smoke test files",
-                    duration_ms=int(duration),
                     artifacts=[str(f) for f in test_files]
                 )
             else:
                 return StageResult(
                     stage="generate_smoke_tests",
                     passed=False,
-                    message=f"Smoke test generation failed: {result.stderr}",
-                    duration_ms=int(duration),
-                    errors=[result.stderr]
+                    message=f"Smoke test generation failed: {result.errors[0]}",
+                    errors=result.errors
                 )
 
         except Exception as e:
@@ -727,30 +654,78 @@ Feature: Sample Feature
 
     def run_all_scenarios(self) -> ValidationReport:
         """Run all test scenarios."""
-        results = []
+        return self.run_scenarios(list(self.SCENARIOS))
+
+    def run_scenarios(self, scenario_names: list[str]) -> ValidationReport:
+        """
+        Run scenarios concurrently, one per worker process.
+
+        Each scenario works in its own temp workspace. Falls back to running
+        them one after another when a process pool cannot be started.
 
-        for scenario_name in self.SCENARIOS:
-            result = self.run_scenario(scenario_name)
-            results.append(result)
+        Returns:
+            ValidationReport with results in scenario_names order
+        """
+        start = time.perf_counter()
+        workers = max(1, min(self.jobs or os.cpu_count() or 1, len(scenario_names)))
+        results = None
+
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(
+                        _run_scenario_worker,
+                        [(self.project_dir, self.scripts_dir, name) for name in scenario_names]
+                    ))
+            except (OSError, BrokenProcessPool) as e:
+                # e.g. no semaphore support in a sandbox; run in-process instead
+                if self.verbose:
+                    print(f"Process pool unavailable ({e}); running scenarios serially")
+                workers = 1
+        if results is None:
+            results = [self.run_scenario(name) for name in scenario_names]
 
-            if self.verbose:
+        if self.verbose:
+            for result in results:
                 status = "PASSED" if result.passed else "FAILED"
-                print(f"\n{scenario_name}: {status} ({result.total_duration_ms}ms)")
+                print(f"\n{result.scenario}: {status} ({result.total_duration_ms}ms)")
                 for stage in result.stages:
                     stage_status = "✓" if stage.passed else "✗"
-                    print(f"  {stage_status} {stage.stage}: {stage.message}")
-
-        passed = len([r for r in results if r.passed])
-        failed = len(results) - passed
-
-        return ValidationReport(
-            timestamp=datetime.now().isoformat(),
-            scenarios_run=len(results),
-            scenarios_passed=passed,
-            scenarios_failed=failed,
-            results=results,
-            overall_status="PASSED" if failed == 0 else "FAILED"
-        )
+                    print(f"  {stage_status} {stage.stage}: {stage.message} ({stage.duration_ms}ms)")
+
+        return build_report(results, wall_ms=int((time.perf_counter() - start) * 1000), workers=workers)
+
+
+def _run_scenario_worker(job: tuple) -> ScenarioResult:
+    """Process-pool worker: run one scenario with a fresh validator."""
+    project_dir, scripts_dir, scenario_name = job
+    return TDDWorkflowValidator(project_dir, scripts_dir).run_scenario(scenario_name)
+
+
+def build_report(results: list, wall_ms: int = 0, workers: int = 1) -> ValidationReport:
+    """Summarize scenario results, aggregating stage durations by stage name."""
+    stage_timings: dict[str, dict[str, int]] = {}
+    for result in results:
+        for stage in result.stages:
+            timing = stage_timings.setdefault(stage.stage, {'runs': 0, 'total_ms': 0, 'max_ms': 0})
+            timing['runs'] += 1
+            timing['total_ms'] += stage.duration_ms
+            timing['max_ms'] = max(timing['max_ms'], stage.duration_ms)
+
+    passed = len([r for r in results if r.passed])
+    failed = len(results) - passed
+
+    return ValidationReport(
+        timestamp=datetime.now().isoformat(),
+        scenarios_run=len(results),
+        scenarios_passed=passed,
+        scenarios_failed=failed,
+        results=results,
+        overall_status="PASSED" if failed == 0 else "FAILED",
+        wall_ms=wall_ms,
+        workers=workers,
+        stage_timings=stage_timings
+    )
 
 
 def main():
@@ -769,6 +744,7 @@ Scenarios:
 Examples:
   python validate_tdd_e2e.py --scenario simple --verbose
   python validate_tdd_e2e.py --scenario all --report json
+  python validate_tdd_e2e.py --scenario all --jobs 2
         """
     )
 
@@ -805,6 +781,13 @@ Examples:
         help='Output file for report'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Scenarios run concurrently with --scenario all (default: CPU count)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -816,21 +799,15 @@ Examples:
     validator = TDDWorkflowValidator(
         project_dir=args.project_dir,
         scripts_dir=args.scripts_dir,
-        verbose=args.verbose
+        verbose=args.verbose,
+        jobs=args.jobs
     )
 
     if args.scenario == 'all':
         report = validator.run_all_scenarios()
     else:
         result = validator.run_scenario(args.scenario)
-        report = ValidationReport(
-            timestamp=datetime.now().isoformat(),
-            scenarios_run=1,
-            scenarios_passed=1 if result.passed else 0,
-            scenarios_failed=0 if result.passed else 1,
-            results=[result],
-            overall_status="PASSED" if result.passed else "FAILED"
-        )
+        report = build_report([result], wall_ms=result.total_duration_ms)
 
     # Format output
     if args.report == 'json':
@@ -840,6 +817,9 @@ Examples:
             'scenarios_passed': report.scenarios_passed,
             'scenarios_failed': report.scenarios_failed,
             'overall_status': report.overall_status,
+            'wall_ms': report.wall_ms,
+            'workers': report.workers,
+            'stage_timings': report.stage_timings,
             'results': [
                 {
                     'scenario': r.scenario,
@@ -866,6 +846,7 @@ Examples:
             f"**Timestamp**: {report.timestamp}",
             f"**Status**: {report.overall_status}",
             f"**Scenarios**: {report.scenarios_passed}/{report.scenarios_run} passed",
+            f"**Wall time**: {report.wall_ms}ms ({report.workers} worker(s))",
             f"",
             "## Results",
             ""
@@ -880,6 +861,14 @@ Examples:
                 s_status = "✅" if s.passed else "❌"
                 lines.append(f"| {s.stage} | {s_status} | {s.duration_ms}ms | {s.message} |")
             lines.append("")
+        lines.extend([
+            "## Stage Timings",
+            "",
+            "| Stage | Runs | Total | Max |",
+            "|-------|------|-------|-----|"
+        ])
+        for stage, timing in report.stage_timings.items():
+            lines.append(f"| {stage} | {timing['runs']} | {timing['total_ms']}ms | {timing['max_ms']}ms |")
         output = "\n".join(lines)
     else:
         lines = [
@@ -888,6 +877,7 @@ Examples:
             f"Timestamp: {report.timestamp}",
             f"Status: {report.overall_status}",
             f"Scenarios: {report.scenarios_passed}/{report.scenarios_run} passed",
+            f"Wall time: {report.wall_ms}ms ({report.workers} worker(s))",
             ""
         ]
         for r in report.results:
@@ -896,6 +886,9 @@ Examples:
             for s in r.stages:
                 s_status = "[OK]" if s.passed else "[FAIL]"
                 lines.append(f"  {s_status} {s.stage}: {s.message}")
+        lines.append("\nStage timings (total / max):")
+        for stage, timing in report.stage_timings.items():
+            lines.append(f"  {stage}: {timing['total_ms']}ms / {timing['max_ms']}ms ({timing['runs']} run(s))")
         output = "\n".join(lines)
 
     # Output
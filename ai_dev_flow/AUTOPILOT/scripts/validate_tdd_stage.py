@@ -9,17 +9,50 @@ Validates TDD workflow stages with proper skip/fail logic:
 Usage:
     python validate_tdd_stage.py --stage red --test-dir tests/unit/
     python validate_tdd_stage.py --stage green --test-dir tests/unit/ --code-dir src/ --coverage 90
+    python validate_tdd_stage.py --stage green --test-dir tests/unit/ --code-dir src/ --runner inprocess -n 4
+    python validate_tdd_stage.py --stage green --test-dir tests/unit/ --code-dir src/ --req REQ-01
+
+Runners:
+    subprocess  Run the pytest CLI and parse its text summary (default)
+    inprocess   Run pytest.main() in this process with a result-collecting plugin;
+                results carry per-test outcomes and durations
+    worker      Like inprocess, but in a warm worker process that a
+                TDDStageValidator keeps between Red and Green validation
+
+Scoped runs:
+    --req/--spec run only the test files whose @req/@spec tags (as extracted
+    by analyze_test_requirements.py) match the given IDs. Every
+    --full-every-th scoped validation runs the whole suite instead; the
+    coverage gate is only enforced on full-suite runs. The run counter and
+    the tag analysis cache live under <test-dir>/.autopilot_state/, so the
+    same test directory shares one state wherever the command is run from.
 
 Reference: IPLAN-001 Section 4.3.1
 """
 
 import argparse
+import json
+import re
 import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+RUNNERS = ('subprocess', 'inprocess', 'worker')
+
+# Test execution timeout (seconds) for subprocess and worker runs
+PYTEST_TIMEOUT = 300
+
+# Every Nth scoped validation runs the full suite
+FULL_SUITE_EVERY = 5
+# Relative state paths are anchored to the test directory
+DEFAULT_SCOPE_STATE = Path('.autopilot_state/tdd_scope_state.json')
+DEFAULT_ANALYSIS_CACHE = Path('.autopilot_state/test_requirements_cache.json')
+
+# Document IDs inside tag values: REQ-01, REQ.01.10, spec/SPEC-01_auth.yaml
+TRACE_ID_PATTERN = re.compile(r'\b([A-Za-z]+)[-.]?(\d+(?:[-.]\d+)*)')
 
 
 class TDDStage(Enum):
@@ -28,6 +61,26 @@ class TDDStage(Enum):
     GREEN = "green"   # Tests expected to pass (after implementation)
 
 
+@dataclass
+class PytestOutcome:
+    """Outcome of one test (or collection error) from an in-process run."""
+    nodeid: str
+    outcome: str  # passed, failed, skipped, error
+    duration: float = 0.0
+    message: str = ""
+
+
+@dataclass
+class PytestRun:
+    """One pytest invocation."""
+    returncode: int
+    passed: int = 0
+    failed: int = 0
+    coverage: float = 0.0
+    output: str = ""
+    outcomes: list[PytestOutcome] = field(default_factory=list)
+
+
 @dataclass
 class ValidationResult:
     """Result of TDD stage validation."""
@@ -37,6 +90,198 @@ class ValidationResult:
     passed_count: int = 0
     failed_count: int = 0
     coverage: float = 0.0
+    outcomes: list[PytestOutcome] = field(default_factory=list)
+
+
+@dataclass
+class ScopeSelection:
+    """Test targets for a REQ/SPEC-scoped validation."""
+    targets: list[Path]
+    full_suite: bool
+    reason: str
+
+
+def _normalize_trace_ids(value: str, default_prefix: str = '') -> list[str]:
+    """
+    Document IDs in a tag value, upper-cased with '.' separators.
+
+    "REQ-01" -> ["REQ.01"], "spec/SPEC-01_auth.yaml" -> ["SPEC.01"];
+    a bare number gets default_prefix ("01" -> "REQ.01").
+    """
+    value = value.strip()
+    if default_prefix and re.fullmatch(r'\d+(?:[-.]\d+)*', value):
+        value = f'{default_prefix}-{value}'
+    return [
+        f"{prefix.upper()}.{re.sub(r'[-.]', '.', number)}"
+        for prefix, number in TRACE_ID_PATTERN.findall(value)
+    ]
+
+
+def _anchored(test_dir: Path, path: Optional[Path]) -> Optional[Path]:
+    """path, taken relative to test_dir unless it is absolute."""
+    if path is None or path.is_absolute():
+        return path
+    return test_dir / path
+
+
+def _matches_scope(trace_id: str, scope_ids: set[str]) -> bool:
+    """REQ.01.10 is in scope for REQ.01.10 and REQ.01 (but not REQ.011)."""
+    return any(trace_id == s or trace_id.startswith(s + '.') for s in scope_ids)
+
+
+class ResultCollector:
+    """
+    pytest plugin recording per-test outcomes and durations.
+
+    A test counts as failed when its call phase fails and as an error when
+    setup/teardown or collection fails. Under pytest-xdist the controller
+    receives every worker's reports, so the plugin works with -n as well.
+    """
+
+    def __init__(self):
+        self.outcomes: dict[str, PytestOutcome] = {}
+        self.coverage: Optional[float] = None
+
+    def pytest_runtest_logreport(self, report) -> None:
+        outcome = self.outcomes.setdefault(report.nodeid, PytestOutcome(report.nodeid, 'passed'))
+        outcome.duration += report.duration
+        if report.failed:
+            outcome.outcome = 'failed' if report.when == 'call' else 'error'
+            outcome.message = str(report.longrepr).splitlines()[-1] if report.longrepr else ''
+        elif report.skipped and outcome.outcome == 'passed':
+            outcome.outcome = 'skipped'
+
+    def pytest_collectreport(self, report) -> None:
+        if report.failed:
+            message = str(report.longrepr).splitlines()[-1] if report.longrepr else ''
+            self.outcomes[report.nodeid] = PytestOutcome(report.nodeid, 'error', 0.0, message)
+
+    def pytest_sessionfinish(self, session) -> None:
+        # pytest-cov stores the total after the run loop
+        cov_plugin = session.config.pluginmanager.getplugin('_cov')
+        total = getattr(cov_plugin, 'cov_total', None)
+        if total is not None:
+            self.coverage = float(total)
+
+
+def _purge_project_modules(before: set[str]) -> None:
+    """
+    Drop modules imported during an in-process run that do not belong to the
+    Python installation (test modules, conftest files, code under test), so
+    the next run in the same process imports freshly generated code.
+    """
+    import importlib
+    import sysconfig
+
+    install_dirs = tuple(
+        str(Path(p).resolve())
+        for key in ('stdlib', 'platstdlib', 'purelib', 'platlib')
+        if (p := sysconfig.get_paths().get(key))
+    )
+    for name in set(sys.modules) - before:
+        module_file = getattr(sys.modules.get(name), '__file__', None)
+        if module_file and not str(Path(module_file).resolve()).startswith(install_dirs):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def run_pytest_inprocess(args: list[str]) -> PytestRun:
+    """
+    Run pytest.main(args) in this process and collect structured results.
+
+    Terminal output, including usage errors, is captured into PytestRun.output.
+    Modules imported from the project are unloaded afterwards (see
+    _purge_project_modules).
+    """
+    import contextlib
+    import io
+
+    import pytest
+
+    collector = ResultCollector()
+    modules_before = set(sys.modules)
+    path_before = list(sys.path)
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            returncode = int(pytest.main(list(args), plugins=[collector]))
+    finally:
+        sys.path[:] = path_before
+        _purge_project_modules(modules_before)
+
+    outcomes = list(collector.outcomes.values())
+    passed = sum(1 for o in outcomes if o.outcome == 'passed')
+    failed = sum(1 for o in outcomes if o.outcome in ('failed', 'error'))
+    return PytestRun(
+        returncode=returncode,
+        passed=passed,
+        failed=failed,
+        coverage=collector.coverage or 0.0,
+        output=buffer.getvalue(),
+        outcomes=outcomes
+    )
+
+
+def _worker_main(conn) -> None:
+    """Warm worker loop: run pytest argument lists until told to stop."""
+    import pytest  # noqa: F401 - import once, up front
+
+    while True:
+        args = conn.recv()
+        if args is None:
+            break
+        try:
+            conn.send(asdict(run_pytest_inprocess(args)))
+        except Exception as e:
+            conn.send({'error': f'{type(e).__name__}: {e}'})
+
+
+class PytestWorker:
+    """
+    Long-lived process running pytest in-process on request.
+
+    Keeps interpreter start-up, pytest and plugin imports warm between runs
+    (e.g. the Red and Green stages of one TDD iteration).
+    """
+
+    def __init__(self):
+        import multiprocessing
+
+        ctx = multiprocessing.get_context('spawn')
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def run(self, args: list[str], timeout: float = PYTEST_TIMEOUT) -> PytestRun:
+        try:
+            self._conn.send(list(args))
+            if not self._conn.poll(timeout):
+                self.close(force=True)
+                raise subprocess.TimeoutExpired(['pytest', *args], timeout)
+            data = self._conn.recv()
+        except (EOFError, OSError) as e:
+            raise RuntimeError(f'pytest worker exited unexpectedly: {e}')
+        if 'error' in data:
+            raise RuntimeError(data['error'])
+        data['outcomes'] = [PytestOutcome(**o) for o in data['outcomes']]
+        return PytestRun(**data)
+
+    @property
+    def alive(self) -> bool:
+        return self._process.is_alive()
+
+    def close(self, force: bool = False) -> None:
+        if self._process.is_alive():
+            if force:
+                self._process.terminate()
+            else:
+                try:
+                    self._conn.send(None)
+                except OSError:
+                    pass
+            self._process.join(timeout=10)
+        self._conn.close()
 
 
 class TDDStageValidator:
@@ -46,13 +291,79 @@ class TDDStageValidator:
     Implements the QualityGateValidator Protocol from IPLAN-001.
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        runner: str = 'subprocess',
+        workers: Optional[int] = None
+    ):
+        """
+        Args:
+            verbose: Verbose output
+            runner: 'subprocess', 'inprocess' or 'worker' (see module docstring)
+            workers: Distribute tests over N processes (requires pytest-xdist)
+        """
+        if runner not in RUNNERS:
+            raise ValueError(f"Unknown runner: {runner} (expected one of {', '.join(RUNNERS)})")
         self.verbose = verbose
+        self.runner = runner
+        self.workers = workers
+        self._worker: Optional[PytestWorker] = None
+
+    def __enter__(self) -> 'TDDStageValidator':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the warm worker process, if one was started."""
+        if self._worker:
+            self._worker.close()
+            self._worker = None
+
+    def _run_pytest(self, args: list[str]) -> PytestRun:
+        """Run pytest with the configured runner."""
+        args = list(args)
+        if self.workers and self.workers > 1:
+            try:
+                import xdist  # noqa: F401
+                args += ['-n', str(self.workers)]
+            except ImportError:
+                if self.verbose:
+                    print("pytest-xdist not installed; running tests serially")
+
+        if self.runner == 'subprocess':
+            result = subprocess.run(
+                ['pytest', *args],
+                capture_output=True,
+                text=True,
+                timeout=PYTEST_TIMEOUT
+            )
+            _, passed, failed = self._parse_pytest_summary(result.stdout)
+            return PytestRun(
+                returncode=result.returncode,
+                passed=passed,
+                failed=failed,
+                coverage=self._parse_coverage(result.stdout),
+                output=result.stdout
+            )
+
+        if self.runner == 'worker':
+            if self._worker is None or not self._worker.alive:
+                self._worker = PytestWorker()
+            run = self._worker.run(args)
+        else:
+            run = run_pytest_inprocess(args)
+        if not run.coverage:
+            run.coverage = self._parse_coverage(run.output)
+        return run
 
     def validate_red_state(
         self,
         test_dir: Path,
-        code_exists: bool = False
+        code_exists: bool = False,
+        targets: Optional[list[Path]] = None
     ) -> ValidationResult:
         """
         Validate Red State: Tests should fail before code generation.
@@ -63,6 +374,7 @@ class TDDStageValidator:
         Args:
             test_dir: Directory containing unit tests
             code_exists: Whether implementation code exists
+            targets: Run only these test files (see select_scoped_tests)
 
         Returns:
             ValidationResult with PASS (tests fail) or SKIP (no tests)
@@ -73,7 +385,7 @@ class TDDStageValidator:
                 message=f'Test directory not found: {test_dir}'
             )
 
-        test_files = list(test_dir.glob('**/test_*.py'))
+        test_files = targets if targets else list(test_dir.glob('**/test_*.py'))
         if not test_files:
             return ValidationResult(
                 status='SKIP',
@@ -82,17 +394,12 @@ class TDDStageValidator:
 
         # Run tests
         try:
-            result = subprocess.run(
-                ['pytest', str(test_dir), '-v', '--tb=no', '-q'],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-
-            # Parse test counts from output
-            test_count, passed, failed = self._parse_pytest_summary(result.stdout)
+            paths = [str(t) for t in targets] if targets else [str(test_dir)]
+            run = self._run_pytest([*paths, '-v', '--tb=no', '-q'])
+            test_count, passed, failed = run.passed + run.failed, run.passed, run.failed
+            outcomes = run.outcomes
 
-            if result.returncode != 0:
+            if run.returncode != 0:
                 # Tests failed - this is EXPECTED in Red State
                 if not code_exists:
                     return ValidationResult(
@@ -100,7 +407,8 @@ class TDDStageValidator:
                         message='Red State valid: Tests fail before implementation',
                         test_count=test_count,
                         passed_count=passed,
-                        failed_count=failed
+                        failed_count=failed,
+                        outcomes=outcomes
                     )
                 else:
                     # Code exists but tests still fail - this is a problem
@@ -109,7 +417,8 @@ class TDDStageValidator:
                         message='Tests fail but code exists - implementation incomplete',
                         test_count=test_count,
                         passed_count=passed,
-                        failed_count=failed
+                        failed_count=failed,
+                        outcomes=outcomes
                     )
             else:
                 # Tests passed - unexpected in Red State
@@ -119,7 +428,8 @@ class TDDStageValidator:
                         message='Tests pass without implementation - tests may have stubs',
                         test_count=test_count,
                         passed_count=passed,
-                        failed_count=failed
+                        failed_count=failed,
+                        outcomes=outcomes
                     )
                 else:
                     # Code exists and tests pass - this is Green State
@@ -128,7 +438,8 @@ class TDDStageValidator:
                         message='Already in Green State (code exists, tests pass)',
                         test_count=test_count,
                         passed_count=passed,
-                        failed_count=failed
+                        failed_count=failed,
+                        outcomes=outcomes
                     )
 
         except FileNotFoundError:
@@ -151,7 +462,8 @@ class TDDStageValidator:
         self,
         test_dir: Path,
         code_dir: Path,
-        coverage_threshold: int = 90
+        coverage_threshold: int = 90,
+        targets: Optional[list[Path]] = None
     ) -> ValidationResult:
         """
         Validate Green State: Tests must pass after code generation.
@@ -162,6 +474,8 @@ class TDDStageValidator:
             test_dir: Directory containing unit tests
             code_dir: Directory containing implementation code
             coverage_threshold: Minimum coverage percentage required
+            targets: Run only these test files (see select_scoped_tests);
+                coverage is reported but the threshold is not enforced
 
         Returns:
             ValidationResult with PASS (tests pass + coverage met) or FAIL
@@ -186,32 +500,28 @@ class TDDStageValidator:
                 message='No Python files found in code directory'
             )
 
-        # Run tests with coverage
+        # Run tests with coverage; a subset of the suite cannot be held to
+        # the project-wide threshold
+        paths = [str(t) for t in targets] if targets else [str(test_dir)]
+        cov_args = [f'--cov={code_dir}', '--cov-report=term-missing']
+        if not targets:
+            cov_args.append(f'--cov-fail-under={coverage_threshold}')
         try:
-            result = subprocess.run(
-                [
-                    'pytest', str(test_dir),
-                    '-v', '--tb=short',
-                    f'--cov={code_dir}',
-                    '--cov-report=term-missing',
-                    f'--cov-fail-under={coverage_threshold}'
-                ],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-
-            test_count, passed, failed = self._parse_pytest_summary(result.stdout)
-            coverage = self._parse_coverage(result.stdout)
+            run = self._run_pytest([*paths, '-v', '--tb=short', *cov_args])
+            test_count, passed, failed = run.passed + run.failed, run.passed, run.failed
+            coverage = run.coverage
+            outcomes = run.outcomes
 
-            if result.returncode == 0:
+            if run.returncode == 0:
+                scope = f' ({len(targets)} scoped file(s), coverage gate not applied)' if targets else ''
                 return ValidationResult(
                     status='PASS',
-                    message=f'Green State valid: All tests pass, coverage {coverage:.0f}%',
+                    message=f'Green State valid: All tests pass, coverage {coverage:.0f}%{scope}',
                     test_count=test_count,
                     passed_count=passed,
                     failed_count=failed,
-                    coverage=coverage
+                    coverage=coverage,
+                    outcomes=outcomes
                 )
             else:
                 if failed > 0:
@@ -221,7 +531,8 @@ class TDDStageValidator:
                         test_count=test_count,
                         passed_count=passed,
                         failed_count=failed,
-                        coverage=coverage
+                        coverage=coverage,
+                        outcomes=outcomes
                     )
                 elif coverage < coverage_threshold:
                     return ValidationResult(
@@ -230,7 +541,8 @@ class TDDStageValidator:
                         test_count=test_count,
                         passed_count=passed,
                         failed_count=failed,
-                        coverage=coverage
+                        coverage=coverage,
+                        outcomes=outcomes
                     )
                 else:
                     return ValidationResult(
@@ -239,7 +551,8 @@ class TDDStageValidator:
                         test_count=test_count,
                         passed_count=passed,
                         failed_count=failed,
-                        coverage=coverage
+                        coverage=coverage,
+                        outcomes=outcomes
                     )
 
         except FileNotFoundError:
@@ -258,6 +571,101 @@ class TDDStageValidator:
                 message=f'Error running tests: {e}'
             )
 
+    def select_scoped_tests(
+        self,
+        test_dir: Path,
+        req_ids: Optional[list[str]] = None,
+        spec_ids: Optional[list[str]] = None,
+        cache_path: Optional[Path] = None
+    ) -> list[Path]:
+        """
+        Test files whose @req/@spec tags match the given IDs.
+
+        Tags are read with TestRequirementAnalyzer (module docstring and
+        per-test tags); a file is selected when any of them matches. Scope
+        IDs match themselves and their sub-IDs: REQ-01 selects REQ.01.10.
+
+        Args:
+            test_dir: Directory containing unit tests
+            req_ids: REQ IDs in scope
+            spec_ids: SPEC IDs in scope
+            cache_path: analyze_test_requirements cache, reused across runs
+                (relative paths are taken relative to test_dir)
+
+        Returns:
+            Matching test files, in glob order
+        """
+        from analyze_test_requirements import TestRequirementAnalyzer
+
+        cache_path = _anchored(test_dir, cache_path)
+
+        scope = {
+            'req': {i for v in req_ids or [] for i in _normalize_trace_ids(v, 'REQ')},
+            'spec': {i for v in spec_ids or [] for i in _normalize_trace_ids(v, 'SPEC')},
+        }
+        analyses = TestRequirementAnalyzer().analyze_directory(test_dir, cache_path=cache_path)
+
+        selected = []
+        for test_file, analysis in analyses.items():
+            if 'error' in analysis:
+                continue
+            tag_sets = [analysis['file_traceability']]
+            tag_sets += [tc['traceability'] for tc in analysis['test_cases']]
+            if any(
+                _matches_scope(trace_id, scope[kind])
+                for tags in tag_sets
+                for kind in ('req', 'spec')
+                for value in tags.get(kind, [])
+                for trace_id in _normalize_trace_ids(value)
+            ):
+                selected.append(test_file)
+        return selected
+
+    def plan_scope(
+        self,
+        test_dir: Path,
+        req_ids: Optional[list[str]] = None,
+        spec_ids: Optional[list[str]] = None,
+        full_every: int = FULL_SUITE_EVERY,
+        state_path: Optional[Path] = DEFAULT_SCOPE_STATE,
+        cache_path: Optional[Path] = None
+    ) -> ScopeSelection:
+        """
+        Decide between a scoped and a full-suite run.
+
+        Scoped validations are counted in state_path; every full_every-th one
+        (and any scope that selects no test files) runs the full suite, so
+        regressions outside the scope are still caught periodically.
+        Relative state_path and cache_path are taken relative to test_dir.
+
+        Returns:
+            ScopeSelection; targets is empty for a full-suite run
+        """
+        state_path = _anchored(test_dir, state_path)
+        state: dict[str, Any] = {}
+        if state_path and state_path.exists():
+            try:
+                state = json.loads(state_path.read_text(encoding='utf-8'))
+            except (OSError, json.JSONDecodeError):
+                state = {}
+        scoped_runs = int(state.get('scoped_runs', 0)) + 1
+
+        if full_every > 0 and scoped_runs % full_every == 0:
+            selection = ScopeSelection([], True, f'periodic full-suite run ({scoped_runs} scoped validations)')
+        else:
+            targets = self.select_scoped_tests(test_dir, req_ids, spec_ids, cache_path)
+            if targets:
+                selection = ScopeSelection(targets, False, f'{len(targets)} test file(s) in scope')
+            else:
+                selection = ScopeSelection([], True, 'no test files matched the scope')
+
+        if state_path:
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            state_path.write_text(json.dumps({'scoped_runs': scoped_runs}), encoding='utf-8')
+        if self.verbose:
+            print(f"Scope: {selection.reason}")
+        return selection
+
     def _parse_pytest_summary(self, output: str) -> tuple:
         """Parse pytest output for test counts."""
         import re
@@ -308,6 +716,14 @@ Examples:
 
   # Green State with custom coverage threshold
   python validate_tdd_stage.py --stage green --test-dir tests/unit/ --code-dir src/ --coverage 85
+
+  # Only the tests tagged with REQ-01 (or its sub-requirements) and SPEC-02
+  python validate_tdd_stage.py --stage green --test-dir tests/unit/ --code-dir src/ \\
+    --req REQ-01 --spec SPEC-02
+
+  # In-process run on 4 xdist workers, per-test results written as JSON
+  python validate_tdd_stage.py --stage green --test-dir tests/unit/ --code-dir src/ \\
+    --runner inprocess -n 4 --json-output tmp/green.json
         """
     )
 
@@ -339,6 +755,62 @@ Examples:
         help='Coverage threshold percentage (default: 90)'
     )
 
+    parser.add_argument(
+        '--runner', '-r',
+        choices=RUNNERS,
+        default='subprocess',
+        help='How to run pytest (default: subprocess)'
+    )
+
+    parser.add_argument(
+        '--workers', '-n',
+        type=int,
+        default=None,
+        help='Distribute tests over N processes (requires pytest-xdist)'
+    )
+
+    parser.add_argument(
+        '--json-output', '-o',
+        type=Path,
+        help='Write the result (with per-test outcomes for in-process runners) as JSON'
+    )
+
+    parser.add_argument(
+        '--req',
+        action='append',
+        default=[],
+        help='Run only tests tagged with this REQ ID or its sub-IDs (repeatable)'
+    )
+
+    parser.add_argument(
+        '--spec',
+        action='append',
+        default=[],
+        help='Run only tests tagged with this SPEC ID (repeatable)'
+    )
+
+    parser.add_argument(
+        '--full-every',
+        type=int,
+        default=FULL_SUITE_EVERY,
+        help=f'Run the full suite every Nth scoped validation, 0 to disable (default: {FULL_SUITE_EVERY})'
+    )
+
+    parser.add_argument(
+        '--scope-state',
+        type=Path,
+        default=DEFAULT_SCOPE_STATE,
+        help=f'Scoped run counter file, relative to --test-dir unless absolute (default: {DEFAULT_SCOPE_STATE})'
+    )
+
+    parser.add_argument(
+        '--analysis-cache',
+        type=Path,
+        default=DEFAULT_ANALYSIS_CACHE,
+        help=f'Test analysis cache for scope selection, relative to --test-dir unless absolute '
+             f'(default: {DEFAULT_ANALYSIS_CACHE})'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -347,9 +819,22 @@ Examples:
 
     args = parser.parse_args()
 
-    validator = TDDStageValidator(verbose=args.verbose)
+    validator = TDDStageValidator(verbose=args.verbose, runner=args.runner, workers=args.workers)
 
     try:
+        targets = None
+        if (args.req or args.spec) and args.test_dir.exists():
+            selection = validator.plan_scope(
+                args.test_dir,
+                req_ids=args.req,
+                spec_ids=args.spec,
+                full_every=args.full_every,
+                state_path=args.scope_state,
+                cache_path=args.analysis_cache
+            )
+            targets = selection.targets
+            print(f"Scope ({', '.join(args.req + args.spec)}): {selection.reason}")
+
         if args.stage == 'red':
             # Check if code exists
             code_exists = False
@@ -359,7 +844,8 @@ Examples:
 
             result = validator.validate_red_state(
                 test_dir=args.test_dir,
-                code_exists=code_exists
+                code_exists=code_exists,
+                targets=targets
             )
 
         elif args.stage == 'green':
@@ -370,7 +856,8 @@ Examples:
             result = validator.validate_green_state(
                 test_dir=args.test_dir,
                 code_dir=args.code_dir,
-                coverage_threshold=args.coverage
+                coverage_threshold=args.coverage,
+                targets=targets
             )
 
         # Print result
@@ -392,6 +879,18 @@ Examples:
         if result.coverage > 0:
             print(f"   Coverage: {result.coverage:.0f}%")
 
+        if args.verbose and result.outcomes:
+            failing = [o for o in result.outcomes if o.outcome in ('failed', 'error')]
+            for outcome in failing:
+                print(f"   {outcome.outcome.upper()}: {outcome.nodeid} {outcome.message}")
+            print("\n   Slowest tests:")
+            for outcome in sorted(result.outcomes, key=lambda o: o.duration, reverse=True)[:5]:
+                print(f"   {outcome.duration:.3f}s {outcome.nodeid}")
+
+        if args.json_output:
+            args.json_output.parent.mkdir(parents=True, exist_ok=True)
+            args.json_output.write_text(json.dumps(asdict(result), indent=2), encoding='utf-8')
+
         # Exit codes
         if result.status == 'PASS':
             return 0
@@ -406,6 +905,8 @@ Examples:
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        validator.close()
 
 
 if __name__ == '__main__':
@@ -3,6 +3,11 @@
 Vertex AI Code Generator
 Generates source code from high-level SPEC files using Google Vertex AI.
 
+Several SPECs (files or directories of SPEC YAML) are generated in one batch:
+contracts are loaded once and shared by every prompt, model calls run on a
+bounded thread pool (--jobs), and responses are cached by prompt hash
+(--cache-dir) so unchanged SPEC + contract inputs reuse the prior output.
+
 Usage:
   python3 vertex_code_generator.py \
     --spec ai_dev_flow/09_SPEC/SPEC-01_service.yaml \
@@ -11,6 +16,15 @@ Usage:
     --location us-central1 \
     --model claude-3-5-sonnet@20240620
 
+  # Batch: every SPEC in a directory, 8 concurrent requests
+  python3 vertex_code_generator.py \
+    --spec ai_dev_flow/09_SPEC/ \
+    --contracts ai_dev_flow/08_CTR/ \
+    --output src/ --jobs 8
+
+  # Offline (mock backend, no GCP calls)
+  python3 vertex_code_generator.py --spec ai_dev_flow/09_SPEC/ --mock
+
 Prerequisites:
   - google-cloud-aiplatform
   - vertexai
@@ -18,11 +32,17 @@ Prerequisites:
 """
 
 import argparse
+import hashlib
 import os
 import sys
+import threading
+import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 import json
 
 # Try importing Vertex AI SDK
@@ -33,6 +53,20 @@ try:
 except ImportError:
     VERTEX_AVAILABLE = False
 
+# Bump when the prompt or response format changes to invalidate cached responses
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path(".autopilot_state") / "codegen_cache"
+DEFAULT_JOBS = 4
+
+GENERATION_CONFIG = {
+    "max_output_tokens": 8192,
+    "temperature": 0.2, # Low temperature for code
+    "top_p": 0.95,
+}
+
+_MODEL_LOCK = threading.Lock()
+_MODELS: Dict[tuple, Any] = {}
+
 
 def load_spec(spec_path: Path) -> Dict[str, Any]:
     """Load and parse the SPEC YAML file."""
@@ -123,90 +157,252 @@ def generate_code_mock(prompt: str) -> str:
     }
     return json.dumps(mock_response)
 
+def _get_model(project: str, location: str, model_name: str) -> Any:
+    """Initialize Vertex AI and load a model once per process; shared across threads."""
+    key = (project, location, model_name)
+    with _MODEL_LOCK:
+        if key not in _MODELS:
+            print(f"🤖 Initializing Vertex AI (Project: {project}, Location: {location})...")
+            vertexai.init(project=project, location=location)
+            print(f"🧠 Loading Model: {model_name}...")
+            _MODELS[key] = GenerativeModel(model_name)
+        return _MODELS[key]
+
+def call_vertex(prompt: str, project: str, location: str, model_name: str) -> str:
+    """Call Vertex AI; raises on API errors (no mock fallback)."""
+    model = _get_model(project, location, model_name)
+    response = model.generate_content(
+        prompt,
+        generation_config=GENERATION_CONFIG,
+        stream=False
+    )
+    return response.text
+
 def generate_code_vertex(prompt: str, project: str, location: str, model_name: str) -> str:
     """Call Vertex AI to generate code."""
     if not VERTEX_AVAILABLE:
         print("❌ Error: google-cloud-aiplatform not installed. Run: pip install google-cloud-aiplatform")
         return generate_code_mock(prompt)
 
-    print(f"🤖 Initializing Vertex AI (Project: {project}, Location: {location})...")
-    vertexai.init(project=project, location=location)
-    
-    print(f"🧠 Loading Model: {model_name}...")
-    model = GenerativeModel(model_name)
-    
-    config = {
-        "max_output_tokens": 8192,
-        "temperature": 0.2, # Low temperature for code
-        "top_p": 0.95,
-    }
-    
     print("🚀 Sending request to Vertex AI...")
     try:
-        response = model.generate_content(
-            prompt,
-            generation_config=config,
-            stream=False
-        )
-        return response.text
+        return call_vertex(prompt, project, location, model_name)
     except Exception as e:
         print(f"❌ Vertex AI Error: {e}")
         return generate_code_mock(prompt)
 
-def save_files(json_content: str, output_root: Path):
-    """Parse JSON response and save files to disk."""
+class ResponseCache:
+    """
+    Model responses stored as one JSON file per prompt hash.
+
+    The key covers the cache version, the backend (e.g. "vertex:<model>" or
+    "mock") and the full prompt, so any change to the SPEC, the contracts or
+    the prompt template is a miss.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(prompt: str, backend_id: str) -> str:
+        payload = f"{CACHE_VERSION}\0{backend_id}\0{prompt}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            entry = json.loads((self.cache_dir / f"{key}.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if entry.get("version") != CACHE_VERSION:
+            return None
+        return entry.get("response")
+
+    def put(self, key: str, backend_id: str, response: str) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        # Unique per process and thread: concurrent runs may share the cache dir
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": CACHE_VERSION, "backend": backend_id, "response": response}),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, path)
+
+@dataclass
+class SpecResult:
+    """Outcome of generating code for one SPEC."""
+    spec: str
+    prompt_hash: str
+    response: str = ""
+    cached: bool = False
+    error: str = ""
+    duration_ms: int = 0
+
+def generate_batch(
+    specs: List[tuple],
+    contracts_context: str,
+    backend: Callable[[str], str],
+    backend_id: str,
+    cache: Optional[ResponseCache] = None,
+    jobs: int = DEFAULT_JOBS
+) -> List[SpecResult]:
+    """
+    Generate code for several SPECs concurrently.
+
+    Args:
+        specs: (name, spec_data) pairs
+        contracts_context: Contract text shared by every prompt (load once)
+        backend: prompt -> response text; should raise on failure
+        backend_id: Identifies the backend/model in cache keys
+        cache: Response cache, or None to always call the backend
+        jobs: Maximum concurrent backend calls
+
+    Returns:
+        One SpecResult per SPEC, in input order. Identical prompts are sent
+        once; failed calls and responses that are not a valid files payload
+        (see parse_response) are reported in .error and never cached.
+    """
+    prompts = [construct_prompt(spec_data, contracts_context) for _, spec_data in specs]
+    keys = [ResponseCache.key(prompt, backend_id) for prompt in prompts]
+
+    responses: Dict[str, tuple] = {}
+    pending: Dict[str, str] = {}
+    for key, prompt in zip(keys, prompts):
+        if key in responses or key in pending:
+            continue
+        cached = cache.get(key) if cache else None
+        if cached is not None and _response_error(cached):
+            cached = None  # Written by an older version without validation
+        if cached is not None:
+            responses[key] = (cached, True, "", 0)
+        else:
+            pending[key] = prompt
+
+    def run(key: str) -> tuple:
+        start = time.perf_counter()
+        try:
+            response, error = backend(pending[key]), ""
+        except Exception as e:
+            response, error = "", str(e)
+        if not error:
+            error = _response_error(response)
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        if cache and not error:
+            cache.put(key, backend_id, response)
+        return response, False, error, duration_ms
+
+    if pending:
+        workers = max(1, min(jobs, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for key, outcome in zip(pending, pool.map(run, pending)):
+                responses[key] = outcome
+
+    results = []
+    for (name, _), key in zip(specs, keys):
+        response, cached, error, duration_ms = responses[key]
+        results.append(SpecResult(name, key, response, cached, error, duration_ms))
+    return results
+
+def collect_spec_paths(paths: List[Path]) -> List[Path]:
+    """Expand SPEC directories to their YAML files; keep file arguments as given."""
+    spec_paths = []
+    for path in paths:
+        if path.is_dir():
+            spec_paths.extend(sorted(path.glob("*.yaml")))
+        else:
+            spec_paths.append(path)
+    return spec_paths
+
+def parse_response(json_content: str) -> List[dict]:
+    """
+    File entries of a model response.
+
+    Raises:
+        ValueError: The response is not JSON (optionally in a ```json block)
+            with a 'files' list of objects
+    """
+    # Clean up markdown code blocks if present
+    clean_json = json_content.strip()
+    if clean_json.startswith("```json"):
+        clean_json = clean_json[7:]
+    if clean_json.endswith("```"):
+        clean_json = clean_json[:-3]
+
+    data = json.loads(clean_json)  # json.JSONDecodeError is a ValueError
+
+    if not isinstance(data, dict) or "files" not in data:
+        raise ValueError("Invalid response format (missing 'files' key)")
+    files = data["files"]
+    if not isinstance(files, list) or not all(isinstance(entry, dict) for entry in files):
+        raise ValueError("Invalid response format ('files' must be a list of objects)")
+    return files
+
+def _response_error(response: str) -> str:
     try:
-        # Clean up markdown code blocks if present
-        clean_json = json_content.strip()
-        if clean_json.startswith("```json"):
-            clean_json = clean_json[7:]
-        if clean_json.endswith("```"):
-            clean_json = clean_json[:-3]
-        
-        data = json.loads(clean_json)
-        
-        if "files" not in data:
-            print("❌ Error: Invalid response format (missing 'files' key)")
-            return
-
-        for file_entry in data["files"]:
-            rel_path = file_entry.get("path")
-            content = file_entry.get("content")
-            
-            if not rel_path or not content:
-                continue
-                
-            full_path = output_root / rel_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ Wrote: {full_path}")
-            
+        parse_response(response)
+    except ValueError as e:
+        return f"invalid response: {e}"
+    return ""
+
+def save_files(json_content: str, output_root: Path) -> int:
+    """Parse JSON response and save files to disk; returns the number of files written."""
+    try:
+        files = parse_response(json_content)
     except json.JSONDecodeError as e:
         print(f"❌ Error decoding JSON response: {e}")
         print(f"Raw response start: {json_content[:500]}...")
+        return 0
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 0
+
+    written = 0
+    for file_entry in files:
+        rel_path = file_entry.get("path")
+        content = file_entry.get("content")
+
+        if not rel_path or not content:
+            continue
+
+        full_path = output_root / rel_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(full_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        written += 1
+        print(f"✅ Wrote: {full_path}")
+
+    return written
 
 def main():
     parser = argparse.ArgumentParser(description="Generate code from SPEC using Vertex AI")
-    parser.add_argument("--spec", required=True, help="Path to SPEC YAML file")
+    parser.add_argument("--spec", required=True, nargs="+", help="SPEC YAML file(s) or directories of SPEC YAML")
     parser.add_argument("--contracts", default="", help="Path to CTR directory or file")
     parser.add_argument("--output", default=".", help="Output directory root")
     parser.add_argument("--project", default=os.environ.get("GCP_PROJECT_ID"), help="GCP Project ID")
     parser.add_argument("--location", default="us-central1", help="GCP Region")
     parser.add_argument("--model", default="gemini-1.5-pro-001", help="Model name (e.g. gemini-1.5-pro, claude-3-5-sonnet)")
     parser.add_argument("--dry-run", action="store_true", help="Print prompt without calling AI")
+    parser.add_argument("--mock", action="store_true", help="Use the offline mock backend")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Concurrent model requests (default: {DEFAULT_JOBS})")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help=f"Response cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the model, ignoring cached responses")
     
     args = parser.parse_args()
     
-    spec_path = Path(args.spec)
+    spec_paths = collect_spec_paths([Path(p) for p in args.spec])
     output_root = Path(args.output)
     contracts_path = Path(args.contracts) if args.contracts else None
     
-    # 1. Load context
-    print(f"📖 Loading SPEC: {spec_path}")
-    spec_data = load_spec(spec_path)
+    # 1. Load context (contracts once, shared by every SPEC)
+    specs = []
+    for spec_path in spec_paths:
+        print(f"📖 Loading SPEC: {spec_path}")
+        specs.append((spec_path.name, load_spec(spec_path)))
+    if not specs:
+        print("❌ Error: No SPEC files found")
+        sys.exit(1)
     
     contracts_context = ""
     if contracts_path:
@@ -214,24 +410,56 @@ def main():
         contracts_context = load_contracts(contracts_path)
 
     # 2. Construct Prompt
-    prompt = construct_prompt(spec_data, contracts_context)
-    
     if args.dry_run:
-        print("\n--- PROMPT PREVIEW ---")
-        print(prompt)
-        print("----------------------")
+        for name, spec_data in specs:
+            print(f"\n--- PROMPT PREVIEW: {name} ---")
+            print(construct_prompt(spec_data, contracts_context))
+            print("----------------------")
         return
 
     # 3. Generate
-    if not args.project:
+    if args.mock:
+        backend, backend_id = generate_code_mock, "mock"
+    elif not args.project:
         print("⚠️  No GCP Project ID provided. Using mock generation.")
-        response_text = generate_code_mock(prompt)
+        backend, backend_id = generate_code_mock, "mock"
+    elif not VERTEX_AVAILABLE:
+        print("❌ Error: google-cloud-aiplatform not installed. Run: pip install google-cloud-aiplatform")
+        backend, backend_id = generate_code_mock, "mock"
     else:
-        response_text = generate_code_vertex(prompt, args.project, args.location, args.model)
+        print(f"🚀 Sending {len(specs)} request(s) to Vertex AI ({args.jobs} concurrent)...")
+        backend = partial(call_vertex, project=args.project, location=args.location, model_name=args.model)
+        backend_id = f"vertex:{args.model}"
+
+    cache = None if args.no_cache else ResponseCache(Path(args.cache_dir))
+    start = time.perf_counter()
+    results = generate_batch(specs, contracts_context, backend, backend_id, cache=cache, jobs=args.jobs)
+    wall_ms = int((time.perf_counter() - start) * 1000)
         
-    # 4. Save
+    # 4. Save (serially, in SPEC order)
     print("\n💾 Saving Generated Files...")
-    save_files(response_text, output_root)
+    failed = 0
+    for result in results:
+        if result.error:
+            failed += 1
+            print(f"❌ {result.spec}: {result.error}")
+            continue
+        source = "cached" if result.cached else f"{result.duration_ms} ms"
+        print(f"📄 {result.spec} ({source})")
+        try:
+            written = save_files(result.response, output_root)
+        except OSError as e:
+            failed += 1
+            print(f"❌ {result.spec}: write failed: {e}")
+            continue
+        if not written:
+            failed += 1
+            print(f"❌ {result.spec}: no files written")
+
+    cached = sum(1 for r in results if r.cached)
+    print(f"\n📊 {len(results)} SPEC(s): {cached} cached, {failed} failed, {wall_ms} ms")
+    if failed:
+        sys.exit(1)
     print("\n✨ Generation Complete!")
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+"""
+Unit Tests for analyze_test_requirements.py directory mode
+
+Tests the analysis cache and process-pool fan-out of generate_test_requirements.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import analyze_test_requirements
+from analyze_test_requirements import AnalysisCache, TestRequirementAnalyzer
+
+
+def _write_tests(test_dir: Path, count: int) -> None:
+    test_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (test_dir / f"test_mod{i}.py").write_text(
+            f'"""@req: REQ-{i:02d}"""\n\n'
+            f"def test_case_{i}():\n"
+            f"    assert compute({i}) == {i}\n",
+            encoding="utf-8",
+        )
+
+
+@pytest.fixture
+def count_analyses(monkeypatch):
+    """Count files actually parsed by the analyzer."""
+    calls = []
+    original = analyze_test_requirements._analyze_file_serialized
+
+    def counting(test_file):
+        calls.append(test_file)
+        return original(test_file)
+
+    monkeypatch.setattr(analyze_test_requirements, "_analyze_file_serialized", counting)
+    return calls
+
+
+@pytest.mark.unit
+class TestAnalysisCache:
+    """Tests for cached directory analysis."""
+
+    def test_unchanged_files_served_from_cache(self, tmp_path, count_analyses):
+        """A re-run only re-analyzes the edited file and produces the same output."""
+        test_dir = tmp_path / "tests"
+        _write_tests(test_dir, 3)
+        cache_path = tmp_path / "cache.json"
+        analyzer = TestRequirementAnalyzer()
+
+        first = analyzer.generate_test_requirements(test_dir, tmp_path / "a.json", jobs=1, cache_path=cache_path)
+        assert len(count_analyses) == 3
+
+        count_analyses.clear()
+        second = analyzer.generate_test_requirements(test_dir, tmp_path / "b.json", jobs=1, cache_path=cache_path)
+        assert count_analyses == []
+        assert json.loads((tmp_path / "a.json").read_text()) == json.loads((tmp_path / "b.json").read_text())
+        assert first["metadata"] == second["metadata"]
+
+        (test_dir / "test_mod1.py").write_text('"""@req: REQ-99"""\n\ndef test_new():\n    pass\n', encoding="utf-8")
+        third = analyzer.generate_test_requirements(test_dir, tmp_path / "c.json", jobs=1, cache_path=cache_path)
+        assert count_analyses == [str(test_dir / "test_mod1.py")]
+        assert "REQ-99" in third["by_req"]
+        assert "REQ-01" not in third["by_req"]
+
+    def test_version_change_invalidates(self, tmp_path, monkeypatch):
+        """Cache entries from another analyzer version are ignored."""
+        test_file = tmp_path / "test_mod.py"
+        test_file.write_text("def test_x():\n    pass\n", encoding="utf-8")
+        cache = AnalysisCache(tmp_path / "cache.json")
+        cache.put(cache.key(test_file), {"test_cases": []})
+        cache.save()
+
+        assert AnalysisCache(tmp_path / "cache.json").get(cache.key(test_file)) is not None
+        monkeypatch.setattr(analyze_test_requirements, "ANALYZER_VERSION", -1)
+        assert AnalysisCache(tmp_path / "cache.json").get(cache.key(test_file)) is None
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        """Pool and in-process analysis produce identical results."""
+        test_dir = tmp_path / "tests"
+        _write_tests(test_dir, analyze_test_requirements.PARALLEL_MIN_FILES + 2)
+        analyzer = TestRequirementAnalyzer()
+
+        serial = analyzer.generate_test_requirements(test_dir, tmp_path / "serial.json", jobs=1)
+        pooled = analyzer.generate_test_requirements(test_dir, tmp_path / "pooled.json", jobs=2)
+
+        assert serial["files"] == pooled["files"]
+        assert serial["metadata"] == pooled["metadata"]
+
+    def test_errors_are_reported_not_cached(self, tmp_path):
+        """Files that fail to parse are reported and re-analyzed next time."""
+        test_dir = tmp_path / "tests"
+        test_dir.mkdir()
+        (test_dir / "test_broken.py").write_text("def test_(:\n", encoding="utf-8")
+        cache_path = tmp_path / "cache.json"
+
+        result = TestRequirementAnalyzer().generate_test_requirements(
+            test_dir, tmp_path / "out.json", jobs=1, cache_path=cache_path
+        )
+
+        assert "error" in result["files"][str(test_dir / "test_broken.py")]
+        assert json.loads(cache_path.read_text())["files"] == {}
@@ -0,0 +1,131 @@
+"""
+Unit Tests for analyze_test_requirements.py single-pass analysis
+
+Tests the ast.NodeVisitor behind TestRequirementAnalyzer.analyze_test_file.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from analyze_test_requirements import TestRequirementAnalyzer
+
+SAMPLE = '''"""
+@brd: BRD.01.01.01
+"""
+import pytest
+
+
+class TestService:
+    """@req: REQ-01"""
+
+    def setup_method(self):
+        self.service = Service(Config())
+
+    def test_run(self):
+        result = self.service.run(1, mode="fast")
+        assert result == 2
+        with pytest.raises(ValueError):
+            self.service.run(-1)
+
+    def _helper(self):
+        return Hidden()
+
+
+class Helper:
+    def test_not_a_test(self):
+        pass
+
+
+@pytest.mark.parametrize("a,b", [(1, 2), (3, 4)])
+def test_add(a, b):
+    """@req: REQ-02"""
+    assert add(a, b) == a + b
+'''
+
+
+@pytest.mark.unit
+class TestSinglePassAnalysis:
+    """Tests for the single-pass module visitor."""
+
+    def test_test_cases_and_scope(self, tmp_path):
+        """Class methods, top-level tests and non-Test classes are told apart by scope."""
+        test_file = tmp_path / "test_sample.py"
+        test_file.write_text(SAMPLE, encoding="utf-8")
+
+        analysis = TestRequirementAnalyzer().analyze_test_file(test_file)
+
+        assert [(tc.test_class, tc.test_name) for tc in analysis.test_cases] == [
+            ("TestService", "test_run"),
+            (None, "test_add"),
+        ]
+        assert sorted(analysis.required_classes) == ["Config", "Service"]
+        assert analysis.coverage_targets == ["REQ-01", "REQ-02"]
+
+    def test_calls_assertions_and_hints(self, tmp_path):
+        """Calls, assertions, I/O hints and parametrize cases come from one traversal."""
+        test_file = tmp_path / "test_sample.py"
+        test_file.write_text(SAMPLE, encoding="utf-8")
+
+        run, add = TestRequirementAnalyzer().analyze_test_file(test_file).test_cases
+
+        assert run.assertions == ["result == 2"]
+        assert run.input_output_hints[0]["call"] == "self.service.run"
+        assert run.input_output_hints[0]["result_variable"] == "result"
+        assert add.parametrized_cases == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+        assert add.traceability.req == ["REQ-02"]
+
+    def test_pytest_raises_attached_to_calls(self, tmp_path):
+        """Calls inside `with pytest.raises(Exc)` record the expected exception."""
+        test_file = tmp_path / "test_sample.py"
+        test_file.write_text(SAMPLE, encoding="utf-8")
+
+        run = TestRequirementAnalyzer().analyze_test_file(test_file).test_cases[0]
+
+        calls = [(m.name, m.exceptions) for m in run.required_methods]
+        assert ("self.service.run", []) in calls
+        assert ("self.service.run", ["ValueError"]) in calls
+
+    def test_nested_test_function_counts_for_both(self, tmp_path):
+        """A nested test_ function is its own test and part of its enclosing test."""
+        test_file = tmp_path / "test_nested.py"
+        test_file.write_text(
+            "def test_outer():\n"
+            "    def test_inner():\n"
+            "        assert compute() == 1\n",
+            encoding="utf-8",
+        )
+
+        outer, inner = TestRequirementAnalyzer().analyze_test_file(test_file).test_cases
+
+        assert outer.assertions == inner.assertions == ["compute() == 1"]
+
+    @pytest.mark.slow
+    def test_5k_tests_benchmark(self, tmp_path):
+        """Analysis stays linear in file size (5,000 tests)."""
+        parts = ["import pytest\n"]
+        for c in range(50):
+            parts.append(f"class TestGroup{c}:\n    def setup_method(self):\n        self.svc = Service{c}()\n")
+            for i in range(50):
+                parts.append(
+                    f"    def test_case_{i}(self):\n"
+                    f"        result = self.svc.run({i})\n"
+                    f"        assert result == {i}\n"
+                )
+        for i in range(2500):
+            parts.append(f"def test_fn_{i}():\n    assert add({i}, 1) == {i + 1}\n")
+        test_file = tmp_path / "test_big.py"
+        test_file.write_text("\n".join(parts), encoding="utf-8")
+
+        start = time.perf_counter()
+        analysis = TestRequirementAnalyzer().analyze_test_file(test_file)
+        elapsed = time.perf_counter() - start
+
+        assert len(analysis.test_cases) == 5000
+        assert elapsed < 30
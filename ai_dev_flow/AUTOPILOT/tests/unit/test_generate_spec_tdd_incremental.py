@@ -0,0 +1,157 @@
+"""
+Unit Tests for generate_spec_tdd.py incremental generation
+
+Tests per-REQ reuse through the SPEC manifest and single-REQ validation.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_spec_tdd
+from generate_spec_tdd import MANIFEST_NAME, TestAwareSPECGenerator
+
+
+def _test_case(name: str, req_id: str, method: str) -> dict:
+    return {
+        'test_id': f'TEST-{name}',
+        'test_name': name,
+        'traceability': {'req': [req_id]},
+        'required_methods': [{'name': f'Service.{method}', 'parameters': [], 'source_test': name}],
+        'assertions': ['result.status == "ok"'],
+    }
+
+
+@pytest.fixture
+def test_requirements() -> dict:
+    return {
+        'files': {
+            'test_auth.py': {
+                'file_traceability': {'req': ['REQ.01.01']},
+                'test_cases': [_test_case('test_login', 'REQ.01.01', 'login')],
+            },
+            'test_billing.py': {
+                'file_traceability': {'req': ['REQ.02.01']},
+                'test_cases': [_test_case('test_charge', 'REQ.02.01', 'charge')],
+            },
+        },
+        'by_req': {
+            'REQ.01.01': ['test_auth.py'],
+            'REQ.02.01': ['test_billing.py'],
+        },
+    }
+
+
+@pytest.mark.unit
+class TestIncrementalSpec:
+    """Tests for per-REQ incremental SPEC generation."""
+
+    def test_only_changed_req_rebuilt(self, tmp_path: Path, test_requirements: dict, monkeypatch):
+        """Unchanged REQs keep their SPEC; a changed REQ is rebuilt and rewritten."""
+        generator = TestAwareSPECGenerator()
+        first = generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        assert (tmp_path / MANIFEST_NAME).exists()
+
+        built = []
+        original = generator._build_spec_for_req
+        monkeypatch.setattr(
+            generator, '_build_spec_for_req',
+            lambda req_id, *args, **kwargs: built.append(req_id) or original(req_id, *args, **kwargs)
+        )
+        changed = copy.deepcopy(test_requirements)
+        changed['files']['test_billing.py']['test_cases'].append(
+            _test_case('test_refund', 'REQ.02.01', 'refund')
+        )
+        second = generator.generate_spec_from_tests(changed, None, tmp_path)
+
+        assert built == ['REQ.02.01']
+        assert second == first
+        assert 'refund' in (tmp_path / 'SPEC-02_req_02_01.yaml').read_text(encoding='utf-8')
+
+    def test_full_rebuild_and_missing_file(self, tmp_path: Path, test_requirements: dict):
+        """incremental=False and a deleted SPEC file both force a rebuild."""
+        generator = TestAwareSPECGenerator()
+        generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        spec_file = tmp_path / 'SPEC-01_req_01_01.yaml'
+        spec_file.unlink()
+
+        generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        assert spec_file.exists()
+
+        spec_file.write_text('stale', encoding='utf-8')
+        generator.generate_spec_from_tests(test_requirements, None, tmp_path, incremental=False)
+        assert spec_file.read_text(encoding='utf-8') != 'stale'
+
+    def test_validate_single_req_from_manifest(self, tmp_path: Path, test_requirements: dict, monkeypatch):
+        """A REQ slice is validated from the manifest without parsing the YAML."""
+        generator = TestAwareSPECGenerator()
+        generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        spec_file = tmp_path / 'SPEC-02_req_02_01.yaml'
+
+        def _no_parse(*args, **kwargs):
+            raise AssertionError('SPEC YAML parsed')
+
+        monkeypatch.setattr(generate_spec_tdd.yaml, 'safe_load', _no_parse)
+
+        changed = copy.deepcopy(test_requirements)
+        changed['files']['test_billing.py']['test_cases'].append(
+            _test_case('test_refund', 'REQ.02.01', 'refund')
+        )
+        results = generator.validate_spec_against_tests(spec_file, changed, req_id='REQ.02.01')
+
+        assert results['coverage']['methods_covered'] == 1
+        assert results['coverage']['methods_missing'] == ['refund']
+        assert results['coverage']['req_covered'] == 1
+
+    def test_validate_hand_edited_spec(self, tmp_path: Path, test_requirements: dict):
+        """A SPEC edited after generation is validated from its YAML, not the manifest."""
+        yaml = pytest.importorskip('yaml')
+        generator = TestAwareSPECGenerator()
+        generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        spec_file = tmp_path / 'SPEC-02_req_02_01.yaml'
+        spec = yaml.safe_load(spec_file.read_text(encoding='utf-8'))
+        for cls in spec['interfaces']['classes']:
+            cls['methods'] = []
+        spec_file.write_text(yaml.safe_dump(spec), encoding='utf-8')
+
+        results = generator.validate_spec_against_tests(spec_file, test_requirements, req_id='REQ.02.01')
+
+        assert results['coverage']['methods_covered'] == 0
+        assert results['coverage']['methods_missing'] == ['charge']
+
+    def test_hand_edited_spec_kept_on_regeneration(self, tmp_path: Path, test_requirements: dict):
+        """An unchanged REQ keeps its edited SPEC, which is then validated from its YAML."""
+        yaml = pytest.importorskip('yaml')
+        generator = TestAwareSPECGenerator()
+        generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        spec_file = tmp_path / 'SPEC-02_req_02_01.yaml'
+        spec = yaml.safe_load(spec_file.read_text(encoding='utf-8'))
+        spec['interfaces']['classes'] = []
+        edited = yaml.safe_dump(spec)
+        spec_file.write_text(edited, encoding='utf-8')
+
+        files = generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        results = generator.validate_spec_against_tests(spec_file, test_requirements, req_id='REQ.02.01')
+
+        assert spec_file in files
+        assert spec_file.read_text(encoding='utf-8') == edited
+        assert results['coverage']['methods_missing'] == ['charge']
+
+    def test_validate_single_req_without_manifest(self, tmp_path: Path, test_requirements: dict):
+        """Without a manifest entry the SPEC YAML is read instead."""
+        generator = TestAwareSPECGenerator()
+        generator.generate_spec_from_tests(test_requirements, None, tmp_path)
+        (tmp_path / MANIFEST_NAME).unlink()
+
+        results = generator.validate_spec_against_tests(
+            tmp_path / 'SPEC-01_req_01_01.yaml', test_requirements, req_id='REQ.02.01'
+        )
+
+        assert results['coverage']['req_missing'] == ['REQ.02.01']
+        assert results['coverage']['methods_missing'] == ['charge']
@@ -0,0 +1,147 @@
+"""
+Unit Tests for generation_pipeline.py and the batched test generators
+
+Tests compiled templates, cross-source dedupe and hash-compared writes.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from generate_integration_tests import IntegrationTestGenerator
+from generate_smoke_tests import SmokeTestGenerator
+from generation_pipeline import CompiledTemplate, parse_sources, write_if_changed
+
+CTR_TEMPLATE = """id: {ctr_id}
+endpoints:
+  - path: /api/{name}
+    method: POST
+    description: Create {name}
+  - path: /health
+    method: GET
+    description: Health check
+"""
+
+FEATURE = """@smoke
+Feature: Login
+
+  Scenario: User logs in
+    Given a registered user
+    When they sign in
+    Then they see the dashboard
+"""
+
+
+def _parse_upper(path: Path) -> str:
+    if path.name == "bad":
+        raise ValueError("unreadable")
+    return path.name.upper()
+
+
+@pytest.mark.unit
+class TestPipelineHelpers:
+    """Tests for the shared pipeline helpers."""
+
+    def test_compiled_template_matches_format(self):
+        """Rendering is equivalent to str.format, including escapes and specs."""
+        text = "def test_{name}():\n    x = {{'n': {count:03d}}}  # {label!r}\n"
+        values = {"name": "login", "count": 7, "label": "a"}
+
+        assert CompiledTemplate(text).render(**values) == text.format(**values)
+
+    def test_parse_sources_reports_errors_in_order(self, tmp_path: Path):
+        """Each path gets (parsed, None) or (None, error), in input order."""
+        work = [(_parse_upper, tmp_path / name) for name in ("a", "bad", "c")]
+
+        assert parse_sources(work, jobs=1) == [("A", None), (None, "unreadable"), ("C", None)]
+
+    def test_write_if_changed_ignores_timestamp(self, tmp_path: Path):
+        """Only the Generated: line differing does not rewrite the file."""
+        target = tmp_path / "test_x.py"
+
+        assert write_if_changed(target, '"""\nGenerated: 2024-01-01\n"""\nx = 1\n')
+        os.utime(target, (1, 1))
+        assert not write_if_changed(target, '"""\nGenerated: 2025-02-02\n"""\nx = 1\n')
+        assert target.stat().st_mtime == 1
+        assert write_if_changed(target, '"""\nGenerated: 2025-02-02\n"""\nx = 2\n')
+        assert "x = 2" in target.read_text(encoding="utf-8")
+
+
+@pytest.mark.unit
+class TestBatchedGeneration:
+    """Tests for generate() on the integration and smoke generators."""
+
+    def test_integration_dedupe_and_rerun(self, tmp_path: Path):
+        """Shared endpoints are generated once; a re-run writes nothing."""
+        pytest.importorskip("yaml")
+        ctr_dir = tmp_path / "ctr"
+        ctr_dir.mkdir()
+        for i, name in enumerate(("users", "orders")):
+            (ctr_dir / f"CTR-0{i}.yaml").write_text(
+                CTR_TEMPLATE.format(ctr_id=f"CTR-0{i}", name=name), encoding="utf-8"
+            )
+        generator = IntegrationTestGenerator(jobs=1)
+        out = tmp_path / "out"
+
+        first = generator.generate([("CTR", ctr_dir)], out)
+        second = generator.generate([("CTR", ctr_dir)], out)
+
+        assert (first.files_generated, first.tests_generated, first.duplicates_skipped) == (2, 3, 1)
+        assert first.files_written == 2
+        assert second.files_written == 0
+        contents = "".join(f.read_text(encoding="utf-8") for f in out.glob("*.py"))
+        assert contents.count("def test_get_health") == 1
+
+    def test_smoke_dedupe_across_sources(self, tmp_path: Path):
+        """The same scenario in two feature directories is generated once."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / f"{name}_login.feature").write_text(FEATURE, encoding="utf-8")
+
+        result = SmokeTestGenerator(jobs=1).generate(
+            [("BDD", tmp_path / "a"), ("BDD", tmp_path / "b"), ("EARS", tmp_path / "missing")],
+            tmp_path / "out"
+        )
+
+        assert result.tests_generated == 1
+        assert result.duplicates_skipped == 1
+        assert result.artifacts_processed == 2
+        assert result.errors == [f"EARS directory not found: {tmp_path / 'missing'}"]
+        assert [f.name for f in (tmp_path / "out").glob("*.py")] == ["test_a_login_smoke.py"]
+
+    def test_stale_file_of_duplicate_source_removed(self, tmp_path: Path):
+        """A source whose cases all duplicate an earlier source loses its old file."""
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / f"{name}_login.feature").write_text(FEATURE, encoding="utf-8")
+        generator = SmokeTestGenerator(jobs=1)
+        out = tmp_path / "out"
+        generator.generate([("BDD", tmp_path / "b")], out)
+        assert (out / "test_b_login_smoke.py").exists()
+
+        result = generator.generate([("BDD", tmp_path / "a"), ("BDD", tmp_path / "b")], out)
+
+        assert result.stale_removed == 1
+        assert [f.name for f in out.glob("*.py")] == ["test_a_login_smoke.py"]
+
+    def test_integration_stale_file_removed(self, tmp_path: Path):
+        pytest.importorskip("yaml")
+        ctr = CTR_TEMPLATE.format(ctr_id="CTR-01", name="users")
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / f"CTR-{name}.yaml").write_text(ctr, encoding="utf-8")
+        generator = IntegrationTestGenerator(jobs=1)
+        out = tmp_path / "out"
+        generator.generate([("CTR", tmp_path / "b")], out)
+
+        result = generator.generate([("CTR", tmp_path / "a"), ("CTR", tmp_path / "b")], out)
+        rerun = generator.generate([("CTR", tmp_path / "a"), ("CTR", tmp_path / "b")], out)
+
+        assert (result.stale_removed, rerun.stale_removed) == (1, 0)
+        assert [f.name for f in out.glob("*.py")] == ["test_ctr_a_integration.py"]
@@ -0,0 +1,107 @@
+"""
+Unit Tests for 04_BDD gherkin_stream.py and the validate_bdd_suite.py subscribers
+
+Tests keyword tokenizing and compares the streaming suite checks with the
+line-regex checks they replaced.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add 04_BDD scripts directory to path for imports
+BDD_SCRIPTS_DIR = Path(__file__).parent.parent.parent.parent / "04_BDD" / "scripts"
+sys.path.insert(0, str(BDD_SCRIPTS_DIR))
+
+from gherkin_stream import (
+    EVENT_FEATURE,
+    EVENT_SCENARIO,
+    EVENT_STEP,
+    EVENT_TEXT,
+    iter_gherkin_events,
+    run_subscribers,
+)
+from validate_bdd_suite import SectionMetadataCheck, SizeAndCountCheck
+
+# The line regexes used by validate_bdd_suite.py before streaming
+OLD_SCENARIO_RE = re.compile(r"^\s*Scenario(?: Outline)?:\s*", re.IGNORECASE)
+OLD_FEATURE_RE = re.compile(r"^\s*Feature:\s*", re.IGNORECASE)
+
+HEADER = "@section: 1.0\n@parent_doc: BDD-01\n@index: BDD-01.0_index.md\n@redirect\n"
+
+
+def _old_findings(lines: list[str]) -> list[tuple[int, str]]:
+    """Aggregator and scenario-count findings as the regex version reported them."""
+    findings = []
+    for i, line in enumerate(lines, 1):
+        if OLD_SCENARIO_RE.search(line):
+            findings.append((i, "Aggregator file (.00) must have 0 scenarios (redirect stub only)"))
+            break
+
+    starts = [i for i, line in enumerate(lines) if OLD_FEATURE_RE.search(line)] + [len(lines)]
+    for start, end in zip(starts, starts[1:]):
+        count = sum(1 for line in lines[start:end] if OLD_SCENARIO_RE.search(line))
+        if count > 12:
+            findings.append((start + 1, f"Feature block has {count} scenarios (>12)"))
+    return findings
+
+
+def _new_findings(lines: list[str]) -> list[tuple[int, str]]:
+    path = Path("BDD-01.01.00_agg.feature")
+    checks = [SectionMetadataCheck(path, is_aggregator=True), SizeAndCountCheck(path)]
+    run_subscribers(iter_gherkin_events(lines, ignore_case=True), checks)
+    return [(v.line, v.message) for check in checks for v in check.violations]
+
+
+def _feature(keyword: str, scenario_keywords: list[str]) -> str:
+    body = "".join(f"  {kw} Case {i}\n    Given x\n" for i, kw in enumerate(scenario_keywords))
+    return f"{keyword} Block\n{body}"
+
+
+@pytest.mark.unit
+class TestTokenizer:
+    """Tests for iter_gherkin_events keyword matching."""
+
+    def test_case_sensitive_by_default(self):
+        """Mis-cased keywords are plain text unless ignore_case is set."""
+        events = list(iter_gherkin_events(["feature: F", "  scenario: S", "    given x"]))
+
+        assert [e.kind for e in events] == [EVENT_TEXT, EVENT_TEXT, EVENT_TEXT]
+
+    def test_ignore_case_uses_canonical_keyword(self):
+        """ignore_case matches any casing and reports the canonical keyword."""
+        events = list(iter_gherkin_events(
+            ["FEATURE: F", "  scenario outline: S", "    given x", "  Examples:"], ignore_case=True
+        ))
+
+        assert [e.kind for e in events[:3]] == [EVENT_FEATURE, EVENT_SCENARIO, EVENT_STEP]
+        assert events[1].keyword == "Scenario Outline:"
+        assert events[1].is_outline
+        assert events[2].keyword == "Given"
+        assert events[3].keyword == "Examples:"
+
+
+@pytest.mark.unit
+class TestSuiteFindingsUnchanged:
+    """The streaming suite checks report what the regex checks reported."""
+
+    @pytest.mark.parametrize("text", [
+        HEADER + _feature("Feature:", ["Scenario:"] * 13),
+        HEADER + _feature("feature:", ["scenario:"] * 7 + ["SCENARIO OUTLINE:"] * 6),
+        HEADER + _feature("Feature:", ["Scenario:"] * 12 + ["Scenario Template:", "Example:"]),
+        HEADER + _feature("Feature:", ["Scenario:"] * 13) + _feature("FEATURE:", ["scenario:"] * 2),
+        HEADER + "Feature: Stub\n  # Scenario: commented out\n",
+        HEADER + "Feature: Stub\n  scenario: mis-cased\n",
+    ])
+    def test_old_and_new_match(self, text: str):
+        lines = text.splitlines(keepends=True)
+
+        assert _new_findings(lines) == _old_findings(lines)
+
+    def test_mis_cased_scenarios_count(self):
+        """Lower-case scenario lines count toward the 12-scenario limit."""
+        lines = (HEADER + _feature("feature:", ["scenario:"] * 13)).splitlines(keepends=True)
+
+        assert (5, "Feature block has 13 scenarios (>12)") in _new_findings(lines)
@@ -0,0 +1,223 @@
+"""
+Unit Tests for layer_scheduler.py
+
+Tests the layer dependency DAG and the concurrent layer scheduler.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from layer_scheduler import (
+    STATUS_BLOCKED,
+    STATUS_ERROR,
+    STATUS_FAILED,
+    STATUS_PASSED,
+    STATUS_TIMEOUT,
+    LayerCycleError,
+    build_layer_dag,
+    call_with_retries,
+    load_layer_dependencies,
+    run_layer_dag,
+)
+
+
+@pytest.mark.unit
+class TestBuildLayerDag:
+    """Tests for dependency graph construction."""
+
+    def test_restricts_to_selected_layers(self):
+        """References to layers outside the run are treated as satisfied."""
+        deps = {"PRD": ["BRD"], "EARS": ["BRD", "PRD"]}
+
+        dag = build_layer_dag(["PRD", "EARS"], deps)
+
+        assert dag == {"PRD": set(), "EARS": {"PRD"}}
+
+    def test_rejects_cycles(self):
+        """Cyclic dependencies raise before anything runs."""
+        with pytest.raises(LayerCycleError):
+            build_layer_dag(["A", "B"], {"A": ["B"], "B": ["A"]})
+
+    def test_registry_dependencies(self):
+        """can_reference lists are loaded from LAYER_REGISTRY.yaml."""
+        pytest.importorskip("yaml")
+
+        deps = load_layer_dependencies()
+
+        assert deps["BRD"] == []
+        assert "EARS" in deps["BDD"]
+
+
+@pytest.mark.unit
+class TestRunLayerDag:
+    """Tests for the layer scheduler."""
+
+    def test_serial_runs_in_pipeline_order(self):
+        """One worker reproduces the serial pipeline."""
+        order = []
+
+        outcomes = run_layer_dag(
+            ["BRD", "PRD", "EARS"],
+            {"PRD": ["BRD"], "EARS": ["PRD"]},
+            lambda layer: order.append(layer) or True,
+        )
+
+        assert order == ["BRD", "PRD", "EARS"]
+        assert all(o.status == STATUS_PASSED for o in outcomes.values())
+
+    def test_independent_layers_run_concurrently(self):
+        """Sibling layers overlap when workers allow it."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run(layer):
+            if layer in ("BDD", "ADR"):
+                barrier.wait()  # Deadlocks (times out) unless both run at once
+            return True
+
+        outcomes = run_layer_dag(
+            ["EARS", "BDD", "ADR"],
+            {"BDD": ["EARS"], "ADR": ["EARS"]},
+            run,
+            max_workers=2,
+        )
+
+        assert [o.status for o in outcomes.values()] == [STATUS_PASSED] * 3
+
+    def test_failure_blocks_remaining_layers(self):
+        """A failed layer halts scheduling of layers not yet started."""
+        outcomes = run_layer_dag(
+            ["BRD", "PRD", "EARS"],
+            {"PRD": ["BRD"], "EARS": ["PRD"]},
+            lambda layer: layer != "PRD",
+        )
+
+        assert outcomes["BRD"].status == STATUS_PASSED
+        assert outcomes["PRD"].status == STATUS_FAILED
+        assert outcomes["EARS"].status == STATUS_BLOCKED
+
+    def test_errors_are_retried(self):
+        """Steps that raise are retried up to max_retries."""
+        calls = []
+
+        def flaky(layer):
+            calls.append(layer)
+            if len(calls) < 3:
+                raise RuntimeError("transient")
+            return True
+
+        outcomes = run_layer_dag(["BRD"], {}, flaky, max_retries=2)
+
+        assert outcomes["BRD"].status == STATUS_PASSED
+        assert outcomes["BRD"].attempts == 3
+
+    def test_errors_exhaust_retries(self):
+        """Persistent errors are reported after the last attempt."""
+        def broken(layer):
+            raise RuntimeError("boom")
+
+        outcomes = run_layer_dag(["BRD"], {}, broken, max_retries=1)
+
+        assert outcomes["BRD"].status == STATUS_ERROR
+        assert outcomes["BRD"].attempts == 2
+        assert "boom" in outcomes["BRD"].error
+
+    def test_timeout(self):
+        """Layers exceeding timeout_per_layer are reported as timed out."""
+        release = threading.Event()
+
+        def slow(layer):
+            release.wait(5)
+            return True
+
+        start = time.monotonic()
+        outcomes = run_layer_dag(["BRD", "PRD"], {"PRD": ["BRD"]}, slow, timeout_per_layer=0.2)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert outcomes["BRD"].status == STATUS_TIMEOUT
+        assert outcomes["PRD"].status == STATUS_BLOCKED
+        assert "not stopped" in outcomes["BRD"].error
+
+
+@pytest.mark.unit
+class TestCallWithRetries:
+    """Tests for retrying a single call inside a layer step."""
+
+    def test_retries_until_success(self):
+        calls = []
+
+        def flaky(value, scale=1):
+            calls.append(value)
+            if len(calls) < 2:
+                raise OSError("transient")
+            return value * scale
+
+        assert call_with_retries(2, flaky, 3, scale=2) == 6
+        assert len(calls) == 2
+
+    def test_last_error_raised(self):
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise OSError(f"attempt {len(calls)}")
+
+        with pytest.raises(OSError, match="attempt 2"):
+            call_with_retries(1, broken)
+
+
+@pytest.mark.unit
+class TestSchedulingDefaults:
+    """Tests for applying configured timeout/retries in mvp_autopilot."""
+
+    @pytest.mark.parametrize("parallel, expected", [(False, (0, 0)), (True, (300, 3))])
+    def test_config_values_need_parallel(self, parallel, expected):
+        from mvp_autopilot import apply_layer_scheduling, build_arg_parser
+
+        args = build_arg_parser().parse_args(["--parallel"] if parallel else [])
+        apply_layer_scheduling(args, {"timeout_per_layer": 300, "max_retries": 3})
+
+        assert (args.timeout_per_layer, args.max_retries) == expected
+
+    def test_cli_values_kept(self):
+        from mvp_autopilot import apply_layer_scheduling, build_arg_parser
+
+        args = build_arg_parser().parse_args(["--parallel", "--max-retries", "1"])
+        apply_layer_scheduling(args, {"timeout_per_layer": 300, "max_retries": 3})
+
+        assert (args.timeout_per_layer, args.max_retries) == (300, 1)
+
+    def test_retry_does_not_repeat_bookkeeping(self, tmp_path, monkeypatch):
+        """A retried generation call adds each layer's plan and result rows once."""
+        import mvp_autopilot
+        from mvp_autopilot import build_arg_parser, run_autopilot
+
+        generate = mvp_autopilot.generate_from_template
+        calls = []
+
+        def flaky(*args, **kwargs):
+            calls.append(args[0].name)
+            if len(calls) == 1:
+                raise OSError("transient")
+            return generate(*args, **kwargs)
+
+        monkeypatch.setattr(mvp_autopilot, "generate_from_template", flaky)
+        args = build_arg_parser().parse_args([
+            "--root", str(tmp_path / "docs"), "--up-to", "PRD", "--nn", "01", "--slug", "demo",
+            "--skip-validate", "--no-precheck", "--parallel", "--max-retries", "1",
+        ])
+
+        summary = run_autopilot(args)
+
+        assert summary["status"] == "PASS"
+        assert calls == ["BRD", "BRD", "PRD"]
+        assert [r["layer"] for r in summary["results"]] == ["BRD", "PRD"]
+        assert [a["layer"] for a in summary["plan"]] == ["BRD", "PRD"]
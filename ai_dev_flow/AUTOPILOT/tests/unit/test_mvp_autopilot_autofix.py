@@ -0,0 +1,109 @@
+"""
+Unit Tests for mvp_autopilot.py in-memory auto-fix
+
+Tests the fix/validate loop that runs on document text before one write.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import mvp_autopilot
+from mvp_autopilot import Layer, autofix_in_memory, build_arg_parser, validate_content
+
+BRD = Layer("BRD", 1, "BRD-MVP-TEMPLATE.md", ".md")
+TASKS = Layer("TASKS", 11, "TASKS-TEMPLATE.md", ".md", upstream_tags=["spec"])
+
+
+@pytest.mark.unit
+class TestAutofixInMemory:
+    """Tests for the in-memory fix/validate loop."""
+
+    def test_validate_content_without_disk(self, tmp_path):
+        """Layers with a content validator are validated from text alone."""
+        pytest.importorskip("yaml")
+
+        result = validate_content("BRD", tmp_path / "BRD-01_demo.md", "# Not a BRD\n")
+
+        assert result is not None
+        ok, issues = result
+        assert not ok
+        assert issues
+
+    def test_fixes_are_written_once(self, tmp_path):
+        """The loop stops when fixers converge and writes the result once."""
+        pytest.importorskip("yaml")
+        doc = tmp_path / "BRD-01_demo.md"
+        doc.write_text("# Draft\n", encoding="utf-8")
+
+        ok, issues, rounds, changed = autofix_in_memory(doc, BRD, {}, max_rounds=5)
+
+        assert ok is not None
+        assert 1 <= rounds < 5
+        assert changed
+        content = doc.read_text(encoding="utf-8")
+        assert content.startswith("---\n")
+        assert "# BRD-01: Demo" in content
+
+    def test_layer_without_content_validator(self, tmp_path):
+        """Layers without a content validator are fixed once and left for disk validation."""
+        doc = tmp_path / "TASKS-01_demo.md"
+        doc.write_text("# TASKS-01\n", encoding="utf-8")
+
+        ok, issues, rounds, changed = autofix_in_memory(doc, TASKS, {"spec": "SPEC-01"}, max_rounds=3)
+
+        assert ok is None
+        assert rounds == 1
+        assert changed
+        assert "@spec: SPEC-01" in doc.read_text(encoding="utf-8")
+
+    def test_nothing_to_fix_reports_unchanged(self, tmp_path):
+        """A document the fixers leave alone is not rewritten."""
+        doc = tmp_path / "TASKS-01_demo.md"
+        doc.write_text("# TASKS-01\n\n@spec: SPEC-01\n", encoding="utf-8")
+        autofix_in_memory(doc, TASKS, {"spec": "SPEC-01"})
+        before = doc.stat().st_mtime_ns
+
+        *_, changed = autofix_in_memory(doc, TASKS, {"spec": "SPEC-01"})
+
+        assert not changed
+        assert doc.stat().st_mtime_ns == before
+
+    def test_validator_errors_propagate(self, tmp_path, monkeypatch):
+        """A crashing content validator is not mistaken for a missing one."""
+        def _crash(file, content):
+            raise ValueError("validator bug")
+
+        module = SimpleNamespace(validate_brd_content=_crash)
+        monkeypatch.setattr(mvp_autopilot, "_load_content_validator", lambda name: module)
+
+        with pytest.raises(ValueError, match="validator bug"):
+            validate_content("BRD", tmp_path / "BRD-01_demo.md", "# BRD-01\n")
+
+    def test_missing_validator_function(self, tmp_path, monkeypatch):
+        """A module without the layer's content function means no in-memory validator."""
+        monkeypatch.setattr(mvp_autopilot, "_load_content_validator", lambda name: SimpleNamespace())
+
+        assert validate_content("BRD", tmp_path / "BRD-01_demo.md", "# BRD-01\n") is None
+
+    def test_autofix_rounds_option(self):
+        """Fix rounds default to the configured max_retries; --autofix-rounds overrides."""
+        from mvp_autopilot import apply_layer_scheduling
+
+        args = build_arg_parser().parse_args([])
+        apply_layer_scheduling(args, {"max_retries": 3})
+        assert (args.autofix_rounds, args.max_retries) == (3, 0)
+
+        args = build_arg_parser().parse_args(["--max-retries", "2"])
+        apply_layer_scheduling(args, {"max_retries": 3})
+        assert args.autofix_rounds == 2
+
+        args = build_arg_parser().parse_args(["--autofix-rounds", "5"])
+        apply_layer_scheduling(args, {"max_retries": 3})
+        assert args.autofix_rounds == 5
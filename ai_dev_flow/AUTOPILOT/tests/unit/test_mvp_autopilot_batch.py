@@ -0,0 +1,76 @@
+"""
+Unit Tests for mvp_autopilot.py batch mode
+
+Tests manifest validation and the per-project status of v4 pipeline runs.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mvp_autopilot import _run_batch_entry, build_arg_parser, load_batch_manifest
+
+V4_CONFIG = """
+metadata:
+  version: "4.0"
+pipeline:
+  L1_BRD:
+    order: 1
+    pre_checks:
+      - name: gate
+        command: "{command}"
+        required: true
+        action: halt
+    on_failure:
+      pre_check: halt
+"""
+
+
+def _write_manifest(tmp_path: Path, projects) -> Path:
+    path = tmp_path / "batch.json"
+    path.write_text(json.dumps(projects), encoding="utf-8")
+    return path
+
+
+@pytest.mark.unit
+class TestLoadBatchManifest:
+    """Tests for manifest validation."""
+
+    def test_valid_layers(self, tmp_path: Path):
+        path = _write_manifest(tmp_path, [{"nn": 1, "include_layers": ["BRD", "prd"], "exclude_layers": []}])
+
+        assert load_batch_manifest(path) == [{"nn": "01", "include_layers": ["BRD", "prd"], "exclude_layers": []}]
+
+    @pytest.mark.parametrize("layers, message", [
+        ("BRD PRD", "must be a list of layer names"),
+        ([1, 2], "must be a list of layer names"),
+        (["BRD", "XYZ"], "unknown layers: XYZ"),
+    ])
+    def test_invalid_layers_rejected(self, tmp_path: Path, layers, message):
+        path = _write_manifest(tmp_path, [{"nn": "01", "include_layers": layers}])
+
+        with pytest.raises(ValueError, match=message):
+            load_batch_manifest(path)
+
+
+@pytest.mark.unit
+class TestV4BatchStatus:
+    """A v4 project's status follows its pipeline result."""
+
+    @pytest.mark.parametrize("command, status", [("true", "PASS"), ("false", "FAIL")])
+    def test_status_from_pipeline(self, tmp_path: Path, command: str, status: str):
+        pytest.importorskip("yaml")
+        config = tmp_path / "autopilot.yaml"
+        config.write_text(V4_CONFIG.format(command=command), encoding="utf-8")
+        args = build_arg_parser().parse_args(["--config", str(config), "--skip-validate"])
+
+        outcome = _run_batch_entry(args, {"nn": "01", "root": str(tmp_path / "docs"), "up_to": "BRD"})
+
+        assert outcome["error"] == ""
+        assert outcome["status"] == status
@@ -0,0 +1,76 @@
+"""
+Unit Tests for mvp_autopilot.py pre/post checks
+
+Tests sequential and parallel_group check execution.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mvp_autopilot import PreCheck, ProjectMode, execute_checks
+
+CONTEXT = {"mode": ProjectMode.GREENFIELD}
+
+
+@pytest.mark.unit
+class TestExecuteChecks:
+    """Tests for check execution."""
+
+    def test_results_in_declaration_order(self):
+        """Results follow declaration order, including skipped checks."""
+        checks = [
+            PreCheck("a", "true", parallel_group="g"),
+            PreCheck("solo", "true"),
+            PreCheck("b", "exit 1", required=False, parallel_group="g"),
+            PreCheck("brownfield-only", "true", mode="brownfield"),
+        ]
+        results = []
+
+        assert execute_checks(checks, CONTEXT, results)
+
+        assert [(r.name, r.status) for r in results] == [
+            ("a", "passed"),
+            ("solo", "passed"),
+            ("b", "failed"),
+            ("brownfield-only", "skipped"),
+        ]
+        assert all(r.duration >= 0 for r in results)
+
+    def test_group_runs_concurrently(self):
+        """Checks in one parallel_group overlap."""
+        checks = [PreCheck(f"c{i}", "sleep 0.3", parallel_group="g") for i in range(3)]
+
+        start = time.monotonic()
+        assert execute_checks(checks, {**CONTEXT, "max_parallel": 3})
+
+        assert time.monotonic() - start < 0.8
+
+    def test_halting_failure_cancels_group(self):
+        """A halting required failure cancels the rest of its group and later checks."""
+        checks = [
+            PreCheck("fail", "sleep 0.1; exit 2", action="halt", parallel_group="g"),
+            PreCheck("slow", "sleep 5", parallel_group="g"),
+            PreCheck("after", "true"),
+        ]
+        results = []
+
+        start = time.monotonic()
+        assert not execute_checks(checks, CONTEXT, results)
+
+        assert time.monotonic() - start < 3
+        assert [(r.name, r.status) for r in results] == [("fail", "failed"), ("slow", "cancelled")]
+
+    def test_required_failure_without_halt_continues(self):
+        """Required failures only stop execution when the action is 'halt'."""
+        results = []
+
+        assert execute_checks([PreCheck("fail", "exit 1"), PreCheck("next", "true")], CONTEXT, results)
+
+        assert [r.status for r in results] == ["failed", "passed"]
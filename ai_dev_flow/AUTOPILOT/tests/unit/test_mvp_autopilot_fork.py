@@ -0,0 +1,120 @@
+"""
+Unit Tests for mvp_autopilot.py fork mode
+
+Tests the compiled ID map, fork source discovery and parallel fork writes.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mvp_autopilot import (
+    Layer,
+    compile_id_map,
+    find_fork_jobs,
+    rewrite_for_new_ids,
+    run_fork_jobs,
+)
+
+LAYERS = [
+    Layer("BRD", 1, "BRD-MVP-TEMPLATE.md", ".md"),
+    Layer("BDD", 4, "BDD-MVP-TEMPLATE.feature", ".feature"),
+]
+
+
+@pytest.mark.unit
+class TestCompileIdMap:
+    """Tests for single-pass ID map replacement."""
+
+    def test_longest_key_wins(self):
+        """Overlapping keys resolve to the most specific ID."""
+        apply = compile_id_map({"REQ-01": "REQ-10", "REQ-01.02": "REQ-20.02"})
+
+        assert apply("REQ-01 and REQ-01.02") == "REQ-10 and REQ-20.02"
+
+    def test_no_chained_rewrites(self):
+        """Replaced text is not rewritten again by another entry."""
+        apply = compile_id_map({"A-1": "B-1", "B-1": "C-1"})
+
+        assert apply("A-1 B-1") == "B-1 C-1"
+
+    def test_empty_map(self):
+        """An empty map leaves text unchanged."""
+        assert compile_id_map({})("REQ-01") == "REQ-01"
+
+    def test_regex_characters_are_literal(self):
+        """Keys are matched literally."""
+        assert compile_id_map({"a.b": "x", "(c)": "y"})("a.b axb (c)") == "x axb y"
+
+
+@pytest.mark.unit
+class TestForkJobs:
+    """Tests for fork discovery and execution."""
+
+    @pytest.fixture
+    def root(self, tmp_path):
+        (tmp_path / "BRD" / "sections").mkdir(parents=True)
+        (tmp_path / "BDD").mkdir()
+        (tmp_path / "BRD" / "BRD-01_old.md").write_text('---\ntitle: "BRD-01: Old"\n---\n# BRD-01: Old\nSee BDD-01.\n')
+        (tmp_path / "BRD" / "sections" / "BRD-01.1_intro.md").write_text("# Intro\nBRD.01.01.01\n")
+        (tmp_path / "BRD" / "BRD-02_other.md").write_text("# BRD-02\n")
+        (tmp_path / "BDD" / "BDD-01_old.feature").write_text("Feature: BDD-01 Old\n")
+        return tmp_path
+
+    def test_find_fork_jobs(self, root):
+        """Monolithic files take the new slug; sectional files keep their suffix."""
+        jobs = find_fork_jobs(root, LAYERS, "01", "03", "new_app")
+
+        dst_names = [job.dst.relative_to(root.resolve()).as_posix() for job in jobs]
+        assert dst_names == [
+            "BRD/BRD-03_new_app.md",
+            "BRD/sections/BRD-03.1_intro.md",
+            "BDD/BDD-03_new_app.feature",
+        ]
+
+    def test_run_fork_jobs_plan_only(self, root):
+        """Without writing, exact byte counts are reported and nothing is created."""
+        jobs = find_fork_jobs(root, LAYERS, "01", "03", "new_app")
+
+        done = run_fork_jobs(
+            jobs, lambda job, raw: rewrite_for_new_ids(raw, job.layer.name, "01", "03", "New App", None), write=False
+        )
+
+        assert [job.src_bytes for job in done] == [job.src.stat().st_size for job in jobs]
+        assert all(len(job.content) > 0 for job in done)
+        assert not any(job.dst.exists() for job in done)
+
+    def test_run_fork_jobs_writes(self, root):
+        """Forked documents are rewritten to the new NN."""
+        jobs = find_fork_jobs(root, LAYERS, "01", "03", "new_app")
+
+        run_fork_jobs(
+            jobs, lambda job, raw: rewrite_for_new_ids(raw, job.layer.name, "01", "03", "New App", None), write=True
+        )
+
+        brd = (root / "BRD" / "BRD-03_new_app.md").read_text()
+        assert 'title: "BRD-03: New App"' in brd
+        assert "BDD-03" in brd
+        assert (root / "BDD" / "BDD-03_new_app.feature").read_text().startswith("Feature: BDD-03 — New App")
+        assert "BRD.03.01.01" in (root / "BRD" / "sections" / "BRD-03.1_intro.md").read_text()
+        assert not list(root.rglob("*.tmp"))
+
+    def test_duplicate_destination_forked_once(self, root):
+        """Two monolithic sources for one NN claim the same destination; only the first is written."""
+        (root / "BRD" / "BRD-01_older.md").write_text("# BRD-01: Older\n")
+        jobs = find_fork_jobs(root, LAYERS, "01", "03", "new_app")
+        brd = [job for job in jobs if job.dst.name == "BRD-03_new_app.md"]
+
+        done = run_fork_jobs(jobs, lambda job, raw: raw, write=True)
+
+        assert [job.src.name for job in brd] == ["BRD-01_old.md", "BRD-01_older.md"]
+        assert brd[0].error == ""
+        assert brd[1].error == "duplicate destination (already forked from BRD-01_old.md)"
+        assert brd[1].content == b""
+        assert (root / "BRD" / "BRD-03_new_app.md").read_text() == (root / "BRD" / "BRD-01_old.md").read_text()
+        assert len(done) == len(jobs)
@@ -0,0 +1,112 @@
+"""
+Unit Tests for mvp_autopilot.py project-mode detection
+
+Tests the bounded, pruned marker scan and the cached detection.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mvp_autopilot import ProjectMode, detect_project_mode_info, scan_mode_markers
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+    return path
+
+
+@pytest.mark.unit
+class TestScanModeMarkers:
+    """Tests for the marker scan."""
+
+    def test_finds_nested_markers(self, tmp_path):
+        """Layer directories below the root are found."""
+        prd = _touch(tmp_path / "docs" / "02_PRD" / "PRD-01.md")
+
+        found, _ = scan_mode_markers(tmp_path)
+
+        assert found == {"prd": prd, "spec": None}
+
+    def test_prunes_dependency_trees(self, tmp_path):
+        """Markers inside pruned directories are ignored."""
+        _touch(tmp_path / "node_modules" / "pkg" / "02_PRD" / "PRD-01.md")
+
+        found, _ = scan_mode_markers(tmp_path)
+
+        assert found["prd"] is None
+
+    def test_depth_limit(self, tmp_path):
+        """Markers deeper than max_depth are not searched."""
+        _touch(tmp_path / "a" / "b" / "c" / "02_PRD" / "PRD-01.md")
+
+        assert scan_mode_markers(tmp_path, max_depth=1)[0]["prd"] is None
+        assert scan_mode_markers(tmp_path, max_depth=3)[0]["prd"] is not None
+
+
+@pytest.mark.unit
+class TestDetectProjectModeInfo:
+    """Tests for mode detection and caching."""
+
+    def test_brownfield(self, tmp_path):
+        """SPEC artifacts plus source code mean brownfield."""
+        _touch(tmp_path / "09_SPEC" / "SPEC-01.yaml")
+        (tmp_path / "src").mkdir()
+
+        assert detect_project_mode_info(tmp_path).mode == ProjectMode.BROWNFIELD
+
+    def test_forced_mode(self, tmp_path):
+        """An explicit mode skips detection."""
+        assert detect_project_mode_info(tmp_path, "brownfield").mode == ProjectMode.BROWNFIELD
+
+    def test_cached_until_root_changes(self, tmp_path):
+        """A second detection is served from the cache until the root changes."""
+        _touch(tmp_path / "02_PRD" / "PRD-01.md")
+        cache_path = tmp_path / ".autopilot_state" / "project_mode.json"
+
+        first = detect_project_mode_info(tmp_path, cache_path=cache_path)
+        second = detect_project_mode_info(tmp_path, cache_path=cache_path)
+        (tmp_path / "new_dir").mkdir()
+        third = detect_project_mode_info(tmp_path, cache_path=cache_path)
+
+        assert not first.cached
+        assert second.cached and second.mode == first.mode
+        assert not third.cached
+
+    def test_state_dir_created_only_to_write(self, tmp_path):
+        """Creating the state dir does not invalidate the cache; cache hits write nothing."""
+        _touch(tmp_path / "02_PRD" / "PRD-01.md")
+        cache_path = tmp_path / ".autopilot_state" / "project_mode.json"
+
+        assert not detect_project_mode_info(tmp_path, "greenfield", cache_path=cache_path).cached
+        assert not cache_path.parent.exists()
+
+        detect_project_mode_info(tmp_path, cache_path=cache_path)
+        root_mtime = tmp_path.stat().st_mtime_ns
+        cache_mtime = cache_path.stat().st_mtime_ns
+
+        assert detect_project_mode_info(tmp_path, cache_path=cache_path).cached
+        assert tmp_path.stat().st_mtime_ns == root_mtime
+        assert cache_path.stat().st_mtime_ns == cache_mtime
+
+    def test_marker_added_in_existing_subdir(self, tmp_path):
+        """A SPEC added below an unchanged root invalidates the cached detection."""
+        _touch(tmp_path / "docs" / "02_PRD" / "PRD-01.md")
+        (tmp_path / "docs" / "09_SPEC").mkdir()
+        (tmp_path / "src").mkdir()
+        cache_path = tmp_path / ".autopilot_state" / "project_mode.json"
+        assert detect_project_mode_info(tmp_path, cache_path=cache_path).mode == ProjectMode.GREENFIELD
+        root_mtime = tmp_path.stat().st_mtime_ns
+
+        _touch(tmp_path / "docs" / "09_SPEC" / "SPEC-01.yaml")
+        detection = detect_project_mode_info(tmp_path, cache_path=cache_path)
+
+        assert tmp_path.stat().st_mtime_ns == root_mtime
+        assert not detection.cached
+        assert detection.mode == ProjectMode.BROWNFIELD
@@ -0,0 +1,92 @@
+"""
+Unit Tests for mvp_autopilot.py template rendering
+
+Tests ID substitution and the compiled template cache.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mvp_autopilot import (
+    Layer,
+    TemplateCache,
+    compile_template,
+    render_template_content,
+    substitute_ids,
+)
+
+SAMPLE_TEMPLATE = """<!-- leading comment -->
+---
+title: "BRD-NN: Template"
+tags:
+  - brd-template
+custom_fields:
+  document_type: template
+---
+
+# BRD-NN: MVP TEMPLATE
+
+Product: [MVP Product/Feature Name] for [MVP idea]
+See BRD.NN.TT.SS, PRD-NN, REQ_NN and BRD.NN.32.SS.
+"""
+
+
+@pytest.mark.unit
+class TestSubstituteIds:
+    """Tests for single-pass ID placeholder substitution."""
+
+    def test_nested_placeholders(self):
+        """Nested element IDs take precedence over the plain prefix."""
+        text = "BRD.NN.TT.SS PRD.NN.EE.SS BRD.NN.32.SS EARS.NN.24.SS"
+
+        assert substitute_ids(text, "BRD", "07") == "BRD.07.01.01 PRD.07.01.01 BRD.07.32.01 EARS.07.24.01"
+
+    def test_separators_preserved(self):
+        """PREFIX-NN, PREFIX.NN and PREFIX_NN keep their separator."""
+        assert substitute_ids("SYS-NN ADR.NN SPEC_NN", "SYS", "3") == "SYS-3 ADR.3 SPEC_3"
+
+    def test_current_layer_prefix(self):
+        """Layers outside the standard prefixes are substituted for their own templates only."""
+        assert substitute_ids("TASKS-NN", "TASKS", "02") == "TASKS-02"
+        assert substitute_ids("TASKS-NN", "BRD", "02") == "TASKS-NN"
+
+
+@pytest.mark.unit
+class TestCompiledTemplates:
+    """Tests for compiled template rendering and caching."""
+
+    LAYER = Layer("BRD", 1, "BRD-MVP-TEMPLATE.md", ".md")
+
+    @pytest.mark.parametrize("nn,slug,intent", [("01", "Demo App", "An idea"), ("42", "Other", "x\\1 $&")])
+    def test_render_matches_pipeline(self, nn, slug, intent):
+        """Compiled rendering equals running the full pipeline per document."""
+        compiled = compile_template(SAMPLE_TEMPLATE, self.LAYER)
+
+        expected = render_template_content(SAMPLE_TEMPLATE, self.LAYER, nn, slug, intent)
+
+        assert compiled.render(nn, slug, intent) == expected
+        assert expected.startswith("---\n")
+
+    def test_disk_cache_reused(self, tmp_path):
+        """A fresh cache loads compiled parts from disk instead of recompiling."""
+        tpl = tmp_path / "BRD-MVP-TEMPLATE.md"
+        tpl.write_text(SAMPLE_TEMPLATE, encoding="utf-8")
+        disk_path = tmp_path / "state" / "template_cache.json"
+
+        first = TemplateCache()
+        first.configure(disk_path)
+        rendered = first.get(tpl, self.LAYER).render("01", "Demo", "idea")
+
+        second = TemplateCache()
+        second.configure(disk_path)
+        second._load_disk()
+
+        assert disk_path.exists()
+        assert len(second._disk) == 1
+        assert second.get(tpl, self.LAYER).render("01", "Demo", "idea") == rendered
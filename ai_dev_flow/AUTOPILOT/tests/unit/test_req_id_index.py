@@ -0,0 +1,139 @@
+"""
+Unit Tests for 07_REQ req_id_index.py and its use in validate_requirement_ids.py
+
+Tests duplicate, gap and order detection through the index, and the corpus
+root recorded in the persisted index.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add 07_REQ scripts directory to path for imports
+REQ_SCRIPTS_DIR = Path(__file__).parent.parent.parent.parent / "07_REQ" / "scripts"
+sys.path.insert(0, str(REQ_SCRIPTS_DIR))
+
+from req_id_index import DEFAULT_INDEX_PATH, build_req_index, load_req_index
+from validate_requirement_ids import RequirementIDValidator
+
+
+def _write_req(path: Path, req_id: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"# {req_id}: Requirement\n\nBody\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "07_REQ"
+    _write_req(root / "REQ-01_auth" / "REQ-01.01_login.md", "REQ-01.01")
+    _write_req(root / "REQ-01_auth" / "REQ-01.03_logout.md", "REQ-01.03")
+    _write_req(root / "REQ-01_auth" / "REQ-02.01_session.md", "REQ-02.01")
+    _write_req(root / "REQ-04_billing" / "REQ-04.01_charge.md", "REQ-04.01")
+    _write_req(root / "REQ-04_billing" / "REQ-04.02_refund.md", "REQ-01.01")
+    return root
+
+
+@pytest.mark.unit
+class TestRequirementIndex:
+    """Tests for the cross-file checks on a built index."""
+
+    def test_duplicates(self, corpus: Path):
+        index = build_req_index(corpus)
+
+        assert index.duplicates() == {
+            "REQ-01.01": ["REQ-01_auth/REQ-01.01_login.md", "REQ-04_billing/REQ-04.02_refund.md"],
+        }
+
+    def test_gaps(self, corpus: Path):
+        """Missing top-level numbers and sub-numbers within a group."""
+        assert build_req_index(corpus).gaps() == ["REQ-03", "REQ-01.02"]
+
+    def test_out_of_order(self, corpus: Path):
+        """Sub-requirements filed under another section's directory."""
+        assert build_req_index(corpus).out_of_order() == [
+            ("REQ-01_auth/REQ-02.01_session.md", "REQ-02.01"),
+            ("REQ-04_billing/REQ-04.02_refund.md", "REQ-01.01"),
+        ]
+
+    def test_persisted_index_reused(self, corpus: Path):
+        """Unchanged files keep their entries; the root is recorded."""
+        index_path = corpus / ".req_id_index.json"
+        first = build_req_index(corpus, index_path=index_path)
+
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        assert data["root"] == str(corpus.resolve())
+        assert build_req_index(corpus, index_path=index_path).entries == first.entries
+
+
+@pytest.mark.unit
+class TestIndexRoot:
+    """Tests for indexes stored outside the corpus."""
+
+    def test_load_uses_recorded_root(self, corpus: Path, tmp_path: Path):
+        index_path = tmp_path / "state" / "req.json"
+        build_req_index(corpus, index_path=index_path)
+
+        index = load_req_index(index_path)
+
+        assert index.root == corpus.resolve()
+        assert "REQ-01_auth/REQ-01.01_login.md" in index.entries
+
+    def test_other_root_is_stale(self, corpus: Path, tmp_path: Path):
+        index_path = tmp_path / "req.json"
+        build_req_index(corpus, index_path=index_path)
+
+        assert load_req_index(index_path, root=tmp_path).entries == {}
+
+    def test_single_file_with_external_index(self, corpus: Path, tmp_path: Path):
+        """Duplicates are found and keys stay relative when --index is outside the corpus."""
+        index_path = tmp_path / "state" / "req.json"
+        RequirementIDValidator().validate_directory(corpus, index_path=index_path)
+        changed = corpus / "REQ-04_billing" / "REQ-04.01_charge.md"
+        _write_req(changed, "REQ-01.03")
+
+        validator = RequirementIDValidator()
+        result = validator.validate_single_file(changed, index_path=index_path)
+
+        assert not result.valid
+        assert any("REQ-01.03" in error for error in result.errors)
+        keys = json.loads(index_path.read_text(encoding="utf-8"))["files"]
+        assert all(not Path(key).is_absolute() for key in keys)
+
+    def test_file_outside_root_not_persisted(self, corpus: Path, tmp_path: Path):
+        index_path = corpus / ".req_id_index.json"
+        build_req_index(corpus, index_path=index_path)
+        stray = _write_req(tmp_path / "elsewhere" / "REQ-01.01_copy.md", "REQ-01.01")
+
+        result = RequirementIDValidator().validate_single_file(stray, index_path=index_path)
+
+        assert not result.valid
+        keys = json.loads(index_path.read_text(encoding="utf-8"))["files"]
+        assert all(not Path(key).is_absolute() for key in keys)
+
+
+@pytest.mark.unit
+class TestIndexLocation:
+    """Tests for where the index is persisted."""
+
+    def test_directory_run_writes_nothing_by_default(self, corpus: Path):
+        before = sorted(corpus.rglob("*"))
+
+        RequirementIDValidator().validate_directory(corpus)
+
+        assert sorted(corpus.rglob("*")) == before
+
+    def test_single_file_finds_project_index(self, corpus: Path, tmp_path: Path):
+        """A single-file run picks up <project>/.autopilot_state/req_id_index.json."""
+        index_path = tmp_path / DEFAULT_INDEX_PATH
+        RequirementIDValidator().validate_directory(corpus, index_path=index_path)
+        changed = _write_req(corpus / "REQ-04_billing" / "REQ-04.01_charge.md", "REQ-01.03")
+
+        result = RequirementIDValidator().validate_single_file(changed)
+
+        assert not result.valid
+        assert any("REQ-01.03" in error for error in result.errors)
+        entries = json.loads(index_path.read_text(encoding="utf-8"))["files"]
+        assert entries["REQ-04_billing/REQ-04.01_charge.md"]["req_id"] == "REQ-01.03"
@@ -0,0 +1,88 @@
+"""
+Unit Tests for run_journal.py
+
+Tests layer checkpoints and the resume freshness check.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from run_journal import (
+    JOURNAL_FAIL,
+    JOURNAL_GENERATED,
+    JOURNAL_PASS,
+    RunJournal,
+)
+
+SETTINGS = {"strict": False, "mvp_validators": False}
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    path = tmp_path / "BRD" / "BRD-01_demo.md"
+    path.parent.mkdir()
+    path.write_text("# BRD-01: Demo\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.unit
+class TestRunJournal:
+    """Tests for the run journal."""
+
+    def test_persists_across_instances(self, tmp_path, artifact):
+        """Checkpoints are written to disk and reloaded."""
+        path = tmp_path / "state" / "journal-01.json"
+        journal = RunJournal(path)
+        journal.begin_run(nn="01")
+        journal.record("BRD", artifact, JOURNAL_PASS, {}, SETTINGS)
+        journal.finish_run("PASS")
+
+        reloaded = RunJournal(path)
+
+        assert reloaded.run["status"] == "PASS"
+        assert reloaded.get("BRD").status == JOURNAL_PASS
+        assert reloaded.artifact("BRD") == artifact
+
+    def test_unchanged_status(self, tmp_path, artifact):
+        """A validated, unchanged layer reports its journaled outcome."""
+        journal = RunJournal(tmp_path / "journal.json")
+        journal.record("BRD", artifact, JOURNAL_PASS, {}, SETTINGS)
+
+        assert journal.unchanged_status("BRD", artifact, {}, SETTINGS) == JOURNAL_PASS
+
+    def test_artifact_change_invalidates(self, tmp_path, artifact):
+        """Editing the artifact forces re-validation."""
+        journal = RunJournal(tmp_path / "journal.json")
+        journal.record("BRD", artifact, JOURNAL_FAIL, {}, SETTINGS)
+
+        artifact.write_text("# BRD-01: Demo (edited)\n", encoding="utf-8")
+
+        assert journal.unchanged_status("BRD", artifact, {}, SETTINGS) is None
+
+    def test_upstream_and_settings_invalidate(self, tmp_path, artifact):
+        """Changed upstream hashes or validation settings force re-validation."""
+        journal = RunJournal(tmp_path / "journal.json")
+        journal.record("PRD", artifact, JOURNAL_PASS, {"BRD": "a"}, SETTINGS)
+
+        assert journal.unchanged_status("PRD", artifact, {"BRD": "b"}, SETTINGS) is None
+        assert journal.unchanged_status("PRD", artifact, {"BRD": "a"}, {**SETTINGS, "strict": True}) is None
+
+    def test_generated_is_not_validated(self, tmp_path, artifact):
+        """A layer that crashed before validation is validated on resume."""
+        journal = RunJournal(tmp_path / "journal.json")
+        journal.record("BRD", artifact, JOURNAL_GENERATED, {}, SETTINGS)
+
+        assert journal.unchanged_status("BRD", artifact, {}, SETTINGS) is None
+
+    def test_corrupt_journal_starts_empty(self, tmp_path):
+        """An unreadable journal is ignored."""
+        path = tmp_path / "journal.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert RunJournal(path).entries == {}
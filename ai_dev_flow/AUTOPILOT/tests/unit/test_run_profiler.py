@@ -0,0 +1,120 @@
+"""
+Unit Tests for run_profiler.py
+
+Tests stage timing aggregation, Chrome trace export and the stages
+recorded by v4 pipeline runs.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from mvp_autopilot import build_arg_parser, run_autopilot
+from run_profiler import RunProfiler
+
+V4_CONFIG = """
+metadata:
+  version: "4.0"
+pipeline:
+  L1_BRD:
+    order: 1
+    pre_checks:
+      - name: gate
+        command: "true"
+        required: true
+    post_checks:
+      - name: done
+        command: "true"
+        required: false
+"""
+
+
+@pytest.mark.unit
+class TestRunProfiler:
+    """Tests for RunProfiler."""
+
+    def test_summary_aggregates_per_layer_stage(self):
+        """Repeated stages are summed into one row, in first-seen order."""
+        profiler = RunProfiler()
+        with profiler.stage("BRD", "generate"):
+            pass
+        with profiler.stage("BRD", "validate") as info:
+            info["ok"] = True
+        with profiler.stage("BRD", "validate"):
+            pass
+
+        rows = profiler.summary()
+
+        assert [(r["layer"], r["stage"], r["count"]) for r in rows] == [
+            ("BRD", "generate", 1),
+            ("BRD", "validate", 2),
+        ]
+        assert all(r["wall_ms"] >= 0 for r in rows)
+
+    def test_stage_recorded_on_error(self):
+        """A stage that raises is still timed."""
+        profiler = RunProfiler()
+        with pytest.raises(RuntimeError):
+            with profiler.stage("PRD", "validate"):
+                raise RuntimeError("boom")
+
+        assert profiler.summary()[0]["stage"] == "validate"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="RUSAGE_CHILDREN is POSIX only")
+    def test_subprocess_cpu_is_separate(self):
+        """Subprocess CPU is attributed to child CPU, not in-process CPU."""
+        profiler = RunProfiler()
+        with profiler.stage("EARS", "validate"):
+            subprocess.run([sys.executable, "-c", "sum(i * i for i in range(2_000_000))"], check=True)
+
+        row = profiler.summary()[0]
+        assert row["child_cpu_ms"] > 0
+        assert row["child_cpu_ms"] > row["cpu_ms"]
+
+    def test_chrome_trace(self, tmp_path):
+        """The trace holds one complete event per stage plus thread metadata."""
+        profiler = RunProfiler()
+        with profiler.stage("BRD", "validate", attempt=1):
+            pass
+
+        path = profiler.write_chrome_trace(tmp_path / "out" / "run.trace.json")
+        trace = json.loads(path.read_text(encoding="utf-8"))
+
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert len(events) == 1
+        assert events[0]["name"] == "BRD:validate"
+        assert events[0]["args"]["attempt"] == "1"
+        assert any(e["ph"] == "M" for e in trace["traceEvents"])
+
+
+@pytest.mark.unit
+class TestV4PipelineTiming:
+    """v4 pipeline runs record stages and write --report/--trace output."""
+
+    def test_v4_trace_and_report(self, tmp_path):
+        pytest.importorskip("yaml")
+        config = tmp_path / "autopilot.yaml"
+        config.write_text(V4_CONFIG, encoding="utf-8")
+        trace_path = tmp_path / "run.trace.json"
+        report_path = tmp_path / "report.json"
+        args = build_arg_parser().parse_args([
+            "--config", str(config), "--root", str(tmp_path / "docs"), "--up-to", "BRD", "--skip-validate",
+            "--trace", str(trace_path), "--report", "json", "--report-path", str(report_path),
+        ])
+
+        summary = run_autopilot(args)
+
+        stages = {(t["layer"], t["stage"]) for t in summary["timings"]}
+        assert {("PIPELINE", "mode"), ("L1_BRD", "precheck"), ("L1_BRD", "generate"), ("L1_BRD", "postcheck")} <= stages
+        trace = json.loads(trace_path.read_text(encoding="utf-8"))
+        assert "L1_BRD:precheck" in {e["name"] for e in trace["traceEvents"] if e["ph"] == "X"}
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["summary"]["status"] == "PASS"
+        assert report["timings"]["stages"]
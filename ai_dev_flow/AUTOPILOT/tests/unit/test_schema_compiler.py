@@ -0,0 +1,205 @@
+"""
+Unit Tests for scripts/schema_compiler.py and the schemas compiled from it
+
+Tests the JSON-Schema subset, error codes and pointers, and the SPEC and
+CTR companion structure schemas.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add shared and layer scripts directories to path for imports
+AI_DEV_FLOW_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "scripts"))
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "08_CTR" / "scripts"))
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "09_SPEC" / "scripts"))
+
+yaml = pytest.importorskip("yaml")
+
+from schema_compiler import compile_schema
+from validate_ctr_spec_readiness import CTRSpecReadinessValidator
+from validate_spec import SPEC_STRUCTURE_VALIDATOR
+
+SPEC_EXAMPLE = AI_DEV_FLOW_DIR / "09_SPEC" / "examples" / "SPEC-01_api_client_example.yaml"
+
+
+def _errors(schema: dict, document) -> list[tuple]:
+    return [(e.code, e.pointer, e.message) for e in compile_schema(schema)(document)]
+
+
+@pytest.mark.unit
+class TestCompiler:
+    """Tests for the supported keywords."""
+
+    def test_required_rejects_null_and_empty(self):
+        """null, "", [] and {} do not satisfy required; false and 0 do."""
+        schema = {"type": "object", "required": ["a", "b", "c", "d", "e", "f", "g"], "x-code": "E1"}
+        document = {"b": None, "c": "", "d": [], "e": {}, "f": False, "g": 0}
+
+        assert _errors(schema, document) == [
+            ("E1", "/a", "required field is missing"),
+            ("E1", "/b", "required field is missing"),
+            ("E1", "/c", "required field is empty"),
+            ("E1", "/d", "required field is empty"),
+            ("E1", "/e", "required field is empty"),
+        ]
+
+    def test_codes_and_pointers(self):
+        """x-code is inherited; a property's code applies when it is missing."""
+        schema = {
+            "type": "object",
+            "x-code": "ROOT",
+            "required": ["meta", "items"],
+            "properties": {
+                "meta": {"type": "object", "x-code": "META", "required": ["a/b"]},
+                "items": {"type": "array", "items": {"enum": ["x", "y"]}},
+            },
+        }
+
+        assert _errors(schema, {"items": ["x", "z"]}) == [
+            ("META", "/meta", "required field is missing"),
+            ("ROOT", "/items/1", "'z' is not one of: x, y"),
+        ]
+        assert _errors(schema, {"meta": {}, "items": ["x"]}) == [
+            ("META", "/meta", "required field is empty"),
+        ]
+        assert _errors(schema, {"meta": {"c": 1}, "items": ["x"]}) == [
+            ("META", "/meta/a~1b", "required field is missing"),
+        ]
+
+    def test_required_code_overrides_property_code(self):
+        """x-required-code reports every missing member with the parent's code."""
+        schema = {
+            "type": "object",
+            "x-required-code": "TOP",
+            "required": ["meta"],
+            "properties": {"meta": {"type": "object", "x-code": "META"}},
+        }
+
+        assert _errors(schema, {}) == [("TOP", "/meta", "required field is missing")]
+        assert _errors(schema, {"meta": []}) == [("TOP", "/meta", "required field is empty")]
+        assert _errors(schema, {"meta": "x"}) == [("META", "/meta", "must be a mapping (got string)")]
+
+    def test_type_pattern_and_lengths(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "v": {"type": "string", "pattern": r"^\d+$", "minLength": 2},
+                "n": {"type": ["integer", "null"]},
+                "l": {"type": "array", "minItems": 2},
+                "m": {"type": "object", "minProperties": 1},
+            },
+        }
+        document = {"v": "a", "n": True, "l": [1], "m": {}}
+
+        assert [pointer for _, pointer, _ in _errors(schema, document)] == ["/v", "/v", "/n", "/l", "/m"]
+        assert _errors(schema, {"v": "12", "n": None, "l": [1, 2], "m": {"k": 1}}) == []
+
+    def test_any_of_reports_closest_branch(self):
+        """The branch whose first required key is present is reported."""
+        schema = {"anyOf": [
+            {"type": "object", "required": ["openapi", "paths"]},
+            {"type": "object", "required": ["asyncapi", "channels"]},
+        ]}
+
+        assert _errors(schema, {"asyncapi": "2.6.0"}) == [(None, "/channels", "required field is missing")]
+        assert _errors(schema, {"asyncapi": "2.6.0", "channels": {"a": {}}}) == []
+
+
+@pytest.mark.unit
+class TestSpecStructureSchema:
+    """Tests for SPEC_STRUCTURE_SCHEMA error codes."""
+
+    @pytest.fixture
+    def spec(self) -> dict:
+        return yaml.safe_load(SPEC_EXAMPLE.read_text(encoding="utf-8"))
+
+    def test_example_is_valid(self, spec: dict):
+        assert SPEC_STRUCTURE_VALIDATOR(spec) == []
+
+    def test_cumulative_tags_mapping_or_list(self, spec: dict):
+        """The list form of cumulative_tags is accepted; empty or scalar is not."""
+        spec["traceability"]["cumulative_tags"] = ["@spec: SPEC-01", "@req: REQ.01.01"]
+        assert SPEC_STRUCTURE_VALIDATOR(spec) == []
+
+        spec["traceability"]["cumulative_tags"] = []
+        assert [e.code for e in SPEC_STRUCTURE_VALIDATOR(spec)] == ["SPEC-E015"]
+
+        spec["traceability"]["cumulative_tags"] = "brd"
+        assert [e.code for e in SPEC_STRUCTURE_VALIDATOR(spec)] == ["SPEC-E015"]
+
+    @pytest.mark.parametrize("section", ["metadata", "traceability", "interfaces", "security", "observability"])
+    def test_missing_top_level_is_e002(self, spec: dict, section: str):
+        del spec[section]
+
+        assert [(e.code, e.pointer) for e in SPEC_STRUCTURE_VALIDATOR(spec)] == [("SPEC-E002", f"/{section}")]
+
+    def test_section_codes(self, spec: dict):
+        broken = copy.deepcopy(spec)
+        broken["metadata"]["version"] = "1.0"
+        broken["security"]["authentication"] = {"method": "oauth"}
+        broken["interfaces"]["classes"][0]["methods"] = []
+
+        assert sorted(e.code for e in SPEC_STRUCTURE_VALIDATOR(broken)) == ["SPEC-E004", "SPEC-E009", "SPEC-E011"]
+
+
+@pytest.mark.unit
+class TestCTRCompanionSchema:
+    """Tests for the companion YAML check in validate_ctr_spec_readiness.py."""
+
+    def _validate(self, tmp_path: Path, companion: dict):
+        (tmp_path / "CTR-01_api.md").write_text("## 2. API Specification\n", encoding="utf-8")
+        (tmp_path / "CTR-01_api.yaml").write_text(yaml.safe_dump(companion), encoding="utf-8")
+        return CTRSpecReadinessValidator(min_score=0).validate_file(tmp_path / "CTR-01_api.md")
+
+    def test_valid_openapi_passes(self, tmp_path: Path):
+        result = self._validate(tmp_path, {
+            "openapi": "3.0.3",
+            "info": {"title": "API", "version": "1.0.0", "description": "d"},
+            "paths": {"/users": {"get": {}}},
+            "components": {"schemas": {"User": {}}},
+        })
+
+        assert result.errors == []
+        assert result.passed
+
+    def test_openapi_errors_block(self, tmp_path: Path):
+        """Structural errors are reported with pointers and fail the file."""
+        result = self._validate(tmp_path, {
+            "openapi": "2.0",
+            "info": {"title": "API", "version": "1.0.0"},
+            "paths": {},
+            "components": {"schemas": {"User": {}}},
+        })
+
+        assert result.errors == [
+            "Companion YAML CTR-01_api.yaml /paths: required field is empty",
+            "Companion YAML CTR-01_api.yaml /openapi: '2.0' does not match ^3\\.[01]\\.",
+            "Companion YAML CTR-01_api.yaml /info/description: required field is missing",
+        ]
+        assert not result.passed
+
+    def test_template_layout_endpoint_errors(self, tmp_path: Path):
+        result = self._validate(tmp_path, {
+            "id": "CTR-01",
+            "title": "API",
+            "document_control": {"version": "1.0"},
+            "contract_endpoints": [{"endpoint_id": "E1", "path": "/x"}],
+        })
+
+        assert result.errors == [
+            "Companion YAML CTR-01_api.yaml /contract_endpoints/0/method: required field is missing",
+        ]
+        assert not result.passed
+
+    def test_unparseable_companion_blocks(self, tmp_path: Path):
+        (tmp_path / "CTR-01_api.md").write_text("## 2. API Specification\n", encoding="utf-8")
+        (tmp_path / "CTR-01_api.yaml").write_text("a: [unclosed", encoding="utf-8")
+
+        result = CTRSpecReadinessValidator(min_score=0).validate_file(tmp_path / "CTR-01_api.md")
+
+        assert result.errors[0].startswith("Companion YAML CTR-01_api.yaml could not be parsed")
+        assert not result.passed
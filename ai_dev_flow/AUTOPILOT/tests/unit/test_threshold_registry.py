@@ -0,0 +1,145 @@
+"""
+Unit Tests for scripts/threshold_registry.py and its use in validate_bdd_suite.py
+
+Tests definition parsing, the hash-keyed parse cache, lookups and the BDD
+@threshold checks resolved through the index.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add shared and 04_BDD scripts directories to path for imports
+AI_DEV_FLOW_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "scripts"))
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "04_BDD" / "scripts"))
+
+import threshold_registry
+from threshold_registry import build_threshold_registry, parse_threshold_definitions
+from validate_bdd_suite import validate
+
+PRD_DOC = """# PRD-01: Payments
+
+```yaml
+thresholds:
+  perf:
+    api:
+      p95: 200  # ms
+  retry:
+    max_attempts: 3
+```
+
+| File | Purpose |
+|------|---------|
+| `config.yaml` | Service settings |
+"""
+
+REGISTRY_DOC = """# PRD-02 Threshold Registry
+
+| Key | Value | Unit |
+|-----|-------|------|
+| `timeout.request.max` | 30 | s |
+"""
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def prd_root(tmp_path: Path) -> Path:
+    root = tmp_path / "PRD"
+    _write(root / "PRD-01_payments" / "PRD-01.1_overview.md", PRD_DOC)
+    _write(root / "PRD-02_search" / "PRD-02_threshold_registry.md", REGISTRY_DOC)
+    _write(root / "PRD-03_notes" / "PRD-03_notes.md", "# PRD-03\n")
+    return root
+
+
+@pytest.mark.unit
+class TestParseThresholdDefinitions:
+    """Tests for the YAML and registry-table formats."""
+
+    def test_yaml_block(self):
+        assert parse_threshold_definitions(PRD_DOC) == [
+            {"key": "perf.api.p95", "value": "200", "line": 7},
+            {"key": "retry.max_attempts", "value": "3", "line": 9},
+        ]
+
+    def test_tables_only_when_requested(self):
+        """Table rows count only for registry files."""
+        assert parse_threshold_definitions(REGISTRY_DOC) == []
+        assert parse_threshold_definitions(REGISTRY_DOC, tables=True) == [
+            {"key": "timeout.request.max", "value": "30", "line": 5},
+        ]
+
+
+@pytest.mark.unit
+class TestThresholdRegistry:
+    """Tests for building and querying the index."""
+
+    def test_lookups(self, prd_root: Path):
+        registry = build_threshold_registry(prd_root)
+
+        assert registry.lookup("PRD", "01", "PERF.API.P95").value == "200"
+        assert registry.lookup("PRD", "02", "timeout.request.max").line == 5
+        assert registry.lookup("PRD", "01", "config.yaml") is None
+        assert registry.has_document("PRD", "02")
+        assert not registry.has_document("PRD", "03")
+
+    def test_cache_reused_until_file_changes(self, prd_root: Path, tmp_path: Path, monkeypatch):
+        cache_path = tmp_path / "cache" / "thresholds.json"
+        build_threshold_registry(prd_root, cache_path=cache_path)
+        parsed = []
+        parse = threshold_registry.parse_threshold_definitions
+
+        def _counting(content, tables=False):
+            parsed.append(content)
+            return parse(content, tables)
+
+        monkeypatch.setattr(threshold_registry, "parse_threshold_definitions", _counting)
+
+        build_threshold_registry(prd_root, cache_path=cache_path)
+        assert parsed == []
+
+        _write(prd_root / "PRD-02_search" / "PRD-02_threshold_registry.md",
+               REGISTRY_DOC + "| `timeout.request.min` | 1 | s |\n")
+        registry = build_threshold_registry(prd_root, cache_path=cache_path)
+
+        assert len(parsed) == 1
+        assert registry.lookup("PRD", "02", "timeout.request.min").value == "1"
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        assert cached["version"] == threshold_registry.REGISTRY_CACHE_VERSION
+
+
+@pytest.mark.unit
+class TestBddThresholdCheck:
+    """Tests for @threshold resolution in validate_bdd_suite.py."""
+
+    def _messages(self, tmp_path: Path, prd_root: Path, tag: str) -> list[str]:
+        bdd = tmp_path / "BDD"
+        _write(bdd / "BDD-01.0_index.md", "# BDD-01\n")
+        _write(bdd / "BDD-01.1_payments.feature", f"Feature: Payments\n  {tag}\n  Scenario: Pay\n    Given x\n")
+        return [v.message for v in validate(bdd, prd_root) if "Threshold" in v.message]
+
+    def test_defined_key_resolves(self, tmp_path: Path, prd_root: Path):
+        assert self._messages(tmp_path, prd_root, "@threshold: PRD.01.perf.api.p95") == []
+
+    def test_table_rows_in_prd_documents_are_not_definitions(self, tmp_path: Path, prd_root: Path):
+        """A backticked file name in a PRD table does not make other keys undefined."""
+        prd_root_tables = prd_root / "PRD-04_ops"
+        _write(prd_root_tables / "PRD-04_threshold_registry.md", "# PRD-04 Threshold Registry\n")
+        _write(prd_root_tables / "PRD-04.1_ops.md", "| `config.yaml` | Settings |\n")
+
+        assert self._messages(tmp_path, prd_root, "@threshold: PRD.04.perf.api.p95") == []
+
+    def test_undefined_key_and_missing_registry(self, tmp_path: Path, prd_root: Path):
+        assert self._messages(tmp_path, prd_root, "@threshold: PRD.01.perf.api.p99") == [
+            "Threshold PRD.01.perf.api.p99 not defined in PRD-01 threshold sources",
+        ]
+        assert self._messages(tmp_path, prd_root, "@threshold: PRD.05.perf.api.p95") == [
+            "Threshold registry for PRD-05 not found under docs/PRD",
+        ]
@@ -0,0 +1,96 @@
+"""
+Unit Tests for update_test_traceability.py ArtifactResolver
+
+Tests the one-time directory indexes used to resolve PENDING tags.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from update_test_traceability import ArtifactResolver, TraceabilityUpdater
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    _touch(tmp_path / "spec" / "SPEC-01_auth.yaml")
+    _touch(tmp_path / "spec" / "nested" / "SPEC-020_billing.yaml")
+    _touch(tmp_path / "spec" / "spec_req_03_01.yaml")
+    _touch(tmp_path / "tasks" / "TASKS_01_auth.md")
+    _touch(tmp_path / "src" / "services" / "user_service.py")
+    _touch(tmp_path / "src" / "api_client.py")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestArtifactResolver:
+    """Tests for ArtifactResolver lookups."""
+
+    def test_spec_by_req_number_prefix(self, project: Path):
+        """REQ numbers match SPEC-<num>* at any depth."""
+        resolver = ArtifactResolver(spec_dir=project / "spec")
+
+        assert resolver.find_spec(["REQ-01"], None) == "spec/SPEC-01_auth.yaml"
+        assert resolver.find_spec(["REQ.02.10"], None) == "spec/nested/SPEC-020_billing.yaml"
+
+    def test_spec_by_slug_then_fallback(self, project: Path):
+        """Full REQ slugs match, and the first SPEC file is the fallback."""
+        resolver = ArtifactResolver(spec_dir=project / "spec")
+
+        assert resolver.find_spec(["REQ.03.01"], None) == "spec/spec_req_03_01.yaml"
+        assert resolver.find_spec(["REQ-99"], "missing") is not None
+
+    def test_tasks_and_code(self, project: Path):
+        """TASKS resolve by REQ; code resolves by component, then by REQ service."""
+        resolver = ArtifactResolver(tasks_dir=project / "tasks", code_dir=project / "src")
+
+        assert resolver.find_tasks(["REQ-01"], None) == "tasks/TASKS_01_auth.md"
+        assert resolver.find_tasks(["REQ-05"], "none") is None
+        assert resolver.find_code([], "user") == "src/services/user_service.py"
+        assert resolver.find_code(["REQ.02.01"], None) == "src/api_client.py"
+
+    def test_directories_indexed_once(self, project: Path, monkeypatch):
+        """Repeated lookups do not walk the directory again."""
+        import update_test_traceability
+
+        walks = []
+        original_walk = update_test_traceability.os.walk
+
+        def counting_walk(top, *args, **kwargs):
+            walks.append(top)
+            return original_walk(top, *args, **kwargs)
+
+        monkeypatch.setattr(update_test_traceability.os, "walk", counting_walk)
+        resolver = ArtifactResolver(spec_dir=project / "spec")
+        for _ in range(3):
+            resolver.find_spec(["REQ-01"], "auth")
+            resolver.find_spec(["REQ-42"], "other")
+
+        assert walks == [project / "spec"]
+
+    def test_update_uses_resolver(self, project: Path):
+        """PENDING tags are resolved through the index."""
+        tests = project / "tests"
+        _touch(tests / "test_auth.py").write_text(
+            '"""\n@req: REQ-01\n@spec: PENDING\n@tasks: PENDING\n"""\n', encoding="utf-8"
+        )
+
+        result = TraceabilityUpdater().update_test_traceability(
+            tests, spec_dir=project / "spec", tasks_dir=project / "tasks"
+        )
+
+        content = (tests / "test_auth.py").read_text(encoding="utf-8")
+        assert "@spec: spec/SPEC-01_auth.yaml" in content
+        assert "@tasks: tasks/TASKS_01_auth.md" in content
+        assert result.pending_remaining == 0
@@ -0,0 +1,103 @@
+"""
+Unit Tests for scripts/validate_documentation_paths.py
+
+Tests incremental re-validation of changed files against a full scan.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add shared scripts directory to path for imports
+AI_DEV_FLOW_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "scripts"))
+
+from validate_documentation_paths import DocumentationPathValidator
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _issues(validator: DocumentationPathValidator) -> list:
+    return sorted((i.file_path, i.line_number, i.issue_type) for i in validator.issues)
+
+
+@pytest.fixture
+def docs(tmp_path: Path) -> Path:
+    _write(tmp_path / "a.md", "# A\n\nSee [b](b.md) and [gone](missing_a.md).\n")
+    _write(tmp_path / "b.md", "# B\n\nSee [gone](missing_b.md).\n")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestValidateFiles:
+    """Tests for DocumentationPathValidator.validate_files."""
+
+    def test_fixed_file_clears_its_issues(self, docs: Path):
+        validator = DocumentationPathValidator(str(docs))
+        validator.validate_all(verbose=False)
+        assert _issues(validator) == [("a.md", 3, "MISSING_FILE"), ("b.md", 3, "MISSING_FILE")]
+
+        _write(docs / "a.md", "# A\n\nSee [b](b.md).\n")
+        validator.validate_files([docs / "a.md"])
+
+        assert _issues(validator) == [("b.md", 3, "MISSING_FILE")]
+
+    def test_changed_file_issues_replaced(self, docs: Path):
+        """Re-checking a file replaces its issues instead of adding duplicates."""
+        validator = DocumentationPathValidator(str(docs))
+        validator.validate_all(verbose=False)
+
+        _write(docs / "a.md", "# A\n\n\nSee [gone](missing_a.md).\n")
+        validator.validate_files([docs / "a.md"])
+        validator.validate_files([docs / "a.md"])
+
+        assert _issues(validator) == [("a.md", 4, "MISSING_FILE"), ("b.md", 3, "MISSING_FILE")]
+
+    def test_untouched_file_keeps_issues(self, docs: Path):
+        """Only issues of the re-checked files change, even if an untouched file changed on disk."""
+        validator = DocumentationPathValidator(str(docs))
+        validator.validate_all(verbose=False)
+
+        _write(docs / "b.md", "# B\n")
+        validator.validate_files([docs / "a.md"])
+
+        assert _issues(validator) == [("a.md", 3, "MISSING_FILE"), ("b.md", 3, "MISSING_FILE")]
+
+    def test_created_target_clears_missing_links(self, docs: Path):
+        """A newly written file fixes missing-file issues in other files."""
+        validator = DocumentationPathValidator(str(docs))
+        validator.validate_all(verbose=False)
+
+        created = _write(docs / "missing_b.md", "# Now here\n")
+        validator.validate_files([created])
+
+        assert _issues(validator) == [("a.md", 3, "MISSING_FILE")]
+
+    def test_matches_full_scan(self, docs: Path):
+        validator = DocumentationPathValidator(str(docs))
+        validator.validate_all(verbose=False)
+        _write(docs / "a.md", "# A\n\nSee [c](sub/c.md).\n")
+        _write(docs / "sub" / "c.md", "# C\n\n[up](../missing_c.md)\n")
+        validator.validate_files([docs / "a.md", docs / "sub" / "c.md"])
+
+        full = DocumentationPathValidator(str(docs))
+        full.validate_all(verbose=False)
+
+        assert _issues(validator) == _issues(full)
+
+    def test_ignores_non_markdown_and_excluded_files(self, docs: Path, tmp_path_factory):
+        validator = DocumentationPathValidator(str(docs))
+        validator.validate_all(verbose=False)
+        before = _issues(validator)
+
+        outside = _write(tmp_path_factory.mktemp("other") / "x.md", "[gone](nowhere.md)\n")
+        excluded = _write(docs / "node_modules" / "pkg.md", "[gone](nowhere.md)\n")
+        text = _write(docs / "notes.txt", "[gone](nowhere.md)\n")
+        validator.validate_files([outside, excluded, text])
+
+        assert _issues(validator) == before
@@ -0,0 +1,128 @@
+"""
+Unit Tests for 09_SPEC/scripts/validate_spec.py
+
+Tests the single YAML parse shared with readiness scoring, the loader
+choice, and that process-pool validation matches serial validation.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add shared and 09_SPEC scripts directories to path for imports
+AI_DEV_FLOW_DIR = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "scripts"))
+sys.path.insert(0, str(AI_DEV_FLOW_DIR / "09_SPEC" / "scripts"))
+
+yaml = pytest.importorskip("yaml")
+
+import validate_spec
+from validate_spec import load_spec_file, validate_files, validate_spec_with_readiness
+
+SPEC_EXAMPLE = AI_DEV_FLOW_DIR / "09_SPEC" / "examples" / "SPEC-01_api_client_example.yaml"
+
+
+def _summary(outcomes: list) -> list:
+    return [
+        (
+            result.file_path, result.errors, result.warnings, result.info,
+            readiness and (readiness.score, readiness.passed, readiness.errors, readiness.warnings),
+        )
+        for result, readiness in outcomes
+    ]
+
+
+@pytest.fixture
+def spec_files(tmp_path: Path) -> list:
+    files = []
+    for n in range(1, 4):
+        path = tmp_path / f"SPEC-0{n}_example.yaml"
+        shutil.copy(SPEC_EXAMPLE, path)
+        files.append(path)
+    broken = tmp_path / "SPEC-04_broken.yaml"
+    broken.write_text("id: [unclosed\n", encoding="utf-8")
+    return files + [broken]
+
+
+@pytest.mark.unit
+class TestLoading:
+    """Tests for reading and parsing SPEC files."""
+
+    def test_prefers_c_loader(self, monkeypatch):
+        """The libyaml loader is used when PyYAML provides it."""
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        loaders = []
+        load = yaml.load
+
+        def _recording(stream, Loader):
+            loaders.append(Loader)
+            return load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml, "load", _recording)
+        _, data, error = load_spec_file(SPEC_EXAMPLE)
+
+        assert validate_spec.YAML_SAFE_LOADER is expected
+        assert error is None and isinstance(data, dict)
+        assert loaders == [expected]
+
+    def test_readiness_shares_single_parse(self, monkeypatch):
+        """Structural checks and readiness scoring parse the file once."""
+        calls = []
+        load = yaml.load
+
+        def _counting(stream, Loader):
+            calls.append(Loader)
+            return load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml, "load", _counting)
+        monkeypatch.setattr(yaml, "safe_load", lambda stream: pytest.fail("unexpected safe_load"))
+        result, readiness = validate_spec_with_readiness(SPEC_EXAMPLE, min_score=90)
+
+        assert len(calls) == 1
+        assert result.file_path == str(SPEC_EXAMPLE)
+        assert readiness.score > 0
+
+    def test_invalid_yaml_reported_by_both(self, spec_files: list):
+        result, readiness = validate_spec_with_readiness(spec_files[-1], min_score=90)
+
+        assert [code for code, _ in result.errors] == ["SPEC-E001"]
+        assert readiness.errors and not readiness.passed
+
+
+@pytest.mark.unit
+class TestValidateFiles:
+    """Tests for serial and process-pool validation."""
+
+    @pytest.mark.parametrize("min_score", [None, 90])
+    def test_parallel_matches_serial(self, spec_files: list, min_score):
+        serial = validate_files(spec_files, min_score=min_score, jobs=1)
+        parallel = validate_files(spec_files, min_score=min_score, jobs=2)
+
+        assert _summary(parallel) == _summary(serial)
+        assert [result.file_path for result, _ in serial] == [str(f) for f in spec_files]
+
+    def test_falls_back_to_serial_without_pool(self, spec_files: list, monkeypatch):
+        """A pool that cannot start (e.g. no semaphores) validates in-process."""
+        def _unavailable(*args, **kwargs):
+            raise OSError("no semaphores")
+
+        serial = validate_files(spec_files, min_score=90, jobs=1)
+        monkeypatch.setattr(validate_spec, "ProcessPoolExecutor", _unavailable)
+
+        assert _summary(validate_files(spec_files, min_score=90, jobs=4)) == _summary(serial)
+
+    def test_cli_defaults_to_serial(self, spec_files: list, monkeypatch, capsys):
+        calls = []
+
+        def _recording(files, min_score=None, jobs=1):
+            calls.append(jobs)
+            return []
+
+        monkeypatch.setattr(validate_spec, "validate_files", _recording)
+        monkeypatch.setattr(sys, "argv", ["validate_spec.py", str(spec_files[0].parent)])
+
+        validate_spec.main()
+
+        assert calls == [1]
@@ -0,0 +1,68 @@
+"""
+Unit Tests for validate_tdd_e2e.py scenario pool
+
+Tests concurrent scenario runs, in-process stages and stage timings.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from validate_tdd_e2e import TDDWorkflowValidator, build_report
+
+
+@pytest.mark.unit
+class TestScenarioPool:
+    """Tests for running E2E scenarios."""
+
+    def test_stages_run_in_process(self, tmp_path: Path, monkeypatch):
+        """No stage shells out to a script."""
+        def no_subprocess(*args, **kwargs):
+            raise AssertionError(f"unexpected subprocess: {args}")
+
+        monkeypatch.setattr(subprocess, "run", no_subprocess)
+        result = TDDWorkflowValidator(tmp_path, SCRIPTS_DIR).run_scenario("simple")
+
+        stages = {s.stage: s for s in result.stages}
+        assert stages["analyze_tests"].message == "Analyzed tests, found 1 files"
+        assert stages["validate_red"].passed
+        assert all(s.duration_ms >= 0 for s in result.stages)
+
+    def test_concurrent_results_in_order(self, tmp_path: Path):
+        """Scenarios run on a worker pool; results keep the requested order."""
+        validator = TDDWorkflowValidator(tmp_path, SCRIPTS_DIR, jobs=2)
+
+        report = validator.run_scenarios(["medium", "simple"])
+
+        assert [r.scenario for r in report.results] == ["medium", "simple"]
+        assert report.scenarios_run == 2
+        assert report.stage_timings["setup"]["runs"] == 2
+        assert report.wall_ms > 0
+
+    def test_missing_script(self, tmp_path: Path):
+        """A scripts dir without the stage modules fails those stages."""
+        result = TDDWorkflowValidator(tmp_path, tmp_path).run_scenario("simple")
+
+        stages = {s.stage: s for s in result.stages}
+        assert stages["setup"].passed
+        assert stages["analyze_tests"].message.startswith("Script not found")
+        assert not result.passed
+
+    def test_stage_timings_aggregated(self, tmp_path: Path):
+        """Stage durations are summed and maxed by stage name."""
+        validator = TDDWorkflowValidator(tmp_path, tmp_path)
+        results = [validator.run_scenario("simple"), validator.run_scenario("integration")]
+        for result in results:
+            for stage in result.stages:
+                stage.duration_ms = 10 if result.scenario == "simple" else 30
+
+        report = build_report(results)
+
+        assert report.stage_timings["setup"] == {"runs": 2, "total_ms": 40, "max_ms": 30}
+        assert report.stage_timings["generate_integration_tests"]["runs"] == 1
@@ -0,0 +1,98 @@
+"""
+Unit Tests for validate_tdd_stage.py in-process runners
+
+Tests pytest.main-based Red/Green runs and the warm worker process.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from validate_tdd_stage import TDDStageValidator, run_pytest_inprocess
+
+CALC_TESTS = '''import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+
+def test_add():
+    from calc_under_test import add
+    assert add(1, 2) == 3
+
+
+def test_sub():
+    from calc_under_test import sub
+    assert sub(3, 2) == 1
+'''
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests" / "test_calc.py").write_text(CALC_TESTS, encoding="utf-8")
+    return tmp_path
+
+
+def _write_code(project: Path, add_body: str = "a + b") -> None:
+    (project / "src" / "calc_under_test.py").write_text(
+        f"def add(a, b):\n    return {add_body}\n\n\ndef sub(a, b):\n    return a - b\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.unit
+class TestInProcessRunner:
+    """Tests for the pytest.main-based runner."""
+
+    def test_structured_outcomes(self, project: Path):
+        """Per-test outcomes and durations are collected by the plugin."""
+        _write_code(project, add_body="a + b + 1")
+
+        run = run_pytest_inprocess([str(project / "tests"), "-q", "-p", "no:cacheprovider"])
+
+        assert run.returncode == 1
+        outcomes = {o.nodeid.split("::")[-1]: o for o in run.outcomes}
+        assert outcomes["test_add"].outcome == "failed"
+        assert outcomes["test_sub"].outcome == "passed"
+        assert all(o.duration >= 0 for o in run.outcomes)
+        assert (run.passed, run.failed) == (1, 1)
+
+    def test_red_then_green_sees_new_code(self, project: Path):
+        """Modules from the previous run are unloaded, so generated code is picked up."""
+        validator = TDDStageValidator(runner="inprocess")
+
+        red = validator.validate_red_state(project / "tests")
+        assert red.status == "PASS"
+        assert red.failed_count == 2
+
+        _write_code(project)
+        after = validator.validate_red_state(project / "tests", code_exists=True)
+        assert after.passed_count == 2
+        assert "calc_under_test" not in sys.modules
+
+    def test_unknown_runner(self):
+        """Unknown runners are rejected."""
+        with pytest.raises(ValueError):
+            TDDStageValidator(runner="remote")
+
+    def test_warm_worker_between_stages(self, project: Path):
+        """The worker process is reused across runs and sees updated code."""
+        with TDDStageValidator(runner="worker") as validator:
+            red = validator.validate_red_state(project / "tests")
+            worker = validator._worker
+
+            _write_code(project)
+            after = validator.validate_red_state(project / "tests", code_exists=True)
+
+            assert validator._worker is worker
+            assert red.failed_count == 2
+            assert after.passed_count == 2
+            assert [o.outcome for o in after.outcomes] == ["passed", "passed"]
+        assert validator._worker is None
@@ -0,0 +1,169 @@
+"""
+Unit Tests for vertex_code_generator.py batch generation
+
+Tests bounded concurrent generation, the prompt-hash response cache, response
+validation and the mock backend.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import vertex_code_generator
+from vertex_code_generator import (
+    ResponseCache,
+    collect_spec_paths,
+    generate_batch,
+    generate_code_mock,
+    main,
+    save_files,
+)
+
+SPECS = [(f"SPEC-0{i}.yaml", {"id": f"SPEC-0{i}", "name": f"svc{i}"}) for i in range(1, 5)]
+
+
+class RecordingBackend:
+    """Backend that records prompts and tracks peak concurrency."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt: str) -> str:
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in prompt:
+                raise RuntimeError("quota exceeded")
+            return json.dumps({"files": [{"path": "out.py", "content": prompt[-40:]}]})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.mark.unit
+class TestGenerateBatch:
+    """Tests for generate_batch()."""
+
+    def test_bounded_concurrency_and_order(self):
+        """Calls overlap up to jobs; results keep SPEC order."""
+        backend = RecordingBackend(delay=0.05)
+
+        results = generate_batch(SPECS, "", backend, "test", jobs=2)
+
+        assert [r.spec for r in results] == [name for name, _ in SPECS]
+        assert backend.peak == 2
+        assert all(not r.cached and not r.error for r in results)
+
+    def test_cache_reuses_unchanged_inputs(self, tmp_path: Path):
+        """Only SPECs whose prompt changed reach the backend on a re-run."""
+        cache = ResponseCache(tmp_path / "cache")
+        generate_batch(SPECS, "ctr", RecordingBackend(), "test", cache=cache)
+
+        backend = RecordingBackend()
+        changed = SPECS[:3] + [("SPEC-04.yaml", {"id": "SPEC-04", "name": "renamed"})]
+        results = generate_batch(changed, "ctr", backend, "test", cache=cache)
+
+        assert [r.cached for r in results] == [True, True, True, False]
+        assert len(backend.prompts) == 1
+
+        other_contracts = generate_batch(SPECS[:1], "ctr v2", backend, "test", cache=cache)
+        other_backend = generate_batch(SPECS[:1], "ctr", backend, "other", cache=cache)
+        assert not other_contracts[0].cached
+        assert not other_backend[0].cached
+
+    def test_failures_reported_and_not_cached(self, tmp_path: Path):
+        """A failing call is reported per SPEC and retried on the next run."""
+        cache = ResponseCache(tmp_path / "cache")
+
+        results = generate_batch(SPECS[:2], "", RecordingBackend(fail_on="svc2"), "test", cache=cache)
+
+        assert results[0].error == ""
+        assert results[1].error == "quota exceeded"
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    @pytest.mark.parametrize("response, error", [
+        ("not json", "invalid response: Expecting value"),
+        ('{"code": "x"}', "invalid response: Invalid response format (missing 'files' key)"),
+        ('{"files": "out.py"}', "invalid response: Invalid response format ('files' must be a list of objects)"),
+    ])
+    def test_invalid_responses_reported_and_not_cached(self, tmp_path: Path, response: str, error: str):
+        """A response save_files would reject is an error and is not replayed from the cache."""
+        cache = ResponseCache(tmp_path / "cache")
+
+        results = generate_batch(SPECS[:1], "", lambda prompt: response, "test", cache=cache)
+
+        assert results[0].error.startswith(error)
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+    def test_invalid_cached_response_is_a_miss(self, tmp_path: Path):
+        """Entries cached before responses were validated are regenerated."""
+        cache = ResponseCache(tmp_path / "cache")
+        key = generate_batch(SPECS[:1], "", RecordingBackend(), "test")[0].prompt_hash
+        cache.put(key, "test", "not json")
+        backend = RecordingBackend()
+
+        results = generate_batch(SPECS[:1], "", backend, "test", cache=cache)
+
+        assert not results[0].cached and not results[0].error
+        assert len(backend.prompts) == 1
+        assert not list((tmp_path / "cache").glob(".*.tmp"))
+
+    def test_identical_prompts_sent_once(self):
+        """Duplicate SPEC content in one batch results in a single call."""
+        backend = RecordingBackend()
+
+        results = generate_batch([SPECS[0], ("copy.yaml", SPECS[0][1])], "", backend, "test")
+
+        assert len(backend.prompts) == 1
+        assert results[0].response == results[1].response
+
+    def test_mock_backend(self, tmp_path: Path):
+        """The mock backend works in a batch and its output can be saved."""
+        results = generate_batch(SPECS[:2], "", generate_code_mock, "mock", jobs=2)
+
+        assert save_files(results[0].response, tmp_path) == 1
+        assert (tmp_path / "src" / "generated_service" / "main.py").exists()
+
+
+@pytest.mark.unit
+def test_collect_spec_paths(tmp_path: Path):
+    """Directories expand to their YAML files; files are kept as given."""
+    (tmp_path / "b.yaml").write_text("id: b", encoding="utf-8")
+    (tmp_path / "a.yaml").write_text("id: a", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("", encoding="utf-8")
+    extra = tmp_path / "extra.yml"
+
+    assert collect_spec_paths([tmp_path, extra]) == [tmp_path / "a.yaml", tmp_path / "b.yaml", extra]
+
+
+@pytest.mark.unit
+def test_main_fails_when_nothing_is_written(tmp_path: Path, monkeypatch):
+    """A SPEC whose response yields no files makes the CLI exit non-zero."""
+    spec = tmp_path / "SPEC-01.yaml"
+    spec.write_text("id: SPEC-01", encoding="utf-8")
+    monkeypatch.setattr(vertex_code_generator, "generate_code_mock", lambda prompt: '{"files": []}')
+    monkeypatch.setattr(sys, "argv", [
+        "vertex_code_generator.py", "--spec", str(spec), "--mock",
+        "--output", str(tmp_path / "out"), "--cache-dir", str(tmp_path / "cache"),
+    ])
+
+    with pytest.raises(SystemExit) as exc:
+        main()
+
+    assert exc.value.code == 1
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Compiled Structural Schemas for YAML Artifacts
+
+Compiles a JSON-Schema subset into a tree of plain Python closures once (at
+import time of the validator that declares the schema), so validating
+hundreds of SPEC/CTR documents costs only the closure calls - no schema
+interpretation per document. Every error carries the exact JSON Pointer
+(RFC 6901) of the offending value.
+
+Supported keywords:
+    type, required, properties, items, enum, pattern,
+    minItems, minProperties, minLength, anyOf
+
+anyOf reports the errors of the closest alternative: one whose first
+`required` key is present, otherwise the one with the fewest errors.
+
+Extensions:
+    x-code           - Error code for errors raised at or below this node
+                       (nearest ancestor wins; a property's x-code also
+                       applies when that property is missing from its parent)
+    x-required-code  - Error code for this node's own `required` errors,
+                       overriding the properties' x-code (e.g. a document
+                       root that reports every missing section alike)
+
+Deviation from JSON Schema: a `required` member whose value is null, an
+empty string, an empty array or an empty mapping is reported as missing,
+matching how empty YAML keys (`field:`, `field: []`) are written.
+
+Usage:
+    from schema_compiler import compile_schema
+
+    validate = compile_schema({"type": "object", "required": ["id"], "x-code": "SPEC-E002"})
+    for error in validate(data):
+        print(error.code, error.pointer, error.message)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# Non-null YAML value types (for required sections whose shape is free-form)
+ANY_NON_NULL = ["object", "array", "string", "number", "boolean"]
+
+TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+TYPE_NAMES = {
+    "object": "a mapping",
+    "array": "an array",
+    "string": "a string",
+    "integer": "an integer",
+    "number": "a number",
+    "boolean": "a boolean",
+    "null": "null",
+}
+
+
+@dataclass
+class SchemaError:
+    """A structural error located by JSON Pointer."""
+    pointer: str
+    message: str
+    code: Optional[str] = None
+
+    def __str__(self) -> str:
+        return f"{self.pointer or '/'}: {self.message}"
+
+
+Check = Callable[[Any, str, List[SchemaError]], None]
+
+
+def escape_pointer_token(token: Any) -> str:
+    """Escape a key or index for use in a JSON Pointer."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def is_missing(value: Any) -> bool:
+    """True for values that do not satisfy `required`: null, "", [] or {}."""
+    return value is None or (isinstance(value, (str, list, dict)) and not value)
+
+
+def _describe(value: Any) -> str:
+    for name, check in TYPE_CHECKS.items():
+        if name != "integer" and check(value):
+            return name
+    return type(value).__name__
+
+
+def _compile(schema: Dict, code: Optional[str]) -> Check:
+    """Compile one schema node into a closure."""
+    code = schema.get("x-code", code)
+    checks: List[Check] = []
+
+    types = schema.get("type")
+    if types is not None:
+        type_list = [types] if isinstance(types, str) else list(types)
+        type_fns = [TYPE_CHECKS[t] for t in type_list]
+        expected = " or ".join(TYPE_NAMES[t] for t in type_list)
+    else:
+        type_fns = []
+        expected = ""
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        allowed_text = ", ".join(str(a) for a in allowed)
+
+        def check_enum(value, pointer, errors):
+            if value not in allowed:
+                errors.append(SchemaError(pointer, f"'{value}' is not one of: {allowed_text}", code))
+        checks.append(check_enum)
+
+    if "pattern" in schema:
+        regex = re.compile(schema["pattern"])
+        pattern_text = schema["pattern"]
+
+        def check_pattern(value, pointer, errors):
+            if isinstance(value, str) and not regex.search(value):
+                errors.append(SchemaError(pointer, f"'{value}' does not match {pattern_text}", code))
+        checks.append(check_pattern)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_min_length(value, pointer, errors):
+            if isinstance(value, str) and len(value) < min_length:
+                errors.append(SchemaError(pointer, f"must be at least {min_length} character(s)", code))
+        checks.append(check_min_length)
+
+    properties = schema.get("properties", {})
+    compiled_props = [
+        (name, escape_pointer_token(name), _compile(sub, code))
+        for name, sub in properties.items()
+    ]
+    required = list(schema.get("required", []))
+    required_code = schema.get("x-required-code")
+    required_codes = [
+        (name, escape_pointer_token(name), required_code or properties.get(name, {}).get("x-code", code))
+        for name in required
+    ]
+    required_set = set(required)
+
+    if required_codes:
+        def check_required(value, pointer, errors):
+            if not isinstance(value, dict):
+                return
+            for name, token, req_code in required_codes:
+                sub_value = value.get(name)
+                if sub_value is None:
+                    errors.append(SchemaError(f"{pointer}/{token}", "required field is missing", req_code))
+                elif is_missing(sub_value):
+                    errors.append(SchemaError(f"{pointer}/{token}", "required field is empty", req_code))
+        checks.append(check_required)
+
+    if "minProperties" in schema:
+        min_props = schema["minProperties"]
+
+        def check_min_properties(value, pointer, errors):
+            if isinstance(value, dict) and len(value) < min_props:
+                errors.append(SchemaError(pointer, f"must define at least {min_props} entr{'y' if min_props == 1 else 'ies'}", code))
+        checks.append(check_min_properties)
+
+    if compiled_props:
+        def check_properties(value, pointer, errors):
+            if not isinstance(value, dict):
+                return
+            for name, token, sub_check in compiled_props:
+                if name not in value:
+                    continue
+                sub_value = value[name]
+                if name in required_set and is_missing(sub_value):
+                    continue  # Already reported as missing
+                sub_check(sub_value, f"{pointer}/{token}", errors)
+        checks.append(check_properties)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+
+        def check_min_items(value, pointer, errors):
+            if isinstance(value, list) and len(value) < min_items:
+                errors.append(SchemaError(pointer, f"must contain at least {min_items} item(s)", code))
+        checks.append(check_min_items)
+
+    if "items" in schema:
+        item_check = _compile(schema["items"], code)
+
+        def check_items(value, pointer, errors):
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    item_check(item, f"{pointer}/{index}", errors)
+        checks.append(check_items)
+
+    if "anyOf" in schema:
+        branches = [
+            (_compile(sub, code), (sub.get("required") or [None])[0])
+            for sub in schema["anyOf"]
+        ]
+
+        def check_any_of(value, pointer, errors):
+            best = None
+            for branch, discriminator in branches:
+                branch_errors: List[SchemaError] = []
+                branch(value, pointer, branch_errors)
+                if not branch_errors:
+                    return
+                # Prefer alternatives whose first required key is present
+                rank = (not (isinstance(value, dict) and discriminator in value), len(branch_errors))
+                if best is None or rank < best[0]:
+                    best = (rank, branch_errors)
+            # Report the closest-matching alternative
+            errors.extend(best[1] if best else [])
+        checks.append(check_any_of)
+
+    def check(value, pointer, errors):
+        if type_fns and not any(fn(value) for fn in type_fns):
+            errors.append(SchemaError(pointer, f"must be {expected} (got {_describe(value)})", code))
+            return
+        for fn in checks:
+            fn(value, pointer, errors)
+
+    return check
+
+
+def compile_schema(schema: Dict) -> Callable[[Any], List[SchemaError]]:
+    """
+    Compile a schema into a validator function.
+
+    Args:
+        schema: JSON-Schema subset (see module docstring)
+
+    Returns:
+        Function taking a parsed document and returning a list of SchemaError
+        (empty when the document conforms)
+    """
+    root_check = _compile(schema, None)
+
+    def validate(document: Any) -> List[SchemaError]:
+        errors: List[SchemaError] = []
+        root_check(document, "", errors)
+        return errors
+
+    return validate
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Threshold Registry Index
+
+Builds a lookup index of thresholds defined in PRD sources so downstream
+validators can resolve `@threshold: PRD.NN.key` references in O(1):
+
+    "PRD.01.perf.api.p95" -> ThresholdDefinition(source, value, line)
+
+Two definition formats are recognized (see THRESHOLD_NAMING_RULES.md):
+    1. YAML `thresholds:` blocks inside PRD documents (current standard)
+    2. Legacy registry tables: | `perf.api.p95` | 200 | ms | ... |, read only
+       from PRD-NN_threshold_registry.md files (other PRD tables often list
+       backticked file names such as `config.yaml`)
+
+The index is built once per run. An optional JSON cache stores the parsed
+definitions per source file keyed by content hash, so unchanged PRD files
+are not re-parsed on the next run.
+
+Usage:
+    from threshold_registry import build_threshold_registry
+
+    registry = build_threshold_registry(Path("docs/PRD"), cache_path=Path(".threshold_cache.json"))
+    definition = registry.lookup("PRD", "01", "perf.api.p95")
+
+    python threshold_registry.py docs/PRD [--cache FILE] [--json]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+# Bump when the parser output changes so stale cache entries are ignored
+REGISTRY_CACHE_VERSION = 2
+
+PRD_FILE_RE = re.compile(r"^PRD-(\d{2,})[._]")
+REGISTRY_FILE_RE = re.compile(r"^PRD-\d{2,}_threshold_registry\.md$")
+TABLE_ROW_RE = re.compile(r"^\s*\|\s*`([a-z0-9_]+(?:\.[a-z0-9_]+)+)`\s*\|\s*([^|]*)\|")
+YAML_KEY_RE = re.compile(r"^(\s*)([A-Za-z0-9_]+)\s*:\s*(.*?)\s*$")
+
+EXCLUDED_DIRS = {"archive", "archived", ".git", "__pycache__"}
+
+
+@dataclass
+class ThresholdDefinition:
+    """A single threshold defined in a source document."""
+    key: str
+    value: str
+    source: str
+    line: int
+
+
+@dataclass
+class ThresholdRegistry:
+    """Index of threshold definitions keyed by DOC.NN.key."""
+    entries: Dict[str, ThresholdDefinition] = field(default_factory=dict)
+    sources: Dict[str, List[str]] = field(default_factory=dict)  # "PRD.01" -> source files
+    defined_documents: Set[str] = field(default_factory=set)  # documents with >= 1 definition
+
+    def has_document(self, doc_type: str, doc_num: str) -> bool:
+        """True if any threshold source exists for the document."""
+        return f"{doc_type}.{doc_num}" in self.sources
+
+    def has_definitions(self, doc_type: str, doc_num: str) -> bool:
+        """True if the document's sources define at least one parseable threshold."""
+        return f"{doc_type}.{doc_num}" in self.defined_documents
+
+    def lookup(self, doc_type: str, doc_num: str, key: str) -> Optional[ThresholdDefinition]:
+        """Resolve a threshold reference, or None if undefined."""
+        return self.entries.get(f"{doc_type}.{doc_num}.{key.lower()}")
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def parse_threshold_definitions(content: str, tables: bool = False) -> List[Dict]:
+    """
+    Extract threshold definitions from a document.
+
+    Args:
+        content: Document text
+        tables: Also read legacy registry table rows (registry files only)
+
+    Returns:
+        List of {"key", "value", "line"} dicts in source order
+    """
+    definitions: List[Dict] = []
+    in_yaml = False
+    in_thresholds = False
+    base_indent = 0
+    stack: List[tuple] = []  # (indent, key)
+
+    for line_no, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+
+        # Fenced YAML blocks
+        if stripped.startswith("```"):
+            in_yaml = not in_yaml and stripped[3:].strip().lower() in ("yaml", "yml")
+            in_thresholds = False
+            continue
+
+        if in_yaml:
+            code = line.split("#", 1)[0].rstrip()
+            match = YAML_KEY_RE.match(code)
+            if not match:
+                continue
+            indent = len(match.group(1))
+            key, value = match.group(2), match.group(3)
+
+            if not in_thresholds:
+                if key == "thresholds" and not value:
+                    in_thresholds = True
+                    base_indent = indent
+                    stack = []
+                continue
+
+            if indent <= base_indent:
+                in_thresholds = key == "thresholds" and not value
+                stack = []
+                continue
+
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            if value:
+                full_key = ".".join([k for _, k in stack] + [key]).lower()
+                definitions.append({"key": full_key, "value": value.strip("'\""), "line": line_no})
+            else:
+                stack.append((indent, key))
+            continue
+
+        # Legacy registry tables
+        match = TABLE_ROW_RE.match(line) if tables else None
+        if match:
+            definitions.append({
+                "key": match.group(1).lower(),
+                "value": match.group(2).strip(),
+                "line": line_no,
+            })
+
+    return definitions
+
+
+def iter_prd_sources(prd_root: Path) -> Iterable[Path]:
+    """Yield PRD markdown files under prd_root (excluding archives)."""
+    if not prd_root.is_dir():
+        return
+    for path in sorted(prd_root.rglob("PRD-*.md")):
+        if EXCLUDED_DIRS.intersection(path.parts) or "backup_" in str(path.parent):
+            continue
+        if PRD_FILE_RE.match(path.name):
+            yield path
+
+
+# =============================================================================
+# REGISTRY BUILD (with hash-keyed cache)
+# =============================================================================
+
+def _load_cache(cache_path: Optional[Path]) -> Dict[str, Dict]:
+    if not cache_path or not cache_path.exists():
+        return {}
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != REGISTRY_CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def _save_cache(cache_path: Optional[Path], files: Dict[str, Dict]):
+    if not cache_path:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": REGISTRY_CACHE_VERSION, "files": files}, indent=2),
+            encoding="utf-8",
+        )
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # Cache is an optimization only
+
+
+def build_threshold_registry(prd_root: Path, cache_path: Optional[Path] = None) -> ThresholdRegistry:
+    """
+    Build the threshold index for all PRD sources under prd_root.
+
+    A source is any threshold registry file, or any PRD document whose YAML
+    `thresholds:` blocks define at least one threshold. When cache_path is given, per-file parse results
+    are reused while the file's SHA-256 hash is unchanged.
+
+    Args:
+        prd_root: Root directory of PRD documents
+        cache_path: Optional JSON cache file
+
+    Returns:
+        ThresholdRegistry with O(1) key lookups
+    """
+    registry = ThresholdRegistry()
+    cached_files = _load_cache(cache_path)
+    current_files: Dict[str, Dict] = {}
+
+    for path in iter_prd_sources(prd_root):
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            continue
+        digest = hashlib.sha256(raw).hexdigest()
+        key = str(path.resolve())
+
+        is_registry = bool(REGISTRY_FILE_RE.match(path.name))
+        cached = cached_files.get(key)
+        if cached and cached.get("sha256") == digest:
+            definitions = cached["definitions"]
+        else:
+            definitions = parse_threshold_definitions(raw.decode("utf-8", errors="replace"), tables=is_registry)
+        current_files[key] = {"sha256": digest, "definitions": definitions}
+
+        if not definitions and not is_registry:
+            continue
+
+        doc_id = f"PRD.{PRD_FILE_RE.match(path.name).group(1)}"
+        registry.sources.setdefault(doc_id, []).append(str(path))
+        if definitions:
+            registry.defined_documents.add(doc_id)
+        for item in definitions:
+            full_key = f"{doc_id}.{item['key']}"
+            # First definition wins; later duplicates are ignored
+            if full_key not in registry.entries:
+                registry.entries[full_key] = ThresholdDefinition(
+                    key=full_key, value=item["value"], source=str(path), line=item["line"]
+                )
+
+    if current_files != cached_files:
+        _save_cache(cache_path, current_files)
+
+    return registry
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the PRD threshold registry index")
+    parser.add_argument("prd_root", type=Path, help="Root directory of PRD documents")
+    parser.add_argument("--cache", type=Path, help="JSON cache file (reused while PRD hashes match)")
+    parser.add_argument("--json", action="store_true", help="Print the index as JSON")
+    args = parser.parse_args()
+
+    registry = build_threshold_registry(args.prd_root, cache_path=args.cache)
+
+    if args.json:
+        print(json.dumps({k: asdict(v) for k, v in sorted(registry.entries.items())}, indent=2))
+        return 0
+
+    for doc_id in sorted(registry.sources):
+        count = sum(1 for key in registry.entries if key.startswith(doc_id + "."))
+        print(f"{doc_id}: {count} threshold(s) from {len(registry.sources[doc_id])} source(s)")
+    print(f"Total: {len(registry.entries)} threshold(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
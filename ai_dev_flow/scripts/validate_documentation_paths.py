@@ -17,6 +17,12 @@ Severity Levels:
 Usage:
     python validate_documentation_paths.py [--strict]
 
+In-process (incremental) use:
+    validator = DocumentationPathValidator(root)
+    validator.validate_all(verbose=False)      # full scan once
+    validator.validate_files([changed_md])     # re-check only changed files
+    exit_code, text = validator.format_report()
+
 Options:
     --strict    Exit with non-zero status if HIGH or MEDIUM issues found
 """
@@ -26,8 +32,7 @@ import os
 import re
 import sys
 from pathlib import Path
-import os
-from typing import List, Tuple, Dict, Set
+from typing import Iterable, List, Tuple, Dict, Set
 from dataclasses import dataclass
 from enum import Enum
 
@@ -47,6 +52,7 @@ class Issue:
     issue_type: str
     description: str
     suggestion: str = ""
+    target: str = ""  # Resolved link target (missing-file / case-mismatch issues)
 
 
 class DocumentationPathValidator:
@@ -80,13 +86,15 @@ class DocumentationPathValidator:
             r'TASKS-\d{3}',
         ]
 
-    def validate_all(self) -> List[Issue]:
+    def validate_all(self, verbose: bool = True) -> List[Issue]:
         """Run all validation checks"""
-        print(f"Scanning documentation in: {self.root_dir}")
+        if verbose:
+            print(f"Scanning documentation in: {self.root_dir}")
 
         # Find all markdown files
         md_files = self._find_markdown_files()
-        print(f"Found {len(md_files)} markdown files")
+        if verbose:
+            print(f"Found {len(md_files)} markdown files")
 
         # Validate each file
         for md_file in md_files:
@@ -94,6 +102,38 @@ class DocumentationPathValidator:
 
         return self.issues
 
+    def validate_files(self, files: Iterable[Path]) -> List[Issue]:
+        """
+        Incrementally re-validate only the given files.
+
+        Previous issues of those files are replaced. Missing-file issues
+        reported for other files are dropped once their target exists (a
+        newly generated file can fix links elsewhere). Non-markdown files and
+        files outside the root or in excluded directories are ignored.
+        """
+        md_files: Dict[str, Path] = {}
+        for file_path in files:
+            file_path = Path(file_path).resolve()
+            if file_path.suffix != '.md' or not file_path.is_file():
+                continue
+            try:
+                rel = file_path.relative_to(self.root_dir)
+            except ValueError:
+                continue
+            if self.exclude_dirs.intersection(rel.parts[:-1]):
+                continue
+            md_files[str(rel)] = file_path
+
+        self.issues = [
+            issue for issue in self.issues
+            if issue.file_path not in md_files
+            and not (issue.target and Path(issue.target).exists())
+        ]
+        for file_path in md_files.values():
+            self._validate_file(file_path)
+
+        return self.issues
+
     def _find_markdown_files(self) -> List[Path]:
         """Find all markdown files, excluding certain directories"""
         md_files = []
@@ -231,7 +271,8 @@ class DocumentationPathValidator:
                     line_number=line_num,
                     issue_type="CASE_MISMATCH",
                     description=f"Case mismatch in path: '{link_path}'",
-                    suggestion="Check filename case (e.g., BRD-MVP-TEMPLATE.md vs brd-mvp-template.md)"
+                    suggestion="Check filename case (e.g., BRD-MVP-TEMPLATE.md vs brd-mvp-template.md)",
+                    target=str(target_path)
                 ))
             else:
                 self.issues.append(Issue(
@@ -240,7 +281,8 @@ class DocumentationPathValidator:
                     line_number=line_num,
                     issue_type="MISSING_FILE",
                     description=f"Referenced file not found: '{link_path}' (resolved to: {target_path})",
-                    suggestion=f"Verify the file exists or update the link"
+                    suggestion=f"Verify the file exists or update the link",
+                    target=str(target_path)
                 ))
 
     def _has_case_mismatch(self, target_path: Path) -> bool:
@@ -261,68 +303,69 @@ class DocumentationPathValidator:
 
     def report(self, strict: bool = False) -> int:
         """Print validation report and return exit code"""
+        exit_code, text = self.format_report(strict=strict)
+        print(text)
+        return exit_code
+
+    def format_report(self, strict: bool = False) -> Tuple[int, str]:
+        """Build the validation report; return (exit code, report text)"""
+        lines: List[str] = []
+
         # Group issues by severity
         high_issues = [i for i in self.issues if i.severity == Severity.HIGH]
         medium_issues = [i for i in self.issues if i.severity == Severity.MEDIUM]
         low_issues = [i for i in self.issues if i.severity == Severity.LOW]
 
-        # Print summary
-        print("\n" + "="*80)
-        print("DOCUMENTATION PATH VALIDATION REPORT")
-        print("="*80)
-        print(f"\nTotal Issues Found: {len(self.issues)}")
-        print(f"  HIGH:   {len(high_issues)}")
-        print(f"  MEDIUM: {len(medium_issues)}")
-        print(f"  LOW:    {len(low_issues)}")
-
-        # Print HIGH severity issues
-        if high_issues:
-            print("\n" + "-"*80)
-            print("HIGH SEVERITY ISSUES")
-            print("-"*80)
-            for issue in high_issues:
-                self._print_issue(issue)
-
-        # Print MEDIUM severity issues
-        if medium_issues:
-            print("\n" + "-"*80)
-            print("MEDIUM SEVERITY ISSUES")
-            print("-"*80)
-            for issue in medium_issues:
-                self._print_issue(issue)
-
-        # Print LOW severity issues
-        if low_issues:
-            print("\n" + "-"*80)
-            print("LOW SEVERITY ISSUES")
-            print("-"*80)
-            for issue in low_issues:
-                self._print_issue(issue)
-
-        # Print success message if no issues
+        # Summary
+        lines.append("\n" + "="*80)
+        lines.append("DOCUMENTATION PATH VALIDATION REPORT")
+        lines.append("="*80)
+        lines.append(f"\nTotal Issues Found: {len(self.issues)}")
+        lines.append(f"  HIGH:   {len(high_issues)}")
+        lines.append(f"  MEDIUM: {len(medium_issues)}")
+        lines.append(f"  LOW:    {len(low_issues)}")
+
+        for title, issues in (
+            ("HIGH SEVERITY ISSUES", high_issues),
+            ("MEDIUM SEVERITY ISSUES", medium_issues),
+            ("LOW SEVERITY ISSUES", low_issues),
+        ):
+            if issues:
+                lines.append("\n" + "-"*80)
+                lines.append(title)
+                lines.append("-"*80)
+                for issue in issues:
+                    lines.extend(self._format_issue(issue))
+
+        # Success message if no issues
         if not self.issues:
-            print("\n✅ No issues found! All documentation paths are valid.")
+            lines.append("\n✅ No issues found! All documentation paths are valid.")
 
-        print("\n" + "="*80)
+        lines.append("\n" + "="*80)
 
         # Determine exit code
         if strict and (high_issues or medium_issues):
-            print("\n❌ VALIDATION FAILED (strict mode)")
-            return 1
+            lines.append("\n❌ VALIDATION FAILED (strict mode)")
+            exit_code = 1
         elif high_issues:
-            print("\n⚠️  HIGH severity issues found - please fix")
-            return 1
+            lines.append("\n⚠️  HIGH severity issues found - please fix")
+            exit_code = 1
         else:
-            print("\n✅ VALIDATION PASSED")
-            return 0
-
-    def _print_issue(self, issue: Issue):
-        """Print a single issue"""
-        print(f"\n{issue.file_path}:{issue.line_number}")
-        print(f"  [{issue.severity.value}] {issue.issue_type}")
-        print(f"  {issue.description}")
+            lines.append("\n✅ VALIDATION PASSED")
+            exit_code = 0
+
+        return exit_code, "\n".join(lines)
+
+    def _format_issue(self, issue: Issue) -> List[str]:
+        """Format a single issue"""
+        lines = [
+            f"\n{issue.file_path}:{issue.line_number}",
+            f"  [{issue.severity.value}] {issue.issue_type}",
+            f"  {issue.description}",
+        ]
         if issue.suggestion:
-            print(f"  💡 Suggestion: {issue.suggestion}")
+            lines.append(f"  💡 Suggestion: {issue.suggestion}")
+        return lines
 
 
 def main():